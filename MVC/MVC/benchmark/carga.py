@@ -0,0 +1,461 @@
+# benchmark/carga.py
+import logging
+import math
+import multiprocessing
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmark.generador import CLAVE_EMPLEADOS, FECHA_REFERENCIA, SerieUF
+from conex.conn import PoolAgotadoError
+from conex.metricas import Histograma
+from dto.dto_arriendo import ArriendoDTO
+from dto.dto_cliente import ClienteDTO
+from dto.dto_user import UserDTO
+from dto.dto_vehiculo import VehiculoDTO
+from modelo.indicador import IndicadorEconomico
+from servicio.cache_uf import CacheUF, configurar_cache_uf
+from servicio.disponibilidad import VehiculoNoDisponibleError
+from servicio.indicador_service import IndicadorService
+from utils.limitador import LimitadorLogin, LoginBloqueadoError, PoliticaLimite, configurar_limitador
+
+logger = logging.getLogger(__name__)
+
+#: Pasos de una sesión de mesón, en orden
+PASOS = ("login", "disponibles", "cotizar", "arrendar", "cancelar")
+
+#: Errores de MySQL por bloqueos entre transacciones
+CODIGOS_BLOQUEO = {1213: "deadlock", 1205: "espera_bloqueo"}
+
+#: Resultados de un paso que no cuentan como error: otro empleado tomó el vehículo primero
+RESULTADOS_ESPERADOS = ("ok", "conflicto")
+
+#: Versión del formato del informe JSON
+VERSION_INFORME = 1
+
+_PATRON_BLOQUEO = re.compile(r"\((1213|1205),")
+
+
+class ConfiguracionCarga(NamedTuple):
+    """
+    Parámetros de una corrida de carga.
+
+    Attributes:
+        empleados (int): Empleados de mesón trabajando a la vez (un hilo cada uno)
+        sesiones (int): Sesiones que completa cada empleado
+        procesos (int): Procesos entre los que se reparten los empleados
+        semilla (int): Semilla de las fechas, vehículos y clientes elegidos
+        desde (date): Primer día de las reservas
+        horizonte (int): Días de la ventana de reservas (más corta, más competencia por vehículo)
+        preferidos (int): Cada empleado elige entre los primeros N vehículos libres (menos, más competencia)
+        proporcion_cancelados (float): Fracción de arriendos que el mismo empleado cancela al terminar
+        pausa (float): Segundos máximos de espera entre pasos (lo que tarda el empleado en el mesón)
+        uf_sintetica (bool): Cotizar con una caché de UF en memoria en lugar de mindicador.cl
+        limitar_login (bool): Mantener el limitador de login de la aplicación
+    """
+    empleados: int = 50
+    sesiones: int = 20
+    procesos: int = 1
+    semilla: int = 1
+    desde: date = FECHA_REFERENCIA
+    horizonte: int = 30
+    preferidos: int = 10
+    proporcion_cancelados: float = 0.5
+    pausa: float = 0.0
+    uf_sintetica: bool = True
+    limitar_login: bool = False
+
+
+class Reserva(NamedTuple):
+    """
+    Arriendo confirmado durante la carga.
+
+    `confirmada` es el momento (time.time) en que `registrarArriendo` volvió
+    y `cancelada` el momento en que se pidió su cancelación (None si sigue
+    activo): el intervalo queda dentro del tiempo real en que estuvo activo.
+    """
+    id_vehiculo: int
+    inicio: date
+    fin: date
+    confirmada: float
+    cancelada: Optional[float] = None
+
+
+class ContadorBloqueos(logging.Handler):
+    """
+    Cuenta por hilo los deadlocks y esperas de bloqueo agotadas.
+
+    Los DAOs capturan los errores de pymysql y solo los registran con
+    `logger.error` antes de devolver False o None, así que se reconocen por
+    el código de MySQL en el mensaje del log.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self._conteos: Dict[int, Counter] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        coincidencia = _PATRON_BLOQUEO.search(record.getMessage())
+        if coincidencia:
+            self._conteos.setdefault(record.thread, Counter())[CODIGOS_BLOQUEO[int(coincidencia.group(1))]] += 1
+
+    def delHilo(self) -> Counter:
+        """Conteos del hilo actual (se actualizan en vivo)."""
+        return self._conteos.setdefault(threading.get_ident(), Counter())
+
+
+class ResultadoCarga:
+    """Latencias y resultados por paso de un grupo de sesiones; se combina entre hilos y procesos."""
+
+    def __init__(self) -> None:
+        self.latencias: Dict[str, Histograma] = {paso: Histograma() for paso in PASOS}
+        self.resultados: Dict[str, Counter] = {paso: Counter() for paso in PASOS}
+        self.bloqueos: Counter = Counter()
+        self.mensajes: Counter = Counter()
+        self.reservas: List[Reserva] = []
+        self.sesiones = 0
+        self.completas = 0
+        self.sin_disponibles = 0
+        self.inicio = math.inf
+        self.fin = 0.0
+
+    def combinar(self, otro: 'ResultadoCarga') -> None:
+        for paso in PASOS:
+            destino, origen = self.latencias[paso], otro.latencias[paso]
+            destino.conteos = [a + b for a, b in zip(destino.conteos, origen.conteos)]
+            destino.total += origen.total
+            destino.suma += origen.suma
+            destino.maximo = max(destino.maximo, origen.maximo)
+            self.resultados[paso].update(otro.resultados[paso])
+        self.bloqueos.update(otro.bloqueos)
+        self.mensajes.update(otro.mensajes)
+        self.reservas.extend(otro.reservas)
+        self.sesiones += otro.sesiones
+        self.completas += otro.completas
+        self.sin_disponibles += otro.sin_disponibles
+        self.inicio = min(self.inicio, otro.inicio)
+        self.fin = max(self.fin, otro.fin)
+
+
+def _clasificar(error: BaseException) -> str:
+    if isinstance(error, VehiculoNoDisponibleError):
+        return "conflicto"
+    if isinstance(error, LoginBloqueadoError):
+        return "login_bloqueado"
+    if isinstance(error, PoolAgotadoError):
+        return "pool_agotado"
+    codigo = error.args[0] if error.args and isinstance(error.args[0], int) else None
+    return CODIGOS_BLOQUEO.get(codigo, "error")
+
+
+class Empleado:
+    """
+    Empleado de mesón que repite la sesión login → disponibles → cotizar → arrendar → cancelar.
+
+    Cada paso llama a los DTOs igual que la vista y se mide por separado; un
+    paso fallido termina la sesión. Las elecciones salen de un
+    `random.Random` propio, así que la secuencia de cada empleado se repite
+    entre corridas (no así el orden entre empleados).
+    """
+
+    def __init__(self, numero: int, run: str, clientes: Sequence[int], config: ConfiguracionCarga,
+                 contador: ContadorBloqueos) -> None:
+        self.numero = numero
+        self.run = run
+        self.clientes = clientes
+        self.config = config
+        self.contador = contador
+        self.origen = f"sucursal-{numero}"
+        self.azar = random.Random(f"carga:{config.semilla}:{numero}")
+        self.resultado = ResultadoCarga()
+
+    def paso(self, paso: str, funcion: Callable[..., Any], *argumentos: Any) -> Any:
+        """
+        Ejecuta y mide un paso.
+
+        Returns:
+            Any: Lo que devolvió `funcion`, o None si falló, lanzó una excepción
+            o devolvió False/None
+        """
+        bloqueos = self.contador.delHilo()
+        antes = bloqueos.copy()
+        inicio = time.perf_counter()
+        valor = None
+        try:
+            valor = funcion(*argumentos)
+            resultado = "ok" if valor is not None and valor is not False else "fallo"
+        except Exception as e:
+            resultado = _clasificar(e)
+            if resultado not in RESULTADOS_ESPERADOS:
+                self.resultado.mensajes[f"{paso}: {type(e).__name__}: {e}"[:200]] += 1
+        self.resultado.latencias[paso].registrar(time.perf_counter() - inicio)
+        if resultado == "fallo":
+            # El DAO tragó el error: si este hilo registró un bloqueo durante el paso, esa fue la causa
+            nuevos = bloqueos - antes
+            resultado = next((tipo for tipo in CODIGOS_BLOQUEO.values() if nuevos[tipo]), resultado)
+        self.resultado.resultados[paso][resultado] += 1
+        return valor if resultado == "ok" else None
+
+    def correr(self, barrera: Optional[threading.Barrier] = None) -> None:
+        if barrera is not None:
+            barrera.wait()
+        self.resultado.inicio = time.time()
+        for _ in range(self.config.sesiones):
+            self.sesion()
+        self.resultado.fin = time.time()
+        self.resultado.bloqueos = self.contador.delHilo().copy()
+
+    def sesion(self) -> None:
+        resultado = self.resultado
+        resultado.sesiones += 1
+        usuario = self.paso("login", UserDTO().validarLogin, self.run, CLAVE_EMPLEADOS, self.origen)
+        if usuario is None:
+            return
+        self._pausar()
+        inicio = self.config.desde + timedelta(days=self.azar.randrange(self.config.horizonte))
+        fin = inicio + timedelta(days=self.azar.randint(1, 7))
+        vehiculos = self.paso("disponibles", VehiculoDTO().listarVehiculosDisponiblesEntre,
+                              inicio.isoformat(), fin.isoformat())
+        if not vehiculos:
+            resultado.sin_disponibles += vehiculos is not None
+            return
+        vehiculo = self.azar.choice(vehiculos[:self.config.preferidos])
+        self._pausar()
+        uf = self.paso("cotizar", IndicadorService.obtener_uf_por_fecha, inicio.isoformat())
+        if uf is None:
+            return
+        costo = round((fin - inicio).days * vehiculo.getPrecioDiario() * uf.getValor())
+        id_cliente = self.azar.choice(self.clientes)
+        self._pausar()
+        if not self.paso("arrendar", ArriendoDTO().registrarArriendo, vehiculo.getIdVehiculo(), id_cliente,
+                         usuario.getIdEmpleado(), inicio.isoformat(), fin.isoformat(), costo,
+                         uf.getValor(), uf.getFechaCorta()):
+            return
+        reserva = Reserva(vehiculo.getIdVehiculo(), inicio, fin, time.time())
+        if self.azar.random() < self.config.proporcion_cancelados:
+            self._pausar()
+            pedida = time.time()
+            if not self.paso("cancelar", self._cancelar, reserva, id_cliente, usuario.getIdEmpleado()):
+                resultado.reservas.append(reserva)
+                return
+            reserva = reserva._replace(cancelada=pedida)
+        resultado.reservas.append(reserva)
+        resultado.completas += 1
+
+    def _cancelar(self, reserva: Reserva, id_cliente: int, id_empleado: int) -> bool:
+        """Busca el arriendo recién creado entre los activos del rango (como en el mesón) y lo cancela."""
+        dto = ArriendoDTO()
+        propios = [a.getIdArriendo() for a in dto.listarArriendosSolapados(reserva.inicio.isoformat(),
+                                                                          reserva.fin.isoformat(), "activo")
+                   if (a.getIdVehiculo(), a.getIdCliente(), a.getIdEmpleado(), str(a.getFechaInicio())[:10])
+                   == (reserva.id_vehiculo, id_cliente, id_empleado, reserva.inicio.isoformat())]
+        return bool(propios) and dto.cancelarArriendo(max(propios), reserva.id_vehiculo)
+
+    def _pausar(self) -> None:
+        if self.config.pausa:
+            time.sleep(self.azar.uniform(0, self.config.pausa))
+
+
+def cache_uf_sintetica(desde: date, hasta: date, semilla: int = 1) -> CacheUF:
+    """
+    Caché de UF en memoria con la `SerieUF` sintética de [desde, hasta).
+
+    Las cotizaciones de la carga no dependen de mindicador.cl ni de su
+    latencia, y usan los mismos valores que `GeneradorDatos`.
+    """
+    serie = SerieUF(desde, hasta, semilla)
+    cache = CacheUF(":memory:", ttl_hoy=float("inf"))
+    dia = desde
+    while dia < hasta:
+        fecha = dia.isoformat()
+        cache.guardar(fecha, IndicadorEconomico("uf", f"{fecha}T03:00:00.000Z", serie.valor(dia)))
+        dia += timedelta(days=1)
+    return cache
+
+
+def ejecutar_empleados(config: ConfiguracionCarga, empleados: Sequence[Tuple[int, str]],
+                       clientes: Sequence[int]) -> ResultadoCarga:
+    """
+    Corre un hilo por empleado en este proceso y junta sus resultados.
+
+    Mientras dura la carga reemplaza el limitador de login (salvo
+    `limitar_login`) y la caché de UF (con `uf_sintetica`), y escucha el log
+    para contar deadlocks.
+
+    Args:
+        config (ConfiguracionCarga): Parámetros de la corrida
+        empleados (Sequence[Tuple[int, str]]): (número de empleado, RUN con el que inicia sesión)
+        clientes (Sequence[int]): IDs de clientes a los que se arrienda
+
+    Returns:
+        ResultadoCarga: Resultados combinados de los empleados
+    """
+    contador = ContadorBloqueos()
+    raiz = logging.getLogger()
+    raiz.addHandler(contador)
+    limitador_anterior = cache_anterior = None
+    if not config.limitar_login:
+        sin_limite = PoliticaLimite(capacidad=10 ** 9, recarga=10.0 ** 9, max_fallos=10 ** 9)
+        limitador_anterior = configurar_limitador(LimitadorLogin(sin_limite, sin_limite))
+    if config.uf_sintetica:
+        cache_anterior = configurar_cache_uf(cache_uf_sintetica(
+            config.desde, config.desde + timedelta(days=config.horizonte), config.semilla))
+    meson = [Empleado(numero, run, clientes, config, contador) for numero, run in empleados]
+    barrera = threading.Barrier(len(meson))
+    hilos = [threading.Thread(target=empleado.correr, args=(barrera,), name=f"empleado-{empleado.numero}")
+             for empleado in meson]
+    try:
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    finally:
+        raiz.removeHandler(contador)
+        if not config.limitar_login:
+            configurar_limitador(limitador_anterior)
+        if config.uf_sintetica:
+            configurar_cache_uf(cache_anterior)
+    total = ResultadoCarga()
+    for empleado in meson:
+        total.combinar(empleado.resultado)
+    return total
+
+
+def ejecutar_carga(config: ConfiguracionCarga) -> ResultadoCarga:
+    """
+    Corre `config.empleados` empleados de mesón contra los DTOs de la base configurada (DB_NAME).
+
+    Los empleados inician sesión con los RUNs existentes (rotando si hay
+    menos que empleados) y la contraseña `CLAVE_EMPLEADOS` del generador.
+    Con `procesos` > 1 los empleados se reparten entre procesos nuevos
+    (spawn), cada uno con su pool de conexiones e índice de disponibilidad.
+
+    Args:
+        config (ConfiguracionCarga): Parámetros de la corrida
+
+    Returns:
+        ResultadoCarga: Resultados de todos los empleados
+
+    Raises:
+        ValueError: Si la base no tiene empleados o clientes
+    """
+    runs = [usuario.getRun() for usuario in UserDTO().listarUsuarios()]
+    clientes = [cliente.getIdCliente() for cliente in ClienteDTO().paginarClientes(limite=1000).getElementos()]
+    if not runs or not clientes:
+        raise ValueError("La base no tiene empleados o clientes; siembre primero el esquema")
+    empleados = [(numero, runs[numero % len(runs)]) for numero in range(config.empleados)]
+    procesos = max(1, min(config.procesos, config.empleados))
+    if procesos == 1:
+        return ejecutar_empleados(config, empleados, clientes)
+    grupos = [empleados[i::procesos] for i in range(procesos)]
+    total = ResultadoCarga()
+    with ProcessPoolExecutor(procesos, mp_context=multiprocessing.get_context("spawn")) as ejecutor:
+        for parte in ejecutor.map(ejecutar_empleados, [config] * procesos, grupos, [clientes] * procesos):
+            total.combinar(parte)
+    return total
+
+
+def dobles_reservas(reservas: Iterable[Reserva]) -> List[Tuple[Reserva, Reserva]]:
+    """
+    Pares de reservas del mismo vehículo con fechas solapadas que estuvieron confirmadas a la vez.
+
+    Como el intervalo de cada `Reserva` queda dentro del tiempo en que el
+    arriendo estuvo realmente activo, cada par encontrado es una doble
+    reserva segura (puede faltar alguna, nunca sobra).
+    """
+    por_vehiculo: Dict[int, List[Reserva]] = defaultdict(list)
+    for reserva in reservas:
+        por_vehiculo[reserva.id_vehiculo].append(reserva)
+    pares = []
+    for lista in por_vehiculo.values():
+        lista.sort(key=lambda r: r.inicio)
+        for i, a in enumerate(lista):
+            for b in lista[i + 1:]:
+                if b.inicio >= a.fin:
+                    break
+                if (a.cancelada or math.inf) > b.confirmada and (b.cancelada or math.inf) > a.confirmada:
+                    pares.append((a, b))
+    return pares
+
+
+def solapes_en_bd(desde: date, hasta: date) -> List[Tuple[int, int]]:
+    """
+    Pares (id_arriendo, id_arriendo) activos del mismo vehículo que se solapan en [desde, hasta).
+
+    Returns:
+        List[Tuple[int, int]]: Vacía si la base quedó consistente
+    """
+    por_vehiculo: Dict[int, List[Tuple[str, str, int]]] = defaultdict(list)
+    for arriendo in ArriendoDTO().listarArriendosSolapados(desde.isoformat(), hasta.isoformat(), "activo"):
+        por_vehiculo[arriendo.getIdVehiculo()].append((str(arriendo.getFechaInicio())[:10],
+                                                       str(arriendo.getFechaFin())[:10], arriendo.getIdArriendo()))
+    pares = []
+    for lista in por_vehiculo.values():
+        lista.sort()
+        fin_mayor, id_mayor = "", None
+        for inicio, fin, id_arriendo in lista:
+            if inicio < fin_mayor:
+                pares.append((id_mayor, id_arriendo))
+            if fin > fin_mayor:
+                fin_mayor, id_mayor = fin, id_arriendo
+    return pares
+
+
+def generar_informe(resultado: ResultadoCarga, config: ConfiguracionCarga,
+                    solapes: Sequence[Tuple[int, int]] = ()) -> Dict[str, Any]:
+    """
+    Arma el informe JSON de una corrida.
+
+    Los conflictos (otro empleado reservó el vehículo primero) son el
+    resultado correcto de una competencia y no cuentan como error; los
+    deadlocks sí, igual que los fallos, rechazos del limitador o del pool.
+
+    Args:
+        resultado (ResultadoCarga): Resultados combinados
+        config (ConfiguracionCarga): Parámetros de la corrida
+        solapes (Sequence[Tuple[int, int]]): Salida de `solapes_en_bd`
+
+    Returns:
+        Dict[str, Any]: Informe serializable
+    """
+    duracion = max(resultado.fin - resultado.inicio, 1e-9) if resultado.fin else 0.0
+    pasos = {}
+    for paso in PASOS:
+        histograma, conteos = resultado.latencias[paso], resultado.resultados[paso]
+        llamadas = sum(conteos.values())
+        errores = llamadas - sum(conteos[r] for r in RESULTADOS_ESPERADOS)
+        pasos[paso] = {
+            "llamadas": llamadas,
+            "por_segundo": round(llamadas / duracion, 2) if duracion else 0.0,
+            "p50_ms": round(histograma.percentil(50) * 1000, 3),
+            "p95_ms": round(histograma.percentil(95) * 1000, 3),
+            "p99_ms": round(histograma.percentil(99) * 1000, 3),
+            "max_ms": round(histograma.maximo * 1000, 3),
+            "tasa_error": round(errores / llamadas, 4) if llamadas else 0.0,
+            "resultados": dict(conteos),
+        }
+    configuracion = config._asdict()
+    configuracion["desde"] = config.desde.isoformat()
+    return {
+        "version": VERSION_INFORME,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "configuracion": configuracion,
+        "duracion_s": round(duracion, 3),
+        "sesiones": resultado.sesiones,
+        "sesiones_completas": resultado.completas,
+        "sesiones_sin_disponibles": resultado.sin_disponibles,
+        "sesiones_por_s": round(resultado.sesiones / duracion, 2) if duracion else 0.0,
+        "arriendos_por_s": round(len(resultado.reservas) / duracion, 2) if duracion else 0.0,
+        "conflictos": resultado.resultados["arrendar"]["conflicto"],
+        "deadlocks": resultado.bloqueos["deadlock"],
+        "esperas_bloqueo": resultado.bloqueos["espera_bloqueo"],
+        "dobles_reservas": len(dobles_reservas(resultado.reservas)),
+        "solapes_en_bd": len(solapes),
+        "pasos": pasos,
+        "errores_frecuentes": resultado.mensajes.most_common(10),
+    }
@@ -0,0 +1,135 @@
+# benchmark/esquema.py
+import os
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pymysql
+
+#: Script con las tablas, índices, triggers, procedimientos y vistas de la aplicación
+SCRIPT_ESQUEMA = Path(__file__).resolve().parent.parent / "create_updated.sql"
+
+#: Base de datos de la aplicación, que las mediciones nunca deben tocar
+BASE_APLICACION = "viaja_seguro"
+
+_PATRON_BASE = re.compile(r"\b%s\b" % BASE_APLICACION)
+_PATRON_NOMBRE = re.compile(r"^[A-Za-z0-9_]{1,64}$")
+
+
+def dividir_script(script: str) -> List[str]:
+    """
+    Divide un script SQL en sentencias, como lo hace el cliente `mysql`.
+
+    Respeta `DELIMITER` (triggers y procedimientos con `;` en el cuerpo) y
+    omite las líneas de comentario completas.
+
+    Args:
+        script (str): Contenido del archivo .sql
+
+    Returns:
+        List[str]: Sentencias sin el delimitador final
+    """
+    sentencias: List[str] = []
+    actual: List[str] = []
+    delimitador = ";"
+    for linea in script.splitlines():
+        limpia = linea.strip()
+        if not limpia or limpia.startswith("--"):
+            continue
+        if limpia.upper().startswith("DELIMITER ") and not actual:
+            delimitador = limpia.split(None, 1)[1]
+            continue
+        if limpia.endswith(delimitador):
+            actual.append(linea.rstrip()[:-len(delimitador)])
+            sentencias.append("\n".join(actual).strip())
+            actual = []
+        else:
+            actual.append(linea)
+    if actual:
+        sentencias.append("\n".join(actual).strip())
+    return [sentencia for sentencia in sentencias if sentencia]
+
+
+def validar_nombre(nombre: str, protegidos: Iterable[str] = (BASE_APLICACION,)) -> str:
+    """
+    Verifica que el esquema de mediciones sea un identificador simple y no sea la base real.
+
+    Args:
+        nombre (str): Nombre del esquema
+        protegidos (Iterable[str]): Bases que no se pueden recrear
+
+    Returns:
+        str: El mismo nombre
+
+    Raises:
+        ValueError: Si el nombre no es válido o está protegido
+    """
+    if not _PATRON_NOMBRE.match(nombre):
+        raise ValueError(f"Nombre de esquema inválido: {nombre!r}")
+    if nombre.lower() in {p.lower() for p in protegidos}:
+        raise ValueError(f"{nombre} es la base de la aplicación; use un esquema aparte para las mediciones")
+    return nombre
+
+
+def sentencias_esquema(nombre: str, script: Optional[str] = None) -> List[str]:
+    """
+    Obtiene el DDL de la aplicación apuntado a otro esquema.
+
+    Omite los datos de ejemplo (`INSERT`) y las consultas informativas del final.
+
+    Args:
+        nombre (str): Esquema destino (ya validado)
+        script (Optional[str]): Script a usar (default: `create_updated.sql`)
+
+    Returns:
+        List[str]: Sentencias listas para ejecutar en orden
+    """
+    texto = script if script is not None else SCRIPT_ESQUEMA.read_text(encoding="utf-8")
+    return [_PATRON_BASE.sub(nombre, sentencia) for sentencia in dividir_script(texto)
+            if not sentencia.lstrip().upper().startswith(("INSERT", "SELECT"))]
+
+
+def conectar_servidor(base: Optional[str] = None) -> pymysql.connections.Connection:
+    """
+    Abre una conexión fuera del pool con los parámetros DB_* del entorno.
+
+    Args:
+        base (Optional[str]): Base a seleccionar (None: ninguna)
+
+    Returns:
+        pymysql.connections.Connection: Conexión en modo autocommit
+    """
+    return pymysql.connect(
+        host=os.environ.get("DB_HOST", "localhost"),
+        user=os.environ.get("DB_USER", "root"),
+        password=os.environ.get("DB_PASSWORD", ""),
+        database=base,
+        port=int(os.environ.get("DB_PORT", 3306)),
+        charset='utf8mb4',
+        autocommit=True
+    )
+
+
+def preparar_esquema(nombre: str, protegidos: Iterable[str] = (BASE_APLICACION,)) -> int:
+    """
+    Recrea desde cero el esquema de mediciones con el DDL de la aplicación.
+
+    Args:
+        nombre (str): Esquema a recrear (se borra si existe)
+        protegidos (Iterable[str]): Bases que no se pueden recrear
+
+    Returns:
+        int: Sentencias ejecutadas
+
+    Raises:
+        ValueError: Si el nombre no es válido o está protegido
+    """
+    sentencias = sentencias_esquema(validar_nombre(nombre, protegidos))
+    conn = conectar_servidor()
+    try:
+        with conn.cursor() as cursor:
+            for sentencia in sentencias:
+                cursor.execute(sentencia)
+    finally:
+        conn.close()
+    return len(sentencias)
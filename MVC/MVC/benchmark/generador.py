@@ -0,0 +1,386 @@
+# benchmark/generador.py
+import csv
+import heapq
+import logging
+import math
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+#: Contraseña de todos los empleados generados (para medir el login)
+CLAVE_EMPLEADOS = "Bench#2026"
+
+#: Fecha "de hoy" de los datos generados: separa el historial de las reservas futuras
+FECHA_REFERENCIA = date(2026, 1, 1)
+
+#: Demanda relativa por mes: vacaciones de verano e invierno, Fiestas Patrias y fin de año
+DEMANDA_MENSUAL = (1.5, 1.45, 0.85, 0.8, 0.75, 0.8, 1.15, 0.9, 1.2, 0.9, 0.95, 1.3)
+
+#: Días promedio entre arriendos de un vehículo y duración promedio (con demanda 1.0); con más
+#: demanda la espera se acorta mucho y la duración se alarga poco, así que hay más arriendos y más ocupación
+ESPERA_MEDIA = 3.5
+DURACION_MEDIA = 6.0
+
+#: UF del 10 de enero de 2026, desde donde se reajusta la serie hacia atrás y hacia adelante
+ANCLA_UF = (date(2026, 1, 10), 39_700.0)
+
+#: Columnas de cada tabla, en el orden de las filas generadas
+COLUMNAS: Dict[str, Tuple[str, ...]] = {
+    "empleado": ("id_empleado", "run", "password", "nombre", "apellido", "cargo"),
+    "cliente": ("id_cliente", "run", "nombre", "apellido", "direccion", "telefono"),
+    "vehiculo": ("id_vehiculo", "patente", "marca", "modelo", "año", "precio_diario", "estado"),
+    "arriendo": ("id_arriendo", "id_vehiculo", "id_cliente", "id_empleado", "fecha_inicio", "fecha_fin",
+                 "costo_total", "estado", "valor_uf_fecha", "fecha_uf_consulta"),
+}
+
+_CONSONANTES = "BCDFGHJKLPRSTVWXYZ"  # letras de las patentes de 4 letras (sin vocales, M, N, Ñ ni Q)
+_LETRAS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_RUN_MIN, _RUN_MAX = 5_000_000, 27_000_000  # cuerpos de RUN de personas adultas
+_MARCAS = (("Toyota", ("Corolla", "Yaris", "RAV4", "Hilux")), ("Kia", ("Rio", "Sportage", "Morning", "Soluto")),
+           ("Hyundai", ("Accent", "Tucson", "Creta")), ("Chevrolet", ("Sail", "Spark", "Tracker", "Groove")),
+           ("Nissan", ("Versa", "Kicks", "Navara")), ("Suzuki", ("Swift", "Vitara", "Baleno")),
+           ("Peugeot", ("208", "2008")), ("MG", ("ZS", "MG3")))
+_NOMBRES = ("Ana", "Carlos", "María", "Pedro", "Javiera", "Diego", "Camila", "Felipe", "Valentina", "Matías",
+            "Constanza", "Benjamín", "Francisca", "Joaquín", "Catalina", "Tomás", "Isidora", "Vicente")
+_APELLIDOS = ("González", "Muñoz", "Rojas", "Díaz", "Pérez", "Soto", "Contreras", "Silva", "Martínez",
+              "Sepúlveda", "Morales", "Rodríguez", "López", "Fuentes", "Hernández", "Torres", "Araya", "Flores")
+_CALLES = ("Av. Providencia", "Los Leones", "Av. Grecia", "Irarrázaval", "Av. Matta", "San Diego",
+           "Av. Pajaritos", "Gran Avenida", "Av. Vicuña Mackenna", "Los Alerces", "Av. Apoquindo")
+_COMUNAS = ("Santiago", "Providencia", "Ñuñoa", "Las Condes", "Maipú", "La Florida", "Puente Alto",
+            "San Miguel", "Estación Central", "Valparaíso", "Viña del Mar", "Concepción")
+
+
+class Dimensiones(NamedTuple):
+    """Cantidad de filas por tabla."""
+    arriendos: int
+    vehiculos: int
+    clientes: int
+    empleados: int
+
+
+def dimensiones(arriendos: int) -> Dimensiones:
+    """
+    Deriva el tamaño de flota, cartera de clientes y personal de la cantidad de arriendos.
+
+    Unos 150 arriendos por vehículo y 10 por cliente, con mínimos para que
+    la escala pequeña siga teniendo variedad.
+
+    Args:
+        arriendos (int): Arriendos a generar
+
+    Returns:
+        Dimensiones: Filas por tabla
+    """
+    return Dimensiones(arriendos, max(50, arriendos // 150), max(100, arriendos // 10),
+                       max(20, min(200, arriendos // 5000)))
+
+
+def digito_verificador(cuerpo: int) -> str:
+    """Calcula el dígito verificador (módulo 11) de un RUN."""
+    suma, factor = 0, 2
+    while cuerpo:
+        suma += (cuerpo % 10) * factor
+        cuerpo //= 10
+        factor = factor + 1 if factor < 7 else 2
+    resto = 11 - suma % 11
+    return "0" if resto == 11 else "K" if resto == 10 else str(resto)
+
+
+def run_valido(cuerpo: int) -> str:
+    """Forma un RUN `12345678-K` con su dígito verificador."""
+    return f"{cuerpo}-{digito_verificador(cuerpo)}"
+
+
+class _Permutacion:
+    """
+    Biyección pseudoaleatoria de [0, n) en sí mismo: `(a * i + b) mod n` con `a` coprimo a `n`.
+
+    Da identificadores únicos con aspecto aleatorio sin guardar los ya usados.
+    """
+
+    def __init__(self, n: int, azar: random.Random) -> None:
+        self.n = n
+        self.a = azar.randrange(n // 3, n) | 1
+        while math.gcd(self.a, n) != 1:
+            self.a += 2
+        self.b = azar.randrange(n)
+
+    def __call__(self, i: int) -> int:
+        return (self.a * i + self.b) % self.n
+
+
+def patente(indice: int, formato_letras: bool) -> str:
+    """
+    Forma una patente válida para `validar_patente` a partir de un índice de su espacio.
+
+    Args:
+        indice (int): Posición dentro de los 10.497.600 (`BCDF12`) o 17.576.000 (`ABC123`) valores posibles
+        formato_letras (bool): True para 4 letras + 2 dígitos, False para 3 letras + 3 dígitos
+
+    Returns:
+        str: Patente sin separadores
+    """
+    if formato_letras:
+        resto, numero = divmod(indice, 100)
+        letras = []
+        for _ in range(4):
+            resto, k = divmod(resto, len(_CONSONANTES))
+            letras.append(_CONSONANTES[k])
+        return "".join(letras) + f"{numero:02d}"
+    resto, numero = divmod(indice, 1000)
+    letras = []
+    for _ in range(3):
+        resto, k = divmod(resto, 26)
+        letras.append(_LETRAS[k])
+    return "".join(letras) + f"{numero:03d}"
+
+
+class SerieUF:
+    """
+    Valor diario sintético de la UF.
+
+    Como la UF real, se reajusta día a día entre el 10 de un mes y el 9 del
+    siguiente según el IPC del mes anterior (aquí simulado con una semilla
+    por mes), así que el valor de una fecha no depende de la ventana pedida.
+    Los valores de la ventana se calculan una vez y se consultan por ordinal.
+    """
+
+    def __init__(self, desde: date, hasta: date, semilla: int = 1,
+                 ipc_medio: float = 0.003, volatilidad: float = 0.002) -> None:
+        """
+        Calcula la serie para [desde, hasta).
+
+        Args:
+            desde (date): Primer día
+            hasta (date): Día siguiente al último
+            semilla (int): Semilla del IPC simulado
+            ipc_medio (float): Variación mensual promedio del IPC
+            volatilidad (float): Desviación estándar de la variación mensual
+        """
+        self._semilla = semilla
+        self._ipc_medio = ipc_medio
+        self._volatilidad = volatilidad
+        self._base = desde.toordinal()
+        self._valores: List[float] = []
+        mes, valor_mes = self._mesAncla()
+        # Retrocede desde el ancla hasta el período (del 10 al 9) que contiene `desde`
+        while self._diezDe(mes) > desde:
+            mes -= 1
+            valor_mes /= 1 + self._ipc(mes)
+        ipc = self._ipc(mes)
+        dia = desde
+        while dia < hasta:
+            while self._diezDe(mes + 1) <= dia:
+                valor_mes *= 1 + ipc
+                mes += 1
+                ipc = self._ipc(mes)
+            inicio = self._diezDe(mes)
+            largo = (self._diezDe(mes + 1) - inicio).days
+            self._valores.append(round(valor_mes * (1 + ipc) ** ((dia - inicio).days / largo), 2))
+            dia += timedelta(days=1)
+
+    @staticmethod
+    def _diezDe(mes: int) -> date:
+        return date(mes // 12, mes % 12 + 1, 10)
+
+    @staticmethod
+    def _mesAncla() -> Tuple[int, float]:
+        fecha, valor = ANCLA_UF
+        return fecha.year * 12 + fecha.month - 1, valor
+
+    def _ipc(self, mes: int) -> float:
+        """Variación del IPC del mes `mes` (año * 12 + mes - 1), que reajusta la UF del 10 en adelante."""
+        return random.Random(f"ipc:{self._semilla}:{mes}").gauss(self._ipc_medio, self._volatilidad)
+
+    def valor(self, fecha: date) -> float:
+        """Valor de la UF en una fecha de la ventana."""
+        return self._valores[fecha.toordinal() - self._base]
+
+
+class GeneradorDatos:
+    """
+    Genera empleados, clientes, vehículos y arriendos consistentes con `create_updated.sql`.
+
+    Todo es determinista dado `semilla` y las dimensiones, y cada tabla se
+    entrega como un iterador de tuplas (en el orden de `COLUMNAS`), así que
+    millones de arriendos se escriben sin acumularlos en memoria: lo único
+    que se mantiene es un recorrido en curso por vehículo.
+
+    - RUNs y patentes son únicos y válidos (dígito verificador, formatos
+      `BCDF12` y `ABC123`), obtenidos de una permutación del índice.
+    - Los arriendos de un vehículo nunca se solapan (intervalos semiabiertos);
+      la espera entre arriendos se acorta y la duración se alarga en los meses
+      de mayor demanda (`DEMANDA_MENSUAL`).
+    - Se emiten ordenados por fecha de inicio, así que los IDs crecen con el
+      tiempo como en la aplicación real.
+    - El costo es días × precio diario (UF) × UF del día de inicio (`SerieUF`).
+    - Los arriendos que terminan antes de `fecha_referencia` quedan
+      finalizados, el resto activos (un 5 % cancelados), y los vehículos con
+      uno en curso ese día quedan "arrendado".
+    """
+
+    def __init__(self, dims: Dimensiones, semilla: int = 1, fecha_referencia: date = FECHA_REFERENCIA,
+                 hash_clave: Optional[str] = None, proporcion_cancelados: float = 0.05) -> None:
+        """
+        Inicializa el generador.
+
+        Args:
+            dims (Dimensiones): Filas por tabla
+            semilla (int): Semilla de todos los datos
+            fecha_referencia (date): "Hoy" de los datos generados
+            hash_clave (Optional[str]): Hash bcrypt de la contraseña de los empleados
+                (default: `CLAVE_EMPLEADOS` encriptada al pedir los empleados)
+            proporcion_cancelados (float): Fracción de arriendos cancelados
+        """
+        if min(dims) < 1:
+            raise ValueError(f"Dimensiones inválidas: {dims}")
+        if dims.clientes + dims.empleados > _RUN_MAX - _RUN_MIN:
+            raise ValueError("Demasiadas personas para RUNs únicos")
+        self.dims = dims
+        self.semilla = semilla
+        self.fecha_referencia = fecha_referencia
+        self.proporcion_cancelados = proporcion_cancelados
+        self._hash_clave = hash_clave
+        self._referencia = fecha_referencia.toordinal()
+        azar = random.Random(f"permutaciones:{semilla}")
+        self._runs = _Permutacion(_RUN_MAX - _RUN_MIN, azar)
+        self._patentes_letras = _Permutacion(len(_CONSONANTES) ** 4 * 100, azar)
+        self._patentes_numeros = _Permutacion(26 ** 3 * 1000, azar)
+        # Días por arriendo (espera + duración, truncadas a días) promediados por arriendo, no por mes:
+        # la historia de cada vehículo termina en promedio un mes después de la referencia
+        ciclos = [1 / math.expm1(d ** 2 / ESPERA_MEDIA) + 1 + 1 / math.expm1(1 / ((DURACION_MEDIA - 1) * d ** 0.25))
+                  for d in DEMANDA_MENSUAL]
+        ciclo = len(ciclos) / sum(1 / c for c in ciclos)
+        self._desde = fecha_referencia - timedelta(days=int(dims.arriendos / dims.vehiculos * ciclo))
+        self._uf: Optional[SerieUF] = None
+
+    def filas(self, tabla: str) -> Iterator[Tuple]:
+        """Iterador de filas de `tabla` ("empleado", "cliente", "vehiculo" o "arriendo")."""
+        return {"empleado": self.empleados, "cliente": self.clientes,
+                "vehiculo": self.vehiculos, "arriendo": self.arriendos}[tabla]()
+
+    def empleados(self) -> Iterator[Tuple]:
+        if self._hash_clave is None:
+            from utils.encoder import Encoder
+            self._hash_clave = Encoder().encode(CLAVE_EMPLEADOS)
+        azar = random.Random(f"empleados:{self.semilla}")
+        for i in range(1, self.dims.empleados + 1):
+            yield (i, self._run(self.dims.clientes + i - 1), self._hash_clave, azar.choice(_NOMBRES),
+                   azar.choice(_APELLIDOS), "gerente" if i % 25 == 1 else "empleado")
+
+    def clientes(self) -> Iterator[Tuple]:
+        azar = random.Random(f"clientes:{self.semilla}")
+        for i in range(1, self.dims.clientes + 1):
+            yield (i, self._run(i - 1), azar.choice(_NOMBRES), azar.choice(_APELLIDOS),
+                   f"{azar.choice(_CALLES)} {azar.randint(1, 9999)}, {azar.choice(_COMUNAS)}",
+                   f"+569{azar.randint(20_000_000, 99_999_999)}")
+
+    def vehiculos(self) -> Iterator[Tuple]:
+        for i in range(1, self.dims.vehiculos + 1):
+            patente_, marca, modelo, año, precio, en_mantencion = self._vehiculo(i)
+            if self._arrendadoEnReferencia(i):
+                estado = "arrendado"
+            else:
+                estado = "mantencion" if en_mantencion else "disponible"
+            yield (i, patente_, marca, modelo, año, precio, estado)
+
+    def arriendos(self) -> Iterator[Tuple]:
+        uf = self.serieUF()
+        azar = random.Random(f"arriendos:{self.semilla}")
+        clientes, empleados = self.dims.clientes, self.dims.empleados
+        precios = [0.0] + [self._vehiculo(i)[4] for i in range(1, self.dims.vehiculos + 1)]
+        recorridos = [self._recorrido(i) for i in range(1, self.dims.vehiculos + 1)]
+        for id_arriendo, (inicio, fin, id_vehiculo, cancelado) in enumerate(heapq.merge(*recorridos), start=1):
+            fecha_inicio = date.fromordinal(inicio)
+            if cancelado:
+                estado = "cancelado"
+            else:
+                estado = "finalizado" if fin <= self._referencia else "activo"
+            valor_uf = uf.valor(fecha_inicio)
+            # Clientes frecuentes: los primeros IDs arriendan más seguido
+            yield (id_arriendo, id_vehiculo, 1 + int(clientes * azar.random() ** 1.6),
+                   1 + int(empleados * azar.random()), fecha_inicio, date.fromordinal(fin),
+                   round((fin - inicio) * precios[id_vehiculo] * valor_uf), estado, valor_uf, fecha_inicio)
+
+    def serieUF(self) -> SerieUF:
+        """Serie de UF que cubre todas las fechas de inicio posibles."""
+        if self._uf is None:
+            hasta = self.fecha_referencia + timedelta(days=int(self.dims.arriendos / self.dims.vehiculos * 2) + 400)
+            self._uf = SerieUF(self._desde - timedelta(days=31), hasta, self.semilla)
+        return self._uf
+
+    def _run(self, indice: int) -> str:
+        return run_valido(_RUN_MIN + self._runs(indice))
+
+    def _vehiculo(self, id_vehiculo: int) -> Tuple[str, str, str, int, float, bool]:
+        """Atributos fijos de un vehículo, derivados solo de la semilla y su ID."""
+        azar = random.Random(f"vehiculo:{self.semilla}:{id_vehiculo}")
+        # Dos de cada tres patentes con el formato de 4 letras, intercaladas
+        if id_vehiculo % 3:
+            patente_ = patente(self._patentes_letras(id_vehiculo - id_vehiculo // 3 - 1), True)
+        else:
+            patente_ = patente(self._patentes_numeros(id_vehiculo // 3 - 1), False)
+        marca, modelos = azar.choice(_MARCAS)
+        return (patente_, marca, azar.choice(modelos), azar.randint(2015, 2025),
+                round(azar.uniform(0.8, 2.5), 2), azar.random() < 0.03)
+
+    def _cantidad(self, id_vehiculo: int) -> int:
+        por_vehiculo, sobrantes = divmod(self.dims.arriendos, self.dims.vehiculos)
+        return por_vehiculo + (1 if id_vehiculo <= sobrantes else 0)
+
+    def _recorrido(self, id_vehiculo: int) -> Iterator[Tuple[int, int, int, bool]]:
+        """(inicio, fin, id_vehiculo, cancelado) consecutivos y sin solape, con fechas como ordinal."""
+        azar = random.Random(f"recorrido:{self.semilla}:{id_vehiculo}")
+        dia = self._desde.toordinal() + azar.randrange(61)
+        for _ in range(self._cantidad(id_vehiculo)):
+            demanda = DEMANDA_MENSUAL[date.fromordinal(dia).month - 1]
+            dia += int(azar.expovariate(demanda ** 2 / ESPERA_MEDIA))
+            duracion = min(30, 1 + int(azar.expovariate(1 / ((DURACION_MEDIA - 1) * demanda ** 0.25))))
+            yield dia, dia + duracion, id_vehiculo, azar.random() < self.proporcion_cancelados
+            dia += duracion
+
+    def _arrendadoEnReferencia(self, id_vehiculo: int) -> bool:
+        for inicio, fin, _, cancelado in self._recorrido(id_vehiculo):
+            if inicio > self._referencia:
+                return False
+            if fin > self._referencia and not cancelado:
+                return True
+        return False
+
+
+def escribir_csv(generador: GeneradorDatos, carpeta: str,
+                 tablas: Sequence[str] = ("empleado", "cliente", "vehiculo", "arriendo")) -> Dict[str, int]:
+    """
+    Escribe un CSV por tabla (`<tabla>.csv`, UTF-8, con encabezado) en streaming.
+
+    Los encabezados son los nombres de columna de la base, así que los
+    archivos sirven para `LOAD DATA INFILE ... IGNORE 1 LINES` y los de
+    vehículos y clientes también para `importar_csv.py`.
+
+    Args:
+        generador (GeneradorDatos): Fuente de filas
+        carpeta (str): Carpeta destino (se crea si no existe)
+        tablas (Sequence[str]): Tablas a escribir
+
+    Returns:
+        Dict[str, int]: Filas escritas por tabla
+    """
+    destino = Path(carpeta)
+    destino.mkdir(parents=True, exist_ok=True)
+    escritas = {}
+    for tabla in tablas:
+        inicio = time.perf_counter()
+        with open(destino / f"{tabla}.csv", "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(COLUMNAS[tabla])
+            total = 0
+            for fila in generador.filas(tabla):
+                escritor.writerow(fila)
+                total += 1
+        escritas[tabla] = total
+        logger.info("%s.csv: %d filas en %.1f s", tabla, total, time.perf_counter() - inicio)
+    return escritas
@@ -0,0 +1,102 @@
+# benchmark/sembrado.py
+import logging
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+from utils.encoder import Encoder
+from benchmark.generador import CLAVE_EMPLEADOS, COLUMNAS, Dimensiones, GeneradorDatos, dimensiones
+
+logger = logging.getLogger(__name__)
+
+#: Puntos de escala disponibles (cantidad de arriendos)
+ESCALAS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def _insertar(cursor: Any, sql: str, filas: Iterable[Tuple], lote: int) -> int:
+    total = 0
+    pendientes: List[Tuple] = []
+    for fila in filas:
+        pendientes.append(fila)
+        if len(pendientes) >= lote:
+            cursor.executemany(sql, pendientes)
+            total += len(pendientes)
+            pendientes = []
+    if pendientes:
+        cursor.executemany(sql, pendientes)
+        total += len(pendientes)
+    return total
+
+
+#: Tablas en orden de claves foráneas
+_TABLAS = ("empleado", "cliente", "vehiculo", "arriendo")
+
+
+def _sql_insert(tabla: str) -> str:
+    columnas = COLUMNAS[tabla]
+    return f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({', '.join(['%s'] * len(columnas))})"
+
+
+def sembrar(conn: Any, arriendos: int, semilla: int = 1, lote: int = 5000) -> Dimensiones:
+    """
+    Llena un esquema recién creado con datos sintéticos deterministas.
+
+    Las filas salen de `GeneradorDatos` y se insertan por lotes a medida que
+    se generan. La misma semilla y escala producen exactamente las mismas
+    filas (con IDs explícitos desde 1), de modo que dos corridas del
+    benchmark miden sobre datos idénticos.
+
+    Args:
+        conn: Conexión pymysql con el esquema de mediciones seleccionado
+        arriendos (int): Arriendos a sembrar (el resto de las tablas se deriva)
+        semilla (int): Semilla del generador
+        lote (int): Filas por `executemany`
+
+    Returns:
+        Dimensiones: Filas insertadas por tabla
+    """
+    dims = dimensiones(arriendos)
+    generador = GeneradorDatos(dims, semilla, hash_clave=Encoder().encode(CLAVE_EMPLEADOS))
+    with conn.cursor() as cursor:
+        cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+        try:
+            inicio = time.perf_counter()
+            for tabla in _TABLAS:
+                filas = _insertar(cursor, _sql_insert(tabla), generador.filas(tabla), lote)
+                conn.commit()
+                logger.info("Sembradas %d filas en %s (%.1f s)", filas, tabla, time.perf_counter() - inicio)
+        finally:
+            cursor.execute("SET SESSION foreign_key_checks = 1, unique_checks = 1")
+        for tabla in _TABLAS:
+            cursor.execute(f"ANALYZE TABLE {tabla}")
+            cursor.fetchall()
+    return dims
+
+
+def registrar_siembra(conn: Any, escala: str, semilla: int, dims: Dimensiones) -> None:
+    """Deja en el esquema con qué escala y semilla se sembró, para que los informes lo declaren."""
+    with conn.cursor() as cursor:
+        cursor.execute("""CREATE TABLE IF NOT EXISTS benchmark_siembra (
+                              escala VARCHAR(10) NOT NULL, semilla INT NOT NULL, arriendos INT NOT NULL,
+                              vehiculos INT NOT NULL, clientes INT NOT NULL, empleados INT NOT NULL,
+                              create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""")
+        cursor.execute("DELETE FROM benchmark_siembra")
+        cursor.execute("INSERT INTO benchmark_siembra (escala, semilla, arriendos, vehiculos, clientes, empleados) "
+                       "VALUES (%s, %s, %s, %s, %s, %s)", (escala, semilla) + tuple(dims))
+    conn.commit()
+
+
+def leer_siembra(conn: Any) -> Optional[Tuple[str, int, Dimensiones]]:
+    """
+    Lee la escala, semilla y dimensiones con que se sembró el esquema.
+
+    Returns:
+        Optional[Tuple[str, int, Dimensiones]]: None si el esquema no fue sembrado por `sembrar`
+    """
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT escala, semilla, arriendos, vehiculos, clientes, empleados FROM benchmark_siembra")
+            fila = cursor.fetchone()
+    except Exception as e:
+        logger.debug("Esquema sin registro de siembra: %s", e)
+        return None
+    return (fila[0], fila[1], Dimensiones(*fila[2:])) if fila else None
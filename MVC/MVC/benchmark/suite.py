@@ -0,0 +1,699 @@
+# benchmark/suite.py
+import itertools
+import logging
+import math
+import platform
+import random
+import statistics
+import subprocess
+import time
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmark.generador import CLAVE_EMPLEADOS, FECHA_REFERENCIA, run_valido
+from conex.conn import UnidadDeTrabajo
+from dao.dao_arriendo import DaoArriendo
+from dao.dao_cliente import DaoCliente
+from dao.dao_informe import DaoInforme
+from dao.dao_user import daoUser
+from dao.dao_vehiculo import DaoVehiculo
+from dto.dto_arriendo import ArriendoDTO
+from dto.dto_cliente import ClienteDTO
+from dto.dto_informe import InformeDTO
+from dto.dto_user import UserDTO
+from dto.dto_vehiculo import VehiculoDTO
+from modelo.arriendo import Arriendo
+from modelo.cliente import Cliente
+from modelo.user import User
+from modelo.vehiculo import Vehiculo
+from servicio.analitica import ESTADOS_ARRIENDO
+from servicio.disponibilidad import invalidar_motor_disponibilidad
+from utils.encoder import Encoder
+from utils.limitador import LimitadorLogin, PoliticaLimite, configurar_limitador
+
+logger = logging.getLogger(__name__)
+
+#: Clases cuyos métodos públicos se miden (todos deben tener un caso)
+CLASES_MEDIDAS = (DaoVehiculo, DaoCliente, daoUser, DaoInforme, DaoArriendo,
+                  VehiculoDTO, ClienteDTO, UserDTO, ArriendoDTO, InformeDTO)
+
+#: Métodos públicos que no se miden: los invoca `__exit__` al cerrar el DAO
+METODOS_EXCLUIDOS = frozenset({"cerrar"})
+
+#: Filas por llamada en los casos de inserción por lote
+TAMANO_LOTE = 50
+
+#: Versión del formato JSON de los informes
+VERSION_INFORME = 1
+
+
+class Contexto:
+    """
+    Muestra fija del esquema sembrado y generador de valores nuevos para los casos.
+
+    Los argumentos de cada repetición se eligen con un `random.Random`
+    sembrado, así que dos corridas sobre los mismos datos hacen exactamente
+    las mismas llamadas.
+    """
+
+    def __init__(self, vehiculos: Sequence[Tuple[int, str, str]], clientes: Sequence[Tuple[int, str]],
+                 empleados: Sequence[Tuple[int, str]], arriendos: Sequence[Tuple[int, int, date, date]],
+                 semilla: int = 1, ultimo_fin: Optional[date] = None) -> None:
+        """
+        Inicializa el contexto con la muestra ya leída.
+
+        Args:
+            vehiculos: (id_vehiculo, patente, estado)
+            clientes: (id_cliente, run)
+            empleados: (id_empleado, run)
+            arriendos: (id_arriendo, id_vehiculo, fecha_inicio, fecha_fin)
+            semilla (int): Semilla de la elección de argumentos
+            ultimo_fin (Optional[date]): Último `fecha_fin` del esquema (default: el de la muestra)
+        """
+        if not (vehiculos and clientes and empleados and arriendos):
+            raise ValueError("El esquema de mediciones está vacío; ejecute primero 'preparar'")
+        self.azar = random.Random(semilla)
+        self._vehiculos = list(vehiculos)
+        self._arrendables = [v for v in vehiculos if v[2] in ("disponible", "arrendado")] or self._vehiculos
+        self._clientes = list(clientes)
+        self._empleados = list(empleados)
+        self._arriendos = list(arriendos)
+        # Las reservas nuevas van después de todo lo sembrado: nunca chocan entre sí ni con los datos
+        self._futuro = max([ultimo_fin or date.min] + [a[3] for a in arriendos]) + timedelta(days=60)
+        self._secuencia = itertools.count(1)
+        self.hash_clave = Encoder().encode(CLAVE_EMPLEADOS)
+
+    @classmethod
+    def cargar(cls, conn: Any, semilla: int = 1, muestra: int = 1000) -> 'Contexto':
+        """
+        Lee una muestra reproducible del esquema sembrado.
+
+        Args:
+            conn: Conexión pymysql al esquema de mediciones
+            semilla (int): Semilla de la muestra y de la elección de argumentos
+            muestra (int): Filas leídas por tabla
+
+        Returns:
+            Contexto: Contexto listo para `ejecutar_suite`
+        """
+        consultas = {
+            "vehiculos": "SELECT id_vehiculo, patente, estado FROM vehiculo",
+            "clientes": "SELECT id_cliente, run FROM cliente",
+            "empleados": "SELECT id_empleado, run FROM empleado",
+            "arriendos": "SELECT id_arriendo, id_vehiculo, fecha_inicio, fecha_fin FROM arriendo",
+        }
+        filas = {}
+        with conn.cursor() as cursor:
+            for nombre, sql in consultas.items():
+                cursor.execute(f"{sql} ORDER BY RAND(%s) LIMIT %s", (semilla, muestra))
+                filas[nombre] = cursor.fetchall()
+            cursor.execute("SELECT MAX(fecha_fin) FROM arriendo")
+            ultimo_fin = cursor.fetchone()[0]
+        return cls(semilla=semilla, ultimo_fin=ultimo_fin, **filas)
+
+    def vehiculo(self) -> Tuple[int, str, str]:
+        return self.azar.choice(self._vehiculos)
+
+    def cliente(self) -> Tuple[int, str]:
+        return self.azar.choice(self._clientes)
+
+    def empleado(self) -> Tuple[int, str]:
+        return self.azar.choice(self._empleados)
+
+    def arriendo(self) -> Tuple[int, int, date, date]:
+        return self.azar.choice(self._arriendos)
+
+    def ids(self, tabla: str, cantidad: int = 100) -> List[int]:
+        """IDs distintos de la muestra de `vehiculos`, `clientes` o `arriendos`."""
+        filas = getattr(self, "_" + tabla)
+        return [fila[0] for fila in self.azar.sample(filas, min(cantidad, len(filas)))]
+
+    def fecha(self) -> str:
+        """Un día en que hay arriendos en curso."""
+        _, _, inicio, fin = self.arriendo()
+        return (inicio + timedelta(days=self.azar.randrange((fin - inicio).days))).isoformat()
+
+    def rango(self, dias: int = 7) -> Tuple[str, str]:
+        desde = date.fromisoformat(self.fecha())
+        return desde.isoformat(), (desde + timedelta(days=dias)).isoformat()
+
+    def patenteNueva(self) -> str:
+        """Patente `AEBC12`: la flota generada no usa vocales en las patentes de 4 letras, así que no choca."""
+        n = next(self._secuencia)
+        return f"AE{chr(65 + n // 2600 % 26)}{chr(65 + n // 100 % 26)}{n % 100:02d}"
+
+    def runNuevo(self) -> str:
+        return run_valido(90_000_000 + next(self._secuencia))
+
+    def vehiculoNuevo(self) -> Vehiculo:
+        return Vehiculo(patente=self.patenteNueva(), marca="Kia", modelo="Rio", año=2024, precio_diario=1.2)
+
+    def clienteNuevo(self) -> Cliente:
+        return Cliente(run=self.runNuevo(), nombre="Ana", apellido="Soto",
+                       direccion="Calle 1 #100, Santiago", telefono="+56911112222")
+
+    def usuarioNuevo(self) -> User:
+        return User(run=self.runNuevo(), nombre="Diego", apellido="Rojas",
+                    password=self.hash_clave, cargo="empleado")
+
+    def reservaNueva(self) -> Tuple[int, int, int, str, str]:
+        """(id_vehiculo, id_cliente, id_empleado, inicio, fin) libre de conflictos."""
+        inicio = self._futuro + timedelta(days=5 * next(self._secuencia))
+        return (self.azar.choice(self._arrendables)[0], self.cliente()[0], self.empleado()[0],
+                inicio.isoformat(), (inicio + timedelta(days=3)).isoformat())
+
+    def arriendoNuevo(self) -> Arriendo:
+        id_vehiculo, id_cliente, id_empleado, inicio, fin = self.reservaNueva()
+        return Arriendo(id_vehiculo=id_vehiculo, id_cliente=id_cliente, id_empleado=id_empleado,
+                        fecha_inicio=inicio, fecha_fin=fin, costo_total=150000.0,
+                        valor_uf_fecha=39000.0, fecha_uf_consulta=inicio)
+
+    # Filas leídas o insertadas antes de medir (dentro de la transacción del caso)
+
+    def vehiculoLeido(self) -> Vehiculo:
+        with DaoVehiculo() as dao:
+            return dao.buscarVehiculoPorId(self.vehiculo()[0])
+
+    def clienteLeido(self) -> Cliente:
+        with DaoCliente() as dao:
+            return dao.buscarClientePorId(self.cliente()[0])
+
+    def usuarioLeido(self) -> User:
+        return UserDTO().buscarUsuario(self.empleado()[1])
+
+    def arriendoLeido(self) -> Arriendo:
+        with DaoArriendo() as dao:
+            return dao.buscarArriendo(self.arriendo()[0])
+
+    def vehiculoInsertado(self) -> str:
+        vehiculo = self.vehiculoNuevo()
+        with DaoVehiculo() as dao:
+            dao.agregarVehiculo(vehiculo)
+        return vehiculo.getPatente()
+
+    def clienteInsertado(self) -> str:
+        cliente = self.clienteNuevo()
+        with DaoCliente() as dao:
+            dao.agregarCliente(cliente)
+        return cliente.getRun()
+
+    def usuarioInsertado(self) -> str:
+        usuario = self.usuarioNuevo()
+        with daoUser() as dao:
+            dao.agregarUsuario(usuario)
+        return usuario.getRun()
+
+    def arriendoInsertado(self) -> int:
+        arriendo = self.arriendoNuevo()
+        with DaoArriendo() as dao:
+            dao.agregarArriendo(arriendo)
+        return arriendo.getIdArriendo()
+
+
+def _sin_argumentos(contexto: Contexto) -> Tuple:
+    return ()
+
+
+class Caso(NamedTuple):
+    """
+    Llamada medida a un método público de un DAO o DTO.
+
+    `argumentos` se evalúa fuera del tiempo medido. Los casos de escritura
+    corren dentro de una `UnidadDeTrabajo` que se revierte al final, así
+    que los datos sembrados no cambian entre repeticiones ni entre corridas.
+    Los casos `pesados` recorren tablas completas y se repiten menos.
+    """
+    clase: type
+    metodo: str
+    argumentos: Callable[[Contexto], Tuple] = _sin_argumentos
+    escritura: bool = False
+    pesado: bool = False
+
+    @property
+    def operacion(self) -> str:
+        return f"{self.clase.__name__}.{self.metodo}"
+
+    @property
+    def capa(self) -> str:
+        return "dao" if hasattr(self.clase, "__enter__") else "dto"
+
+
+def _consumir(resultado: Any) -> Any:
+    """Recorre los generadores para medir también la lectura de sus filas."""
+    if isinstance(resultado, Iterator):
+        return sum(1 for _ in resultado)
+    return resultado
+
+
+def _llamar(caso: Caso, argumentos: Tuple) -> Any:
+    if caso.capa == "dao":
+        with caso.clase() as dao:
+            return _consumir(getattr(dao, caso.metodo)(*argumentos))
+    return _consumir(getattr(caso.clase(), caso.metodo)(*argumentos))
+
+
+def _actualizacion_vehiculo(c: Contexto) -> Tuple:
+    v = c.vehiculoLeido()
+    return v.getPatente(), v.getMarca(), v.getModelo(), v.getAño(), v.getPrecioDiario() + 0.1, v.getEstado(), v
+
+
+def _actualizacion_cliente(c: Contexto) -> Tuple:
+    cl = c.clienteLeido()
+    return cl.getRun(), cl.getNombre(), cl.getApellido(), cl.getDireccion(), "+56933334444", cl
+
+
+def _actualizacion_usuario(c: Contexto) -> Tuple:
+    u = c.usuarioLeido()
+    return u.getRun(), u.getNombre() + "a", u.getApellido(), u.getPassword(), u.getCargo(), u
+
+
+def _actualizacion_arriendo(c: Contexto) -> Tuple:
+    a = c.arriendoLeido()
+    return (a.getIdArriendo(), a.getIdVehiculo(), a.getIdCliente(), a.getIdEmpleado(), a.getFechaInicio(),
+            a.getFechaFin(), a.getCostoTotal() + 1000, a.getEstado(), a.getValorUfFecha(),
+            a.getFechaUfConsulta(), a)
+
+
+def _modificado(leer: Callable[[Contexto], Any], modificar: Callable[[Any], None]) -> Callable[[Contexto], Tuple]:
+    def argumentos(c: Contexto) -> Tuple:
+        entidad = leer(c)
+        modificar(entidad)
+        return (entidad,)
+    return argumentos
+
+
+def _ventana_anual(c: Contexto) -> Tuple:
+    return (FECHA_REFERENCIA - timedelta(days=365)).isoformat(), FECHA_REFERENCIA.isoformat()
+
+
+def _conflictos(c: Contexto) -> Tuple:
+    _, id_vehiculo, inicio, fin = c.arriendo()
+    return id_vehiculo, inicio.isoformat(), fin.isoformat()
+
+
+def casos() -> List[Caso]:
+    """
+    Obtiene un caso por cada método público de `CLASES_MEDIDAS`.
+
+    Returns:
+        List[Caso]: Casos en orden de ejecución (DAOs primero)
+    """
+    uno = lambda valor: lambda c: (valor(c),)  # noqa: E731
+    lote = lambda nuevo: lambda c: ([nuevo(c) for _ in range(TAMANO_LOTE)],)  # noqa: E731
+    id_vehiculo = uno(lambda c: c.vehiculo()[0])
+    patente = uno(lambda c: c.vehiculo()[1])
+    id_cliente = uno(lambda c: c.cliente()[0])
+    run_cliente = uno(lambda c: c.cliente()[1])
+    run_empleado = uno(lambda c: c.empleado()[1])
+    id_arriendo = uno(lambda c: c.arriendo()[0])
+    fecha = uno(Contexto.fecha)
+    rango = Contexto.rango
+    primera_pagina = lambda c: (20,)  # noqa: E731
+    return [
+        Caso(DaoVehiculo, "agregarVehiculo", uno(Contexto.vehiculoNuevo), escritura=True),
+        Caso(DaoVehiculo, "agregarVehiculosLote", lote(Contexto.vehiculoNuevo), escritura=True),
+        Caso(DaoVehiculo, "buscarVehiculo", patente),
+        Caso(DaoVehiculo, "buscarVehiculoPorId", id_vehiculo),
+        Caso(DaoVehiculo, "buscarVehiculosPorIds", uno(lambda c: c.ids("vehiculos"))),
+        Caso(DaoVehiculo, "actualizarVehiculo",
+             _modificado(Contexto.vehiculoLeido, lambda v: v.setPrecioDiario(v.getPrecioDiario() + 0.1)),
+             escritura=True),
+        Caso(DaoVehiculo, "actualizarVehiculoParcial", lambda c: (c.vehiculo()[0], {"precio_diario": 1.9}),
+             escritura=True),
+        Caso(DaoVehiculo, "bloquearParaArriendo", id_vehiculo, escritura=True),
+        Caso(DaoVehiculo, "actualizarEstado", lambda c: (c.vehiculo()[0], "mantencion"), escritura=True),
+        Caso(DaoVehiculo, "eliminarVehiculo", uno(Contexto.vehiculoInsertado), escritura=True),
+        Caso(DaoVehiculo, "listarVehiculos"),
+        Caso(DaoVehiculo, "iterVehiculos"),
+        Caso(DaoVehiculo, "paginarVehiculos", primera_pagina),
+        Caso(DaoVehiculo, "listarVehiculosDisponibles"),
+        Caso(DaoVehiculo, "listarIdsArrendables"),
+        Caso(DaoVehiculo, "buscarIdsPorPatentes", lambda c: ([c.vehiculo()[1]],)),
+
+        Caso(DaoCliente, "agregarCliente", uno(Contexto.clienteNuevo), escritura=True),
+        Caso(DaoCliente, "agregarClientesLote", lote(Contexto.clienteNuevo), escritura=True),
+        Caso(DaoCliente, "buscarCliente", run_cliente),
+        Caso(DaoCliente, "actualizarCliente",
+             _modificado(Contexto.clienteLeido, lambda cl: cl.setTelefono("+56933334444")), escritura=True),
+        Caso(DaoCliente, "actualizarClienteParcial", lambda c: (c.cliente()[0], {"telefono": "+56933334444"}),
+             escritura=True),
+        Caso(DaoCliente, "eliminarCliente", uno(Contexto.clienteInsertado), escritura=True),
+        Caso(DaoCliente, "listarClientes", pesado=True),
+        Caso(DaoCliente, "iterClientes", pesado=True),
+        Caso(DaoCliente, "paginarClientes", primera_pagina),
+        Caso(DaoCliente, "buscarClientePorId", id_cliente),
+        Caso(DaoCliente, "buscarClientesPorIds", uno(lambda c: c.ids("clientes"))),
+
+        Caso(daoUser, "validarLogin", uno(lambda c: User(run=c.empleado()[1]))),
+        Caso(daoUser, "agregarUsuario", uno(Contexto.usuarioNuevo), escritura=True),
+        Caso(daoUser, "agregarUsuariosLote", lote(Contexto.usuarioNuevo), escritura=True),
+        Caso(daoUser, "actualizarUsuario",
+             _modificado(Contexto.usuarioLeido, lambda u: u.setNombre(u.getNombre() + "a")), escritura=True),
+        Caso(daoUser, "actualizarUsuarioParcial", lambda c: (c.empleado()[0], {"nombre": "Bench"}),
+             escritura=True),
+        Caso(daoUser, "actualizarPassword", lambda c: (c.empleado()[1], c.hash_clave), escritura=True),
+        Caso(daoUser, "buscarUsuario", uno(lambda c: User(run=c.empleado()[1]))),
+        Caso(daoUser, "eliminarUsuario", uno(lambda c: User(run=c.usuarioInsertado())), escritura=True),
+        Caso(daoUser, "listarUsuarios"),
+        Caso(daoUser, "iterUsuarios"),
+
+        Caso(DaoInforme, "obtenerResumen", pesado=True),
+
+        Caso(DaoArriendo, "agregarArriendo", uno(Contexto.arriendoNuevo), escritura=True),
+        Caso(DaoArriendo, "buscarArriendo", id_arriendo),
+        Caso(DaoArriendo, "buscarArriendosPorIds", uno(lambda c: c.ids("arriendos"))),
+        Caso(DaoArriendo, "actualizarArriendo",
+             _modificado(Contexto.arriendoLeido, lambda a: a.setCostoTotal(a.getCostoTotal() + 1000)),
+             escritura=True),
+        Caso(DaoArriendo, "actualizarArriendoParcial", lambda c: (c.arriendo()[0], {"costo_total": 123456}),
+             escritura=True),
+        Caso(DaoArriendo, "actualizarEstado", lambda c: (c.arriendo()[0], "cancelado"), escritura=True),
+        Caso(DaoArriendo, "eliminarArriendo", uno(Contexto.arriendoInsertado), escritura=True),
+        Caso(DaoArriendo, "listarArriendos", pesado=True),
+        Caso(DaoArriendo, "iterArriendos", pesado=True),
+        Caso(DaoArriendo, "iterArriendosConRelacion", pesado=True),
+        Caso(DaoArriendo, "listarArriendosConRelacion", pesado=True),
+        Caso(DaoArriendo, "paginarArriendosConRelacion", primera_pagina),
+        Caso(DaoArriendo, "listarArriendosPorFechaConRelacion", fecha),
+        Caso(DaoArriendo, "listarConflictos", _conflictos),
+        Caso(DaoArriendo, "contarArriendosActivos", id_vehiculo),
+        Caso(DaoArriendo, "listarReservasActivas"),
+        Caso(DaoArriendo, "iterFilasNumericas", lambda c: (ESTADOS_ARRIENDO,), pesado=True),
+        Caso(DaoArriendo, "listarArriendosPorFecha", fecha),
+        Caso(DaoArriendo, "listarArriendosActivosEn", fecha),
+        Caso(DaoArriendo, "listarArriendosSolapados", rango),
+        Caso(DaoArriendo, "listarArriendosQueInicianEntre", rango),
+        Caso(DaoArriendo, "listarArriendosQueTerminanEntre", rango),
+
+        Caso(VehiculoDTO, "invalidarCache", patente),
+        Caso(VehiculoDTO, "estadisticasCache"),
+        Caso(VehiculoDTO, "agregarVehiculo", lambda c: (c.patenteNueva(), "Kia", "Rio", 2024, 1.2),
+             escritura=True),
+        Caso(VehiculoDTO, "agregarVehiculosLote", lote(Contexto.vehiculoNuevo), escritura=True),
+        Caso(VehiculoDTO, "buscarVehiculo", patente),
+        Caso(VehiculoDTO, "buscarVehiculoPorId", id_vehiculo),
+        Caso(VehiculoDTO, "buscarVehiculosPorIds", uno(lambda c: c.ids("vehiculos"))),
+        Caso(VehiculoDTO, "actualizarVehiculo", _actualizacion_vehiculo, escritura=True),
+        Caso(VehiculoDTO, "eliminarVehiculo", uno(Contexto.vehiculoInsertado), escritura=True),
+        Caso(VehiculoDTO, "listarVehiculos"),
+        Caso(VehiculoDTO, "iterVehiculos"),
+        Caso(VehiculoDTO, "paginarVehiculos", primera_pagina),
+        Caso(VehiculoDTO, "listarVehiculosDisponibles"),
+        Caso(VehiculoDTO, "listarVehiculosDisponiblesEntre", rango),
+
+        Caso(ClienteDTO, "invalidarCache", run_cliente),
+        Caso(ClienteDTO, "estadisticasCache"),
+        Caso(ClienteDTO, "agregarCliente",
+             lambda c: (c.runNuevo(), "Ana", "Soto", "Calle 1 #100, Santiago", "+56911112222"), escritura=True),
+        Caso(ClienteDTO, "agregarClientesLote", lote(Contexto.clienteNuevo), escritura=True),
+        Caso(ClienteDTO, "buscarCliente", run_cliente),
+        Caso(ClienteDTO, "actualizarCliente", _actualizacion_cliente, escritura=True),
+        Caso(ClienteDTO, "eliminarCliente", uno(Contexto.clienteInsertado), escritura=True),
+        Caso(ClienteDTO, "listarClientes", pesado=True),
+        Caso(ClienteDTO, "iterClientes", pesado=True),
+        Caso(ClienteDTO, "paginarClientes", primera_pagina),
+        Caso(ClienteDTO, "buscarClientePorId", id_cliente),
+        Caso(ClienteDTO, "buscarClientesPorIds", uno(lambda c: c.ids("clientes"))),
+
+        # Login y alta de usuario incluyen bcrypt (BCRYPT_ROUNDS): miden el costo real por intento
+        Caso(UserDTO, "validarLogin", lambda c: (c.empleado()[1], CLAVE_EMPLEADOS, "benchmark")),
+        Caso(UserDTO, "agregarUsuario", lambda c: (c.runNuevo(), "Diego", "Rojas", CLAVE_EMPLEADOS, "empleado"),
+             escritura=True),
+        Caso(UserDTO, "agregarUsuariosLote", lote(Contexto.usuarioNuevo), escritura=True),
+        Caso(UserDTO, "actualizarUsuario", _actualizacion_usuario, escritura=True),
+        Caso(UserDTO, "buscarUsuario", run_empleado),
+        Caso(UserDTO, "eliminarUsuario", uno(Contexto.usuarioInsertado), escritura=True),
+        Caso(UserDTO, "listarUsuarios"),
+        Caso(UserDTO, "iterUsuarios"),
+
+        Caso(ArriendoDTO, "agregarArriendo", lambda c: c.reservaNueva() + (150000.0,), escritura=True),
+        Caso(ArriendoDTO, "registrarArriendo", lambda c: c.reservaNueva() + (150000.0, 39000.0),
+             escritura=True),
+        Caso(ArriendoDTO, "cancelarArriendo", lambda c: c.arriendo()[:2], escritura=True),
+        Caso(ArriendoDTO, "buscarArriendo", id_arriendo),
+        Caso(ArriendoDTO, "buscarArriendosPorIds", uno(lambda c: c.ids("arriendos"))),
+        Caso(ArriendoDTO, "presentarArriendos",
+             uno(lambda c: list(ArriendoDTO().buscarArriendosPorIds(c.ids("arriendos")).values()))),
+        Caso(ArriendoDTO, "actualizarArriendo", _actualizacion_arriendo, escritura=True),
+        Caso(ArriendoDTO, "eliminarArriendo", uno(Contexto.arriendoInsertado), escritura=True),
+        Caso(ArriendoDTO, "listarArriendos", pesado=True),
+        Caso(ArriendoDTO, "iterArriendos", pesado=True),
+        Caso(ArriendoDTO, "listarArriendosPresentacion", pesado=True),
+        Caso(ArriendoDTO, "iterArriendosPresentacion", pesado=True),
+        Caso(ArriendoDTO, "paginarArriendosPresentacion", primera_pagina),
+        Caso(ArriendoDTO, "listarArriendosPorFecha", fecha),
+        Caso(ArriendoDTO, "listarArriendosSolapados", rango),
+        Caso(ArriendoDTO, "listarArriendosQueInicianEntre", rango),
+        Caso(ArriendoDTO, "listarArriendosQueTerminanEntre", rango),
+        Caso(ArriendoDTO, "listarArriendosPorFechaPresentacion", fecha),
+
+        Caso(InformeDTO, "obtenerResumen", pesado=True),
+        Caso(InformeDTO, "obtenerDatasetArriendos", pesado=True),
+        Caso(InformeDTO, "obtenerOcupacionFlota", _ventana_anual, pesado=True),
+        Caso(InformeDTO, "obtenerMetricasBD"),
+        Caso(InformeDTO, "reiniciarMetricasBD"),
+    ]
+
+
+def metodos_sin_caso(lista: Optional[Sequence[Caso]] = None) -> List[str]:
+    """
+    Lista los métodos públicos de `CLASES_MEDIDAS` que no tienen caso.
+
+    Args:
+        lista (Optional[Sequence[Caso]]): Casos a revisar (default: `casos()`)
+
+    Returns:
+        List[str]: `Clase.metodo` sin medir (vacía si la suite está completa)
+    """
+    cubiertos = {caso.operacion for caso in (lista if lista is not None else casos())}
+    faltantes = []
+    for clase in CLASES_MEDIDAS:
+        for nombre, valor in vars(clase).items():
+            if nombre.startswith("_") or nombre in METODOS_EXCLUIDOS:
+                continue
+            if callable(valor) or isinstance(valor, (classmethod, staticmethod)):
+                if f"{clase.__name__}.{nombre}" not in cubiertos:
+                    faltantes.append(f"{clase.__name__}.{nombre}")
+    return faltantes
+
+
+def resumir(tiempos: Sequence[float]) -> Dict[str, float]:
+    """
+    Resume una serie de duraciones (segundos) en milisegundos.
+
+    Los percentiles son exactos (rango más cercano) sobre las repeticiones.
+
+    Args:
+        tiempos (Sequence[float]): Duraciones medidas
+
+    Returns:
+        Dict[str, float]: min, p50, p95, p99, max, media y desviación en ms (vacío sin datos)
+    """
+    if not tiempos:
+        return {}
+    ordenados = sorted(tiempos)
+
+    def percentil(p: float) -> float:
+        return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+    valores = {
+        "min_ms": ordenados[0], "p50_ms": percentil(50), "p95_ms": percentil(95), "p99_ms": percentil(99),
+        "max_ms": ordenados[-1], "media_ms": statistics.fmean(ordenados),
+        "desviacion_ms": statistics.pstdev(ordenados),
+    }
+    return {clave: round(valor * 1000, 4) for clave, valor in valores.items()}
+
+
+def medir(caso: Caso, contexto: Contexto, repeticiones: int, tiempo_maximo: float = 30.0,
+          calentamiento: int = 1) -> Dict[str, Any]:
+    """
+    Mide un caso: calentamiento, luego hasta `repeticiones` llamadas o `tiempo_maximo` segundos.
+
+    Solo se cronometra la llamada al método; la elección de argumentos y
+    la reversión de los casos de escritura quedan fuera. Una excepción
+    cuenta como error y la medición continúa.
+
+    Args:
+        caso (Caso): Caso a medir
+        contexto (Contexto): Datos de muestra
+        repeticiones (int): Llamadas medidas como máximo
+        tiempo_maximo (float): Segundos de medición tras los cuales se corta (mínimo una llamada)
+        calentamiento (int): Llamadas previas que no se registran
+
+    Returns:
+        Dict[str, Any]: Operación, capa, repeticiones, errores y estadísticas en ms
+    """
+    tiempos: List[float] = []
+    errores = 0
+    ultimo_error = None
+    limite = None
+    for i in range(calentamiento + repeticiones):
+        with UnidadDeTrabajo() if caso.escritura else nullcontext() as uow:
+            argumentos = caso.argumentos(contexto)
+            inicio = time.perf_counter()
+            try:
+                _llamar(caso, argumentos)
+            except Exception as e:
+                errores += 1
+                ultimo_error = f"{type(e).__name__}: {e}"
+            duracion = time.perf_counter() - inicio
+            if uow is not None:
+                uow.revertir()
+        if i < calentamiento:
+            continue
+        tiempos.append(duracion)
+        limite = limite or time.perf_counter() + tiempo_maximo
+        if time.perf_counter() >= limite:
+            break
+    if caso.escritura:
+        # Las reservas revertidas pueden haber quedado en el índice de disponibilidad en memoria
+        invalidar_motor_disponibilidad()
+    resultado = {"operacion": caso.operacion, "capa": caso.capa, "escritura": caso.escritura,
+                 "repeticiones": len(tiempos), "errores": errores}
+    if ultimo_error:
+        resultado["ultimo_error"] = ultimo_error
+    resultado.update(resumir(tiempos))
+    return resultado
+
+
+def ejecutar_suite(contexto: Contexto, repeticiones: int = 50, repeticiones_pesadas: int = 3,
+                   tiempo_maximo: float = 30.0, filtro: Optional[str] = None,
+                   al_medir: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Mide todos los casos (o los que contienen `filtro`) contra el pool compartido.
+
+    Mientras corre, el limitador de login se reemplaza por uno sin límites
+    para que las repeticiones de `validarLogin` no queden bloqueadas.
+
+    Args:
+        contexto (Contexto): Datos de muestra
+        repeticiones (int): Llamadas medidas por caso
+        repeticiones_pesadas (int): Llamadas medidas en los casos que recorren tablas completas
+        tiempo_maximo (float): Segundos máximos de medición por caso
+        filtro (Optional[str]): Subcadena de `Clase.metodo` para medir solo algunos casos
+        al_medir (Optional[Callable]): Se llama con cada resultado (progreso)
+
+    Returns:
+        List[Dict[str, Any]]: Un resultado por caso, en orden
+    """
+    sin_limite = PoliticaLimite(capacidad=10 ** 9, recarga=10.0 ** 9, max_fallos=10 ** 9)
+    anterior = configurar_limitador(LimitadorLogin(sin_limite, sin_limite))
+    resultados = []
+    try:
+        for caso in casos():
+            if filtro and filtro.lower() not in caso.operacion.lower():
+                continue
+            resultado = medir(caso, contexto, repeticiones_pesadas if caso.pesado else repeticiones,
+                              tiempo_maximo)
+            resultados.append(resultado)
+            if al_medir is not None:
+                al_medir(resultado)
+    finally:
+        configurar_limitador(anterior)
+    return resultados
+
+
+def _git(*argumentos: str) -> Optional[str]:
+    try:
+        salida = subprocess.run(("git",) + argumentos, cwd=Path(__file__).resolve().parent,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() if salida.returncode == 0 else None
+
+
+def generar_informe(resultados: List[Dict[str, Any]], escala: str, dimensiones: Dict[str, int],
+                    semilla: int, version_servidor: Optional[str] = None,
+                    configuracion: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Arma el informe JSON de una corrida con los datos necesarios para compararla con otra.
+
+    Args:
+        resultados (List[Dict]): Salida de `ejecutar_suite`
+        escala (str): Punto de escala medido (ej: "100k")
+        dimensiones (Dict[str, int]): Filas por tabla del esquema
+        semilla (int): Semilla de datos y argumentos
+        version_servidor (Optional[str]): `SELECT VERSION()` del servidor
+        configuracion (Optional[Dict]): Repeticiones, tiempo máximo, filtro, ...
+
+    Returns:
+        Dict[str, Any]: Informe serializable con `json.dump`
+    """
+    estado = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "version": VERSION_INFORME,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "arbol_modificado": bool(estado) if estado is not None else None,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "servidor": version_servidor,
+        "escala": escala,
+        "dimensiones": dimensiones,
+        "semilla": semilla,
+        "configuracion": configuracion or {},
+        "resultados": resultados,
+    }
+
+
+class Comparacion(NamedTuple):
+    """Mediana de una operación en dos corridas; `cambio` es relativo (-0.25 = 25 % más rápida)."""
+    operacion: str
+    antes_ms: Optional[float]
+    despues_ms: Optional[float]
+    cambio: Optional[float]
+
+
+def comparar_informes(antes: Dict[str, Any], despues: Dict[str, Any],
+                      metrica: str = "p50_ms") -> List[Comparacion]:
+    """
+    Compara dos informes operación por operación.
+
+    Args:
+        antes (Dict): Informe de referencia
+        despues (Dict): Informe nuevo
+        metrica (str): Estadística a comparar (default: mediana)
+
+    Returns:
+        List[Comparacion]: Una fila por operación presente en alguno de los dos, en orden del informe nuevo
+
+    Raises:
+        ValueError: Si los informes son de escalas, dimensiones o semillas distintas
+    """
+    for clave in ("escala", "dimensiones", "semilla"):
+        if antes.get(clave) != despues.get(clave):
+            raise ValueError(f"Los informes no son comparables: {clave} {antes.get(clave)} != {despues.get(clave)}")
+    valores_antes = {r["operacion"]: r.get(metrica) for r in antes["resultados"]}
+    valores_despues = {r["operacion"]: r.get(metrica) for r in despues["resultados"]}
+    filas = []
+    for operacion in list(valores_despues) + [op for op in valores_antes if op not in valores_despues]:
+        a, d = valores_antes.get(operacion), valores_despues.get(operacion)
+        cambio = round(d / a - 1, 4) if a and d is not None else None
+        filas.append(Comparacion(operacion, a, d, cambio))
+    return filas
+
+
+def formatear_comparacion(filas: Sequence[Comparacion], umbral: float = 0.10) -> str:
+    """
+    Tabla de texto de `comparar_informes`, marcando cambios mayores a `umbral`.
+
+    Args:
+        filas (Sequence[Comparacion]): Comparaciones
+        umbral (float): Cambio relativo a partir del cual se marca mejora o regresión
+
+    Returns:
+        str: Tabla lista para imprimir
+    """
+    lineas = [f"{'Operación':<52} {'antes ms':>11} {'después ms':>11} {'cambio':>8}", "-" * 86]
+    for fila in filas:
+        if fila.cambio is None:
+            marca, cambio = "", "—"
+        else:
+            marca = "  ▲ regresión" if fila.cambio > umbral else "  ▼ mejora" if fila.cambio < -umbral else ""
+            cambio = f"{fila.cambio:+.1%}"
+        antes = f"{fila.antes_ms:.3f}" if fila.antes_ms is not None else "—"
+        despues = f"{fila.despues_ms:.3f}" if fila.despues_ms is not None else "—"
+        lineas.append(f"{fila.operacion:<52} {antes:>11} {despues:>11} {cambio:>8}{marca}")
+    return "\n".join(lineas)
@@ -0,0 +1,156 @@
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from utils.logger import SistemaLogging
+from benchmark.esquema import BASE_APLICACION, conectar_servidor, preparar_esquema, validar_nombre
+from benchmark.sembrado import ESCALAS, leer_siembra, registrar_siembra, sembrar
+
+logger = logging.getLogger(__name__)
+
+#: Esquema por defecto de las mediciones (BENCH_DB_NAME)
+ESQUEMA_POR_DEFECTO = os.environ.get("BENCH_DB_NAME", "viaja_seguro_bench")
+
+
+def _preparar(esquema: str, escala: str, semilla: int) -> None:
+    print(f"🛠  Recreando {esquema} y sembrando {ESCALAS[escala]:,} arriendos (semilla {semilla})...")
+    preparar_esquema(esquema, protegidos={BASE_APLICACION, os.environ.get("DB_NAME", BASE_APLICACION)})
+    conn = conectar_servidor(esquema)
+    try:
+        dims = sembrar(conn, ESCALAS[escala], semilla)
+        registrar_siembra(conn, escala, semilla, dims)
+    finally:
+        conn.close()
+    print(f"✅ {dims.vehiculos:,} vehículos, {dims.clientes:,} clientes, {dims.empleados} empleados, "
+          f"{dims.arriendos:,} arriendos")
+
+
+def _ejecutar(args: argparse.Namespace) -> int:
+    conn = conectar_servidor(args.esquema)
+    try:
+        siembra = leer_siembra(conn)
+    finally:
+        conn.close()
+    if siembra is None or siembra[:2] != (args.escala, args.semilla):
+        _preparar(args.esquema, args.escala, args.semilla)
+
+    # El pool compartido se crea en el primer uso con DB_NAME: a partir de aquí todo va al esquema de mediciones
+    os.environ["DB_NAME"] = args.esquema
+    from benchmark.suite import Contexto, ejecutar_suite, generar_informe
+    from conex.conn import cerrar_pool
+
+    conn = conectar_servidor(args.esquema)
+    try:
+        escala, semilla, dims = leer_siembra(conn)
+        contexto = Contexto.cargar(conn, semilla)
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT VERSION()")
+            version_servidor = cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+    def al_medir(resultado: Dict[str, Any]) -> None:
+        errores = f"  ❌ {resultado['errores']} errores" if resultado["errores"] else ""
+        print(f"   {resultado['operacion']:<52} p50 {resultado.get('p50_ms', 0):>10.3f} ms "
+              f"p99 {resultado.get('p99_ms', 0):>10.3f} ms  n={resultado['repeticiones']}{errores}")
+
+    print(f"⏱  Midiendo sobre {args.esquema} ({escala}, MySQL {version_servidor})")
+    try:
+        resultados = ejecutar_suite(contexto, args.repeticiones, args.repeticiones_pesadas,
+                                    args.tiempo_maximo, args.filtro, al_medir)
+    finally:
+        cerrar_pool()
+    informe = generar_informe(resultados, escala, dims._asdict(), semilla, version_servidor, {
+        "repeticiones": args.repeticiones, "repeticiones_pesadas": args.repeticiones_pesadas,
+        "tiempo_maximo": args.tiempo_maximo, "filtro": args.filtro,
+    })
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, ensure_ascii=False, indent=2)
+    print(f"📄 Informe guardado en {args.salida}")
+    return 1 if any(r["errores"] for r in resultados) else 0
+
+
+def _comparar(args: argparse.Namespace) -> int:
+    from benchmark.suite import comparar_informes, formatear_comparacion
+
+    with open(args.antes, encoding="utf-8") as archivo:
+        antes = json.load(archivo)
+    with open(args.despues, encoding="utf-8") as archivo:
+        despues = json.load(archivo)
+    filas = comparar_informes(antes, despues, args.metrica)
+    print(f"Antes:   {antes.get('commit')} ({antes.get('fecha')})")
+    print(f"Después: {despues.get('commit')} ({despues.get('fecha')})\n")
+    print(formatear_comparacion(filas, args.umbral))
+    return 1 if any(f.cambio is not None and f.cambio > args.umbral for f in filas) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Mide los métodos públicos de DAOs y DTOs contra un esquema MySQL sembrado.
+
+    Uso:
+        python benchmark_dao.py preparar --escala 100k [--semilla 1]
+        python benchmark_dao.py ejecutar --escala 100k --salida antes.json [--filtro Arriendo]
+        python benchmark_dao.py comparar antes.json despues.json [--umbral 0.1]
+
+    El esquema (`--esquema`, default BENCH_DB_NAME o viaja_seguro_bench) se
+    crea con `create_updated.sql` en el servidor de DB_HOST/DB_PORT; nunca
+    se usa la base de la aplicación. `ejecutar` vuelve a sembrar si el
+    esquema no tiene la escala y semilla pedidas.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de línea de comandos (default: sys.argv)
+
+    Returns:
+        int: 0 si todo se midió (o no hubo regresiones), 1 si hubo errores o
+        regresiones, 2 si los argumentos o la conexión no son válidos
+    """
+    parser = argparse.ArgumentParser(description="Benchmark reproducible de DAOs y DTOs")
+    parser.add_argument("--esquema", default=ESQUEMA_POR_DEFECTO, help="Esquema MySQL de las mediciones")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    preparar = comandos.add_parser("preparar", help="Recrear y sembrar el esquema")
+    ejecutar = comandos.add_parser("ejecutar", help="Medir y guardar un informe JSON")
+    for sub in (preparar, ejecutar):
+        sub.add_argument("--escala", choices=list(ESCALAS), default="1k")
+        sub.add_argument("--semilla", type=int, default=1)
+    ejecutar.add_argument("--salida", required=True, help="Archivo JSON del informe")
+    ejecutar.add_argument("--repeticiones", type=int, default=50, help="Llamadas medidas por método")
+    ejecutar.add_argument("--repeticiones-pesadas", type=int, default=3,
+                          help="Llamadas medidas en los métodos que recorren tablas completas")
+    ejecutar.add_argument("--tiempo-maximo", type=float, default=30.0, help="Segundos máximos por método")
+    ejecutar.add_argument("--filtro", default=None, help="Medir solo Clase.metodo que contengan el texto")
+
+    comparar = comandos.add_parser("comparar", help="Comparar dos informes")
+    comparar.add_argument("antes")
+    comparar.add_argument("despues")
+    comparar.add_argument("--metrica", default="p50_ms", choices=["p50_ms", "p95_ms", "p99_ms", "media_ms"])
+    comparar.add_argument("--umbral", type=float, default=0.10, help="Cambio relativo que cuenta como regresión")
+    args = parser.parse_args(argv)
+
+    # Solo errores: los casos de escritura revierten a propósito y no deben llenar la consola
+    SistemaLogging.configurar(nivel=logging.ERROR, archivo_log="benchmark.log")
+    try:
+        if args.comando == "comparar":
+            return _comparar(args)
+        validar_nombre(args.esquema, {BASE_APLICACION, os.environ.get("DB_NAME", BASE_APLICACION)})
+        if args.comando == "preparar":
+            _preparar(args.esquema, args.escala, args.semilla)
+            return 0
+        return _ejecutar(args)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error("Benchmark %s falló: %s", args.comando, e)
+        print(f"❌ {e}")
+        return 2
+    except Exception as e:
+        # pymysql.err.* al no poder conectar o crear el esquema
+        logger.error("Benchmark %s falló: %s", args.comando, e)
+        print(f"❌ Error de base de datos: {e}")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
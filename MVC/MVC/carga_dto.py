@@ -0,0 +1,144 @@
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+from datetime import date, timedelta
+from typing import List, Optional
+
+from utils.logger import SistemaLogging
+from benchmark.esquema import BASE_APLICACION, conectar_servidor, preparar_esquema, validar_nombre
+from benchmark.generador import FECHA_REFERENCIA
+from benchmark.sembrado import ESCALAS, leer_siembra, registrar_siembra, sembrar
+
+logger = logging.getLogger(__name__)
+
+#: Esquema por defecto de la prueba de carga (BENCH_CARGA_DB_NAME); la carga lo modifica
+ESQUEMA_POR_DEFECTO = os.environ.get("BENCH_CARGA_DB_NAME", "viaja_seguro_carga")
+
+
+def _sembrar(esquema: str, escala: str, semilla: int) -> None:
+    print(f"🛠  Recreando {esquema} con {ESCALAS[escala]:,} arriendos (semilla {semilla})...")
+    preparar_esquema(esquema, protegidos={BASE_APLICACION, os.environ.get("DB_NAME", BASE_APLICACION)})
+    conn = conectar_servidor(esquema)
+    try:
+        registrar_siembra(conn, escala, semilla, sembrar(conn, ESCALAS[escala], semilla))
+    finally:
+        conn.close()
+
+
+def _imprimir(informe: dict) -> None:
+    print(f"\n   {'paso':<12}{'llamadas':>10}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'max ms':>10}{'error':>8}")
+    for paso, datos in informe["pasos"].items():
+        print(f"   {paso:<12}{datos['llamadas']:>10}{datos['por_segundo']:>10.1f}{datos['p50_ms']:>10.1f}"
+              f"{datos['p95_ms']:>10.1f}{datos['p99_ms']:>10.1f}{datos['max_ms']:>10.1f}"
+              f"{datos['tasa_error']:>8.1%}")
+    print(f"\n   {informe['sesiones']} sesiones en {informe['duracion_s']:.1f} s "
+          f"({informe['sesiones_por_s']:.1f}/s, {informe['arriendos_por_s']:.1f} arriendos/s); "
+          f"{informe['sesiones_completas']} completas, {informe['conflictos']} conflictos, "
+          f"{informe['sesiones_sin_disponibles']} sin vehículos libres")
+    print(f"   Deadlocks: {informe['deadlocks']}  Esperas de bloqueo agotadas: {informe['esperas_bloqueo']}  "
+          f"Dobles reservas: {informe['dobles_reservas']}  Solapes en la base: {informe['solapes_en_bd']}")
+    for mensaje, veces in informe["errores_frecuentes"]:
+        print(f"   ❌ {veces} × {mensaje}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Prueba de carga: empleados de mesón concurrentes contra los DTOs.
+
+    Uso:
+        python carga_dto.py --empleados 50 --sesiones 20 [--procesos 4] [--escala 100k] [--salida carga.json]
+
+    Cada empleado repite login → vehículos disponibles → cotización con UF →
+    arriendo → cancelación. El esquema (`--esquema`, default
+    BENCH_CARGA_DB_NAME o viaja_seguro_carga) se recrea y siembra antes de
+    cada corrida salvo con `--reusar`; nunca se usa la base de la aplicación.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de línea de comandos (default: sys.argv)
+
+    Returns:
+        int: 0 si no hubo dobles reservas, 1 si las hubo, 2 si los argumentos
+        o la conexión no son válidos
+    """
+    parser = argparse.ArgumentParser(description="Prueba de carga de empleados concurrentes sobre los DTOs")
+    parser.add_argument("--esquema", default=ESQUEMA_POR_DEFECTO, help="Esquema MySQL de la prueba")
+    parser.add_argument("--escala", choices=list(ESCALAS), default="1k")
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--reusar", action="store_true", help="No recrear el esquema si ya está sembrado")
+    parser.add_argument("--empleados", type=int, default=50, help="Empleados trabajando a la vez")
+    parser.add_argument("--sesiones", type=int, default=20, help="Sesiones por empleado")
+    parser.add_argument("--procesos", type=int, default=1, help="Procesos entre los que repartir los empleados")
+    parser.add_argument("--desde", type=date.fromisoformat, default=FECHA_REFERENCIA,
+                        help="Primer día de las reservas (AAAA-MM-DD)")
+    parser.add_argument("--horizonte", type=int, default=30, help="Días de la ventana de reservas")
+    parser.add_argument("--preferidos", type=int, default=10,
+                        help="Vehículos libres entre los que elige cada empleado (menos = más competencia)")
+    parser.add_argument("--cancelados", type=float, default=0.5, help="Fracción de arriendos que se cancelan")
+    parser.add_argument("--pausa", type=float, default=0.0, help="Segundos máximos entre pasos")
+    parser.add_argument("--pool", type=int, default=None,
+                        help="Conexiones por proceso (default: una por empleado del proceso)")
+    parser.add_argument("--uf-real", action="store_true", help="Cotizar con mindicador.cl en vez de la UF sintética")
+    parser.add_argument("--limitar-login", action="store_true", help="Mantener el limitador de login")
+    parser.add_argument("--salida", default=None, help="Archivo JSON del informe")
+    args = parser.parse_args(argv)
+
+    SistemaLogging.configurar(nivel=logging.ERROR, archivo_log="carga.log")
+    try:
+        if min(args.empleados, args.sesiones, args.procesos, args.horizonte, args.preferidos) < 1:
+            raise ValueError("empleados, sesiones, procesos, horizonte y preferidos deben ser positivos")
+        validar_nombre(args.esquema, {BASE_APLICACION, os.environ.get("DB_NAME", BASE_APLICACION)})
+        conn = conectar_servidor(args.esquema) if args.reusar else None
+        try:
+            siembra = leer_siembra(conn) if conn else None
+        finally:
+            if conn:
+                conn.close()
+        if siembra is None or siembra[:2] != (args.escala, args.semilla):
+            _sembrar(args.esquema, args.escala, args.semilla)
+
+        # Antes del primer uso del pool (también en los procesos hijos, que heredan el entorno)
+        os.environ["DB_NAME"] = args.esquema
+        procesos = min(args.procesos, args.empleados)
+        os.environ["DB_POOL_MAX"] = str(args.pool or math.ceil(args.empleados / procesos))
+        from benchmark.carga import ConfiguracionCarga, ejecutar_carga, generar_informe, solapes_en_bd
+        from conex.conn import cerrar_pool
+
+        config = ConfiguracionCarga(args.empleados, args.sesiones, procesos, args.semilla, args.desde,
+                                    args.horizonte, args.preferidos, args.cancelados, args.pausa,
+                                    not args.uf_real, args.limitar_login)
+        print(f"⏱  {args.empleados} empleados × {args.sesiones} sesiones en {procesos} proceso(s) "
+              f"sobre {args.esquema}...")
+        try:
+            resultado = ejecutar_carga(config)
+            solapes = solapes_en_bd(args.desde, args.desde + timedelta(days=args.horizonte + 7))
+        finally:
+            cerrar_pool()
+    except (OSError, ValueError, KeyError) as e:
+        logger.error("Prueba de carga falló: %s", e)
+        print(f"❌ {e}")
+        return 2
+    except Exception as e:
+        # pymysql.err.* al no poder conectar o crear el esquema
+        logger.error("Prueba de carga falló: %s", e)
+        print(f"❌ Error de base de datos: {e}")
+        return 2
+
+    informe = generar_informe(resultado, config, solapes)
+    _imprimir(informe)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, ensure_ascii=False, indent=2)
+        print(f"📄 Informe guardado en {args.salida}")
+    if informe["dobles_reservas"] or informe["solapes_en_bd"]:
+        print("❌ Se detectaron dobles reservas")
+        return 1
+    print("✅ Sin dobles reservas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
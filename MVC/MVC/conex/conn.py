@@ -1,16 +1,567 @@
+import os
+import threading
+import time
+from collections import deque
 import pymysql
-from typing import Optional
+from typing import Optional, Callable, Deque, Dict, Iterable, Iterator, Tuple, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+class PoolAgotadoError(Exception):
+    """Se lanza cuando no hay conexiones libres dentro del tiempo de espera."""
+
+
+class PoolConexiones:
+    """
+    Pool acotado de conexiones MySQL compartido por todo el proceso.
+
+    Las conexiones se crean bajo demanda hasta ``max_size``; cuando todas
+    están en uso, quien pide una conexión espera hasta ``timeout_checkout``
+    segundos. Las conexiones devueltas quedan inactivas para ser reutilizadas
+    y las que exceden ``min_size`` se cierran tras ``max_idle`` segundos sin uso.
+
+    Attributes:
+        min_size (int): Conexiones inactivas que nunca se cierran por inactividad
+        max_size (int): Máximo de conexiones abiertas (en uso + inactivas)
+        timeout_checkout (float): Segundos máximos de espera por una conexión
+        max_idle (float): Segundos de inactividad antes de cerrar una conexión
+        verificar_tras (float): Inactividad a partir de la cual se hace ping al entregarla
+    """
+
+    def __init__(self, fabrica: Callable[[], Any], min_size: int = 1, max_size: int = 10,
+                 timeout_checkout: float = 5.0, max_idle: float = 300.0,
+                 verificar_tras: float = 30.0) -> None:
+        """
+        Inicializa el pool sin abrir conexiones.
+
+        Args:
+            fabrica (Callable): Función que crea una conexión nueva
+            min_size (int): Conexiones que se mantienen aunque estén inactivas
+            max_size (int): Máximo de conexiones abiertas simultáneamente
+            timeout_checkout (float): Segundos máximos de espera por una conexión
+            max_idle (float): Segundos de inactividad antes de cerrar una conexión
+            verificar_tras (float): Segundos de inactividad tras los cuales se
+                verifica la conexión con ping antes de entregarla (0 = siempre)
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Tamaños de pool inválidos: min=%s max=%s" % (min_size, max_size))
+        self._fabrica = fabrica
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout_checkout = timeout_checkout
+        self.max_idle = max_idle
+        self.verificar_tras = verificar_tras
+        self._cond = threading.Condition(threading.Lock())
+        self._inactivas: Deque[Tuple[Any, float]] = deque()
+        self._total = 0
+        self._cerrado = False
+        self._stats: Dict[str, float] = {
+            'checkouts': 0,
+            'devoluciones': 0,
+            'esperas': 0,
+            'tiempo_espera_total': 0.0,
+            'timeouts': 0,
+            'creadas': 0,
+            'cerradas': 0,
+            'fallidas_salud': 0,
+            'reaped': 0,
+            'errores_creacion': 0,
+        }
+
+    def precalentar(self) -> None:
+        """Abre conexiones hasta alcanzar ``min_size`` inactivas."""
+        while True:
+            with self._cond:
+                if self._cerrado or self._total >= self.min_size:
+                    return
+                self._total += 1
+            try:
+                conn = self._crear()
+            except Exception:
+                return
+            self.devolver(conn)
+
+    def obtener(self, timeout: Optional[float] = None) -> Any:
+        """
+        Entrega una conexión sana, reutilizando una inactiva si existe.
+
+        Args:
+            timeout (Optional[float]): Espera máxima; por defecto ``timeout_checkout``
+
+        Returns:
+            Any: Conexión lista para usar; debe devolverse con ``devolver``
+
+        Raises:
+            PoolAgotadoError: Si no se libera ninguna conexión a tiempo
+            pymysql.Error: Si falla la creación de una conexión nueva
+        """
+        espera_max = self.timeout_checkout if timeout is None else timeout
+        limite = time.monotonic() + espera_max
+        esperado = False
+        inicio_espera = 0.0
+        while True:
+            candidata = None
+            crear = False
+            with self._cond:
+                if self._cerrado:
+                    raise PoolAgotadoError("El pool de conexiones está cerrado")
+                vencidas = self._reap_locked(time.monotonic())
+                if self._inactivas:
+                    # LIFO: se reutiliza la más reciente y las antiguas envejecen
+                    candidata = self._inactivas.pop()
+                elif self._total < self.max_size:
+                    self._total += 1
+                    crear = True
+                else:
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        self._stats['timeouts'] += 1
+                        if esperado:
+                            self._stats['tiempo_espera_total'] += time.monotonic() - inicio_espera
+                        raise PoolAgotadoError(
+                            "No hay conexiones libres tras %.1f s (max_size=%d)" % (espera_max, self.max_size))
+                    if not esperado:
+                        esperado = True
+                        inicio_espera = time.monotonic()
+                        self._stats['esperas'] += 1
+                    self._cond.wait(restante)
+                    continue
+
+            self._cerrar_todas(vencidas)
+            if crear:
+                conn = self._crear()
+            else:
+                conn, devuelta_en = candidata
+                if not self._sana(conn, time.monotonic() - devuelta_en):
+                    self._descartar(conn)
+                    with self._cond:
+                        self._stats['fallidas_salud'] += 1
+                    continue
+
+            with self._cond:
+                self._stats['checkouts'] += 1
+                if esperado:
+                    self._stats['tiempo_espera_total'] += time.monotonic() - inicio_espera
+            return conn
+
+    def devolver(self, conn: Any, descartar: bool = False) -> None:
+        """
+        Devuelve una conexión al pool.
+
+        Cualquier transacción pendiente se revierte para que la conexión
+        quede limpia (y sin snapshot de lectura viejo) para el siguiente uso.
+
+        Args:
+            conn (Any): Conexión obtenida con ``obtener``
+            descartar (bool): Si es True la conexión se cierra en vez de reutilizarse
+        """
+        if conn is None:
+            return
+        if not descartar:
+            try:
+                if not getattr(conn, 'open', False):
+                    descartar = True
+                else:
+                    conn.rollback()
+            except Exception as e:
+                logger.warning("Conexión descartada al devolverla al pool: %s", e)
+                descartar = True
+        with self._cond:
+            self._stats['devoluciones'] += 1
+            if not descartar and not self._cerrado:
+                ahora = time.monotonic()
+                self._inactivas.append((conn, ahora))
+                self._cond.notify()
+                vencidas = self._reap_locked(ahora)
+            else:
+                vencidas = None
+        if vencidas is None:
+            self._descartar(conn)
+        else:
+            self._cerrar_todas(vencidas)
+
+    def cerrar(self) -> None:
+        """Cierra todas las conexiones inactivas y rechaza nuevos pedidos."""
+        with self._cond:
+            self._cerrado = True
+            inactivas = [c for c, _ in self._inactivas]
+            self._inactivas.clear()
+            self._cond.notify_all()
+        for conn in inactivas:
+            self._descartar(conn)
+        logger.info("🔌 Pool de conexiones cerrado")
+
+    def estadisticas(self) -> Dict[str, float]:
+        """
+        Obtiene los contadores del pool.
+
+        Returns:
+            Dict[str, float]: checkouts, esperas, timeouts, conexiones creadas y
+            cerradas (rotación), además de conexiones en uso e inactivas
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats['abiertas'] = self._total
+            stats['inactivas'] = len(self._inactivas)
+            stats['en_uso'] = self._total - len(self._inactivas)
+        return stats
+
+    def _crear(self) -> Any:
+        try:
+            conn = self._fabrica()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._stats['errores_creacion'] += 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats['creadas'] += 1
+        return conn
+
+    def _sana(self, conn: Any, inactividad: float) -> bool:
+        try:
+            if not getattr(conn, 'open', False):
+                return False
+            if inactividad >= self.verificar_tras:
+                conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.warning("Conexión inactiva no responde, se descarta: %s", e)
+            return False
+
+    def _descartar(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._total -= 1
+            self._stats['cerradas'] += 1
+            self._cond.notify()
+
+    def _reap_locked(self, ahora: float) -> list:
+        # Las inactivas más antiguas están al inicio de la cola; se retiran
+        # aquí y se cierran fuera del lock para no bloquear a otros hilos.
+        vencidas = []
+        while (len(self._inactivas) > self.min_size
+               and ahora - self._inactivas[0][1] > self.max_idle):
+            conn, _ = self._inactivas.popleft()
+            self._total -= 1
+            self._stats['cerradas'] += 1
+            self._stats['reaped'] += 1
+            vencidas.append(conn)
+        return vencidas
+
+    @staticmethod
+    def _cerrar_todas(conexiones: list) -> None:
+        for conn in conexiones:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+_pool: Optional[PoolConexiones] = None
+_pool_lock = threading.Lock()
+
+
+def _entero_env(nombre: str, defecto: int) -> int:
+    try:
+        return int(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+def _real_env(nombre: str, defecto: float) -> float:
+    try:
+        return float(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+def _fabrica_mysql() -> pymysql.connections.Connection:
+    """Crea una conexión MySQL con los parámetros del entorno (DB_*)."""
+    return pymysql.connect(
+        host=os.environ.get("DB_HOST", "localhost"),
+        user=os.environ.get("DB_USER", "root"),
+        password=os.environ.get("DB_PASSWORD", ""),
+        database=os.environ.get("DB_NAME", "viaja_seguro"),
+        port=_entero_env("DB_PORT", 3306),
+        charset='utf8mb4'
+    )
+
+
+def obtener_pool() -> PoolConexiones:
+    """
+    Obtiene el pool compartido del proceso, creándolo en el primer uso.
+
+    El tamaño se configura con DB_POOL_MIN, DB_POOL_MAX, DB_POOL_TIMEOUT y
+    DB_POOL_MAX_IDLE.
+
+    Returns:
+        PoolConexiones: Pool compartido
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = PoolConexiones(
+                    _fabrica_mysql,
+                    min_size=_entero_env("DB_POOL_MIN", 1),
+                    max_size=_entero_env("DB_POOL_MAX", 10),
+                    timeout_checkout=_real_env("DB_POOL_TIMEOUT", 5.0),
+                    max_idle=_real_env("DB_POOL_MAX_IDLE", 300.0)
+                )
+                pool.precalentar()
+                _pool = pool
+    return _pool
+
+
+def configurar_pool(pool: Optional[PoolConexiones]) -> Optional[PoolConexiones]:
+    """
+    Reemplaza el pool compartido (por ejemplo, para pruebas o benchmarks).
+
+    Args:
+        pool (Optional[PoolConexiones]): Nuevo pool, o None para volver al por defecto
+
+    Returns:
+        Optional[PoolConexiones]: El pool anterior, que queda a cargo del llamador
+    """
+    global _pool
+    with _pool_lock:
+        anterior = _pool
+        _pool = pool
+    return anterior
+
+
+def cerrar_pool() -> None:
+    """Cierra el pool compartido si fue creado (llamar al terminar el proceso)."""
+    anterior = configurar_pool(None)
+    if anterior is not None:
+        anterior.cerrar()
+
+
+#: Filas por viaje al servidor en las consultas en streaming (DB_FETCH_LOTE)
+TAMANO_LOTE = _entero_env("DB_FETCH_LOTE", 500)
+
+
+def iterar_consulta(conn: Any, sql: str, params: Optional[Tuple] = None,
+                    tamano_lote: Optional[int] = None) -> Iterator[Tuple]:
+    """
+    Recorre el resultado de una consulta con un cursor de servidor sin buffer.
+
+    Las filas se traen en lotes de ``tamano_lote`` con ``fetchmany``, de modo
+    que la memoria usada no depende del tamaño de la tabla y la primera fila
+    llega sin esperar al resto. Mientras el generador esté abierto la
+    conexión queda ocupada: no se deben ejecutar otras consultas en ella.
+
+    Args:
+        conn: Conexión pymysql (o la conexión compartida de una unidad de trabajo)
+        sql (str): Consulta a ejecutar
+        params (Optional[Tuple]): Parámetros de la consulta
+        tamano_lote (Optional[int]): Filas por lote (default: TAMANO_LOTE)
+
+    Yields:
+        Tuple: Cada fila del resultado
+    """
+    lote = tamano_lote or TAMANO_LOTE
+    cursor = conn.cursor(pymysql.cursors.SSCursor)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            filas = cursor.fetchmany(lote)
+            if not filas:
+                break
+            yield from filas
+    finally:
+        # Cerrar un SSCursor descarta las filas pendientes y libera la conexión
+        cursor.close()
+
+
+TAMANO_IN = _entero_env("DB_IN_LOTE", 500)
+
+
+def consultar_por_ids(conn: Any, sql: str, ids: Iterable[Any],
+                      tamano_lote: Optional[int] = None) -> Iterator[Tuple]:
+    """
+    Ejecuta una consulta ``IN (...)`` por lotes de IDs.
+
+    Los IDs se deduplican (conservando el orden) y se envían en bloques de
+    ``tamano_lote``, de modo que resolver cientos de referencias cuesta una
+    ida y vuelta por bloque en vez de una por ID, sin armar sentencias de
+    largo ilimitado.
+
+    Args:
+        conn: Conexión pymysql (o la conexión compartida de una unidad de trabajo)
+        sql (str): Consulta con el marcador ``{marcadores}`` dentro del ``IN``
+        ids (Iterable[Any]): IDs a buscar (los None se ignoran)
+        tamano_lote (Optional[int]): IDs por consulta (default: TAMANO_IN)
+
+    Yields:
+        Tuple: Cada fila encontrada
+    """
+    unicos = list(dict.fromkeys(i for i in ids if i is not None))
+    if not unicos:
+        return
+    lote = tamano_lote or TAMANO_IN
+    cursor = conn.cursor()
+    try:
+        for inicio in range(0, len(unicos), lote):
+            bloque = unicos[inicio:inicio + lote]
+            cursor.execute(sql.format(marcadores=", ".join(["%s"] * len(bloque))), bloque)
+            yield from cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+#: Errores de MySQL que indican un esquema sin migrar (columna, tabla o índice inexistente)
+CODIGOS_ESQUEMA = frozenset((1054, 1146, 1176))
+
+
+def es_error_de_esquema(error: BaseException) -> bool:
+    """
+    Indica si un error de la base de datos se debe a un esquema desactualizado.
+
+    Estos errores no deben convertirse en un resultado vacío: el DAO los
+    vuelve a lanzar para que se note que falta aplicar la migración.
+
+    Args:
+        error (BaseException): Excepción capturada por el DAO
+
+    Returns:
+        bool: True si es un error pymysql con un código de CODIGOS_ESQUEMA
+    """
+    return (isinstance(error, pymysql.MySQLError) and bool(error.args)
+            and error.args[0] in CODIGOS_ESQUEMA)
+
+class _ConexionCompartida:
+    """
+    Envoltorio de la conexión de una unidad de trabajo.
+
+    Delega todo en la conexión real salvo ``commit``, ``rollback`` y
+    ``close``, que quedan en manos de la unidad de trabajo; así los DAOs
+    pueden seguir llamando ``self.conn.commit()`` sin confirmar a medias.
+    """
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, nombre: str) -> Any:
+        return getattr(self._conn, nombre)
+
+
+class UnidadDeTrabajo:
+    """
+    Agrupa varias operaciones de DAO en una sola transacción.
+
+    Mientras el bloque ``with`` está activo, todo ``Conex()`` creado en el
+    mismo hilo comparte la conexión de la unidad de trabajo, y los
+    ``commit()`` de los DAOs se postergan hasta el final: se confirma una
+    sola vez si no hubo errores, o se revierte todo si hubo una excepción
+    o se llamó a ``revertir()``. Las unidades anidadas se unen a la externa.
+
+    Example:
+        >>> with UnidadDeTrabajo() as uow:
+        ...     with DaoArriendo() as dao_a, DaoVehiculo() as dao_v:
+        ...         if not (dao_a.agregarArriendo(a) and dao_v.actualizarEstado(1, "arrendado")):
+        ...             uow.revertir()
+        >>> uow.confirmada
+        True
+    """
+
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        """Prepara la unidad de trabajo; la conexión se obtiene al entrar."""
+        self._pool: Optional[PoolConexiones] = None
+        self._conn: Any = None
+        self._compartida: Optional[_ConexionCompartida] = None
+        self._externa: Optional['UnidadDeTrabajo'] = None
+        self._fallida = False
+        self.confirmada = False
+
+    @classmethod
+    def actual(cls) -> Optional['UnidadDeTrabajo']:
+        """Obtiene la unidad de trabajo activa en el hilo actual, si existe."""
+        return getattr(cls._local, 'uow', None)
+
+    def getConex(self) -> Optional[_ConexionCompartida]:
+        """Obtiene la conexión compartida por los DAOs de esta unidad."""
+        if self._externa is not None:
+            return self._externa.getConex()
+        return self._compartida
+
+    def revertir(self) -> None:
+        """Marca la unidad para revertir todos sus cambios al salir del bloque."""
+        self._fallida = True
+        if self._externa is not None:
+            self._externa.revertir()
+
+    def __enter__(self) -> 'UnidadDeTrabajo':
+        externa = UnidadDeTrabajo.actual()
+        if externa is not None:
+            self._externa = externa
+            return self
+        self._pool = obtener_pool()
+        self._conn = self._pool.obtener()
+        try:
+            self._conn.begin()
+        except Exception:
+            self._pool.devolver(self._conn, descartar=True)
+            raise
+        self._compartida = _ConexionCompartida(self._conn)
+        UnidadDeTrabajo._local.uow = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._externa is not None:
+            if exc_type is not None:
+                self._externa.revertir()
+            self.confirmada = not self._externa._fallida and exc_type is None
+            return
+        UnidadDeTrabajo._local.uow = None
+        descartar = False
+        try:
+            if exc_type is None and not self._fallida:
+                self._conn.commit()
+                self.confirmada = True
+            else:
+                self._conn.rollback()
+                logger.warning("Unidad de trabajo revertida")
+        except Exception as e:
+            logger.error("Error al finalizar la unidad de trabajo: %s", e)
+            descartar = True
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+        finally:
+            self._pool.devolver(self._conn, descartar=descartar)
+            self._conn = None
+            self._compartida = None
+
+
 class Conex:
     """
     Maneja la conexión a la base de datos MySQL.
-    
+
     Proporciona una interfaz simplificada para establecer, verificar
-    y cerrar conexiones a la base de datos.
-    
+    y cerrar conexiones a la base de datos. Sin parámetros explícitos la
+    conexión se toma prestada del pool compartido y ``closeConex`` la devuelve;
+    dentro de una ``UnidadDeTrabajo`` se usa la conexión de la transacción.
+
     Attributes:
         host (str): Servidor de base de datos
         user (str): Usuario de la base de datos
@@ -19,62 +570,84 @@ class Conex:
         port (int): Puerto de conexión
         __myconn: Conexión interna a MySQL
     """
-    
-    def __init__(self, host: str = "localhost", user: str = "root", 
-                 passwd: str = "", database: str = "viaja_seguro", 
-                 port: int = 3306) -> None:
+
+    def __init__(self, host: Optional[str] = None, user: Optional[str] = None,
+                 passwd: Optional[str] = None, database: Optional[str] = None,
+                 port: Optional[int] = None) -> None:
         """
         Inicializa una nueva conexión a la base de datos.
-        
+
         Args:
-            host (str): Servidor de base de datos (default: "localhost")
-            user (str): Usuario de la base de datos (default: "root")
-            passwd (str): Contraseña del usuario (default: "")
-            database (str): Nombre de la base de datos (default: "viaja_seguro")
-            port (int): Puerto de conexión (default: 3306)
-        """
-        self.host = host
-        self.user = user
-        self.passwd = passwd
-        self.database = database
-        self.port = port
+            host (str): Servidor de base de datos (default: DB_HOST o "localhost")
+            user (str): Usuario de la base de datos (default: DB_USER o "root")
+            passwd (str): Contraseña del usuario (default: DB_PASSWORD o "")
+            database (str): Nombre de la base de datos (default: DB_NAME o "viaja_seguro")
+            port (int): Puerto de conexión (default: DB_PORT o 3306)
+        """
+        self._dedicada = any(p is not None for p in (host, user, passwd, database, port))
+        self.host = host if host is not None else os.environ.get("DB_HOST", "localhost")
+        self.user = user if user is not None else os.environ.get("DB_USER", "root")
+        self.passwd = passwd if passwd is not None else os.environ.get("DB_PASSWORD", "")
+        self.database = database if database is not None else os.environ.get("DB_NAME", "viaja_seguro")
+        self.port = port if port is not None else _entero_env("DB_PORT", 3306)
         self.__myconn: Optional[pymysql.connections.Connection] = None
+        self.__pool: Optional[PoolConexiones] = None
         self.connect()
 
     def connect(self) -> None:
         """
         Establece la conexión con la base de datos.
-        
-        Raises:
-            pymysql.Error: Si no se puede establecer la conexión
+
+        Con parámetros explícitos abre una conexión dedicada; si hay una
+        unidad de trabajo activa usa su conexión, y en otro caso pide una
+        conexión al pool compartido.
         """
         try:
-            self.__myconn = pymysql.connect(
-                host=self.host,
-                user=self.user,
-                password=self.passwd,
-                database=self.database,
-                port=self.port,
-                charset='utf8mb4'
-            )
-            logger.info("✅ Conexión a MySQL establecida correctamente")
-            logger.info("✅ Base de datos: %s", self.database)
+            uow = None if self._dedicada else UnidadDeTrabajo.actual()
+            if uow is not None:
+                self.__myconn = uow.getConex()
+            elif self._dedicada:
+                self.__myconn = pymysql.connect(
+                    host=self.host,
+                    user=self.user,
+                    password=self.passwd,
+                    database=self.database,
+                    port=self.port,
+                    charset='utf8mb4'
+                )
+                logger.info("✅ Conexión a MySQL establecida correctamente")
+                logger.info("✅ Base de datos: %s", self.database)
+            else:
+                self.__pool = obtener_pool()
+                self.__myconn = self.__pool.obtener()
+                logger.debug("Conexión obtenida del pool")
         except Exception as ex:
             logger.error("❌ Error de conexión: %s", ex)
-            logger.error("   Host: %s, User: %s, Database: %s", 
+            logger.error("   Host: %s, User: %s, Database: %s",
                         self.host, self.user, self.database)
             self.__myconn = None
+            self.__pool = None
 
     def closeConex(self) -> None:
-        """Cierra la conexión a la base de datos si está abierta."""
-        if self.__myconn:
-            self.__myconn.close()
+        """Libera la conexión: la devuelve al pool o la cierra si es dedicada."""
+        conn, self.__myconn = self.__myconn, None
+        if not conn:
+            return
+        if self.__pool is not None:
+            self.__pool.devolver(conn)
+            self.__pool = None
+            logger.debug("Conexión devuelta al pool")
+        elif isinstance(conn, _ConexionCompartida):
+            # La conexión pertenece a la unidad de trabajo
+            return
+        else:
+            conn.close()
             logger.info("🔌 Conexión cerrada")
 
     def getConex(self) -> Optional[pymysql.connections.Connection]:
         """
         Obtiene la conexión activa a la base de datos.
-        
+
         Returns:
             Optional[pymysql.connections.Connection]: Conexión activa o None
         """
@@ -83,7 +656,7 @@ class Conex:
     def is_connected(self) -> bool:
         """
         Verifica si la conexión está activa y funcionando.
-        
+
         Returns:
             bool: True si la conexión está activa, False en caso contrario
         """
@@ -96,3 +669,18 @@ class Conex:
             return False
         except Exception:
             return False
+
+    def __enter__(self) -> 'Conex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.closeConex()
+
+    def __del__(self) -> None:
+        # Red de seguridad: una conexión olvidada vuelve al pool
+        try:
+            if self.__myconn is not None and self.__pool is not None:
+                logger.debug("Conexión no liberada explícitamente; se devuelve al pool")
+                self.closeConex()
+        except Exception:
+            pass
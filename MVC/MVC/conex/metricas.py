@@ -0,0 +1,515 @@
+import contextvars
+import functools
+import inspect
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+logger_lentas = logging.getLogger("conex.consultas_lentas")
+
+T = TypeVar('T')
+
+SIN_OPERACION = "(sin DAO)"
+
+
+def _entero_env(nombre: str, defecto: int) -> int:
+    try:
+        return int(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+def _real_env(nombre: str, defecto: float) -> float:
+    try:
+        return float(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+class Histograma:
+    """
+    Histograma de latencias con cubetas geométricas.
+
+    Cada cubeta es un 9 % más ancha que la anterior (8 por cada potencia de
+    2), desde 10 µs hasta ~3 min, así que registrar un valor cuesta un
+    logaritmo y un incremento, la memoria es fija (~200 enteros) y los
+    percentiles tienen un error relativo menor al 9 %.
+    """
+
+    MINIMO = 1e-5
+    CUBETAS_POR_OCTAVA = 8
+    CUBETAS = 8 * 24
+
+    __slots__ = ('conteos', 'total', 'suma', 'maximo')
+
+    def __init__(self) -> None:
+        self.conteos = [0] * (self.CUBETAS + 1)
+        self.total = 0
+        self.suma = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos: float) -> None:
+        if segundos <= self.MINIMO:
+            indice = 0
+        else:
+            indice = min(int(math.log2(segundos / self.MINIMO) * self.CUBETAS_POR_OCTAVA) + 1, self.CUBETAS)
+        self.conteos[indice] += 1
+        self.total += 1
+        self.suma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, p: float) -> float:
+        """
+        Obtiene el percentil `p` (0-100) en segundos.
+
+        Devuelve el límite superior de la cubeta donde cae el percentil,
+        acotado por el máximo observado.
+        """
+        if not self.total:
+            return 0.0
+        objetivo = max(1, math.ceil(self.total * p / 100))
+        acumulado = 0
+        for indice, conteo in enumerate(self.conteos):
+            acumulado += conteo
+            if acumulado >= objetivo:
+                return min(self.MINIMO * 2 ** (indice / self.CUBETAS_POR_OCTAVA), self.maximo)
+        return self.maximo
+
+
+class ResumenOperacion(NamedTuple):
+    """Métricas acumuladas de una operación (método de DAO)."""
+    operacion: str
+    llamadas: int
+    p50: float
+    p95: float
+    p99: float
+    maximo: float
+    sentencias: int
+    segundos_bd: float
+    filas: int
+    bytes: int
+    errores: int
+
+
+class ConsultaLenta(NamedTuple):
+    """Una sentencia que superó el umbral de consulta lenta."""
+    momento: datetime
+    operacion: str
+    segundos: float
+    filas: int
+    parametros: int
+    forma: str
+
+
+class _Operacion:
+    __slots__ = ('histograma', 'sentencias', 'segundos_bd', 'filas', 'bytes', 'errores')
+
+    def __init__(self) -> None:
+        self.histograma = Histograma()
+        self.sentencias = 0
+        self.segundos_bd = 0.0
+        self.filas = 0
+        self.bytes = 0
+        self.errores = 0
+
+
+class RegistroMetricas:
+    """
+    Métricas en memoria de las operaciones de base de datos.
+
+    Por cada operación (``DaoVehiculo.buscarVehiculo``...) guarda un
+    histograma del tiempo total del método y, desde el cursor, el tiempo en
+    la base de datos, filas y bytes leídos, sentencias y errores. Las
+    sentencias que tardan más que `umbral_lenta` se registran en el logger
+    ``conex.consultas_lentas`` y en una lista con las últimas `max_lentas`.
+
+    Args:
+        umbral_lenta (float): Segundos desde los que una sentencia es lenta
+        max_lentas (int): Consultas lentas que se conservan para el informe
+    """
+
+    def __init__(self, umbral_lenta: float = 0.2, max_lentas: int = 50) -> None:
+        self.umbral_lenta = umbral_lenta
+        self._operaciones: Dict[str, _Operacion] = {}
+        self._lentas: Deque[ConsultaLenta] = deque(maxlen=max_lentas)
+        self._lock = threading.Lock()
+        self.desde = datetime.now()
+
+    def _operacion(self, nombre: str) -> _Operacion:
+        operacion = self._operaciones.get(nombre)
+        if operacion is None:
+            operacion = self._operaciones.setdefault(nombre, _Operacion())
+        return operacion
+
+    def registrarLlamada(self, operacion: str, segundos: float) -> None:
+        """Registra el tiempo total de una llamada a un método de DAO."""
+        with self._lock:
+            self._operacion(operacion).histograma.registrar(segundos)
+
+    def registrarSentencia(self, operacion: str, sql: str, parametros: int, segundos: float,
+                           filas: int, bytes_leidos: int, error: bool = False) -> None:
+        """
+        Registra una sentencia ejecutada por un cursor medido.
+
+        Args:
+            operacion (str): Operación en curso
+            sql (str): Sentencia con marcadores (sin valores)
+            parametros (int): Cantidad de parámetros enviados
+            segundos (float): Tiempo de execute más los fetch posteriores
+            filas (int): Filas leídas
+            bytes_leidos (int): Tamaño estimado de las filas leídas
+            error (bool): Si la sentencia lanzó una excepción
+        """
+        with self._lock:
+            datos = self._operacion(operacion)
+            datos.sentencias += 1
+            datos.segundos_bd += segundos
+            datos.filas += filas
+            datos.bytes += bytes_leidos
+            datos.errores += error
+        if segundos >= self.umbral_lenta:
+            forma = forma_sql(sql)
+            self._lentas.append(ConsultaLenta(datetime.now(), operacion, segundos, filas, parametros, forma))
+            logger_lentas.warning("Consulta lenta en %s: %.1f ms, %d filas, %d parámetros: %s",
+                                  operacion, segundos * 1000, filas, parametros, forma)
+
+    def resumen(self) -> List[ResumenOperacion]:
+        """
+        Obtiene las métricas de cada operación, de mayor a menor tiempo total.
+
+        Returns:
+            List[ResumenOperacion]: Una entrada por operación (tiempos en segundos)
+        """
+        with self._lock:
+            filas = [ResumenOperacion(nombre, d.histograma.total, d.histograma.percentil(50),
+                                      d.histograma.percentil(95), d.histograma.percentil(99),
+                                      d.histograma.maximo, d.sentencias, d.segundos_bd, d.filas,
+                                      d.bytes, d.errores)
+                     for nombre, d in self._operaciones.items()]
+            totales = {nombre: d.histograma.suma or d.segundos_bd for nombre, d in self._operaciones.items()}
+        return sorted(filas, key=lambda fila: totales[fila.operacion], reverse=True)
+
+    def consultasLentas(self) -> List[ConsultaLenta]:
+        """Obtiene las últimas consultas lentas, de la más reciente a la más antigua."""
+        return list(reversed(self._lentas))
+
+    def volcar(self) -> str:
+        """
+        Obtiene un informe de texto con las métricas y las consultas lentas.
+
+        Returns:
+            str: Tabla por operación (tiempos en ms, bytes en KB) y consultas lentas recientes
+        """
+        lineas = [f"Métricas de base de datos desde {self.desde:%Y-%m-%d %H:%M:%S}",
+                  f"{'Operación':<44}{'Llamadas':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Máx':>9}"
+                  f"{'Sent.':>7}{'BD ms':>10}{'Filas':>9}{'KB':>9}{'Err':>5}"]
+        for fila in self.resumen():
+            lineas.append(f"{fila.operacion[:43]:<44}{fila.llamadas:>9}{fila.p50 * 1000:>9.1f}"
+                          f"{fila.p95 * 1000:>9.1f}{fila.p99 * 1000:>9.1f}{fila.maximo * 1000:>9.1f}"
+                          f"{fila.sentencias:>7}{fila.segundos_bd * 1000:>10.1f}{fila.filas:>9}"
+                          f"{fila.bytes / 1024:>9.1f}{fila.errores:>5}")
+        lentas = self.consultasLentas()
+        lineas.append(f"Consultas lentas (>= {self.umbral_lenta * 1000:.0f} ms): {len(lentas)}")
+        for lenta in lentas:
+            lineas.append(f"  {lenta.momento:%H:%M:%S} {lenta.operacion} {lenta.segundos * 1000:.1f} ms, "
+                          f"{lenta.filas} filas, {lenta.parametros} parámetros: {lenta.forma}")
+        return "\n".join(lineas)
+
+    def reiniciar(self) -> None:
+        """Descarta todas las métricas acumuladas."""
+        with self._lock:
+            self._operaciones.clear()
+            self._lentas.clear()
+            self.desde = datetime.now()
+
+
+_registro: Optional[RegistroMetricas] = None
+_registro_leido = False
+_registro_lock = threading.Lock()
+
+# Operación (Clase.metodo) que está ejecutando el hilo o tarea actual
+_operacion_actual: contextvars.ContextVar[str] = contextvars.ContextVar('operacion_dao', default=SIN_OPERACION)
+
+
+def obtener_registro() -> Optional[RegistroMetricas]:
+    """
+    Obtiene el registro de métricas compartido, creándolo la primera vez.
+
+    Se configura con DB_METRICAS (0 desactiva la medición),
+    DB_CONSULTA_LENTA_MS (default 200) y DB_MAX_LENTAS (default 50).
+
+    Returns:
+        Optional[RegistroMetricas]: Registro compartido o None si está desactivado
+    """
+    global _registro, _registro_leido
+    if not _registro_leido:
+        with _registro_lock:
+            if not _registro_leido:
+                if _entero_env("DB_METRICAS", 1):
+                    _registro = RegistroMetricas(umbral_lenta=_real_env("DB_CONSULTA_LENTA_MS", 200) / 1000,
+                                                 max_lentas=_entero_env("DB_MAX_LENTAS", 50))
+                _registro_leido = True
+    return _registro
+
+
+def configurar_registro(registro: Optional[RegistroMetricas]) -> Optional[RegistroMetricas]:
+    """
+    Reemplaza el registro de métricas compartido (útil en pruebas).
+
+    Args:
+        registro (Optional[RegistroMetricas]): Nuevo registro
+
+    Returns:
+        Optional[RegistroMetricas]: Registro anterior
+    """
+    global _registro, _registro_leido
+    with _registro_lock:
+        anterior, _registro = _registro, registro
+        _registro_leido = True
+    return anterior
+
+
+_PARAMETROS_REPETIDOS = re.compile(r"%s(?:\s*,\s*%s)+")
+_ESPACIOS = re.compile(r"\s+")
+
+
+def forma_sql(sql: str, largo_maximo: int = 300) -> str:
+    """
+    Normaliza una sentencia para agruparla y registrarla sin datos.
+
+    Colapsa espacios y las listas de marcadores (``IN (%s, %s, ...)``), que
+    cambian de largo según la cantidad de IDs.
+
+    Args:
+        sql (str): Sentencia con marcadores
+        largo_maximo (int): Largo máximo del resultado
+
+    Returns:
+        str: Forma de la sentencia
+    """
+    forma = _PARAMETROS_REPETIDOS.sub("%s, ...", _ESPACIOS.sub(" ", sql).strip())
+    return forma if len(forma) <= largo_maximo else forma[:largo_maximo - 3] + "..."
+
+
+_TEXTO = (str, bytes, bytearray)
+
+
+def _bytes_fila(fila: Any) -> int:
+    """Estima el tamaño de una fila: largo de los textos y 8 bytes por cualquier otro valor."""
+    if isinstance(fila, dict):
+        fila = fila.values()
+    total = 0
+    for valor in fila:
+        if valor.__class__ in _TEXTO:
+            total += len(valor)
+        elif valor is not None:
+            total += 8
+    return total
+
+
+def _cantidad_parametros(params: Any) -> int:
+    if params is None:
+        return 0
+    if isinstance(params, (str, bytes, int, float)):
+        return 1
+    return len(params)
+
+
+class _CursorMedido:
+    """
+    Cursor que mide cada sentencia: execute más los fetch que le siguen.
+
+    La sentencia se cierra (y se registra) al ejecutar la siguiente o al
+    cerrar el cursor, así los cursores sin buffer de `iterar_consulta`
+    cuentan también el tiempo de traer las filas por lotes. Los bytes se
+    estiman con el ancho de la primera fila por la cantidad de filas.
+    """
+
+    def __init__(self, cursor: Any, registro: RegistroMetricas) -> None:
+        self._cursor = cursor
+        self._registro = registro
+        self._sql: Optional[str] = None
+
+    def _abrir(self, sql: str, params: Any) -> None:
+        self._cerrarSentencia()
+        self._sql = sql
+        self._operacion = _operacion_actual.get()
+        self._parametros = _cantidad_parametros(params)
+        self._segundos = 0.0
+        self._filas = 0
+        self._ancho = -1
+        self._error = False
+
+    def _cerrarSentencia(self) -> None:
+        if self._sql is not None:
+            sql, self._sql = self._sql, None
+            self._registro.registrarSentencia(self._operacion, sql, self._parametros, self._segundos,
+                                              self._filas, max(self._ancho, 0) * self._filas, self._error)
+
+    def _ejecutar(self, metodo: Callable, sql: str, params: Any) -> Any:
+        self._abrir(sql, params)
+        inicio = time.perf_counter()
+        try:
+            return metodo(sql, params)
+        except Exception:
+            self._error = True
+            raise
+        finally:
+            self._segundos += time.perf_counter() - inicio
+
+    def execute(self, sql: str, params: Any = None) -> Any:
+        return self._ejecutar(self._cursor.execute, sql, params)
+
+    def executemany(self, sql: str, params: Any) -> Any:
+        return self._ejecutar(self._cursor.executemany, sql, params)
+
+    def _leer(self, metodo: Callable, *args) -> Any:
+        inicio = time.perf_counter()
+        try:
+            resultado = metodo(*args)
+        finally:
+            if self._sql is not None:
+                self._segundos += time.perf_counter() - inicio
+        if self._sql is not None and resultado:
+            if isinstance(resultado, (list, tuple)) and isinstance(resultado[0], (list, tuple, dict)):
+                self._filas += len(resultado)
+                fila = resultado[0]
+            else:
+                self._filas += 1
+                fila = resultado
+            if self._ancho < 0:
+                self._ancho = _bytes_fila(fila)
+        return resultado
+
+    def fetchone(self) -> Any:
+        return self._leer(self._cursor.fetchone)
+
+    def fetchmany(self, size: Optional[int] = None) -> Any:
+        return self._leer(self._cursor.fetchmany, *(() if size is None else (size,)))
+
+    def fetchall(self) -> Any:
+        return self._leer(self._cursor.fetchall)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self) -> None:
+        try:
+            self._cursor.close()
+        finally:
+            self._cerrarSentencia()
+
+    def __enter__(self) -> '_CursorMedido':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __getattr__(self, nombre: str) -> Any:
+        return getattr(self._cursor, nombre)
+
+
+class _ConexionMedida:
+    """Envoltorio de una conexión cuyos cursores se miden; delega todo lo demás."""
+
+    def __init__(self, conn: Any, registro: RegistroMetricas) -> None:
+        self._conn = conn
+        self._registro = registro
+
+    def cursor(self, *args, **kwargs) -> _CursorMedido:
+        return _CursorMedido(self._conn.cursor(*args, **kwargs), self._registro)
+
+    def __getattr__(self, nombre: str) -> Any:
+        return getattr(self._conn, nombre)
+
+
+def conexion_medida(conn: Any) -> Any:
+    """
+    Envuelve una conexión para que sus cursores registren métricas.
+
+    Args:
+        conn: Conexión pymysql (o None si no se pudo conectar)
+
+    Returns:
+        La conexión envuelta; la misma conexión si es None o la medición está desactivada
+    """
+    registro = obtener_registro()
+    if conn is None or registro is None:
+        return conn
+    return _ConexionMedida(conn, registro)
+
+
+def instrumentar_dao(clase: Type[T]) -> Type[T]:
+    """
+    Decorador de clase que mide cada método público de un DAO.
+
+    Mientras corre el método, las sentencias de sus cursores se atribuyen
+    a ``Clase.metodo``, y al terminar se registra su tiempo total. En los
+    métodos generadores (``iter*``) solo cuenta el tiempo dentro del
+    generador, no el que pasa el consumidor entre fila y fila.
+
+    Args:
+        clase (Type[T]): Clase DAO
+
+    Returns:
+        Type[T]: La misma clase con sus métodos públicos envueltos
+    """
+    for nombre, metodo in list(vars(clase).items()):
+        if nombre.startswith('_') or nombre == 'cerrar' or not inspect.isfunction(metodo):
+            continue
+        setattr(clase, nombre, _medir(metodo, f"{clase.__name__}.{nombre}"))
+    return clase
+
+
+def _medir(metodo: Callable, operacion: str) -> Callable:
+    if inspect.isgeneratorfunction(metodo):
+        @functools.wraps(metodo)
+        def envoltura_generador(*args, **kwargs):
+            registro = obtener_registro()
+            if registro is None:
+                yield from metodo(*args, **kwargs)
+                return
+            generador = metodo(*args, **kwargs)
+            segundos = 0.0
+            try:
+                while True:
+                    token = _operacion_actual.set(operacion)
+                    inicio = time.perf_counter()
+                    try:
+                        elemento = next(generador)
+                    except StopIteration:
+                        return
+                    finally:
+                        segundos += time.perf_counter() - inicio
+                        _operacion_actual.reset(token)
+                    yield elemento
+            finally:
+                token = _operacion_actual.set(operacion)
+                try:
+                    generador.close()
+                finally:
+                    _operacion_actual.reset(token)
+                registro.registrarLlamada(operacion, segundos)
+        return envoltura_generador
+
+    @functools.wraps(metodo)
+    def envoltura(*args, **kwargs):
+        registro = obtener_registro()
+        if registro is None:
+            return metodo(*args, **kwargs)
+        token = _operacion_actual.set(operacion)
+        inicio = time.perf_counter()
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            registro.registrarLlamada(operacion, time.perf_counter() - inicio)
+            _operacion_actual.reset(token)
+    return envoltura
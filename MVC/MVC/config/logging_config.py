@@ -45,4 +45,13 @@ LOGGING_CONFIG = {
             'propagate': False
         }
     }
-}
\ No newline at end of file
+}
+
+# Cola entre los hilos que registran y el hilo que escribe (ver utils/logger.py).
+# Con la cola llena, los mensajes bajo `nivel_bloqueo` se descartan y los demás
+# esperan hasta `espera_maxima` segundos a que se libere espacio.
+COLA_LOGGING = {
+    'tamano': 10000,
+    'nivel_bloqueo': 'WARNING',
+    'espera_maxima': 1.0
+}
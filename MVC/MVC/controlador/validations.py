@@ -2,15 +2,22 @@ from dto.dto_user import UserDTO
 from dto.dto_cliente import ClienteDTO
 from dto.dto_vehiculo import VehiculoDTO
 from dto.dto_arriendo import ArriendoDTO
+from dto.dto_informe import InformeDTO
 from modelo.empleado import Empleado
 import getpass
 from datetime import datetime, timedelta
 from utils.validador_formatos import *
 import logging
 from servicio.indicador_service import IndicadorService
+from servicio.disponibilidad import VehiculoNoDisponibleError
+from servicio.analitica import numpy_disponible
+from dao.concurrencia import ConflictoVersionError
 
 logger = logging.getLogger(__name__)
 
+# Filas por página en los listados de clientes, vehículos y arriendos
+TAMANO_PAGINA = 20
+
 def validarLogin(username, password):
     logger.debug("Validando credenciales para usuario: %s", username)
     userdto = UserDTO()
@@ -81,6 +88,21 @@ def obtener_dato_validado(funcion_validacion, mensaje, mensaje_error, formato_es
             if formato_esperado:
                 print(f"💡 Formato esperado: {formato_esperado}")
 
+def mostrar_paginado(obtener_pagina, mostrar):
+    """Muestra un listado página a página (Enter avanza, 'q' vuelve). Retorna el total mostrado."""
+    cursor = None
+    total = 0
+    while True:
+        pagina = obtener_pagina(TAMANO_PAGINA, cursor)
+        for elemento in pagina:
+            total += 1
+            mostrar(total, elemento)
+        if not pagina.hayMas():
+            return total
+        if input("-- Enter para ver más, 'q' para volver: ").strip().lower() == 'q':
+            return total
+        cursor = pagina.getSiguiente()
+
 def gestion_empleados():
     """Gestión de empleados (solo para gerentes)"""
     logger.info("Iniciando gestión de empleados")
@@ -226,10 +248,16 @@ def gestion_empleados():
                     "Cargo inválido"
                 ) or empleado_existente.getCargo()
                 
-                if userdto.actualizarUsuario(run, nombre, apellido, password, cargo):
+                try:
+                    actualizado = userdto.actualizarUsuario(run, nombre, apellido, password, cargo, original=empleado_existente)
+                except ConflictoVersionError:
+                    logger.warning("Empleado modificado por otra sesión: %s", run)
+                    print("❌ Otro usuario modificó este registro mientras lo editaba; búsquelo de nuevo para ver los datos actuales")
+                    actualizado = None
+                if actualizado:
                     logger.info("Empleado actualizado exitosamente: %s", run)
                     print("✅ Empleado actualizado correctamente")
-                else:
+                elif actualizado is not None:
                     logger.error("Error al actualizar empleado: %s", run)
                     print("❌ Error al actualizar empleado")
             else:
@@ -262,11 +290,12 @@ def gestion_empleados():
         elif opcion == '5':
             logger.info("Listando todos los empleados")
             print("\n--- LISTA DE EMPLEADOS ---")
-            empleados = userdto.listarUsuarios()
-            if empleados:
-                logger.debug("Listados %d empleados", len(empleados))
-                for i, empleado in enumerate(empleados, 1):
-                    print(f"{i}. {empleado.getNombre()} {empleado.getApellido()} - RUN: {empleado.getRun()} - Cargo: {empleado.getCargo()}")
+            # Se imprime a medida que llegan las filas (cursor en streaming)
+            i = 0
+            for i, empleado in enumerate(userdto.iterUsuarios(), 1):
+                print(f"{i}. {empleado.getNombre()} {empleado.getApellido()} - RUN: {empleado.getRun()} - Cargo: {empleado.getCargo()}")
+            if i:
+                logger.debug("Listados %d empleados", i)
             else:
                 logger.debug("No hay empleados registrados")
                 print("📝 No hay empleados registrados")
@@ -411,10 +440,16 @@ def gestion_clientes():
                     "Teléfono inválido"
                 ) or cliente_existente.getTelefono()
                 
-                if clientedto.actualizarCliente(run, nombre, apellido, direccion, telefono):
+                try:
+                    actualizado = clientedto.actualizarCliente(run, nombre, apellido, direccion, telefono, original=cliente_existente)
+                except ConflictoVersionError:
+                    logger.warning("Cliente modificado por otra sesión: %s", run)
+                    print("❌ Otro usuario modificó este registro mientras lo editaba; búsquelo de nuevo para ver los datos actuales")
+                    actualizado = None
+                if actualizado:
                     logger.info("Cliente actualizado exitosamente: %s", run)
                     print("✅ Cliente actualizado correctamente")
-                else:
+                elif actualizado is not None:
                     logger.error("Error al actualizar cliente: %s", run)
                     print("❌ Error al actualizar cliente")
             else:
@@ -452,11 +487,11 @@ def gestion_clientes():
         elif opcion == '5':
             logger.info("Listando todos los clientes")
             print("\n--- LISTA DE CLIENTES ---")
-            clientes = clientedto.listarClientes()
-            if clientes:
-                logger.debug("Listados %d clientes", len(clientes))
-                for i, cliente in enumerate(clientes, 1):
-                    print(f"{i}. {cliente.getNombre()} {cliente.getApellido()} - RUN: {cliente.getRun()} - Tel: {cliente.getTelefono()}")
+            i = mostrar_paginado(
+                clientedto.paginarClientes,
+                lambda i, cliente: print(f"{i}. {cliente.getNombre()} {cliente.getApellido()} - RUN: {cliente.getRun()} - Tel: {cliente.getTelefono()}"))
+            if i:
+                logger.debug("Listados %d clientes", i)
             else:
                 logger.debug("No hay clientes registrados")
                 print("📝 No hay clientes registrados")
@@ -602,10 +637,16 @@ def gestion_vehiculos():
                     "Estado inválido"
                 ) or vehiculo_existente.getEstado()
                 
-                if vehiculodto.actualizarVehiculo(patente, marca, modelo, año, precio_diario, estado):
+                try:
+                    actualizado = vehiculodto.actualizarVehiculo(patente, marca, modelo, año, precio_diario, estado, original=vehiculo_existente)
+                except ConflictoVersionError:
+                    logger.warning("Vehículo modificado por otra sesión: %s", patente)
+                    print("❌ Otro usuario modificó este registro mientras lo editaba; búsquelo de nuevo para ver los datos actuales")
+                    actualizado = None
+                if actualizado:
                     logger.info("Vehículo actualizado exitosamente: %s", patente)
                     print("✅ Vehículo actualizado correctamente")
-                else:
+                elif actualizado is not None:
                     logger.error("Error al actualizar vehículo: %s", patente)
                     print("❌ Error al actualizar vehículo")
             else:
@@ -638,12 +679,12 @@ def gestion_vehiculos():
         elif opcion == '5':
             logger.info("Listando todos los vehículos")
             print("\n--- LISTA DE VEHÍCULOS ---")
-            vehiculos = vehiculodto.listarVehiculos()
-            if vehiculos:
-                logger.debug("Listados %d vehículos", len(vehiculos))
-                for i, vehiculo in enumerate(vehiculos, 1):
-                    estado_icon = "🟢" if vehiculo.getEstado() == "disponible" else "🟡" if vehiculo.getEstado() == "mantencion" else "🔴"
-                    print(f"{i}. {vehiculo.getMarca()} {vehiculo.getModelo()} - {vehiculo.getPatente()} - Año: {vehiculo.getAño()} - Precio: ${vehiculo.getPrecioDiario():,.0f} - {estado_icon} {vehiculo.getEstado()}")
+            def mostrar_vehiculo(i, vehiculo):
+                estado_icon = "🟢" if vehiculo.getEstado() == "disponible" else "🟡" if vehiculo.getEstado() == "mantencion" else "🔴"
+                print(f"{i}. {vehiculo.getMarca()} {vehiculo.getModelo()} - {vehiculo.getPatente()} - Año: {vehiculo.getAño()} - Precio: ${vehiculo.getPrecioDiario():,.0f} - {estado_icon} {vehiculo.getEstado()}")
+            i = mostrar_paginado(vehiculodto.paginarVehiculos, mostrar_vehiculo)
+            if i:
+                logger.debug("Listados %d vehículos", i)
             else:
                 logger.debug("No hay vehículos registrados")
                 print("📝 No hay vehículos registrados")
@@ -707,20 +748,8 @@ def gestion_arriendos(empleado_actual):
                 print("❌ ID debe ser un número")
                 continue
             
-            # Listar vehículos disponibles
-            print("\n--- VEHÍCULOS DISPONIBLES ---")
-            vehiculos = vehiculodto.listarVehiculosDisponibles()
-            if not vehiculos:
-                logger.warning("No hay vehículos disponibles para arriendo")
-                print("❌ No hay vehículos disponibles")
-                continue
-            for vehiculo in vehiculos:
-                print(f"  ID: {vehiculo.getIdVehiculo()} - {vehiculo.getMarca()} {vehiculo.getModelo()} - ${vehiculo.getPrecioDiario():,.0f}/día")
-            
             try:
-                id_vehiculo = int(input("\nID del vehículo: "))
-                
-                # Validar fecha de inicio
+                # Las fechas se piden primero para listar solo los vehículos libres en el rango
                 fecha_inicio = obtener_dato_validado(
                     validar_fecha,
                     "Fecha de inicio (YYYY-MM-DD): ",
@@ -736,6 +765,27 @@ def gestion_arriendos(empleado_actual):
                     "YYYY-MM-DD"
                 )
                 
+                if datetime.strptime(fecha_fin, '%Y-%m-%d') <= datetime.strptime(fecha_inicio, '%Y-%m-%d'):
+                    logger.warning("Fechas inválidas para arriendo: inicio %s, fin %s", fecha_inicio, fecha_fin)
+                    print("❌ La fecha fin debe ser posterior a la fecha inicio")
+                    continue
+                
+                # Listar vehículos libres en el rango
+                print(f"\n--- VEHÍCULOS DISPONIBLES DEL {fecha_inicio} AL {fecha_fin} ---")
+                vehiculos = vehiculodto.listarVehiculosDisponiblesEntre(fecha_inicio, fecha_fin)
+                if not vehiculos:
+                    logger.warning("No hay vehículos disponibles entre %s y %s", fecha_inicio, fecha_fin)
+                    print("❌ No hay vehículos disponibles en esas fechas")
+                    continue
+                for vehiculo in vehiculos:
+                    print(f"  ID: {vehiculo.getIdVehiculo()} - {vehiculo.getMarca()} {vehiculo.getModelo()} - ${vehiculo.getPrecioDiario():,.0f}/día")
+                
+                id_vehiculo = int(input("\nID del vehículo: "))
+                if id_vehiculo not in {v.getIdVehiculo() for v in vehiculos}:
+                    logger.warning("Vehículo %s no disponible entre %s y %s", id_vehiculo, fecha_inicio, fecha_fin)
+                    print("❌ El vehículo no está disponible en esas fechas")
+                    continue
+                
                 # Obtener valor UF para la fecha de inicio
                 print(f"Buscando valor de UF para la fecha: {fecha_inicio}...")
                 indicador_uf = IndicadorService.obtener_uf_por_fecha(fecha_inicio)
@@ -755,11 +805,6 @@ def gestion_arriendos(empleado_actual):
                 fecha_f = datetime.strptime(fecha_fin, '%Y-%m-%d')
                 dias = (fecha_f - fecha_ini).days
                 
-                if dias <= 0:
-                    logger.warning("Fechas inválidas para arriendo: inicio %s, fin %s", fecha_inicio, fecha_fin)
-                    print("❌ La fecha fin debe ser posterior a la fecha inicio")
-                    continue
-                
                 vehiculo = vehiculodto.buscarVehiculoPorId(id_vehiculo)
                 if not vehiculo:
                     logger.warning("Vehículo no encontrado para arriendo: ID %s", id_vehiculo)
@@ -778,20 +823,20 @@ def gestion_arriendos(empleado_actual):
                 
                 confirmacion = input("\n¿Confirmar arriendo? (s/n): ")
                 if confirmacion.lower() == 's':
-                    if arriendodto.agregarArriendo(id_vehiculo, id_cliente, empleado_actual.getIdEmpleado(), 
-                                                  fecha_inicio, fecha_fin, costo_total_pesos,
-                                                  valor_uf_fecha=valor_uf_obtenido,
-                                                  fecha_uf_consulta=fecha_uf_obtenida):
-                        # Cambiar estado del vehículo a arrendado
-                        vehiculodto.actualizarVehiculo(vehiculo.getPatente(), vehiculo.getMarca(), 
-                                                      vehiculo.getModelo(), vehiculo.getAño(), 
-                                                      vehiculo.getPrecioDiario(), "arrendado")
+                    # Registra el arriendo y marca el vehículo como arrendado en una transacción
+                    if arriendodto.registrarArriendo(id_vehiculo, id_cliente, empleado_actual.getIdEmpleado(), 
+                                                    fecha_inicio, fecha_fin, costo_total_pesos,
+                                                    valor_uf_fecha=valor_uf_obtenido,
+                                                    fecha_uf_consulta=fecha_uf_obtenida):
                         logger.info("Arriendo agregado exitosamente: vehículo %s, cliente %s", id_vehiculo, id_cliente)
                         print("✅ Arriendo agregado correctamente")
                     else:
                         logger.error("Error al agregar arriendo: vehículo %s, cliente %s", id_vehiculo, id_cliente)
                         print("❌ Error al agregar arriendo")
                         
+            except VehiculoNoDisponibleError as e:
+                logger.warning("Arriendo rechazado: %s", e)
+                print("❌ El vehículo ya fue reservado para esas fechas. Elija otro vehículo.")
             except ValueError as e:
                 logger.error("Error de valor en arriendo: %s", str(e))
                 print(f"❌ Error en los datos ingresados: {e}")
@@ -838,23 +883,13 @@ def gestion_arriendos(empleado_actual):
                         if diferencia.total_seconds() > 4 * 3600:  # 4 horas en segundos
                             confirmacion = input(f"¿Está seguro de cancelar el arriendo ID {id_arriendo}? (s/n): ")
                             if confirmacion.lower() == 's':
-                                if arriendodto.actualizarArriendo(id_arriendo, arriendo.getIdVehiculo(), 
-                                                                arriendo.getIdCliente(), arriendo.getIdEmpleado(),
-                                                                arriendo.getFechaInicio(), arriendo.getFechaFin(),
-                                                                arriendo.getCostoTotal(), "cancelado",
-                                                                valor_uf_fecha=arriendo.getValorUfFecha(),
-                                                                fecha_uf_consulta=arriendo.getFechaUfConsulta()):
-                                    # Liberar vehículo
-                                    vehiculo = vehiculodto.buscarVehiculoPorId(arriendo.getIdVehiculo())
-                                    if vehiculo:
-                                        vehiculodto.actualizarVehiculo(vehiculo.getPatente(), vehiculo.getMarca(), 
-                                                                      vehiculo.getModelo(), vehiculo.getAño(), 
-                                                                      vehiculo.getPrecioDiario(), "disponible")
+                                # Cancela y libera el vehículo en una misma transacción
+                                if arriendodto.cancelarArriendo(id_arriendo, arriendo.getIdVehiculo()):
                                     logger.info("Arriendo cancelado exitosamente: %s", id_arriendo)
                                     print("✅ Arriendo cancelado correctamente")
                                 else:
                                     logger.error("Error al cancelar arriendo: %s", id_arriendo)
-                                    print("❌ Error al cancelar arriendo")
+                                    print("❌ Error al cancelar arriendo (puede que ya no esté activo)")
                         else:
                             logger.warning("Intento de cancelación fuera de plazo: arriendo %s", id_arriendo)
                             print("❌ No se puede cancelar el arriendo. Debe cancelarse al menos 4 horas antes.")
@@ -871,16 +906,16 @@ def gestion_arriendos(empleado_actual):
         elif opcion == '4':
             logger.info("Listando todos los arriendos")
             print("\n--- LISTA DE ARRIENDOS ---")
-            present_list = arriendodto.listarArriendosPresentacion()
-            if present_list:
-                logger.debug("Listados %d arriendos", len(present_list))
-                for item in present_list:
-                    arriendo = item['arriendo']
-                    veh_info = item.get('vehiculo_info', f"Vehículo ID {arriendo.getIdVehiculo()}")
-                    cli_info = item.get('cliente_info', f"Cliente ID {arriendo.getIdCliente()}")
-                    estado_icon = "🟢" if arriendo.getEstado() == "activo" else "🟡" if arriendo.getEstado() == "finalizado" else "🔴"
-                    print(f"ID: {arriendo.getIdArriendo()} - {veh_info} - Cliente: {cli_info}")
-                    print(f"   Fechas: {arriendo.getFechaInicio()} a {arriendo.getFechaFin()} - Costo: ${arriendo.getCostoTotal():,.0f} - {estado_icon} {arriendo.getEstado()}\n")
+            def mostrar_arriendo(i, item):
+                arriendo = item['arriendo']
+                veh_info = item.get('vehiculo_info', f"Vehículo ID {arriendo.getIdVehiculo()}")
+                cli_info = item.get('cliente_info', f"Cliente ID {arriendo.getIdCliente()}")
+                estado_icon = "🟢" if arriendo.getEstado() == "activo" else "🟡" if arriendo.getEstado() == "finalizado" else "🔴"
+                print(f"ID: {arriendo.getIdArriendo()} - {veh_info} - Cliente: {cli_info}")
+                print(f"   Fechas: {arriendo.getFechaInicio()} a {arriendo.getFechaFin()} - Costo: ${arriendo.getCostoTotal():,.0f} - {estado_icon} {arriendo.getEstado()}\n")
+            i = mostrar_paginado(arriendodto.paginarArriendosPresentacion, mostrar_arriendo)
+            if i:
+                logger.debug("Listados %d arriendos", i)
             else:
                 logger.debug("No hay arriendos registrados")
                 print("📝 No hay arriendos registrados")
@@ -922,6 +957,7 @@ def generar_informes():
     vehiculodto = VehiculoDTO()
     userdto = UserDTO()
     arriendodto = ArriendoDTO()
+    informedto = InformeDTO()
     
     while True:
         print("""
@@ -931,7 +967,10 @@ def generar_informes():
 3. Informe de Empleados
 4. Informe de Arriendos
 5. Informe General del Sistema
-6. Volver al Menú Principal
+6. Análisis de Ingresos (por mes, vehículo y empleado)
+7. Utilización de la Flota
+8. Métricas de Rendimiento de la Base de Datos
+9. Volver al Menú Principal
 """)
         opcion = input("Seleccione una opción: ")
         
@@ -940,11 +979,12 @@ def generar_informes():
             print("\n" + "="*50)
             print("           INFORME DE CLIENTES")
             print("="*50)
-            clientes = clientedto.listarClientes()
-            logger.debug("Informe clientes - Total: %d", len(clientes))
-            print(f"Total de clientes: {len(clientes)}")
+            # Totales calculados en la base de datos; el detalle se recorre en streaming
+            total_clientes = informedto.obtenerResumen(('clientes',)).getTotalClientes()
+            logger.debug("Informe clientes - Total: %d", total_clientes)
+            print(f"Total de clientes: {total_clientes}")
             print("-" * 50)
-            for cliente in clientes:
+            for cliente in clientedto.iterClientes():
                 print(f"RUN: {cliente.getRun()}")
                 print(f"Nombre: {cliente.getNombre()} {cliente.getApellido()}")
                 print(f"Teléfono: {cliente.getTelefono()}")
@@ -956,21 +996,22 @@ def generar_informes():
             print("\n" + "="*50)
             print("           INFORME DE VEHÍCULOS")
             print("="*50)
-            vehiculos = vehiculodto.listarVehiculos()
-            disponibles = vehiculodto.listarVehiculosDisponibles()
-            arrendados = [v for v in vehiculos if v.getEstado() == "arrendado"]
-            mantencion = [v for v in vehiculos if v.getEstado() == "mantencion"]
+            resumen = informedto.obtenerResumen(('vehiculos',))
+            total = resumen.getTotalVehiculos()
+            disponibles = resumen.getVehiculosPorEstado("disponible")
+            arrendados = resumen.getVehiculosPorEstado("arrendado")
+            mantencion = resumen.getVehiculosPorEstado("mantencion")
             
             logger.debug("Informe vehículos - Total: %d, Disponibles: %d, Arrendados: %d, Mantención: %d", 
-                        len(vehiculos), len(disponibles), len(arrendados), len(mantencion))
+                        total, disponibles, arrendados, mantencion)
             
-            print(f"Total de vehículos: {len(vehiculos)}")
-            print(f"Disponibles: {len(disponibles)}")
-            print(f"Arrendados: {len(arrendados)}")
-            print(f"En mantención: {len(mantencion)}")
+            print(f"Total de vehículos: {total}")
+            print(f"Disponibles: {disponibles}")
+            print(f"Arrendados: {arrendados}")
+            print(f"En mantención: {mantencion}")
             print("-" * 50)
             
-            for vehiculo in vehiculos:
+            for vehiculo in vehiculodto.iterVehiculos():
                 estado_icon = "🟢" if vehiculo.getEstado() == "disponible" else "🔴" if vehiculo.getEstado() == "arrendado" else "🟡"
                 print(f"{estado_icon} {vehiculo.getPatente()} - {vehiculo.getMarca()} {vehiculo.getModelo()} - Año: {vehiculo.getAño()} - ${vehiculo.getPrecioDiario():,.0f}/día")
                 
@@ -979,19 +1020,20 @@ def generar_informes():
             print("\n" + "="*50)
             print("           INFORME DE EMPLEADOS")
             print("="*50)
-            empleados = userdto.listarUsuarios()
-            gerentes = [e for e in empleados if e.getCargo() == 'gerente']
-            empleados_normales = [e for e in empleados if e.getCargo() == 'empleado']
+            resumen = informedto.obtenerResumen(('empleados',))
+            total = resumen.getTotalEmpleados()
+            gerentes = resumen.getEmpleadosPorCargo('gerente')
+            empleados_normales = resumen.getEmpleadosPorCargo('empleado')
             
             logger.debug("Informe empleados - Total: %d, Gerentes: %d, Empleados: %d", 
-                        len(empleados), len(gerentes), len(empleados_normales))
+                        total, gerentes, empleados_normales)
             
-            print(f"Total de empleados: {len(empleados)}")
-            print(f"Gerentes: {len(gerentes)}")
-            print(f"Empleados: {len(empleados_normales)}")
+            print(f"Total de empleados: {total}")
+            print(f"Gerentes: {gerentes}")
+            print(f"Empleados: {empleados_normales}")
             print("-" * 50)
             
-            for empleado in empleados:
+            for empleado in userdto.iterUsuarios():
                 cargo_icon = "👑" if empleado.getCargo() == 'gerente' else "👨‍💼"
                 print(f"{cargo_icon} {empleado.getNombre()} {empleado.getApellido()} - RUN: {empleado.getRun()} - {empleado.getCargo()}")
                 
@@ -1000,32 +1042,31 @@ def generar_informes():
             print("\n" + "="*50)
             print("           INFORME DE ARRIENDOS")
             print("="*50)
-            # Usar solo la lista de presentación (evita consultas/llamadas dobles)
-            present_list = arriendodto.listarArriendosPresentacion()
-            arriendos = [ item['arriendo'] for item in present_list ]
-            present_map = { item['arriendo'].getIdArriendo(): item for item in present_list }
-            activos = [a for a in arriendos if a.getEstado() == "activo"]
-            finalizados = [a for a in arriendos if a.getEstado() == "finalizado"]
-            cancelados = [a for a in arriendos if a.getEstado() == "cancelado"]
+            # Conteos y suma calculados en la base de datos; el detalle se recorre en streaming
+            resumen = informedto.obtenerResumen(('arriendos',))
+            total = resumen.getTotalArriendos()
+            activos = resumen.getArriendosPorEstado("activo")
+            finalizados = resumen.getArriendosPorEstado("finalizado")
+            cancelados = resumen.getArriendosPorEstado("cancelado")
             
             logger.debug("Informe arriendos - Total: %d, Activos: %d, Finalizados: %d, Cancelados: %d", 
-                        len(arriendos), len(activos), len(finalizados), len(cancelados))
+                        total, activos, finalizados, cancelados)
             
-            print(f"Total de arriendos: {len(arriendos)}")
-            print(f"Activos: {len(activos)}")
-            print(f"Finalizados: {len(finalizados)}")
-            print(f"Cancelados: {len(cancelados)}")
+            print(f"Total de arriendos: {total}")
+            print(f"Activos: {activos}")
+            print(f"Finalizados: {finalizados}")
+            print(f"Cancelados: {cancelados}")
             print("-" * 50)
             
-            if arriendos:
-                ingresos_totales = sum(a.getCostoTotal() for a in arriendos if a.getEstado() != "cancelado")
+            if total:
+                ingresos_totales = resumen.getIngresosTotales()
                 logger.debug("Ingresos totales calculados: $%s", ingresos_totales)
                 print(f"Ingresos totales: ${ingresos_totales:,.0f}")
                 print("-" * 30)
                 
-            for arriendo in arriendos:
+            for pres in arriendodto.iterArriendosPresentacion():
+                arriendo = pres['arriendo']
                 estado_icon = "🟢" if arriendo.getEstado() == "activo" else "🟡" if arriendo.getEstado() == "finalizado" else "🔴"
-                pres = present_map.get(arriendo.getIdArriendo(), {})
                 veh_info = pres.get('vehiculo_info', f"Vehículo ID {arriendo.getIdVehiculo()}")
                 cli_info = pres.get('cliente_info', f"Cliente ID {arriendo.getIdCliente()}")
                 print(f"{estado_icon} ID: {arriendo.getIdArriendo()} - {veh_info}")
@@ -1037,32 +1078,31 @@ def generar_informes():
             print("              INFORME GENERAL DEL SISTEMA")
             print("="*60)
             
-            # Estadísticas generales
-            clientes = clientedto.listarClientes()
-            vehiculos = vehiculodto.listarVehiculos()
-            empleados = userdto.listarUsuarios()
-            arriendos = arriendodto.listarArriendos()
+            # Estadísticas generales (conteos y sumas agrupados en SQL)
+            resumen = informedto.obtenerResumen()
+            total_arriendos = resumen.getTotalArriendos()
             
             logger.info("Informe general - Clientes: %d, Vehículos: %d, Empleados: %d, Arriendos: %d", 
-                       len(clientes), len(vehiculos), len(empleados), len(arriendos))
+                       resumen.getTotalClientes(), resumen.getTotalVehiculos(),
+                       resumen.getTotalEmpleados(), total_arriendos)
             
             print(f"📊 ESTADÍSTICAS GENERALES:")
-            print(f"   👥 Clientes registrados: {len(clientes)}")
-            print(f"   🚗 Vehículos en flota: {len(vehiculos)}")
-            print(f"   👨‍💼 Empleados activos: {len(empleados)}")
-            print(f"   📋 Arriendos totales: {len(arriendos)}")
+            print(f"   👥 Clientes registrados: {resumen.getTotalClientes()}")
+            print(f"   🚗 Vehículos en flota: {resumen.getTotalVehiculos()}")
+            print(f"   👨‍💼 Empleados activos: {resumen.getTotalEmpleados()}")
+            print(f"   📋 Arriendos totales: {total_arriendos}")
             
-            if arriendos:
-                ingresos_totales = sum(a.getCostoTotal() for a in arriendos if a.getEstado() != "cancelado")
-                arriendos_activos = len([a for a in arriendos if a.getEstado() == "activo"])
+            if total_arriendos:
+                ingresos_totales = resumen.getIngresosTotales()
+                arriendos_activos = resumen.getArriendosPorEstado("activo")
                 logger.debug("Informe general - Ingresos: $%s, Arriendos activos: %d", ingresos_totales, arriendos_activos)
                 print(f"   💰 Ingresos totales: ${ingresos_totales:,.0f}")
                 print(f"   📅 Arriendos activos: {arriendos_activos}")
                 
             print("\n🚗 ESTADO DE VEHÍCULOS:")
-            disponibles = len([v for v in vehiculos if v.getEstado() == "disponible"])
-            arrendados = len([v for v in vehiculos if v.getEstado() == "arrendado"])
-            mantencion = len([v for v in vehiculos if v.getEstado() == "mantencion"])
+            disponibles = resumen.getVehiculosPorEstado("disponible")
+            arrendados = resumen.getVehiculosPorEstado("arrendado")
+            mantencion = resumen.getVehiculosPorEstado("mantencion")
             logger.debug("Estado vehículos - Disponibles: %d, Arrendados: %d, Mantención: %d", 
                         disponibles, arrendados, mantencion)
             print(f"   🟢 Disponibles: {disponibles}")
@@ -1070,9 +1110,9 @@ def generar_informes():
             print(f"   🟡 En mantención: {mantencion}")
             
             print("\n📈 ESTADO DE ARRIENDOS:")
-            activos = len([a for a in arriendos if a.getEstado() == "activo"])
-            finalizados = len([a for a in arriendos if a.getEstado() == "finalizado"])
-            cancelados = len([a for a in arriendos if a.getEstado() == "cancelado"])
+            activos = resumen.getArriendosPorEstado("activo")
+            finalizados = resumen.getArriendosPorEstado("finalizado")
+            cancelados = resumen.getArriendosPorEstado("cancelado")
             logger.debug("Estado arriendos - Activos: %d, Finalizados: %d, Cancelados: %d", 
                         activos, finalizados, cancelados)
             print(f"   🟢 Activos: {activos}")
@@ -1081,6 +1121,106 @@ def generar_informes():
             print("="*60)
                 
         elif opcion == '6':
+            logger.info("Generando análisis de ingresos")
+            if not numpy_disponible():
+                print("❌ El análisis de ingresos requiere numpy (pip install numpy)")
+                continue
+            print("\n" + "="*60)
+            print("              ANÁLISIS DE INGRESOS")
+            print("="*60)
+            # Se carga una sola vez en columnas; cada agrupación es vectorizada
+            dataset = informedto.obtenerDatasetArriendos().filtrar(estados=('activo', 'finalizado'))
+            logger.debug("Análisis de ingresos - Arriendos: %d", len(dataset))
+            if not len(dataset):
+                print("No hay arriendos activos ni finalizados")
+                continue
+            print(f"💰 Ingresos totales: ${dataset.ingresosTotales():,.0f} en {len(dataset)} arriendos")
+            
+            print("\n📅 POR MES:")
+            for mes, grupo in sorted(dataset.agruparPorMes().items()):
+                print(f"   {mes}: {grupo.arriendos} arriendos - ${grupo.ingresos:,.0f} - {grupo.dias} días")
+            
+            print("\n🚗 VEHÍCULOS CON MÁS INGRESOS:")
+            por_vehiculo = sorted(dataset.agruparPorVehiculo().items(), key=lambda item: item[1].ingresos, reverse=True)[:10]
+            vehiculos = vehiculodto.buscarVehiculosPorIds(id_vehiculo for id_vehiculo, _ in por_vehiculo)
+            for id_vehiculo, grupo in por_vehiculo:
+                vehiculo = vehiculos.get(id_vehiculo)
+                nombre = f"{vehiculo.getPatente()} - {vehiculo.getMarca()} {vehiculo.getModelo()}" if vehiculo else f"ID {id_vehiculo}"
+                print(f"   {nombre}: {grupo.arriendos} arriendos - ${grupo.ingresos:,.0f}")
+            
+            print("\n👨‍💼 POR EMPLEADO:")
+            nombres = {empleado.getIdEmpleado(): f"{empleado.getNombre()} {empleado.getApellido()}"
+                       for empleado in userdto.iterUsuarios()}
+            for id_empleado, grupo in sorted(dataset.agruparPorEmpleado().items(), key=lambda item: item[1].ingresos, reverse=True):
+                print(f"   {nombres.get(id_empleado, f'ID {id_empleado}')}: {grupo.arriendos} arriendos - ${grupo.ingresos:,.0f}")
+            print("="*60)
+                
+        elif opcion == '7':
+            logger.info("Generando informe de utilización de la flota")
+            if not numpy_disponible():
+                print("❌ El informe de utilización requiere numpy (pip install numpy)")
+                continue
+            desde = obtener_dato_validado(validar_fecha, "Desde (YYYY-MM-DD): ", "Fecha inválida", "YYYY-MM-DD")
+            hasta = obtener_dato_validado(validar_fecha, "Hasta, sin incluir (YYYY-MM-DD): ", "Fecha inválida", "YYYY-MM-DD")
+            try:
+                matriz = informedto.obtenerOcupacionFlota(desde, hasta)
+            except ValueError as e:
+                print(f"❌ {e}")
+                continue
+            flota = matriz.utilizacionFlota()
+            logger.debug("Utilización flota %s - %s: %.1f%%", desde, hasta, flota.porcentaje)
+            print("\n" + "="*60)
+            print(f"        UTILIZACIÓN DE LA FLOTA ({desde} a {hasta})")
+            print("="*60)
+            print(f"🚗 Flota: {flota.porcentaje:.1f}% ({flota.dias_ocupados} de {flota.dias_totales} días-vehículo)")
+            
+            print("\n🏷️ POR MARCA:")
+            for marca, uso in sorted(matriz.utilizacionPorMarca().items(), key=lambda item: item[1].porcentaje, reverse=True):
+                print(f"   {marca}: {uso.porcentaje:.1f}%")
+            
+            por_vehiculo = sorted(zip(matriz.patentes, matriz.utilizacionPorVehiculo().values()),
+                                  key=lambda item: item[1].porcentaje)
+            print("\n🔴 MENOS UTILIZADOS:")
+            for patente, uso in por_vehiculo[:10]:
+                print(f"   {patente}: {uso.porcentaje:.1f}% ({uso.dias_ocupados} días)")
+            print("\n🟢 MÁS UTILIZADOS:")
+            for patente, uso in reversed(por_vehiculo[-10:]):
+                print(f"   {patente}: {uso.porcentaje:.1f}% ({uso.dias_ocupados} días)")
+            print("="*60)
+            
+            ruta = input("\nArchivo CSV para exportar la utilización mensual (Enter para omitir): ").strip()
+            if ruta:
+                try:
+                    matriz.exportarCsv(ruta)
+                    print(f"✅ Utilización exportada a {ruta}")
+                except OSError as e:
+                    logger.error("No se pudo exportar la utilización a %s: %s", ruta, e)
+                    print(f"❌ No se pudo escribir el archivo: {e}")
+                
+        elif opcion == '8':
+            logger.info("Generando informe de métricas de base de datos")
+            informe = informedto.obtenerMetricasBD()
+            print("\n" + "="*60)
+            print("         MÉTRICAS DE RENDIMIENTO (tiempos en ms)")
+            print("="*60)
+            print(informe)
+            print("="*60)
+            
+            ruta = input("\nArchivo para guardar el informe (Enter para omitir): ").strip()
+            if ruta:
+                try:
+                    with open(ruta, 'w', encoding='utf-8') as archivo:
+                        archivo.write(informe + "\n")
+                    print(f"✅ Informe guardado en {ruta}")
+                except OSError as e:
+                    logger.error("No se pudo guardar el informe de métricas en %s: %s", ruta, e)
+                    print(f"❌ No se pudo escribir el archivo: {e}")
+            if input("¿Reiniciar las métricas? (s/n): ").strip().lower() == 's':
+                informedto.reiniciarMetricasBD()
+                logger.info("Métricas de base de datos reiniciadas")
+                print("✅ Métricas reiniciadas")
+                
+        elif opcion == '9':
             logger.info("Saliendo de generación de informes")
             break
         else:
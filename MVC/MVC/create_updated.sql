@@ -25,7 +25,7 @@ CREATE TABLE empleado (
     cargo ENUM('gerente', 'empleado') NOT NULL DEFAULT 'empleado',
     activo BOOLEAN DEFAULT TRUE,
     create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    update_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),  -- versión para edición concurrente
     
     -- Índices para mejorar performance
     INDEX idx_empleado_run (run),
@@ -46,11 +46,11 @@ CREATE TABLE cliente (
     email VARCHAR(100),
     activo BOOLEAN DEFAULT TRUE,
     create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    update_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),  -- versión para edición concurrente
     
     -- Índices
     INDEX idx_cliente_run (run),
-    INDEX idx_cliente_nombre (nombre),
+    INDEX idx_cliente_nombre_apellido (nombre, apellido),  -- orden y paginación del listado
     INDEX idx_cliente_activo (activo),
     INDEX idx_cliente_telefono (telefono)
 ) ENGINE=InnoDB;
@@ -71,7 +71,7 @@ CREATE TABLE vehiculo (
     descripcion TEXT,
     activo BOOLEAN DEFAULT TRUE,
     create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    update_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),  -- versión para edición concurrente
     
     -- Restricciones de datos
     CHECK (año >= 1900),
@@ -80,7 +80,7 @@ CREATE TABLE vehiculo (
     
     -- Índices
     INDEX idx_vehiculo_patente (patente),
-    INDEX idx_vehiculo_marca (marca),
+    INDEX idx_vehiculo_marca_modelo (marca, modelo),  -- orden y paginación del listado
     INDEX idx_vehiculo_estado (estado),
     INDEX idx_vehiculo_activo (activo),
     INDEX idx_vehiculo_precio (precio_diario)
@@ -104,7 +104,8 @@ CREATE TABLE arriendo (
     valor_uf_fecha DECIMAL(10, 2) DEFAULT 0.0,
     fecha_uf_consulta DATE DEFAULT NULL,
     create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    update_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),  -- versión para edición concurrente
+    duracion_dias INT AS (DATEDIFF(fecha_fin, fecha_inicio)) STORED,  -- cota de las consultas de cruce por fecha
     
     -- Claves foráneas con acciones específicas
     FOREIGN KEY (id_vehiculo) 
@@ -124,10 +125,13 @@ CREATE TABLE arriendo (
     CHECK (costo_total > 0),
     
     -- Índices
-    INDEX idx_arriendo_vehiculo (id_vehiculo),
+    INDEX idx_arriendo_vehiculo_estado (id_vehiculo, estado, fecha_inicio),  -- solapes al reservar
     INDEX idx_arriendo_cliente (id_cliente),
     INDEX idx_arriendo_empleado (id_empleado),
     INDEX idx_arriendo_fechas (fecha_inicio, fecha_fin),
+    INDEX idx_arriendo_fin (fecha_fin),  -- arriendos que terminan en un rango
+    INDEX idx_arriendo_duracion (estado, duracion_dias),  -- MAX(duracion_dias) por estado sin recorrer la tabla
+    INDEX idx_arriendo_inicio_id (fecha_inicio DESC, id_arriendo),  -- paginación del listado
     INDEX idx_arriendo_estado (estado)
 ) ENGINE=InnoDB;
 
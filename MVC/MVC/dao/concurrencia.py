@@ -0,0 +1,130 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ConflictoVersionError(Exception):
+    """
+    Se lanza cuando otra sesión modificó el registro después de que fue leído.
+
+    La versión de un registro es su columna ``update_time``: una actualización
+    con versión solo se aplica si la fila sigue teniendo el valor leído, así
+    que dos ediciones concurrentes no se pisan sin bloquear la fila.
+
+    Attributes:
+        tabla (str): Tabla del registro
+        id: Valor de la clave usada en la actualización
+        version (Optional[datetime]): update_time leído al buscar el registro
+        actual (Optional[datetime]): update_time vigente en la base de datos
+    """
+
+    def __init__(self, tabla: str, id: Any, version: Optional[datetime] = None,
+                 actual: Optional[datetime] = None) -> None:
+        self.tabla = tabla
+        self.id = id
+        self.version = version
+        self.actual = actual
+        super().__init__(f"El registro {id} de {tabla} fue modificado por otra sesión")
+
+
+#: Asignación de la nueva versión: estrictamente mayor que la leída
+_NUEVA_VERSION = "update_time = GREATEST(CURRENT_TIMESTAMP(6), update_time + INTERVAL 1 MICROSECOND)"
+
+
+def cambios_entre(original: Dict[str, Any], nuevos: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Obtiene las columnas cuyo valor nuevo difiere del original.
+
+    Args:
+        original (Dict[str, Any]): Valores leídos de la base de datos por columna
+        nuevos (Dict[str, Any]): Valores editados por columna
+
+    Returns:
+        Dict[str, Any]: Solo las columnas modificadas, en el orden de ``nuevos``
+    """
+    return {columna: valor for columna, valor in nuevos.items()
+            if columna not in original or original[columna] != valor}
+
+
+def sentencia_actualizar(tabla: str, columna_id: str, valor_id: Any, cambios: Dict[str, Any],
+                         permitidas: Iterable[str],
+                         version: Optional[datetime] = None) -> Tuple[str, List[Any]]:
+    """
+    Arma un ``UPDATE`` que envía solo las columnas modificadas.
+
+    Siempre renueva ``update_time`` (con microsegundos), así la fila cambia
+    de versión aunque los valores enviados sean iguales a los guardados y el
+    conteo de filas afectadas distingue "versión vieja" de "sin cambios".
+    La nueva versión es al menos un microsegundo mayor que la anterior, de
+    modo que dos ediciones en el mismo instante (o con el reloj del servidor
+    retrocedido) nunca dejan la misma versión. Requiere la columna
+    ``TIMESTAMP(6)`` de create_updated.sql (migrate_updated.sql en bases
+    existentes): con precisión de segundos la versión se trunca.
+
+    Args:
+        tabla (str): Tabla a actualizar
+        columna_id (str): Columna que identifica la fila (id o clave única)
+        valor_id (Any): Valor de esa columna
+        cambios (Dict[str, Any]): Columnas a escribir y sus valores (no vacío)
+        permitidas (Iterable[str]): Columnas que se pueden actualizar
+        version (Optional[datetime]): update_time leído; si se entrega se agrega
+            ``AND update_time = %s`` al WHERE
+
+    Returns:
+        Tuple[str, List[Any]]: Sentencia SQL y sus parámetros
+
+    Raises:
+        ValueError: Si no hay cambios o alguna columna no está permitida
+    """
+    if not cambios:
+        raise ValueError("No hay columnas que actualizar")
+    desconocidas = [c for c in cambios if c not in set(permitidas)]
+    if desconocidas:
+        raise ValueError(f"Columnas no actualizables en {tabla}: {', '.join(desconocidas)}")
+    asignaciones = [f"{columna} = %s" for columna in cambios]
+    asignaciones.append(_NUEVA_VERSION)
+    sql = f"UPDATE {tabla} SET {', '.join(asignaciones)} WHERE {columna_id} = %s"
+    parametros = list(cambios.values()) + [valor_id]
+    if version is not None:
+        sql += " AND update_time = %s"
+        parametros.append(version)
+    return sql, parametros
+
+
+def actualizar_con_version(conn, cursor, tabla: str, columna_id: str, valor_id: Any,
+                           cambios: Dict[str, Any], permitidas: Iterable[str],
+                           version: Optional[datetime] = None) -> bool:
+    """
+    Ejecuta una actualización parcial y detecta ediciones concurrentes.
+
+    Si la actualización con versión no afecta filas se vuelve a leer la fila:
+    si existe, otra sesión la modificó y se lanza ``ConflictoVersionError``;
+    si no existe, fue eliminada y se retorna False.
+
+    Args:
+        conn: Conexión del DAO (confirma con ``commit()``)
+        cursor: Cursor abierto sobre ``conn``
+        tabla, columna_id, valor_id, cambios, permitidas, version: Ver ``sentencia_actualizar``
+
+    Returns:
+        bool: True si la fila se actualizó (o no había cambios), False si no existe
+
+    Raises:
+        ConflictoVersionError: Si la fila tiene otra versión
+        ValueError: Si alguna columna no está permitida
+    """
+    if not cambios:
+        return True
+    sql, parametros = sentencia_actualizar(tabla, columna_id, valor_id, cambios, permitidas, version)
+    filas = cursor.execute(sql, parametros)
+    if not filas and version is not None:
+        cursor.execute(f"SELECT update_time FROM {tabla} WHERE {columna_id} = %s", (valor_id,))
+        vigente = cursor.fetchone()
+        if vigente is not None:
+            logger.warning("Conflicto de versión en %s %s: leída %s, vigente %s",
+                           tabla, valor_id, version, vigente[0])
+            raise ConflictoVersionError(tabla, valor_id, version, vigente[0])
+    conn.commit()
+    return bool(filas)
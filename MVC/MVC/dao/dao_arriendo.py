@@ -1,11 +1,38 @@
-from conex.conn import Conex
+from conex.conn import Conex, iterar_consulta, consultar_por_ids, es_error_de_esquema
+from conex.metricas import conexion_medida, instrumentar_dao
+from dao.concurrencia import ConflictoVersionError, actualizar_con_version
+from dao.mapeo import columna, crear_mapeador
+from dao.paginacion import Pagina, armar_pagina, decodificar_cursor
 from modelo.arriendo import Arriendo
 import logging
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple, Dict, Iterable, Sequence, Union
+from datetime import date, datetime
 import pymysql
 
 logger = logging.getLogger(__name__)
 
+Fecha = Union[str, date]
+
+# Filas "id_arriendo, id_vehiculo, id_cliente, id_empleado, fecha_inicio, fecha_fin, costo_total,
+# estado, create_time, valor_uf_fecha, fecha_uf_consulta[, update_time]"; las columnas extra
+# de las consultas con relación (vehículo y cliente) se ignoran
+_COLUMNAS_ARRIENDO = (
+    columna('id_arriendo', int),
+    columna('id_vehiculo', int),
+    columna('id_cliente', int),
+    columna('id_empleado', int),
+    columna('fecha_inicio'),
+    columna('fecha_fin'),
+    columna('costo_total', float, 0.0),
+    columna('estado'),
+    columna('create_time'),
+    columna('valor_uf_fecha', float, 0.0),
+    columna('fecha_uf_consulta'),
+)
+_mapear_arriendo = crear_mapeador(Arriendo, _COLUMNAS_ARRIENDO)
+_mapear_arriendo_versionado = crear_mapeador(Arriendo, _COLUMNAS_ARRIENDO + (columna('update_time'),))
+
+@instrumentar_dao
 class DaoArriendo:
     """
     Data Access Object para la entidad Arriendo.
@@ -14,19 +41,67 @@ class DaoArriendo:
     de la base de datos.
     """
 
+    # Columnas que pueden enviarse en una actualización parcial
+    COLUMNAS_ACTUALIZABLES = ('id_vehiculo', 'id_cliente', 'id_empleado', 'fecha_inicio', 'fecha_fin',
+                              'costo_total', 'estado', 'valor_uf_fecha', 'fecha_uf_consulta')
+
+    _SQL_LISTAR = """SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
+                 a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
+                 a.valor_uf_fecha, a.fecha_uf_consulta,
+                 v.patente, v.marca, v.modelo,
+                 c.nombre, c.apellido
+             FROM arriendo a
+             JOIN vehiculo v ON a.id_vehiculo = v.id_vehiculo
+             JOIN cliente c ON a.id_cliente = c.id_cliente
+             ORDER BY a.fecha_inicio DESC, a.id_arriendo"""
+
+    _COLUMNAS_ARRIENDO = """a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
+                 a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
+                 a.valor_uf_fecha, a.fecha_uf_consulta"""
+
+    # Condiciones por fechas: todas son rangos sobre la primera columna de un
+    # índice (idx_arriendo_fechas o idx_arriendo_fin). Un arriendo vigente en
+    # `desde` no pudo empezar antes de `desde - dias` (duración máxima
+    # registrada); sin esa cota el cruce recorrería todo el historial anterior.
+    _CONDICIONES_FECHAS = {
+        'activos': ("a.fecha_inicio >= DATE_SUB(%(desde)s, INTERVAL %(dias)s DAY)"
+                    " AND a.fecha_inicio <= %(desde)s AND a.fecha_fin >= %(desde)s"),
+        'solapados': ("a.fecha_inicio >= DATE_SUB(%(desde)s, INTERVAL %(dias)s DAY)"
+                      " AND a.fecha_inicio < %(hasta)s AND a.fecha_fin > %(desde)s"),
+        'inician': "a.fecha_inicio >= %(desde)s AND a.fecha_inicio < %(hasta)s",
+        'terminan': "a.fecha_fin >= %(desde)s AND a.fecha_fin < %(hasta)s",
+    }
+
+    # Se resuelven con el índice idx_arriendo_duracion (estado, duracion_dias),
+    # sin leer la tabla; solo cuentan los estados consultados, así un arriendo
+    # largo ya cancelado no ensancha las búsquedas de arriendos activos
+    _SQL_DURACION_MAXIMA = "SELECT MAX(duracion_dias) FROM arriendo WHERE estado = %(estado)s"
+    _SQL_DURACION_MAXIMA_POR_ESTADO = "SELECT MAX(duracion_dias) FROM arriendo GROUP BY estado"
+
     def __init__(self) -> None:
         """
-        Inicializa el DAO creando una conexión a la base de datos.
+        Inicializa el DAO tomando una conexión del pool compartido.
         
         Attributes:
             conex (Conex): Instancia de conexión a la base de datos
-            conn: Conexión activa a la base de datos
+            conn: Conexión activa a la base de datos (sus cursores registran métricas)
             cursor: Cursor para ejecutar consultas SQL
         """
         self.conex = Conex()
-        self.conn = self.conex.getConex()
+        self.conn = conexion_medida(self.conex.getConex())
         self.cursor: Optional[pymysql.cursors.Cursor] = None
 
+    def cerrar(self) -> None:
+        """Devuelve la conexión del DAO al pool de conexiones."""
+        self.conex.closeConex()
+        self.conn = None
+
+    def __enter__(self) -> 'DaoArriendo':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cerrar()
+
     def agregarArriendo(self, arriendo: Arriendo) -> bool:
         """
         Inserta un nuevo arriendo en la base de datos.
@@ -56,6 +131,7 @@ class DaoArriendo:
                 arriendo.getFechaUfConsulta()
             ))
             self.conn.commit()
+            arriendo.setIdArriendo(self.cursor.lastrowid)
             return True
         except Exception as e:
             logger.error("Error al agregar arriendo: %s", e)
@@ -74,25 +150,13 @@ class DaoArriendo:
         Returns:
             Optional[Arriendo]: Instancia de Arriendo si se encuentra, None en caso contrario
         """
-        sql = "SELECT id_arriendo, id_vehiculo, id_cliente, id_empleado, fecha_inicio, fecha_fin, costo_total, estado, create_time, valor_uf_fecha, fecha_uf_consulta FROM arriendo WHERE id_arriendo = %s"
+        sql = "SELECT id_arriendo, id_vehiculo, id_cliente, id_empleado, fecha_inicio, fecha_fin, costo_total, estado, create_time, valor_uf_fecha, fecha_uf_consulta, update_time FROM arriendo WHERE id_arriendo = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (id_arriendo,))
             resultado = self.cursor.fetchone()
             if resultado:
-                return Arriendo(
-                    id_arriendo=int(resultado[0]),
-                    id_vehiculo=int(resultado[1]) if resultado[1] is not None else None,
-                    id_cliente=int(resultado[2]) if resultado[2] is not None else None,
-                    id_empleado=int(resultado[3]) if resultado[3] is not None else None,
-                    fecha_inicio=resultado[4],
-                    fecha_fin=resultado[5],
-                    costo_total=float(resultado[6]) if resultado[6] is not None else 0.0,
-                    estado=resultado[7],
-                    create_time=resultado[8],
-                    valor_uf_fecha=float(resultado[9]) if resultado[9] is not None else 0.0,
-                    fecha_uf_consulta=resultado[10]
-                )
+                return _mapear_arriendo_versionado(resultado)
             return None
         except Exception as e:
             logger.error("Error al buscar arriendo: %s", e)
@@ -101,35 +165,74 @@ class DaoArriendo:
             if self.cursor:
                 self.cursor.close()
 
+    def buscarArriendosPorIds(self, ids: Iterable[int]) -> Dict[int, Arriendo]:
+        """
+        Busca varios arriendos por ID con consultas `IN` por lotes.
+        
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[int, Arriendo]: Arriendos encontrados indexados por ID; los IDs
+            inexistentes no aparecen. Vacío si ocurre un error
+        """
+        sql = "SELECT id_arriendo, id_vehiculo, id_cliente, id_empleado, fecha_inicio, fecha_fin, costo_total, estado, create_time, valor_uf_fecha, fecha_uf_consulta FROM arriendo WHERE id_arriendo IN ({marcadores})"
+        try:
+            return {int(fila[0]): self._crearArriendo(fila) for fila in consultar_por_ids(self.conn, sql, ids)}
+        except Exception as e:
+            logger.error("Error al buscar arriendos por IDs: %s", e)
+            return {}
+
     def actualizarArriendo(self, arriendo: Arriendo) -> bool:
         """
         Actualiza los datos de un arriendo existente.
         
+        Si el arriendo trae `update_time` (fue leído con `buscarArriendo`), la
+        actualización solo se aplica si nadie lo modificó desde esa lectura.
+        
         Args:
             arriendo (Arriendo): Instancia de Arriendo con los datos actualizados
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el arriendo
+        """
+        return self.actualizarArriendoParcial(arriendo.getIdArriendo(), {
+            'id_vehiculo': arriendo.getIdVehiculo(),
+            'id_cliente': arriendo.getIdCliente(),
+            'id_empleado': arriendo.getIdEmpleado(),
+            'fecha_inicio': arriendo.getFechaInicio(),
+            'fecha_fin': arriendo.getFechaFin(),
+            'costo_total': arriendo.getCostoTotal(),
+            'estado': arriendo.getEstado(),
+            'valor_uf_fecha': arriendo.getValorUfFecha(),
+            'fecha_uf_consulta': arriendo.getFechaUfConsulta(),
+        }, arriendo.getUpdateTime())
+
+    def actualizarArriendoParcial(self, id_arriendo: int, cambios: Dict[str, object],
+                                  version: Optional[datetime] = None) -> bool:
+        """
+        Actualiza solo las columnas indicadas de un arriendo.
+        
+        Args:
+            id_arriendo (int): ID del arriendo
+            cambios (Dict[str, object]): Columnas modificadas y sus valores (vacío = sin cambios)
+            version (Optional[datetime]): update_time leído; None actualiza sin verificar
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el arriendo
         """
-        sql = """UPDATE arriendo SET id_vehiculo = %s, id_cliente = %s, id_empleado = %s, 
-                 fecha_inicio = %s, fecha_fin = %s, costo_total = %s, estado = %s, valor_uf_fecha = %s, fecha_uf_consulta = %s 
-                 WHERE id_arriendo = %s"""
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (
-                arriendo.getIdVehiculo(), 
-                arriendo.getIdCliente(), 
-                arriendo.getIdEmpleado(), 
-                arriendo.getFechaInicio(), 
-                arriendo.getFechaFin(), 
-                arriendo.getCostoTotal(), 
-                arriendo.getEstado(),
-                arriendo.getValorUfFecha(),
-                arriendo.getFechaUfConsulta(),
-                arriendo.getIdArriendo()
-            ))
-            self.conn.commit()
-            return True
+            return actualizar_con_version(self.conn, self.cursor, 'arriendo', 'id_arriendo', id_arriendo,
+                                          cambios, self.COLUMNAS_ACTUALIZABLES, version)
+        except ConflictoVersionError:
+            raise
         except Exception as e:
             logger.error("Error al actualizar arriendo: %s", e)
             return False
@@ -137,6 +240,40 @@ class DaoArriendo:
             if self.cursor:
                 self.cursor.close()
 
+    def actualizarEstado(self, id_arriendo: int, estado: str,
+                         estado_actual: Optional[str] = None) -> bool:
+        """
+        Cambia solo el estado de un arriendo.
+        
+        Con `estado_actual` el cambio es condicional (`... AND estado = %s`):
+        si otra sesión ya cambió el estado no se modifica nada.
+        
+        Args:
+            id_arriendo (int): ID del arriendo
+            estado (str): Nuevo estado (activo, finalizado, cancelado)
+            estado_actual (Optional[str]): Estado que debe tener el arriendo para cambiarlo
+            
+        Returns:
+            bool: True si la actualización fue exitosa (y, si es condicional,
+            si el arriendo estaba en `estado_actual`), False en caso contrario
+        """
+        sql = "UPDATE arriendo SET estado = %s WHERE id_arriendo = %s"
+        params: Tuple = (estado, id_arriendo)
+        if estado_actual is not None:
+            sql += " AND estado = %s"
+            params = (estado, id_arriendo, estado_actual)
+        try:
+            self.cursor = self.conn.cursor()
+            filas = self.cursor.execute(sql, params)
+            self.conn.commit()
+            return estado_actual is None or filas == 1
+        except Exception as e:
+            logger.error("Error al actualizar estado de arriendo: %s", e)
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
     def eliminarArriendo(self, id_arriendo: int) -> bool:
         """
         Elimina un arriendo de la base de datos.
@@ -170,39 +307,14 @@ class DaoArriendo:
         Note:
             Retorna una lista vacía si no hay arriendos o si ocurre un error
         """
-        sql = """SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
-                 a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
-                 a.valor_uf_fecha, a.fecha_uf_consulta,
-                 v.patente, v.marca, v.modelo,
-                 c.nombre, c.apellido
-             FROM arriendo a
-             JOIN vehiculo v ON a.id_vehiculo = v.id_vehiculo
-             JOIN cliente c ON a.id_cliente = c.id_cliente
-             ORDER BY a.fecha_inicio DESC"""
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql)
+            self.cursor.execute(self._SQL_LISTAR)
             resultados = self.cursor.fetchall()
-            arriendos: List[Arriendo] = []
-            for resultado in resultados:
-                arriendo = Arriendo(
-                    id_arriendo=int(resultado[0]),
-                    id_vehiculo=int(resultado[1]) if resultado[1] is not None else None,
-                    id_cliente=int(resultado[2]) if resultado[2] is not None else None,
-                    id_empleado=int(resultado[3]) if resultado[3] is not None else None,
-                    fecha_inicio=resultado[4],
-                    fecha_fin=resultado[5],
-                    costo_total=float(resultado[6]) if resultado[6] is not None else 0.0,
-                    estado=resultado[7],
-                    create_time=resultado[8],
-                    valor_uf_fecha=float(resultado[9]) if resultado[9] is not None else 0.0,
-                    fecha_uf_consulta=resultado[10]
-                )
-                # Nota: no agregar atributos de presentación al modelo aquí.
-                # La información de vehículo/cliente para presentación debe armarse
-                # en la capa DTO o en el controlador.
-                arriendos.append(arriendo)
-            return arriendos
+            # Nota: no agregar atributos de presentación al modelo aquí.
+            # La información de vehículo/cliente para presentación debe armarse
+            # en la capa DTO o en el controlador.
+            return [self._crearArriendo(resultado) for resultado in resultados]
         except Exception as e:
             logger.error("Error al listar arriendos: %s", e)
             return []
@@ -210,6 +322,44 @@ class DaoArriendo:
             if self.cursor:
                 self.cursor.close()
 
+    def iterArriendos(self, tamano_lote: Optional[int] = None) -> Iterator[Arriendo]:
+        """
+        Recorre todos los arriendos sin cargarlos completos en memoria.
+        
+        Versión en streaming de `listarArriendos`: usa un cursor de servidor
+        y trae las filas por lotes, entregando cada arriendo apenas llega.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            Arriendo: Cada arriendo, en el mismo orden que `listarArriendos`
+        """
+        try:
+            for resultado in iterar_consulta(self.conn, self._SQL_LISTAR, tamano_lote=tamano_lote):
+                yield self._crearArriendo(resultado)
+        except Exception as e:
+            logger.error("Error al recorrer arriendos: %s", e)
+
+    def iterArriendosConRelacion(self, tamano_lote: Optional[int] = None) -> Iterator[dict]:
+        """
+        Versión en streaming de `listarArriendosConRelacion`.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            dict: Claves 'arriendo', 'veh_patente', 'veh_marca', 'veh_modelo', 'cli_nombre', 'cli_apellido'
+        """
+        try:
+            for resultado in iterar_consulta(self.conn, self._SQL_LISTAR, tamano_lote=tamano_lote):
+                yield self._crearArriendoConRelacion(resultado)
+        except Exception as e:
+            logger.error("Error al recorrer arriendos con relación: %s", e)
+
+    # Construye un Arriendo a partir de las primeras columnas de `_SQL_LISTAR`
+    _crearArriendo = staticmethod(_mapear_arriendo)
+
     def listarArriendosConRelacion(self) -> List[dict]:
         """
         Obtiene todos los arriendos junto con campos seleccionados de vehiculo y cliente
@@ -217,43 +367,11 @@ class DaoArriendo:
 
         Retorna lista de dicts con claves: 'arriendo', 'veh_patente', 'veh_marca', 'veh_modelo', 'cli_nombre', 'cli_apellido'
         """
-        sql = """SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
-                 a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
-                 a.valor_uf_fecha, a.fecha_uf_consulta,
-                 v.patente, v.marca, v.modelo,
-                 c.nombre, c.apellido
-             FROM arriendo a
-             JOIN vehiculo v ON a.id_vehiculo = v.id_vehiculo
-             JOIN cliente c ON a.id_cliente = c.id_cliente
-             ORDER BY a.fecha_inicio DESC"""
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql)
+            self.cursor.execute(self._SQL_LISTAR)
             resultados = self.cursor.fetchall()
-            lista: List[dict] = []
-            for resultado in resultados:
-                arriendo = Arriendo(
-                    id_arriendo=int(resultado[0]),
-                    id_vehiculo=int(resultado[1]) if resultado[1] is not None else None,
-                    id_cliente=int(resultado[2]) if resultado[2] is not None else None,
-                    id_empleado=int(resultado[3]) if resultado[3] is not None else None,
-                    fecha_inicio=resultado[4],
-                    fecha_fin=resultado[5],
-                    costo_total=float(resultado[6]) if resultado[6] is not None else 0.0,
-                    estado=resultado[7],
-                    create_time=resultado[8],
-                    valor_uf_fecha=float(resultado[9]) if resultado[9] is not None else 0.0,
-                    fecha_uf_consulta=resultado[10]
-                )
-                lista.append({
-                    'arriendo': arriendo,
-                    'veh_patente': resultado[11],
-                    'veh_marca': resultado[12],
-                    'veh_modelo': resultado[13],
-                    'cli_nombre': resultado[14],
-                    'cli_apellido': resultado[15]
-                })
-            return lista
+            return [self._crearArriendoConRelacion(resultado) for resultado in resultados]
         except Exception as e:
             logger.error("Error al listar arriendos con relación: %s", e)
             return []
@@ -261,11 +379,31 @@ class DaoArriendo:
             if self.cursor:
                 self.cursor.close()
 
-    def listarArriendosPorFechaConRelacion(self, fecha: str) -> List[dict]:
+    def paginarArriendosConRelacion(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[dict]:
         """
-        Obtiene arriendos que coinciden con la fecha junto con campos del vehiculo y cliente.
+        Obtiene una página de arriendos con datos de vehículo y cliente.
+        
+        Usa paginación por clave sobre ``fecha_inicio DESC, id_arriendo``:
+        la página siguiente continúa después de la última fila entregada
+        usando el índice ``idx_arriendo_inicio_id``, sin ``OFFSET``.
+        
+        Args:
+            limite (int): Cantidad máxima de arriendos por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[dict]: Elementos con las mismas claves que `listarArriendosConRelacion`
+            
+        Raises:
+            CursorInvalidoError: Si el token no corresponde a este listado
         """
-        sql = """SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
+        params: list = []
+        where = ""
+        if cursor:
+            fecha_inicio, id_arriendo = decodificar_cursor('arriendo', cursor, 2)
+            where = "WHERE a.fecha_inicio < %s OR (a.fecha_inicio = %s AND a.id_arriendo > %s)"
+            params = [fecha_inicio, fecha_inicio, id_arriendo]
+        sql = f"""SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
                  a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
                  a.valor_uf_fecha, a.fecha_uf_consulta,
                  v.patente, v.marca, v.modelo,
@@ -273,92 +411,241 @@ class DaoArriendo:
              FROM arriendo a
              JOIN vehiculo v ON a.id_vehiculo = v.id_vehiculo
              JOIN cliente c ON a.id_cliente = c.id_cliente
-             WHERE a.fecha_inicio = %s OR a.fecha_fin = %s
-             ORDER BY a.fecha_inicio"""
+             {where}
+             ORDER BY a.fecha_inicio DESC, a.id_arriendo
+             LIMIT %s"""
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (fecha, fecha))
+            # Se pide una fila extra para saber si existe una página siguiente
+            self.cursor.execute(sql, (*params, limite + 1))
             resultados = self.cursor.fetchall()
-            lista: List[dict] = []
-            for resultado in resultados:
-                arriendo = Arriendo(
-                    id_arriendo=int(resultado[0]),
-                    id_vehiculo=int(resultado[1]) if resultado[1] is not None else None,
-                    id_cliente=int(resultado[2]) if resultado[2] is not None else None,
-                    id_empleado=int(resultado[3]) if resultado[3] is not None else None,
-                    fecha_inicio=resultado[4],
-                    fecha_fin=resultado[5],
-                    costo_total=float(resultado[6]) if resultado[6] is not None else 0.0,
-                    estado=resultado[7],
-                    create_time=resultado[8],
-                    valor_uf_fecha=float(resultado[9]) if resultado[9] is not None else 0.0,
-                    fecha_uf_consulta=resultado[10]
-                )
-                lista.append({
-                    'arriendo': arriendo,
-                    'veh_patente': resultado[11],
-                    'veh_marca': resultado[12],
-                    'veh_modelo': resultado[13],
-                    'cli_nombre': resultado[14],
-                    'cli_apellido': resultado[15]
-                })
-            return lista
+            lista = [self._crearArriendoConRelacion(resultado) for resultado in resultados]
+            return armar_pagina(lista, limite, 'arriendo',
+                                lambda item: (item['arriendo'].getFechaInicio(), item['arriendo'].getIdArriendo()))
         except Exception as e:
-            logger.error("Error al listar arriendos por fecha con relación: %s", e)
-            return []
+            logger.error("Error al paginar arriendos: %s", e)
+            return Pagina([])
         finally:
             if self.cursor:
                 self.cursor.close()
 
+    @classmethod
+    def _crearArriendoConRelacion(cls, resultado: Tuple) -> dict:
+        """Construye el dict arriendo + vehículo + cliente de una fila con relación."""
+        return {
+            'arriendo': cls._crearArriendo(resultado),
+            'veh_patente': resultado[11],
+            'veh_marca': resultado[12],
+            'veh_modelo': resultado[13],
+            'cli_nombre': resultado[14],
+            'cli_apellido': resultado[15]
+        }
+
+    def listarArriendosPorFechaConRelacion(self, fecha: str) -> List[dict]:
+        """
+        Obtiene los arriendos en curso en la fecha junto con campos del vehiculo y cliente.
+        """
+        return self._listarPorFechas('activos', fecha, con_relacion=True)
+
+    def listarConflictos(self, id_vehiculo: int, fecha_inicio: str, fecha_fin: str) -> Optional[List[int]]:
+        """
+        Obtiene los arriendos activos del vehículo que se cruzan con un rango.
+        
+        Los rangos son semiabiertos: un arriendo que termina el día en que
+        empieza el rango no es conflicto.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo
+            fecha_inicio (str): Inicio del rango (YYYY-MM-DD)
+            fecha_fin (str): Fin del rango (YYYY-MM-DD)
+            
+        Returns:
+            Optional[List[int]]: IDs de los arriendos en conflicto, None si ocurre un error
+        """
+        sql = """SELECT id_arriendo FROM arriendo
+                 WHERE id_vehiculo = %s AND estado = 'activo'
+                   AND fecha_inicio < %s AND fecha_fin > %s"""
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.execute(sql, (id_vehiculo, fecha_fin, fecha_inicio))
+            return [int(fila[0]) for fila in self.cursor.fetchall()]
+        except Exception as e:
+            logger.error("Error al buscar arriendos en conflicto: %s", e)
+            return None
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    def contarArriendosActivos(self, id_vehiculo: int) -> Optional[int]:
+        """
+        Cuenta los arriendos activos de un vehículo, en cualquier fecha.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo
+            
+        Returns:
+            Optional[int]: Cantidad de arriendos activos, None si ocurre un error
+        """
+        sql = "SELECT COUNT(*) FROM arriendo WHERE id_vehiculo = %s AND estado = 'activo'"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.execute(sql, (id_vehiculo,))
+            resultado = self.cursor.fetchone()
+            return int(resultado[0]) if resultado else 0
+        except Exception as e:
+            logger.error("Error al contar arriendos activos: %s", e)
+            return None
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    def listarReservasActivas(self) -> List[Tuple[int, int, date, date]]:
+        """
+        Obtiene los intervalos ocupados por los arriendos activos.
+        
+        Returns:
+            List[Tuple[int, int, date, date]]: (id_arriendo, id_vehiculo, fecha_inicio, fecha_fin);
+            vacía si ocurre un error
+        """
+        sql = "SELECT id_arriendo, id_vehiculo, fecha_inicio, fecha_fin FROM arriendo WHERE estado = 'activo'"
+        try:
+            return [(int(fila[0]), int(fila[1]), fila[2], fila[3])
+                    for fila in iterar_consulta(self.conn, sql)]
+        except Exception as e:
+            logger.error("Error al listar reservas activas: %s", e)
+            return []
+
+    def iterFilasNumericas(self, estados: Sequence[str],
+                           tamano_lote: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Recorre los arriendos como filas de enteros, listas para cargar en arreglos.
+        
+        La conversión se hace en la base de datos: las fechas llegan como
+        número de día (`date.toordinal()`), el costo en centavos y el estado
+        como su posición en `estados` (0 si no está), así que no se crean
+        objetos `date` ni `Decimal` por fila.
+        
+        Args:
+            estados (Sequence[str]): Estados en el orden de sus códigos (1, 2, ...)
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            Tuple[int, ...]: (id_arriendo, id_vehiculo, id_cliente, id_empleado,
+            inicio, fin, costo_centavos, codigo_estado)
+        """
+        marcadores = ", ".join(["%s"] * len(estados))
+        # TO_DAYS cuenta desde el año 0; date.toordinal() desde el año 1
+        sql = f"""SELECT id_arriendo, id_vehiculo, id_cliente, id_empleado,
+                 TO_DAYS(fecha_inicio) - 365, TO_DAYS(fecha_fin) - 365,
+                 CAST(ROUND(costo_total * 100) AS SIGNED),
+                 FIELD(estado, {marcadores})
+             FROM arriendo"""
+        try:
+            yield from iterar_consulta(self.conn, sql, tuple(estados), tamano_lote=tamano_lote)
+        except Exception as e:
+            logger.error("Error al recorrer arriendos para análisis: %s", e)
+
     def listarArriendosPorFecha(self, fecha: str) -> List[Arriendo]:
         """
-        Obtiene los arriendos que coinciden con una fecha específica.
+        Obtiene los arriendos en curso en una fecha específica.
         
         Args:
             fecha (str): Fecha a buscar en formato YYYY-MM-DD
             
         Returns:
-            List[Arriendo]: Lista de arriendos que empiezan o terminan en la fecha especificada
+            List[Arriendo]: Arriendos que empiezan, terminan o están en curso en la fecha
             
         Note:
             Retorna una lista vacía si no hay coincidencias o si ocurre un error
         """
-        sql = """SELECT a.id_arriendo, a.id_vehiculo, a.id_cliente, a.id_empleado,
-                 a.fecha_inicio, a.fecha_fin, a.costo_total, a.estado, a.create_time,
-                 a.valor_uf_fecha, a.fecha_uf_consulta,
-                 v.patente, v.marca, v.modelo,
-                 c.nombre, c.apellido
-             FROM arriendo a
+        return self.listarArriendosActivosEn(fecha)
+
+    def listarArriendosActivosEn(self, fecha: Fecha, estado: Optional[str] = None) -> List[Arriendo]:
+        """
+        Obtiene los arriendos en curso en una fecha (inicio <= fecha <= fin).
+        
+        Args:
+            fecha (Fecha): Día consultado (date o 'YYYY-MM-DD')
+            estado (Optional[str]): Filtra por estado (activo, finalizado, cancelado)
+            
+        Returns:
+            List[Arriendo]: Arriendos ordenados por fecha de inicio; vacía si ocurre un error
+        """
+        return self._listarPorFechas('activos', fecha, estado=estado)
+
+    def listarArriendosSolapados(self, desde: Fecha, hasta: Fecha,
+                                 estado: Optional[str] = None) -> List[Arriendo]:
+        """
+        Obtiene los arriendos que se cruzan con el rango semiabierto [desde, hasta).
+        
+        Args:
+            desde (Fecha): Primer día del rango
+            hasta (Fecha): Día siguiente al último del rango
+            estado (Optional[str]): Filtra por estado
+            
+        Returns:
+            List[Arriendo]: Arriendos ordenados por fecha de inicio; vacía si ocurre un error
+        """
+        return self._listarPorFechas('solapados', desde, hasta, estado)
+
+    def listarArriendosQueInicianEntre(self, desde: Fecha, hasta: Fecha,
+                                       estado: Optional[str] = None) -> List[Arriendo]:
+        """
+        Obtiene los arriendos cuya fecha de inicio está en [desde, hasta).
+        
+        Returns:
+            List[Arriendo]: Arriendos ordenados por fecha de inicio; vacía si ocurre un error
+        """
+        return self._listarPorFechas('inician', desde, hasta, estado)
+
+    def listarArriendosQueTerminanEntre(self, desde: Fecha, hasta: Fecha,
+                                        estado: Optional[str] = None) -> List[Arriendo]:
+        """
+        Obtiene los arriendos cuya fecha de fin está en [desde, hasta).
+        
+        Returns:
+            List[Arriendo]: Arriendos ordenados por fecha de inicio; vacía si ocurre un error
+        """
+        return self._listarPorFechas('terminan', desde, hasta, estado)
+
+    @classmethod
+    def _sqlPorFechas(cls, tipo: str, con_relacion: bool = False, estado: Optional[str] = None) -> str:
+        """Arma la consulta de `_CONDICIONES_FECHAS[tipo]` (parámetros con nombre: desde, hasta, dias, estado)."""
+        columnas = cls._COLUMNAS_ARRIENDO
+        origen = "FROM arriendo a"
+        if con_relacion:
+            columnas += ", v.patente, v.marca, v.modelo, c.nombre, c.apellido"
+            origen += """
              JOIN vehiculo v ON a.id_vehiculo = v.id_vehiculo
-             JOIN cliente c ON a.id_cliente = c.id_cliente
-             WHERE a.fecha_inicio = %s OR a.fecha_fin = %s
-             ORDER BY a.fecha_inicio"""
+             JOIN cliente c ON a.id_cliente = c.id_cliente"""
+        condicion = cls._CONDICIONES_FECHAS[tipo]
+        if estado is not None:
+            condicion += " AND a.estado = %(estado)s"
+        return f"""SELECT {columnas}
+             {origen}
+             WHERE {condicion}
+             ORDER BY a.fecha_inicio, a.id_arriendo"""
+
+    def _listarPorFechas(self, tipo: str, desde: Fecha, hasta: Optional[Fecha] = None,
+                         estado: Optional[str] = None, con_relacion: bool = False) -> list:
+        parametros = {'desde': desde, 'hasta': hasta, 'estado': estado, 'dias': 0}
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (fecha, fecha))
-            resultados = self.cursor.fetchall()
-            arriendos: List[Arriendo] = []
-            for resultado in resultados:
-                arriendo = Arriendo(
-                    id_arriendo=int(resultado[0]),
-                    id_vehiculo=int(resultado[1]) if resultado[1] is not None else None,
-                    id_cliente=int(resultado[2]) if resultado[2] is not None else None,
-                    id_empleado=int(resultado[3]) if resultado[3] is not None else None,
-                    fecha_inicio=resultado[4],
-                    fecha_fin=resultado[5],
-                    costo_total=float(resultado[6]) if resultado[6] is not None else 0.0,
-                    estado=resultado[7],
-                    create_time=resultado[8],
-                    valor_uf_fecha=float(resultado[9]) if resultado[9] is not None else 0.0,
-                    fecha_uf_consulta=resultado[10]
-                )
-                # Nota: no agregar atributos de presentación al modelo aquí.
-                # Devolver solo el objeto Arriendo; la capa superior se encargará
-                # de obtener y formatear los datos relacionados.
-                arriendos.append(arriendo)
-            return arriendos
+            if '%(dias)s' in self._CONDICIONES_FECHAS[tipo]:
+                if estado is not None:
+                    self.cursor.execute(self._SQL_DURACION_MAXIMA, parametros)
+                else:
+                    self.cursor.execute(self._SQL_DURACION_MAXIMA_POR_ESTADO)
+                parametros['dias'] = max((int(fila[0] or 0) for fila in self.cursor.fetchall()), default=0)
+            self.cursor.execute(self._sqlPorFechas(tipo, con_relacion, estado), parametros)
+            crear = self._crearArriendoConRelacion if con_relacion else self._crearArriendo
+            return [crear(fila) for fila in self.cursor.fetchall()]
         except Exception as e:
-            logger.error("Error al listar arriendos por fecha: %s", e)
+            if es_error_de_esquema(e):
+                # Una lista vacía escondería que falta aplicar migrate_updated.sql
+                logger.error("Esquema desactualizado al listar arriendos por fechas (%s): %s", tipo, e)
+                raise
+            logger.error("Error al listar arriendos por fechas (%s): %s", tipo, e)
             return []
         finally:
             if self.cursor:
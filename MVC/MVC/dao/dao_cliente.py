@@ -1,11 +1,30 @@
-from conex.conn import Conex
+from conex.conn import Conex, iterar_consulta, consultar_por_ids
+from conex.metricas import conexion_medida, instrumentar_dao
+from dao.concurrencia import ConflictoVersionError, actualizar_con_version
+from dao.mapeo import columna, crear_mapeador
+from dao.paginacion import Pagina, armar_pagina, decodificar_cursor
 from modelo.cliente import Cliente
 import logging
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Iterator, Tuple, Dict, Iterable
 import pymysql
 
 logger = logging.getLogger(__name__)
 
+# Filas "id_cliente, run, nombre, apellido, direccion, telefono, create_time[, update_time]"
+_COLUMNAS_CLIENTE = (
+    columna('id_cliente', int),
+    columna('run'),
+    columna('nombre'),
+    columna('apellido'),
+    columna('direccion'),
+    columna('telefono'),
+    columna('create_time'),
+)
+_mapear_cliente = crear_mapeador(Cliente, _COLUMNAS_CLIENTE)
+_mapear_cliente_versionado = crear_mapeador(Cliente, _COLUMNAS_CLIENTE + (columna('update_time'),))
+
+@instrumentar_dao
 class DaoCliente:
     """
     Data Access Object para la entidad Cliente.
@@ -14,19 +33,33 @@ class DaoCliente:
     de la base de datos.
     """
 
+    # Columnas que pueden enviarse en una actualización parcial
+    COLUMNAS_ACTUALIZABLES = ('nombre', 'apellido', 'direccion', 'telefono')
+
     def __init__(self) -> None:
         """
-        Inicializa el DAO creando una conexión a la base de datos.
+        Inicializa el DAO tomando una conexión del pool compartido.
         
         Attributes:
             conex (Conex): Instancia de conexión a la base de datos
-            conn: Conexión activa a la base de datos
+            conn: Conexión activa a la base de datos (sus cursores registran métricas)
             cursor: Cursor para ejecutar consultas SQL
         """
         self.conex = Conex()
-        self.conn = self.conex.getConex()
+        self.conn = conexion_medida(self.conex.getConex())
         self.cursor: Optional[pymysql.cursors.Cursor] = None
 
+    def cerrar(self) -> None:
+        """Devuelve la conexión del DAO al pool de conexiones."""
+        self.conex.closeConex()
+        self.conn = None
+
+    def __enter__(self) -> 'DaoCliente':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cerrar()
+
     def agregarCliente(self, cliente: Cliente) -> bool:
         """
         Inserta un nuevo cliente en la base de datos.
@@ -59,6 +92,35 @@ class DaoCliente:
             if self.cursor:
                 self.cursor.close()
 
+    def agregarClientesLote(self, clientes: List[Cliente]) -> bool:
+        """
+        Inserta un lote de clientes con `executemany` y una sola confirmación.
+        
+        Si alguna fila falla (ej: duplicada) se revierte el lote completo.
+        
+        Args:
+            clientes (List[Cliente]): Clientes a insertar
+            
+        Returns:
+            bool: True si el lote completo fue insertado, False en caso contrario
+        """
+        sql = "INSERT INTO cliente (run, nombre, apellido, direccion, telefono) VALUES (%s, %s, %s, %s, %s)"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.executemany(sql, [(c.getRun(), c.getNombre(), c.getApellido(), c.getDireccion(), c.getTelefono()) for c in clientes])
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error("Error al agregar lote de clientes: %s", e)
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
     def buscarCliente(self, run: str) -> Optional[Cliente]:
         """
         Busca un cliente por su RUN.
@@ -69,21 +131,13 @@ class DaoCliente:
         Returns:
             Optional[Cliente]: Instancia de Cliente si se encuentra, None en caso contrario
         """
-        sql = "SELECT * FROM cliente WHERE run = %s"
+        sql = "SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time, update_time FROM cliente WHERE run = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (run,))
             resultado = self.cursor.fetchone()
             if resultado:
-                return Cliente(
-                    run=resultado[1], 
-                    nombre=resultado[2], 
-                    apellido=resultado[3], 
-                    direccion=resultado[4], 
-                    telefono=resultado[5], 
-                    id_cliente=resultado[0], 
-                    create_time=resultado[6]
-                )
+                return _mapear_cliente_versionado(resultado)
             return None
         except Exception as e:
             logger.error("Error al buscar cliente: %s", e)
@@ -96,24 +150,51 @@ class DaoCliente:
         """
         Actualiza los datos de un cliente existente.
         
+        Si el cliente trae `update_time` (fue leído con `buscarCliente`), la
+        actualización solo se aplica si nadie lo modificó desde esa lectura.
+        
         Args:
             cliente (Cliente): Instancia de Cliente con los datos actualizados
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el cliente
+        """
+        return self._actualizarColumnas('run', cliente.getRun(), {
+            'nombre': cliente.getNombre(),
+            'apellido': cliente.getApellido(),
+            'direccion': cliente.getDireccion(),
+            'telefono': cliente.getTelefono(),
+        }, cliente.getUpdateTime())
+
+    def actualizarClienteParcial(self, id_cliente: int, cambios: Dict[str, object],
+                                 version: Optional[datetime] = None) -> bool:
+        """
+        Actualiza solo las columnas indicadas de un cliente.
+        
+        Args:
+            id_cliente (int): ID del cliente
+            cambios (Dict[str, object]): Columnas modificadas y sus valores (vacío = sin cambios)
+            version (Optional[datetime]): update_time leído; None actualiza sin verificar
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el cliente
         """
-        sql = "UPDATE cliente SET nombre = %s, apellido = %s, direccion = %s, telefono = %s WHERE run = %s"
+        return self._actualizarColumnas('id_cliente', id_cliente, cambios, version)
+
+    def _actualizarColumnas(self, columna_id: str, valor_id: object, cambios: Dict[str, object],
+                            version: Optional[datetime]) -> bool:
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (
-                cliente.getNombre(), 
-                cliente.getApellido(), 
-                cliente.getDireccion(), 
-                cliente.getTelefono(), 
-                cliente.getRun()
-            ))
-            self.conn.commit()
-            return True
+            return actualizar_con_version(self.conn, self.cursor, 'cliente', columna_id, valor_id,
+                                          cambios, self.COLUMNAS_ACTUALIZABLES, version)
+        except ConflictoVersionError:
+            raise
         except Exception as e:
             logger.error("Error al actualizar cliente: %s", e)
             return False
@@ -157,24 +238,12 @@ class DaoCliente:
         Note:
             Retorna una lista vacía si no hay clientes o si ocurre un error
         """
-        sql = "SELECT * FROM cliente ORDER BY nombre, apellido"
+        sql = "SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time FROM cliente ORDER BY nombre, apellido"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql)
             resultados = self.cursor.fetchall()
-            clientes: List[Cliente] = []
-            for resultado in resultados:
-                cliente = Cliente(
-                    run=resultado[1], 
-                    nombre=resultado[2], 
-                    apellido=resultado[3], 
-                    direccion=resultado[4], 
-                    telefono=resultado[5], 
-                    id_cliente=resultado[0], 
-                    create_time=resultado[6]
-                )
-                clientes.append(cliente)
-            return clientes
+            return [self._crearCliente(resultado) for resultado in resultados]
         except Exception as e:
             logger.error("Error al listar clientes: %s", e)
             return []
@@ -182,6 +251,71 @@ class DaoCliente:
             if self.cursor:
                 self.cursor.close()
 
+    def iterClientes(self, tamano_lote: Optional[int] = None) -> Iterator[Cliente]:
+        """
+        Recorre todos los clientes sin cargarlos completos en memoria.
+        
+        Versión en streaming de `listarClientes`: usa un cursor de servidor
+        y trae las filas por lotes, entregando cada cliente apenas llega.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            Cliente: Cada cliente, ordenado por nombre y apellido
+        """
+        sql = "SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time FROM cliente ORDER BY nombre, apellido"
+        try:
+            for resultado in iterar_consulta(self.conn, sql, tamano_lote=tamano_lote):
+                yield self._crearCliente(resultado)
+        except Exception as e:
+            logger.error("Error al recorrer clientes: %s", e)
+
+    def paginarClientes(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[Cliente]:
+        """
+        Obtiene una página de clientes ordenados por nombre, apellido e ID.
+        
+        Usa paginación por clave: la página siguiente continúa después del
+        último cliente entregado usando el índice ``idx_cliente_nombre_apellido``,
+        sin ``OFFSET``.
+        
+        Args:
+            limite (int): Cantidad máxima de clientes por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[Cliente]: Página de clientes
+            
+        Raises:
+            CursorInvalidoError: Si el token no corresponde a este listado
+        """
+        params: list = []
+        where = ""
+        if cursor:
+            nombre, apellido, id_cliente = decodificar_cursor('cliente', cursor, 3)
+            # Comparación expandida: MySQL no recorre el índice como rango con (a, b, c) > (...)
+            where = ("WHERE nombre > %s OR (nombre = %s AND "
+                     "(apellido > %s OR (apellido = %s AND id_cliente > %s)))")
+            params = [nombre, nombre, apellido, apellido, id_cliente]
+        sql = f"SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time FROM cliente {where} ORDER BY nombre, apellido, id_cliente LIMIT %s"
+        try:
+            self.cursor = self.conn.cursor()
+            # Se pide una fila extra para saber si existe una página siguiente
+            self.cursor.execute(sql, (*params, limite + 1))
+            resultados = self.cursor.fetchall()
+            clientes = [self._crearCliente(resultado) for resultado in resultados]
+            return armar_pagina(clientes, limite, 'cliente',
+                                lambda c: (c.getNombre(), c.getApellido(), c.getIdCliente()))
+        except Exception as e:
+            logger.error("Error al paginar clientes: %s", e)
+            return Pagina([])
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    # Construye un Cliente a partir de una fila (id_cliente, run, ..., create_time)
+    _crearCliente = staticmethod(_mapear_cliente)
+
     def buscarClientePorId(self, id_cliente: int) -> Optional[Cliente]:
         """
         Busca un cliente por su ID.
@@ -192,21 +326,13 @@ class DaoCliente:
         Returns:
             Optional[Cliente]: Instancia de Cliente si se encuentra, None en caso contrario
         """
-        sql = "SELECT * FROM cliente WHERE id_cliente = %s"
+        sql = "SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time, update_time FROM cliente WHERE id_cliente = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (id_cliente,))
             resultado = self.cursor.fetchone()
             if resultado:
-                return Cliente(
-                    run=resultado[1], 
-                    nombre=resultado[2], 
-                    apellido=resultado[3], 
-                    direccion=resultado[4], 
-                    telefono=resultado[5], 
-                    id_cliente=resultado[0], 
-                    create_time=resultado[6]
-                )
+                return _mapear_cliente_versionado(resultado)
             return None
         except Exception as e:
             logger.error("Error al buscar cliente por ID: %s", e)
@@ -214,3 +340,22 @@ class DaoCliente:
         finally:
             if self.cursor:
                 self.cursor.close()
+
+    def buscarClientesPorIds(self, ids: Iterable[int]) -> Dict[int, Cliente]:
+        """
+        Busca varios clientes por ID con consultas `IN` por lotes.
+
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+
+        Returns:
+            Dict[int, Cliente]: Clientes encontrados indexados por ID; los IDs
+            inexistentes no aparecen. Vacío si ocurre un error
+        """
+        sql = "SELECT id_cliente, run, nombre, apellido, direccion, telefono, create_time, update_time FROM cliente WHERE id_cliente IN ({marcadores})"
+        try:
+            # Con update_time: el DTO guarda estos clientes en la misma caché que buscarClientePorId
+            return {int(fila[0]): _mapear_cliente_versionado(fila) for fila in consultar_por_ids(self.conn, sql, ids)}
+        except Exception as e:
+            logger.error("Error al buscar clientes por IDs: %s", e)
+            return {}
@@ -0,0 +1,107 @@
+from conex.conn import Conex
+from conex.metricas import conexion_medida, instrumentar_dao
+from modelo.resumen import ResumenSistema
+import logging
+from typing import Optional, Dict, Tuple, Iterable
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+#: Secciones del resumen; cada una es una sola consulta agregada
+SECCIONES_RESUMEN = ('clientes', 'empleados', 'vehiculos', 'arriendos')
+
+@instrumentar_dao
+class DaoInforme:
+    """
+    Data Access Object para los informes del sistema.
+
+    Calcula conteos y sumas con consultas agrupadas en la base de datos,
+    de modo que los informes no cargan tablas completas en memoria.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa el DAO tomando una conexión del pool compartido.
+
+        Attributes:
+            conex (Conex): Instancia de conexión a la base de datos
+            conn: Conexión activa a la base de datos (sus cursores registran métricas)
+            cursor: Cursor para ejecutar consultas SQL
+        """
+        self.conex = Conex()
+        self.conn = conexion_medida(self.conex.getConex())
+        self.cursor: Optional[pymysql.cursors.Cursor] = None
+
+    def cerrar(self) -> None:
+        """Devuelve la conexión del DAO al pool de conexiones."""
+        self.conex.closeConex()
+        self.conn = None
+
+    def __enter__(self) -> 'DaoInforme':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cerrar()
+
+    def obtenerResumen(self, secciones: Iterable[str] = SECCIONES_RESUMEN) -> Optional[ResumenSistema]:
+        """
+        Obtiene los totales del sistema con consultas agregadas.
+
+        Ejecuta un ``COUNT(*)`` de clientes y ``GROUP BY`` de empleados por
+        cargo, vehículos por estado y arriendos por estado (con
+        ``SUM(costo_total)``), todo en el mismo cursor. Solo se consultan las
+        secciones pedidas; las demás quedan en cero.
+
+        Args:
+            secciones (Iterable[str]): Subconjunto de SECCIONES_RESUMEN (default: todas)
+
+        Returns:
+            Optional[ResumenSistema]: Resumen del sistema, None si ocurre un error
+
+        Raises:
+            ValueError: Si alguna sección no existe
+        """
+        secciones = set(secciones)
+        desconocidas = secciones.difference(SECCIONES_RESUMEN)
+        if desconocidas:
+            raise ValueError(f"Secciones de resumen desconocidas: {sorted(desconocidas)}")
+        total_clientes, empleados, vehiculos, arriendos, costos = 0, {}, {}, {}, {}
+        try:
+            self.cursor = self.conn.cursor()
+            if 'clientes' in secciones:
+                self.cursor.execute("SELECT COUNT(*) FROM cliente")
+                total_clientes = int(self.cursor.fetchone()[0])
+
+            if 'empleados' in secciones:
+                self.cursor.execute("SELECT cargo, COUNT(*) FROM empleado GROUP BY cargo")
+                empleados = self._agrupar(self.cursor.fetchall())
+
+            if 'vehiculos' in secciones:
+                self.cursor.execute("SELECT estado, COUNT(*) FROM vehiculo GROUP BY estado")
+                vehiculos = self._agrupar(self.cursor.fetchall())
+
+            if 'arriendos' in secciones:
+                self.cursor.execute("""SELECT estado, COUNT(*), COALESCE(SUM(costo_total), 0)
+                     FROM arriendo GROUP BY estado""")
+                filas = self.cursor.fetchall()
+                arriendos = self._agrupar(filas)
+                costos = {fila[0]: float(fila[2]) for fila in filas}
+
+            return ResumenSistema(
+                total_clientes=total_clientes,
+                empleados_por_cargo=empleados,
+                vehiculos_por_estado=vehiculos,
+                arriendos_por_estado=arriendos,
+                costo_por_estado=costos
+            )
+        except Exception as e:
+            logger.error("Error al obtener resumen del sistema: %s", e)
+            return None
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    @staticmethod
+    def _agrupar(filas: Tuple) -> Dict[str, int]:
+        """Convierte filas (clave, conteo, ...) en un dict clave -> conteo."""
+        return {fila[0]: int(fila[1]) for fila in filas}
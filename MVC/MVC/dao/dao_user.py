@@ -1,11 +1,27 @@
-from conex.conn import Conex
+from conex.conn import Conex, iterar_consulta
+from conex.metricas import conexion_medida, instrumentar_dao
+from dao.concurrencia import ConflictoVersionError, actualizar_con_version
+from dao.mapeo import columna, crear_mapeador
 from modelo.user import User
 import logging
-from typing import Optional, List, Tuple, Any
+from datetime import datetime
+from typing import Optional, List, Tuple, Any, Iterator, Dict
 import pymysql
 
 logger = logging.getLogger(__name__)
 
+# Filas "run, nombre, apellido, password, cargo, id_empleado, create_time"; update_time queda en None
+_mapear_usuario = crear_mapeador(User, (
+    columna('run'),
+    columna('nombre'),
+    columna('apellido'),
+    columna('password'),
+    columna('cargo'),
+    columna('id_empleado', int),
+    columna('create_time'),
+))
+
+@instrumentar_dao
 class daoUser:
     """
     Data Access Object para la entidad User.
@@ -13,20 +29,34 @@ class daoUser:
     Proporciona métodos para realizar operaciones CRUD en la tabla 'empleado'
     de la base de datos.
     """
+
+    # Columnas que pueden enviarse en una actualización parcial
+    COLUMNAS_ACTUALIZABLES = ('nombre', 'apellido', 'password', 'cargo')
     
     def __init__(self) -> None:
         """
-        Inicializa el DAO creando una conexión a la base de datos.
+        Inicializa el DAO tomando una conexión del pool compartido.
         
         Attributes:
             conex (Conex): Instancia de conexión a la base de datos
-            conn: Conexión activa a la base de datos
+            conn: Conexión activa a la base de datos (sus cursores registran métricas)
             cursor: Cursor para ejecutar consultas SQL
         """
         self.conex = Conex()
-        self.conn = self.conex.getConex()
+        self.conn = conexion_medida(self.conex.getConex())
         self.cursor: Optional[pymysql.cursors.Cursor] = None
 
+    def cerrar(self) -> None:
+        """Devuelve la conexión del DAO al pool de conexiones."""
+        self.conex.closeConex()
+        self.conn = None
+
+    def __enter__(self) -> 'daoUser':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cerrar()
+
     def validarLogin(self, user: User) -> Optional[Tuple[str, str, str, str, str, int]]:
         """
         Valida las credenciales de un usuario para el login.
@@ -98,31 +128,122 @@ class daoUser:
             if self.cursor:
                 self.cursor.close()
 
+    def agregarUsuariosLote(self, usuarios: List[User]) -> bool:
+        """
+        Inserta un lote de usuarios con `executemany` y una sola confirmación.
+        
+        Si alguna fila falla (ej: duplicada) se revierte el lote completo.
+        
+        Args:
+            usuarios (List[User]): Usuarios a insertar
+            
+        Returns:
+            bool: True si el lote completo fue insertado, False en caso contrario
+        """
+        sql = "INSERT INTO empleado (run, password, nombre, apellido, cargo) VALUES (%s, %s, %s, %s, %s)"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.executemany(sql, [(u.getRun(), u.getPassword(), u.getNombre(), u.getApellido(), u.getCargo()) for u in usuarios])
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error("Error al agregar lote de usuarios en BD: %s", e)
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
     def actualizarUsuario(self, user: User) -> bool:
         """
         Actualiza los datos de un usuario existente.
         
+        Si el usuario trae `update_time` (fue leído con `buscarUsuario`), la
+        actualización solo se aplica si nadie lo modificó desde esa lectura.
+        
         Args:
             user (User): Instancia de User con los datos actualizados
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el usuario
+        """
+        return self._actualizarColumnas('run', user.getRun(), {
+            'nombre': user.getNombre(),
+            'apellido': user.getApellido(),
+            'password': user.getPassword(),
+            'cargo': user.getCargo(),
+        }, user.getUpdateTime())
+
+    def actualizarUsuarioParcial(self, id_empleado: int, cambios: Dict[str, Any],
+                                 version: Optional[datetime] = None) -> bool:
+        """
+        Actualiza solo las columnas indicadas de un usuario.
+        
+        Args:
+            id_empleado (int): ID del empleado
+            cambios (Dict[str, Any]): Columnas modificadas y sus valores (vacío = sin cambios)
+            version (Optional[datetime]): update_time leído; None actualiza sin verificar
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el usuario
         """
-        sql = "UPDATE empleado SET nombre = %s, apellido = %s, password = %s, cargo = %s WHERE run = %s"
+        return self._actualizarColumnas('id_empleado', id_empleado, cambios, version)
+
+    def _actualizarColumnas(self, columna_id: str, valor_id: Any, cambios: Dict[str, Any],
+                            version: Optional[datetime]) -> bool:
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (
-                user.getNombre(), 
-                user.getApellido(), 
-                user.getPassword(), 
-                user.getCargo(), 
-                user.getRun()
-            ))
+            ok = actualizar_con_version(self.conn, self.cursor, 'empleado', columna_id, valor_id,
+                                        cambios, self.COLUMNAS_ACTUALIZABLES, version)
+            logger.debug("Usuario actualizado en BD: %s (%s)", valor_id, ", ".join(cambios) or "sin cambios")
+            return ok
+        except ConflictoVersionError:
+            raise
+        except Exception as e:
+            logger.error("Error al actualizar usuario %s en BD: %s", valor_id, str(e))
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    def actualizarPassword(self, run: str, password_hash: str, anterior: Optional[str] = None) -> bool:
+        """
+        Reemplaza solo el hash de contraseña de un usuario.
+        
+        Args:
+            run (str): RUN del usuario
+            password_hash (str): Nuevo hash bcrypt
+            anterior (Optional[str]): Si se entrega, solo se reemplaza si el hash guardado
+                sigue siendo este (evita pisar un cambio de contraseña posterior)
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+        """
+        sql = "UPDATE empleado SET password = %s WHERE run = %s"
+        params: tuple = (password_hash, run)
+        if anterior is not None:
+            sql += " AND password = %s"
+            params += (anterior,)
+        try:
+            self.cursor = self.conn.cursor()
+            afectadas = self.cursor.execute(sql, params)
             self.conn.commit()
-            logger.debug("Usuario actualizado en BD: %s", user.getRun())
+            if anterior is not None and not afectadas:
+                logger.debug("La contraseña de %s cambió; no se reemplaza", run)
+                return False
+            logger.debug("Contraseña actualizada en BD: %s", run)
             return True
         except Exception as e:
-            logger.error("Error al actualizar usuario %s en BD: %s", user.getRun(), str(e))
+            logger.error("Error al actualizar contraseña de %s en BD: %s", run, str(e))
             return False
         finally:
             if self.cursor:
@@ -136,9 +257,10 @@ class daoUser:
             user (User): Instancia de User con el RUN a buscar
             
         Returns:
-            Optional[Tuple]: Tupla con los datos del usuario si existe, None en caso contrario
+            Optional[Tuple]: (run, nombre, apellido, password, cargo, id_empleado, update_time)
+                si existe, None en caso contrario
         """
-        sql = "SELECT run, nombre, apellido, password, cargo, id_empleado FROM empleado WHERE run = %s"
+        sql = "SELECT run, nombre, apellido, password, cargo, id_empleado, update_time FROM empleado WHERE run = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (user.getRun(),))
@@ -189,22 +311,12 @@ class daoUser:
         Note:
             Retorna una lista vacía si no hay usuarios o si ocurre un error
         """
-        sql = "SELECT run, nombre, apellido, password, cargo, id_empleado FROM empleado ORDER BY nombre, apellido"
+        sql = "SELECT run, nombre, apellido, password, cargo, id_empleado, create_time FROM empleado ORDER BY nombre, apellido"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql)
             resultados = self.cursor.fetchall()
-            usuarios: List[User] = []
-            for resultado in resultados:
-                user = User(
-                    run=resultado[0], 
-                    nombre=resultado[1], 
-                    apellido=resultado[2], 
-                    password=resultado[3], 
-                    cargo=resultado[4], 
-                    id_empleado=resultado[5]
-                )
-                usuarios.append(user)
+            usuarios: List[User] = [self._crearUsuario(resultado) for resultado in resultados]
             logger.debug("Listados %d usuarios de BD", len(usuarios))
             return usuarios
         except Exception as e:
@@ -213,3 +325,26 @@ class daoUser:
         finally:
             if self.cursor:
                 self.cursor.close()
+
+    def iterUsuarios(self, tamano_lote: Optional[int] = None) -> Iterator[User]:
+        """
+        Recorre todos los usuarios sin cargarlos completos en memoria.
+        
+        Versión en streaming de `listarUsuarios`: usa un cursor de servidor
+        y trae las filas por lotes, entregando cada usuario apenas llega.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            User: Cada empleado, ordenado por nombre y apellido
+        """
+        sql = "SELECT run, nombre, apellido, password, cargo, id_empleado, create_time FROM empleado ORDER BY nombre, apellido"
+        try:
+            for resultado in iterar_consulta(self.conn, sql, tamano_lote=tamano_lote):
+                yield self._crearUsuario(resultado)
+        except Exception as e:
+            logger.error("Error al recorrer usuarios de BD: %s", str(e))
+
+    # Construye un User a partir de una fila (run, nombre, ..., id_empleado, create_time)
+    _crearUsuario = staticmethod(_mapear_usuario)
@@ -1,11 +1,31 @@
-from conex.conn import Conex
+from conex.conn import Conex, iterar_consulta, consultar_por_ids
+from conex.metricas import conexion_medida, instrumentar_dao
+from dao.concurrencia import ConflictoVersionError, actualizar_con_version
+from dao.mapeo import columna, crear_mapeador
+from dao.paginacion import Pagina, armar_pagina, decodificar_cursor
 from modelo.vehiculo import Vehiculo
 import logging
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Iterator, Tuple, Dict, Iterable
 import pymysql
 
 logger = logging.getLogger(__name__)
 
+# Filas "id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time[, update_time]"
+_COLUMNAS_VEHICULO = (
+    columna('id_vehiculo', int),
+    columna('patente'),
+    columna('marca'),
+    columna('modelo'),
+    columna('año', int),
+    columna('precio_diario', float),
+    columna('estado'),
+    columna('create_time'),
+)
+_mapear_vehiculo = crear_mapeador(Vehiculo, _COLUMNAS_VEHICULO)
+_mapear_vehiculo_versionado = crear_mapeador(Vehiculo, _COLUMNAS_VEHICULO + (columna('update_time'),))
+
+@instrumentar_dao
 class DaoVehiculo:
     """
     Data Access Object para la entidad Vehiculo.
@@ -14,19 +34,33 @@ class DaoVehiculo:
     de la base de datos.
     """
 
+    # Columnas que pueden enviarse en una actualización parcial
+    COLUMNAS_ACTUALIZABLES = ('patente', 'marca', 'modelo', 'año', 'precio_diario', 'estado')
+
     def __init__(self) -> None:
         """
-        Inicializa el DAO creando una conexión a la base de datos.
+        Inicializa el DAO tomando una conexión del pool compartido.
         
         Attributes:
             conex (Conex): Instancia de conexión a la base de datos
-            conn: Conexión activa a la base de datos
+            conn: Conexión activa a la base de datos (sus cursores registran métricas)
             cursor: Cursor para ejecutar consultas SQL
         """
         self.conex = Conex()
-        self.conn = self.conex.getConex()
+        self.conn = conexion_medida(self.conex.getConex())
         self.cursor: Optional[pymysql.cursors.Cursor] = None
 
+    def cerrar(self) -> None:
+        """Devuelve la conexión del DAO al pool de conexiones."""
+        self.conex.closeConex()
+        self.conn = None
+
+    def __enter__(self) -> 'DaoVehiculo':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cerrar()
+
     def agregarVehiculo(self, vehiculo: Vehiculo) -> bool:
         """
         Inserta un nuevo vehículo en la base de datos.
@@ -52,6 +86,7 @@ class DaoVehiculo:
                 vehiculo.getEstado()
             ))
             self.conn.commit()
+            vehiculo.setIdVehiculo(self.cursor.lastrowid)
             return True
         except Exception as e:
             logger.error("Error al agregar vehículo: %s", e)
@@ -60,6 +95,35 @@ class DaoVehiculo:
             if self.cursor:
                 self.cursor.close()
 
+    def agregarVehiculosLote(self, vehiculos: List[Vehiculo]) -> bool:
+        """
+        Inserta un lote de vehículos con `executemany` y una sola confirmación.
+        
+        Si alguna fila falla (ej: duplicada) se revierte el lote completo.
+        
+        Args:
+            vehiculos (List[Vehiculo]): Vehículos a insertar
+            
+        Returns:
+            bool: True si el lote completo fue insertado, False en caso contrario
+        """
+        sql = "INSERT INTO vehiculo (patente, marca, modelo, año, precio_diario, estado) VALUES (%s, %s, %s, %s, %s, %s)"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.executemany(sql, [(v.getPatente(), v.getMarca(), v.getModelo(), v.getAño(), v.getPrecioDiario(), v.getEstado()) for v in vehiculos])
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error("Error al agregar lote de vehículos: %s", e)
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
     def buscarVehiculo(self, patente: str) -> Optional[Vehiculo]:
         """
         Busca un vehículo por su patente.
@@ -70,22 +134,13 @@ class DaoVehiculo:
         Returns:
             Optional[Vehiculo]: Instancia de Vehiculo si se encuentra, None en caso contrario
         """
-        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time FROM vehiculo WHERE patente = %s"
+        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time, update_time FROM vehiculo WHERE patente = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (patente,))
             resultado = self.cursor.fetchone()
             if resultado:
-                return Vehiculo(
-                    patente=resultado[1], 
-                    marca=resultado[2], 
-                    modelo=resultado[3], 
-                    año=int(resultado[4]), 
-                    precio_diario=float(resultado[5]), 
-                    estado=resultado[6], 
-                    id_vehiculo=int(resultado[0]), 
-                    create_time=resultado[7]
-                )
+                return _mapear_vehiculo_versionado(resultado)
             return None
         except Exception as e:
             logger.error("Error al buscar vehículo: %s", e)
@@ -104,22 +159,13 @@ class DaoVehiculo:
         Returns:
             Optional[Vehiculo]: Instancia de Vehiculo si se encuentra, None en caso contrario
         """
-        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time FROM vehiculo WHERE id_vehiculo = %s"
+        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time, update_time FROM vehiculo WHERE id_vehiculo = %s"
         try:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql, (id_vehiculo,))
             resultado = self.cursor.fetchone()
             if resultado:
-                return Vehiculo(
-                    patente=resultado[1], 
-                    marca=resultado[2], 
-                    modelo=resultado[3], 
-                    año=int(resultado[4]), 
-                    precio_diario=float(resultado[5]), 
-                    estado=resultado[6], 
-                    id_vehiculo=int(resultado[0]), 
-                    create_time=resultado[7]
-                )
+                return _mapear_vehiculo_versionado(resultado)
             return None
         except Exception as e:
             logger.error("Error al buscar vehículo por ID: %s", e)
@@ -128,31 +174,145 @@ class DaoVehiculo:
             if self.cursor:
                 self.cursor.close()
 
+    def buscarVehiculosPorIds(self, ids: Iterable[int]) -> Dict[int, Vehiculo]:
+        """
+        Busca varios vehículos por ID con consultas `IN` por lotes.
+        
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[int, Vehiculo]: Vehículos encontrados indexados por ID; los IDs
+            inexistentes no aparecen. Vacío si ocurre un error
+        """
+        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time, update_time FROM vehiculo WHERE id_vehiculo IN ({marcadores})"
+        try:
+            # Con update_time: el DTO guarda estos vehículos en la misma caché que buscarVehiculoPorId
+            return {int(fila[0]): _mapear_vehiculo_versionado(fila) for fila in consultar_por_ids(self.conn, sql, ids)}
+        except Exception as e:
+            logger.error("Error al buscar vehículos por IDs: %s", e)
+            return {}
+
+    def buscarIdsPorPatentes(self, patentes: Iterable[str]) -> Dict[str, int]:
+        """
+        Obtiene los IDs de varios vehículos a partir de sus patentes.
+        
+        Args:
+            patentes (Iterable[str]): Patentes a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[str, int]: ID de cada patente encontrada; vacío si ocurre un error
+        """
+        sql = "SELECT patente, id_vehiculo FROM vehiculo WHERE patente IN ({marcadores})"
+        try:
+            return {fila[0]: int(fila[1]) for fila in consultar_por_ids(self.conn, sql, patentes)}
+        except Exception as e:
+            logger.error("Error al buscar IDs de vehículos por patente: %s", e)
+            return {}
+
     def actualizarVehiculo(self, vehiculo: Vehiculo) -> bool:
         """
         Actualiza los datos de un vehículo existente.
         
+        Si el vehículo trae `update_time` (fue leído con `buscarVehiculo`), la
+        actualización solo se aplica si nadie lo modificó desde esa lectura.
+        
         Args:
             vehiculo (Vehiculo): Instancia de Vehiculo con los datos actualizados
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el vehículo
+        """
+        return self._actualizarColumnas('patente', vehiculo.getPatente(), {
+            'marca': vehiculo.getMarca(),
+            'modelo': vehiculo.getModelo(),
+            'año': vehiculo.getAño(),
+            'precio_diario': vehiculo.getPrecioDiario(),
+            'estado': vehiculo.getEstado(),
+        }, vehiculo.getUpdateTime())
+
+    def actualizarVehiculoParcial(self, id_vehiculo: int, cambios: Dict[str, object],
+                                  version: Optional[datetime] = None) -> bool:
+        """
+        Actualiza solo las columnas indicadas de un vehículo.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo
+            cambios (Dict[str, object]): Columnas modificadas y sus valores (vacío = sin cambios)
+            version (Optional[datetime]): update_time leído; None actualiza sin verificar
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otra sesión modificó el vehículo
         """
-        sql = "UPDATE vehiculo SET marca = %s, modelo = %s, año = %s, precio_diario = %s, estado = %s WHERE patente = %s"
+        return self._actualizarColumnas('id_vehiculo', id_vehiculo, cambios, version)
+
+    def _actualizarColumnas(self, columna_id: str, valor_id: object, cambios: Dict[str, object],
+                            version: Optional[datetime]) -> bool:
         try:
             self.cursor = self.conn.cursor()
-            self.cursor.execute(sql, (
-                vehiculo.getMarca(), 
-                vehiculo.getModelo(), 
-                vehiculo.getAño(), 
-                vehiculo.getPrecioDiario(), 
-                vehiculo.getEstado(), 
-                vehiculo.getPatente()
-            ))
+            return actualizar_con_version(self.conn, self.cursor, 'vehiculo', columna_id, valor_id,
+                                          cambios, self.COLUMNAS_ACTUALIZABLES, version)
+        except ConflictoVersionError:
+            raise
+        except Exception as e:
+            logger.error("Error al actualizar vehículo: %s", e)
+            return False
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    def bloquearParaArriendo(self, id_vehiculo: int) -> Optional[str]:
+        """
+        Bloquea la fila del vehículo hasta el fin de la transacción (`FOR UPDATE`).
+        
+        Serializa las reservas concurrentes del mismo vehículo sin bloquear la
+        tabla: otra sesión que intente reservarlo espera a que esta confirme o
+        revierta. Debe llamarse dentro de una `UnidadDeTrabajo`.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo a reservar
+            
+        Returns:
+            Optional[str]: Estado del vehículo, None si no existe o si ocurre un error
+        """
+        sql = "SELECT estado FROM vehiculo WHERE id_vehiculo = %s FOR UPDATE"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.execute(sql, (id_vehiculo,))
+            resultado = self.cursor.fetchone()
+            return resultado[0] if resultado else None
+        except Exception as e:
+            logger.error("Error al bloquear vehículo %s: %s", id_vehiculo, e)
+            return None
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    def actualizarEstado(self, id_vehiculo: int, estado: str) -> bool:
+        """
+        Cambia solo el estado de un vehículo.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo
+            estado (str): Nuevo estado (disponible, arrendado, mantencion)
+            
+        Returns:
+            bool: True si la actualización fue exitosa, False en caso contrario
+        """
+        sql = "UPDATE vehiculo SET estado = %s WHERE id_vehiculo = %s"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.execute(sql, (estado, id_vehiculo))
             self.conn.commit()
             return True
         except Exception as e:
-            logger.error("Error al actualizar vehículo: %s", e)
+            logger.error("Error al actualizar estado de vehículo: %s", e)
             return False
         finally:
             if self.cursor:
@@ -199,20 +359,7 @@ class DaoVehiculo:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql)
             resultados = self.cursor.fetchall()
-            vehiculos: List[Vehiculo] = []
-            for resultado in resultados:
-                vehiculo = Vehiculo(
-                    patente=resultado[1], 
-                    marca=resultado[2], 
-                    modelo=resultado[3], 
-                    año=int(resultado[4]), 
-                    precio_diario=float(resultado[5]),
-                    estado=resultado[6], 
-                    id_vehiculo=resultado[0], 
-                    create_time=resultado[7]
-                )
-                vehiculos.append(vehiculo)
-            return vehiculos
+            return [self._crearVehiculo(resultado) for resultado in resultados]
         except Exception as e:
             logger.error("Error al listar vehículos: %s", e)
             return []
@@ -220,6 +367,72 @@ class DaoVehiculo:
             if self.cursor:
                 self.cursor.close()
 
+    def iterVehiculos(self, tamano_lote: Optional[int] = None) -> Iterator[Vehiculo]:
+        """
+        Recorre todos los vehículos sin cargarlos completos en memoria.
+        
+        Versión en streaming de `listarVehiculos`: usa un cursor de servidor
+        y trae las filas por lotes, entregando cada vehículo apenas llega.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: DB_FETCH_LOTE)
+            
+        Yields:
+            Vehiculo: Cada vehículo, ordenado por marca y modelo
+        """
+        sql = "SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time FROM vehiculo ORDER BY marca, modelo"
+        try:
+            for resultado in iterar_consulta(self.conn, sql, tamano_lote=tamano_lote):
+                yield self._crearVehiculo(resultado)
+        except Exception as e:
+            logger.error("Error al recorrer vehículos: %s", e)
+
+    def paginarVehiculos(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[Vehiculo]:
+        """
+        Obtiene una página de vehículos ordenados por marca, modelo e ID.
+        
+        Usa paginación por clave: la página siguiente continúa después del
+        último vehículo entregado usando el índice ``idx_vehiculo_marca_modelo``,
+        sin ``OFFSET``.
+        
+        Args:
+            limite (int): Cantidad máxima de vehículos por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[Vehiculo]: Página de vehículos
+            
+        Raises:
+            CursorInvalidoError: Si el token no corresponde a este listado
+        """
+        params: list = []
+        where = ""
+        if cursor:
+            marca, modelo, id_vehiculo = decodificar_cursor('vehiculo', cursor, 3)
+            # Comparación expandida: MySQL no recorre el índice como rango con (a, b, c) > (...)
+            where = ("WHERE marca > %s OR (marca = %s AND "
+                     "(modelo > %s OR (modelo = %s AND id_vehiculo > %s)))")
+            params = [marca, marca, modelo, modelo, id_vehiculo]
+        sql = f"""SELECT id_vehiculo, patente, marca, modelo, año, precio_diario, estado, create_time
+             FROM vehiculo {where} ORDER BY marca, modelo, id_vehiculo LIMIT %s"""
+        try:
+            self.cursor = self.conn.cursor()
+            # Se pide una fila extra para saber si existe una página siguiente
+            self.cursor.execute(sql, (*params, limite + 1))
+            resultados = self.cursor.fetchall()
+            vehiculos = [self._crearVehiculo(resultado) for resultado in resultados]
+            return armar_pagina(vehiculos, limite, 'vehiculo',
+                                lambda v: (v.getMarca(), v.getModelo(), v.getIdVehiculo()))
+        except Exception as e:
+            logger.error("Error al paginar vehículos: %s", e)
+            return Pagina([])
+        finally:
+            if self.cursor:
+                self.cursor.close()
+
+    # Construye un Vehiculo a partir de una fila (id, patente, ..., create_time)
+    _crearVehiculo = staticmethod(_mapear_vehiculo)
+
     def listarVehiculosDisponibles(self) -> List[Vehiculo]:
         """
         Obtiene todos los vehículos con estado 'disponible'.
@@ -235,23 +448,32 @@ class DaoVehiculo:
             self.cursor = self.conn.cursor()
             self.cursor.execute(sql)
             resultados = self.cursor.fetchall()
-            vehiculos: List[Vehiculo] = []
-            for resultado in resultados:
-                vehiculo = Vehiculo(
-                    patente=resultado[1], 
-                    marca=resultado[2], 
-                    modelo=resultado[3], 
-                    año=int(resultado[4]), 
-                    precio_diario=float(resultado[5]), 
-                    estado=resultado[6], 
-                    id_vehiculo=resultado[0], 
-                    create_time=resultado[7]
-                )
-                vehiculos.append(vehiculo)
-            return vehiculos
+            return [self._crearVehiculo(resultado) for resultado in resultados]
         except Exception as e:
             logger.error("Error al listar vehículos disponibles: %s", e)
             return []
         finally:
             if self.cursor:
                 self.cursor.close()
+
+    def listarIdsArrendables(self) -> List[int]:
+        """
+        Obtiene los IDs de los vehículos que pueden arrendarse en alguna fecha.
+        
+        Incluye los arrendados (pueden estar libres en otro rango) y excluye
+        los que están en mantención o reparación.
+        
+        Returns:
+            List[int]: IDs de vehículos; vacía si ocurre un error
+        """
+        sql = "SELECT id_vehiculo FROM vehiculo WHERE estado IN ('disponible', 'arrendado')"
+        try:
+            self.cursor = self.conn.cursor()
+            self.cursor.execute(sql)
+            return [int(fila[0]) for fila in self.cursor.fetchall()]
+        except Exception as e:
+            logger.error("Error al listar vehículos arrendables: %s", e)
+            return []
+        finally:
+            if self.cursor:
+                self.cursor.close()
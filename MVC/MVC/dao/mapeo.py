@@ -0,0 +1,86 @@
+from typing import Any, Callable, Optional, Sequence, Tuple, Type, TypeVar
+
+T = TypeVar('T')
+
+# (atributo, conversión, valor si la columna es NULL); la posición en la
+# secuencia es el índice de la columna en la fila
+Columna = Tuple[str, Optional[Callable[[Any], Any]], Any]
+
+
+def columna(atributo: str, conversion: Optional[Callable[[Any], Any]] = None,
+            si_nulo: Any = None) -> Columna:
+    """
+    Describe cómo copiar una columna de la fila a un atributo del modelo.
+
+    Args:
+        atributo (str): Nombre del atributo sin el guion bajo (``id_vehiculo`` -> ``_id_vehiculo``)
+        conversion (Optional[Callable]): Función aplicada al valor (``int``, ``float``...)
+        si_nulo (Any): Valor asignado cuando la columna es NULL (no se convierte)
+
+    Returns:
+        Columna: Especificación para ``crear_mapeador``
+    """
+    return (atributo, conversion, si_nulo)
+
+
+def crear_mapeador(clase: Type[T], columnas: Sequence[Columna], **constantes: Any) -> Callable[[Tuple], T]:
+    """
+    Compila una función que convierte una fila de una consulta en una instancia.
+
+    La función se genera una sola vez por forma de consulta (como hace
+    ``collections.namedtuple``): crea la instancia sin pasar por
+    ``__init__`` y asigna cada atributo con una sola expresión, sin bucles
+    ni búsquedas por nombre por fila.
+
+    Los atributos que la consulta no trae toman el valor de ``constantes``
+    o, si no está ahí, el que deja ``clase()`` con sus argumentos por
+    defecto. Ese prototipo se construye una sola vez, al compilar: todas
+    las filas comparten el mismo valor, así que un default calculado (por
+    ejemplo ``create_time or datetime.now()``) queda fijo en la hora de
+    importación. Por eso las columnas con defaults así deben venir en la
+    consulta o pasarse en ``constantes``.
+
+    Args:
+        clase (Type[T]): Modelo a construir (con ``__slots__`` o no)
+        columnas (Sequence[Columna]): Una entrada por columna de la fila, en orden
+        **constantes: Valores fijos para atributos que no vienen en la fila
+
+    Returns:
+        Callable[[Tuple], T]: Función ``fila -> instancia``
+    """
+    valores = {'_new': object.__new__, '_clase': clase}
+    lineas = ["def mapear(fila):", "    obj = _new(_clase)"]
+    asignados = set()
+    for i, (atributo, conversion, si_nulo) in enumerate(columnas):
+        expresion = f"fila[{i}]"
+        if conversion is not None:
+            valores[f"_c{i}"] = conversion
+            valores[f"_n{i}"] = si_nulo
+            expresion = f"(_n{i} if fila[{i}] is None else _c{i}(fila[{i}]))"
+        lineas.append(f"    obj._{atributo} = {expresion}")
+        asignados.add(atributo)
+
+    # El resto de los atributos: constantes explícitas o el valor que deja el constructor
+    prototipo = clase()
+    nombres = _slots(clase) + list(getattr(prototipo, '__dict__', {}))
+    for nombre in nombres:
+        atributo = nombre[1:]
+        if atributo in asignados or not hasattr(prototipo, nombre):
+            continue
+        valores[f"_d{nombre}"] = constantes.get(atributo, getattr(prototipo, nombre))
+        lineas.append(f"    obj.{nombre} = _d{nombre}")
+    lineas.append("    return obj")
+
+    exec("\n".join(lineas), valores)
+    mapear = valores['mapear']
+    mapear.__qualname__ = f"mapear_{clase.__name__}"
+    return mapear
+
+
+def _slots(clase: type) -> list:
+    nombres = []
+    for base in clase.__mro__:
+        for nombre in getattr(base, '__slots__', ()):
+            if nombre not in nombres:
+                nombres.append(nombre)
+    return nombres
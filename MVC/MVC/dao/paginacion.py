@@ -0,0 +1,115 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class CursorInvalidoError(ValueError):
+    """Se lanza cuando un token de página no es válido para el listado pedido."""
+
+
+class Pagina(Generic[T]):
+    """
+    Una página de resultados obtenida con paginación por clave (keyset).
+
+    En lugar de ``OFFSET``, cada página recuerda los valores de la clave de
+    orden de su última fila; la siguiente consulta continúa "después" de esa
+    fila usando el índice, por lo que la página 1000 cuesta lo mismo que la 1.
+
+    Attributes:
+        elementos (List[T]): Elementos de la página
+        siguiente (Optional[str]): Token opaco de la página siguiente, o None si es la última
+    """
+
+    def __init__(self, elementos: List[T], siguiente: Optional[str] = None) -> None:
+        self.elementos = elementos
+        self.siguiente = siguiente
+
+    def getElementos(self) -> List[T]:
+        return self.elementos
+
+    def getSiguiente(self) -> Optional[str]:
+        return self.siguiente
+
+    def hayMas(self) -> bool:
+        """Indica si existe una página siguiente."""
+        return self.siguiente is not None
+
+    def __len__(self) -> int:
+        return len(self.elementos)
+
+    def __iter__(self):
+        return iter(self.elementos)
+
+
+def _serializar(valor: Any) -> Any:
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return str(valor)
+    return valor
+
+
+def codificar_cursor(listado: str, clave: Sequence[Any]) -> str:
+    """
+    Genera el token opaco que apunta a la fila siguiente a ``clave``.
+
+    Args:
+        listado (str): Nombre del listado (evita usar un token en otro listado)
+        clave (Sequence): Valores de la clave de orden de la última fila entregada
+
+    Returns:
+        str: Token en base64 seguro para URL
+    """
+    datos = json.dumps({'l': listado, 'k': [_serializar(v) for v in clave]},
+                       separators=(',', ':'))
+    return base64.urlsafe_b64encode(datos.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(listado: str, token: str, largo: int) -> List[Any]:
+    """
+    Recupera los valores de la clave de orden guardados en un token.
+
+    Args:
+        listado (str): Nombre del listado que se está paginando
+        token (str): Token entregado en una página anterior
+        largo (int): Cantidad de columnas de la clave de orden
+
+    Returns:
+        List[Any]: Valores de la clave, en el orden del ORDER BY
+
+    Raises:
+        CursorInvalidoError: Si el token está dañado o pertenece a otro listado
+    """
+    try:
+        relleno = '=' * (-len(token) % 4)
+        datos = json.loads(base64.urlsafe_b64decode(token + relleno).decode('utf-8'))
+        clave = datos['k']
+        if datos['l'] != listado or not isinstance(clave, list) or len(clave) != largo:
+            raise ValueError("token de otro listado")
+        return clave
+    except Exception as e:
+        raise CursorInvalidoError(f"Cursor de página inválido: {e}") from e
+
+
+def armar_pagina(elementos: List[T], limite: int, listado: str,
+                 clave_de: Callable[[T], Sequence[Any]]) -> Pagina[T]:
+    """
+    Recorta los ``limite + 1`` elementos consultados y calcula el token siguiente.
+
+    Args:
+        elementos (List[T]): Filas ya convertidas; se consultó una fila extra
+        limite (int): Tamaño de página solicitado
+        listado (str): Nombre del listado, para el token
+        clave_de (Callable[[T], Sequence]): Obtiene la clave de orden de un elemento
+
+    Returns:
+        Pagina[T]: Página con a lo más ``limite`` elementos
+    """
+    if len(elementos) <= limite:
+        return Pagina(elementos)
+    elementos = elementos[:limite]
+    return Pagina(elementos, codificar_cursor(listado, clave_de(elementos[-1])))
@@ -0,0 +1,183 @@
+import copy
+import os
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def _entero_env(nombre: str, defecto: int) -> int:
+    try:
+        return int(os.environ.get(nombre, defecto))
+    except ValueError:
+        logger.warning("Valor inválido para %s; se usa %s", nombre, defecto)
+        return defecto
+
+
+class CacheLRU:
+    """
+    Caché acotada en memoria con desalojo LRU y expiración por TTL.
+
+    Se usa como caché de lectura (read-through) de entidades en los DTOs:
+    las búsquedas por clave se sirven desde memoria y las escrituras
+    invalidan las entradas afectadas. Las entidades se entregan como copia
+    para que modificar el objeto devuelto no altere la caché.
+
+    Attributes:
+        max_entradas (int): Entradas máximas antes de desalojar la menos usada
+        ttl (float): Segundos de validez de cada entrada
+    """
+
+    def __init__(self, max_entradas: int = 1024, ttl: float = 60.0,
+                 reloj: Callable[[], float] = time.monotonic) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entradas (int): Tamaño máximo de la caché
+            ttl (float): Segundos de validez de cada entrada
+            reloj (Callable[[], float]): Fuente de tiempo en segundos
+        """
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._reloj = reloj
+        self._datos: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._desalojos = 0
+        self._expirados = 0
+        self._invalidaciones = 0
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        """
+        Busca una entrada vigente.
+
+        Args:
+            clave (Hashable): Clave de la entrada
+
+        Returns:
+            Optional[Any]: Copia del valor guardado, o None si no está o expiró
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self._misses += 1
+                return None
+            valor, vence = entrada
+            if vence <= self._reloj():
+                del self._datos[clave]
+                self._expirados += 1
+                self._misses += 1
+                return None
+            self._datos.move_to_end(clave)
+            self._hits += 1
+        return copy.copy(valor)
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """
+        Guarda un valor, desalojando la entrada menos usada si la caché está llena.
+
+        Args:
+            clave (Hashable): Clave de la entrada
+            valor (Any): Valor a guardar (se guarda una copia)
+        """
+        with self._lock:
+            self._datos[clave] = (copy.copy(valor), self._reloj() + self.ttl)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+                self._desalojos += 1
+
+    def obtener_o_cargar(self, clave: Hashable, cargar: Callable[[], Optional[T]]) -> Optional[T]:
+        """
+        Lectura a través de la caché: si la clave no está, la carga y la guarda.
+
+        Los resultados None (no encontrado) no se guardan.
+
+        Args:
+            clave (Hashable): Clave de la entrada
+            cargar (Callable[[], Optional[T]]): Función que consulta la base de datos
+
+        Returns:
+            Optional[T]: Valor desde la caché o recién cargado
+        """
+        valor = self.obtener(clave)
+        if valor is not None:
+            return valor
+        valor = cargar()
+        if valor is not None:
+            self.guardar(clave, valor)
+        return valor
+
+    def invalidar(self, clave: Hashable) -> None:
+        """Elimina una entrada si existe."""
+        with self._lock:
+            if self._datos.pop(clave, None) is not None:
+                self._invalidaciones += 1
+
+    def invalidar_donde(self, condicion: Callable[[Any], bool]) -> int:
+        """
+        Elimina todas las entradas cuyo valor cumple la condición.
+
+        Permite invalidar una entidad guardada bajo varias claves (ej: por ID
+        y por patente) conociendo solo uno de sus datos.
+
+        Args:
+            condicion (Callable[[Any], bool]): Predicado sobre el valor guardado
+
+        Returns:
+            int: Cantidad de entradas eliminadas
+        """
+        with self._lock:
+            claves = [clave for clave, (valor, _) in self._datos.items() if condicion(valor)]
+            for clave in claves:
+                del self._datos[clave]
+            self._invalidaciones += len(claves)
+        return len(claves)
+
+    def limpiar(self) -> None:
+        """Vacía la caché (los contadores se mantienen)."""
+        with self._lock:
+            self._invalidaciones += len(self._datos)
+            self._datos.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas de la caché para dimensionarla.
+
+        Returns:
+            Dict[str, Any]: hits, misses, tasa_aciertos, desalojos, expirados,
+            invalidaciones, entradas y max_entradas
+        """
+        with self._lock:
+            consultas = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'tasa_aciertos': self._hits / consultas if consultas else 0.0,
+                'desalojos': self._desalojos,
+                'expirados': self._expirados,
+                'invalidaciones': self._invalidaciones,
+                'entradas': len(self._datos),
+                'max_entradas': self.max_entradas,
+            }
+
+
+def crear_cache_entidades() -> CacheLRU:
+    """
+    Crea una caché de entidades con el tamaño y TTL configurados.
+
+    Se configura con CACHE_ENTIDADES_MAX (default 1024) y
+    CACHE_ENTIDADES_TTL (segundos, default 60).
+
+    Returns:
+        CacheLRU: Caché nueva
+    """
+    return CacheLRU(max_entradas=_entero_env("CACHE_ENTIDADES_MAX", 1024),
+                    ttl=float(_entero_env("CACHE_ENTIDADES_TTL", 60)))
@@ -1,8 +1,17 @@
 from dao.dao_arriendo import DaoArriendo
+from dao.dao_vehiculo import DaoVehiculo
+from dao.concurrencia import cambios_entre
+from dao.paginacion import Pagina
+from conex.conn import UnidadDeTrabajo
 from modelo.arriendo import Arriendo
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict, Iterable
 from dto.dto_cliente import ClienteDTO
 from dto.dto_vehiculo import VehiculoDTO
+from servicio.disponibilidad import (obtener_motor_disponibilidad, actualizar_motor_disponibilidad,
+                                     invalidar_motor_disponibilidad, VehiculoNoDisponibleError)
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ArriendoDTO:
     """
@@ -33,8 +42,7 @@ class ArriendoDTO:
         Returns:
             bool: True si el arriendo fue agregado exitosamente, False en caso contrario
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.agregarArriendo(Arriendo(
+        arriendo = Arriendo(
             id_vehiculo=id_vehiculo, 
             id_cliente=id_cliente, 
             id_empleado=id_empleado, 
@@ -44,7 +52,139 @@ class ArriendoDTO:
             estado=estado,
             valor_uf_fecha=valor_uf_fecha,
             fecha_uf_consulta=fecha_uf_consulta
-        ))
+        )
+        with DaoArriendo() as daoarriendo:
+            ok = daoarriendo.agregarArriendo(arriendo)
+        if ok:
+            self._actualizarIndice(arriendo)
+        return ok
+
+    @staticmethod
+    def _actualizarIndice(arriendo: Arriendo) -> None:
+        """Refleja un arriendo escrito en el índice de disponibilidad: solo los activos ocupan el vehículo."""
+        id_arriendo = arriendo.getIdArriendo()
+        if id_arriendo is None:
+            invalidar_motor_disponibilidad()
+        elif arriendo.getEstado() == "activo":
+            actualizar_motor_disponibilidad(lambda motor: motor.reservar(
+                id_arriendo, arriendo.getIdVehiculo(), arriendo.getFechaInicio(), arriendo.getFechaFin()))
+        else:
+            actualizar_motor_disponibilidad(lambda motor: motor.liberar(id_arriendo))
+
+    def registrarArriendo(self, id_vehiculo: int, id_cliente: int, id_empleado: int, 
+                          fecha_inicio: str, fecha_fin: str, costo_total: float, 
+                          valor_uf_fecha: float = 0.0, 
+                          fecha_uf_consulta: Optional[str] = None) -> bool:
+        """
+        Registra un arriendo activo y marca el vehículo como arrendado.
+        
+        Ambas operaciones se ejecutan en una misma transacción: si alguna
+        falla no queda un arriendo sin vehículo reservado ni viceversa.
+        
+        La transacción bloquea primero la fila del vehículo (`FOR UPDATE`) y
+        recién entonces busca solapes en la base de datos, de modo que dos
+        sesiones que reservan el mismo vehículo se serializan y la segunda
+        ve el arriendo de la primera. Vehículos distintos no se bloquean
+        entre sí. El índice en memoria del proceso no rechaza nada: puede no
+        haber visto cancelaciones de otros procesos, así que solo la base
+        decide, y si el índice discrepaba se descarta para recargarlo.
+        
+        Args:
+            id_vehiculo (int): ID del vehículo arrendado
+            id_cliente (int): ID del cliente que arrienda
+            id_empleado (int): ID del empleado que gestiona el arriendo
+            fecha_inicio (str): Fecha de inicio del arriendo (YYYY-MM-DD)
+            fecha_fin (str): Fecha de fin del arriendo (YYYY-MM-DD)
+            costo_total (float): Costo total calculado del arriendo
+            valor_uf_fecha (float): Valor de la UF al momento del arriendo
+            fecha_uf_consulta (Optional[str]): Fecha del indicador UF consultado
+            
+        Returns:
+            bool: True si ambas operaciones se confirmaron, False en caso contrario
+            
+        Raises:
+            ValueError: Si fecha_fin no es posterior a fecha_inicio
+            VehiculoNoDisponibleError: Si el vehículo ya está reservado en el rango
+                (por ejemplo, otra sesión lo tomó primero) o no se puede arrendar
+        """
+        motor = obtener_motor_disponibilidad()
+        indice_ocupado = not motor.estaDisponible(id_vehiculo, fecha_inicio, fecha_fin)
+        arriendo = Arriendo(
+            id_vehiculo=id_vehiculo, 
+            id_cliente=id_cliente, 
+            id_empleado=id_empleado, 
+            fecha_inicio=fecha_inicio, 
+            fecha_fin=fecha_fin, 
+            costo_total=costo_total, 
+            estado="activo",
+            valor_uf_fecha=valor_uf_fecha,
+            fecha_uf_consulta=fecha_uf_consulta
+        )
+        rechazo: Optional[VehiculoNoDisponibleError] = None
+        with UnidadDeTrabajo() as uow:
+            with DaoArriendo() as daoarriendo, DaoVehiculo() as daovehiculo:
+                estado = daovehiculo.bloquearParaArriendo(id_vehiculo)
+                # La lectura consistente empieza después de obtener el bloqueo,
+                # así que ve lo que confirmó la sesión que lo tenía antes
+                conflictos = (daoarriendo.listarConflictos(id_vehiculo, fecha_inicio, fecha_fin)
+                              if estado is not None else None)
+                if estado not in (None, "disponible", "arrendado") or conflictos:
+                    rechazo = VehiculoNoDisponibleError(id_vehiculo, conflictos)
+                ok = (rechazo is None and conflictos is not None
+                      and daoarriendo.agregarArriendo(arriendo)
+                      and daovehiculo.actualizarEstado(id_vehiculo, "arrendado"))
+            if not ok:
+                uow.revertir()
+        VehiculoDTO.invalidarCache(id_vehiculo=id_vehiculo)
+        if rechazo is not None:
+            # Otra sesión o proceso reservó antes: el índice local estaba desactualizado
+            logger.warning("Reserva rechazada para vehículo %s: %s", id_vehiculo, rechazo)
+            invalidar_motor_disponibilidad()
+            raise rechazo
+        if uow.confirmada:
+            if indice_ocupado:
+                # La base lo tenía libre: el índice local no vio una cancelación de otro proceso
+                logger.info("Índice de disponibilidad desactualizado para vehículo %s; se recargará", id_vehiculo)
+                invalidar_motor_disponibilidad()
+            else:
+                self._actualizarIndice(arriendo)
+        return uow.confirmada
+
+    def cancelarArriendo(self, id_arriendo: int, id_vehiculo: int) -> bool:
+        """
+        Cancela un arriendo y, si era el último activo del vehículo, lo deja disponible.
+        
+        Todo ocurre en una sola transacción que bloquea primero la fila del
+        vehículo, igual que `registrarArriendo`: una reserva concurrente del
+        mismo vehículo espera, y el conteo de arriendos activos que decide
+        el nuevo estado ya ve las reservas confirmadas por otras sesiones.
+        Un vehículo en mantención conserva su estado.
+        
+        Args:
+            id_arriendo (int): ID del arriendo a cancelar
+            id_vehiculo (int): ID del vehículo asociado al arriendo
+            
+        Returns:
+            bool: True si ambas operaciones se confirmaron, False si fallaron o
+            si el arriendo ya no estaba activo (otra sesión lo cambió antes)
+        """
+        with UnidadDeTrabajo() as uow:
+            with DaoArriendo() as daoarriendo, DaoVehiculo() as daovehiculo:
+                estado = daovehiculo.bloquearParaArriendo(id_vehiculo)
+                # Condicional: si otra sesión ya lo canceló o finalizó no se toca el vehículo
+                ok = (estado is not None
+                      and daoarriendo.actualizarEstado(id_arriendo, "cancelado", estado_actual="activo"))
+                if ok:
+                    restantes = daoarriendo.contarArriendosActivos(id_vehiculo)
+                    ok = restantes is not None
+                    if ok and restantes == 0 and estado == "arrendado":
+                        ok = daovehiculo.actualizarEstado(id_vehiculo, "disponible")
+            if not ok:
+                uow.revertir()
+        VehiculoDTO.invalidarCache(id_vehiculo=id_vehiculo)
+        if uow.confirmada:
+            actualizar_motor_disponibilidad(lambda motor: motor.liberar(id_arriendo))
+        return uow.confirmada
 
     def buscarArriendo(self, id_arriendo: int) -> Optional[Arriendo]:
         """
@@ -56,13 +196,56 @@ class ArriendoDTO:
         Returns:
             Optional[Arriendo]: Instancia de Arriendo si se encuentra, None en caso contrario
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.buscarArriendo(id_arriendo)
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.buscarArriendo(id_arriendo)
+
+    def buscarArriendosPorIds(self, ids: Iterable[int]) -> Dict[int, Arriendo]:
+        """
+        Busca varios arriendos por ID con consultas `IN` por lotes.
+        
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[int, Arriendo]: Arriendos encontrados indexados por ID
+        """
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.buscarArriendosPorIds(ids)
+
+    def presentarArriendos(self, arriendos: List[Arriendo]) -> List[dict]:
+        """
+        Arma los dicts de presentación para arriendos obtenidos sin relación.
+        
+        Los vehículos y clientes referenciados se resuelven con una consulta
+        por lote (no una por arriendo).
+        
+        Args:
+            arriendos (List[Arriendo]): Arriendos a presentar
+            
+        Returns:
+            List[dict]: Elementos con las claves 'arriendo', 'vehiculo_info' y 'cliente_info'
+        """
+        vehiculos = VehiculoDTO().buscarVehiculosPorIds(a.getIdVehiculo() for a in arriendos)
+        clientes = ClienteDTO().buscarClientesPorIds(a.getIdCliente() for a in arriendos)
+        resultado = []
+        for a in arriendos:
+            v = vehiculos.get(a.getIdVehiculo())
+            c = clientes.get(a.getIdCliente())
+            resultado.append(self._presentar({
+                'arriendo': a,
+                'veh_patente': v.getPatente() if v else None,
+                'veh_marca': v.getMarca() if v else None,
+                'veh_modelo': v.getModelo() if v else None,
+                'cli_nombre': c.getNombre() if c else None,
+                'cli_apellido': c.getApellido() if c else None,
+            }))
+        return resultado
 
     def actualizarArriendo(self, id_arriendo: int, id_vehiculo: int, id_cliente: int, 
                           id_empleado: int, fecha_inicio: str, fecha_fin: str, 
                           costo_total: float, estado: str, valor_uf_fecha: float = 0.0, 
-                          fecha_uf_consulta: Optional[str] = None) -> bool:
+                          fecha_uf_consulta: Optional[str] = None,
+                          original: Optional[Arriendo] = None) -> bool:
         """
         Actualiza la información de un arriendo existente.
         
@@ -77,12 +260,16 @@ class ArriendoDTO:
             estado (str): Nuevo estado del arriendo
             valor_uf_fecha (float): Nuevo valor de la UF al momento del arriendo
             fecha_uf_consulta (Optional[str]): Nueva fecha del indicador UF consultado
+            original (Optional[Arriendo]): Arriendo tal como se leyó antes de editarlo; si se
+                entrega solo se envían los campos modificados y se verifica su versión
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otro usuario modificó el arriendo después de leerlo
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.actualizarArriendo(Arriendo(
+        nuevo = Arriendo(
             id_vehiculo=id_vehiculo, 
             id_cliente=id_cliente, 
             id_empleado=id_empleado, 
@@ -93,7 +280,31 @@ class ArriendoDTO:
             id_arriendo=id_arriendo,
             valor_uf_fecha=valor_uf_fecha,
             fecha_uf_consulta=fecha_uf_consulta
-        ))
+        )
+        with DaoArriendo() as daoarriendo:
+            if original is not None:
+                cambios = cambios_entre(self._columnas(original), self._columnas(nuevo))
+                ok = daoarriendo.actualizarArriendoParcial(id_arriendo, cambios, original.getUpdateTime())
+            else:
+                ok = daoarriendo.actualizarArriendo(nuevo)
+        if ok:
+            self._actualizarIndice(nuevo)
+        return ok
+
+    @staticmethod
+    def _columnas(arriendo: Arriendo) -> Dict[str, object]:
+        """Valores editables de un arriendo por columna (fechas como 'YYYY-MM-DD' para compararlas)."""
+        return {
+            'id_vehiculo': arriendo.getIdVehiculo(),
+            'id_cliente': arriendo.getIdCliente(),
+            'id_empleado': arriendo.getIdEmpleado(),
+            'fecha_inicio': str(arriendo.getFechaInicio()) if arriendo.getFechaInicio() is not None else None,
+            'fecha_fin': str(arriendo.getFechaFin()) if arriendo.getFechaFin() is not None else None,
+            'costo_total': arriendo.getCostoTotal(),
+            'estado': arriendo.getEstado(),
+            'valor_uf_fecha': arriendo.getValorUfFecha(),
+            'fecha_uf_consulta': arriendo.getFechaUfConsulta(),
+        }
 
     def eliminarArriendo(self, id_arriendo: int) -> bool:
         """
@@ -105,8 +316,11 @@ class ArriendoDTO:
         Returns:
             bool: True si la eliminación fue exitosa, False en caso contrario
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.eliminarArriendo(id_arriendo)
+        with DaoArriendo() as daoarriendo:
+            ok = daoarriendo.eliminarArriendo(id_arriendo)
+        if ok:
+            actualizar_motor_disponibilidad(lambda motor: motor.liberar(id_arriendo))
+        return ok
 
     def listarArriendos(self) -> List[Arriendo]:
         """
@@ -115,27 +329,73 @@ class ArriendoDTO:
         Returns:
             List[Arriendo]: Lista de todos los arriendos registrados
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.listarArriendos()
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.listarArriendos()
+
+    def iterArriendos(self, tamano_lote: Optional[int] = None) -> Iterator[Arriendo]:
+        """
+        Recorre los arriendos del sistema de a uno, sin cargarlos todos en memoria.
+        
+        La conexión se mantiene ocupada hasta agotar o cerrar el generador.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote traídas desde el servidor
+            
+        Yields:
+            Arriendo: Los mismos elementos que `listarArriendos`
+        """
+        with DaoArriendo() as daoarriendo:
+            yield from daoarriendo.iterArriendos(tamano_lote)
 
     def listarArriendosPresentacion(self) -> List[dict]:
         """
         Retorna una lista preparada para presentación donde cada elemento es un dict:
         { 'arriendo': Arriendo, 'vehiculo_info': str, 'cliente_info': str }
         """
-        daoarriendo = DaoArriendo()
-        resultados = daoarriendo.listarArriendosConRelacion()
-        lista = []
-        for item in resultados:
-            a = item['arriendo']
-            veh_info = f"{item.get('veh_patente')} - {item.get('veh_marca')} {item.get('veh_modelo')}" if item.get('veh_patente') else f"Vehículo ID {a.getIdVehiculo()}"
-            cli_info = f"{item.get('cli_nombre')} {item.get('cli_apellido')}" if item.get('cli_nombre') else f"Cliente ID {a.getIdCliente()}"
-            lista.append({
-                'arriendo': a,
-                'vehiculo_info': veh_info,
-                'cliente_info': cli_info
-            })
-        return lista
+        with DaoArriendo() as daoarriendo:
+            resultados = daoarriendo.listarArriendosConRelacion()
+        return [self._presentar(item) for item in resultados]
+
+    def iterArriendosPresentacion(self, tamano_lote: Optional[int] = None) -> Iterator[dict]:
+        """
+        Versión en streaming de `listarArriendosPresentacion`.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote traídas desde el servidor
+            
+        Yields:
+            dict: Claves 'arriendo', 'vehiculo_info' y 'cliente_info'
+        """
+        with DaoArriendo() as daoarriendo:
+            for item in daoarriendo.iterArriendosConRelacion(tamano_lote):
+                yield self._presentar(item)
+
+    def paginarArriendosPresentacion(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[dict]:
+        """
+        Versión paginada de `listarArriendosPresentacion` (por clave, sin OFFSET).
+        
+        Args:
+            limite (int): Cantidad máxima de arriendos por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[dict]: Elementos con las claves 'arriendo', 'vehiculo_info' y 'cliente_info'
+        """
+        with DaoArriendo() as daoarriendo:
+            pagina = daoarriendo.paginarArriendosConRelacion(limite, cursor)
+        return Pagina([self._presentar(item) for item in pagina], pagina.getSiguiente())
+
+    @staticmethod
+    def _presentar(item: dict) -> dict:
+        """Arma el dict de presentación a partir de una fila con relación del DAO."""
+        a = item['arriendo']
+        veh_info = f"{item.get('veh_patente')} - {item.get('veh_marca')} {item.get('veh_modelo')}" if item.get('veh_patente') else f"Vehículo ID {a.getIdVehiculo()}"
+        cli_info = f"{item.get('cli_nombre')} {item.get('cli_apellido')}" if item.get('cli_nombre') else f"Cliente ID {a.getIdCliente()}"
+        return {
+            'arriendo': a,
+            'vehiculo_info': veh_info,
+            'cliente_info': cli_info
+        }
 
     def listarArriendosPorFecha(self, fecha: str) -> List[Arriendo]:
         """
@@ -145,26 +405,44 @@ class ArriendoDTO:
             fecha (str): Fecha a buscar (YYYY-MM-DD)
             
         Returns:
-            List[Arriendo]: Lista de arriendos que empiezan o terminan en la fecha especificada
+            List[Arriendo]: Arriendos que empiezan, terminan o están en curso en la fecha
         """
-        daoarriendo = DaoArriendo()
-        return daoarriendo.listarArriendosPorFecha(fecha)
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.listarArriendosPorFecha(fecha)
+
+    def listarArriendosSolapados(self, desde: str, hasta: str,
+                                 estado: Optional[str] = None) -> List[Arriendo]:
+        """
+        Obtiene los arriendos que se cruzan con el rango [desde, hasta).
+        
+        Args:
+            desde (str): Primer día del rango (YYYY-MM-DD)
+            hasta (str): Día siguiente al último del rango (YYYY-MM-DD)
+            estado (Optional[str]): Filtra por estado
+            
+        Returns:
+            List[Arriendo]: Arriendos ordenados por fecha de inicio
+        """
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.listarArriendosSolapados(desde, hasta, estado)
+
+    def listarArriendosQueInicianEntre(self, desde: str, hasta: str,
+                                       estado: Optional[str] = None) -> List[Arriendo]:
+        """Obtiene los arriendos que comienzan en [desde, hasta)."""
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.listarArriendosQueInicianEntre(desde, hasta, estado)
+
+    def listarArriendosQueTerminanEntre(self, desde: str, hasta: str,
+                                        estado: Optional[str] = None) -> List[Arriendo]:
+        """Obtiene los arriendos que terminan en [desde, hasta)."""
+        with DaoArriendo() as daoarriendo:
+            return daoarriendo.listarArriendosQueTerminanEntre(desde, hasta, estado)
 
     def listarArriendosPorFechaPresentacion(self, fecha: str) -> List[dict]:
         """
         Versión para presentación de `listarArriendosPorFecha`.
         Devuelve lista de dicts con las mismas claves que `listarArriendosPresentacion`.
         """
-        daoarriendo = DaoArriendo()
-        resultados = daoarriendo.listarArriendosPorFechaConRelacion(fecha)
-        lista = []
-        for item in resultados:
-            a = item['arriendo']
-            veh_info = f"{item.get('veh_patente')} - {item.get('veh_marca')} {item.get('veh_modelo')}" if item.get('veh_patente') else f"Vehículo ID {a.getIdVehiculo()}"
-            cli_info = f"{item.get('cli_nombre')} {item.get('cli_apellido')}" if item.get('cli_nombre') else f"Cliente ID {a.getIdCliente()}"
-            lista.append({
-                'arriendo': a,
-                'vehiculo_info': veh_info,
-                'cliente_info': cli_info
-            })
-        return lista
+        with DaoArriendo() as daoarriendo:
+            resultados = daoarriendo.listarArriendosPorFechaConRelacion(fecha)
+        return [self._presentar(item) for item in resultados]
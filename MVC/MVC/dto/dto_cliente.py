@@ -1,6 +1,9 @@
 from dao.dao_cliente import DaoCliente
+from dao.concurrencia import cambios_entre
+from dao.paginacion import Pagina
+from dto.cache_entidades import CacheLRU, crear_cache_entidades
 from modelo.cliente import Cliente
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict, Any, Iterable
 
 class ClienteDTO:
     """
@@ -8,8 +11,28 @@ class ClienteDTO:
     
     Se encarga de la transferencia de datos entre la capa de negocio
     y la capa de persistencia para los clientes.
+    
+    Las búsquedas por RUN e ID se sirven desde una caché LRU compartida,
+    que se invalida al actualizar o eliminar un cliente.
     """
 
+    _cache: CacheLRU = crear_cache_entidades()
+
+    @classmethod
+    def invalidarCache(cls, run: str) -> None:
+        """
+        Elimina de la caché el cliente indicado (bajo todas sus claves).
+        
+        Args:
+            run (str): RUN del cliente modificado
+        """
+        cls._cache.invalidar_donde(lambda c: c.getRun() == run)
+
+    @classmethod
+    def estadisticasCache(cls) -> Dict[str, Any]:
+        """Obtiene las métricas (aciertos, desalojos, ...) de la caché de clientes."""
+        return cls._cache.estadisticas()
+
     def agregarCliente(self, run: str, nombre: str, apellido: str, 
                       direccion: str, telefono: str) -> bool:
         """
@@ -25,14 +48,34 @@ class ClienteDTO:
         Returns:
             bool: True si el cliente fue agregado exitosamente, False en caso contrario
         """
-        daocliente = DaoCliente()
-        return daocliente.agregarCliente(Cliente(
-            run=run, 
-            nombre=nombre, 
-            apellido=apellido, 
-            direccion=direccion, 
-            telefono=telefono
-        ))
+        with DaoCliente() as daocliente:
+            return daocliente.agregarCliente(Cliente(
+                run=run, 
+                nombre=nombre, 
+                apellido=apellido, 
+                direccion=direccion, 
+                telefono=telefono
+            ))
+
+    def agregarClientesLote(self, clientes: List[Cliente]) -> List[Cliente]:
+        """
+        Inserta un lote de clientes con una sola confirmación.
+        
+        Si la base de datos rechaza el lote (ej: un duplicado), se reintenta
+        de a uno para insertar los válidos y aislar los rechazados.
+        
+        Args:
+            clientes (List[Cliente]): Clientes a insertar
+            
+        Returns:
+            List[Cliente]: Los rechazados por la base de datos (vacía si se insertaron todos)
+        """
+        if not clientes:
+            return []
+        with DaoCliente() as daocliente:
+            if daocliente.agregarClientesLote(clientes):
+                return []
+            return [x for x in clientes if not daocliente.agregarCliente(x)]
 
     def buscarCliente(self, run: str) -> Optional[Cliente]:
         """
@@ -44,11 +87,13 @@ class ClienteDTO:
         Returns:
             Optional[Cliente]: Instancia de Cliente si se encuentra, None en caso contrario
         """
-        daocliente = DaoCliente()
-        return daocliente.buscarCliente(run)
+        def cargar() -> Optional[Cliente]:
+            with DaoCliente() as daocliente:
+                return daocliente.buscarCliente(run)
+        return self._cache.obtener_o_cargar(('run', run), cargar)
 
     def actualizarCliente(self, run: str, nombre: str, apellido: str, 
-                         direccion: str, telefono: str) -> bool:
+                         direccion: str, telefono: str, original: Optional[Cliente] = None) -> bool:
         """
         Actualiza la información de un cliente existente.
         
@@ -58,18 +103,41 @@ class ClienteDTO:
             apellido (str): Nuevo apellido del cliente
             direccion (str): Nueva dirección del cliente
             telefono (str): Nuevo teléfono del cliente
+            original (Optional[Cliente]): Cliente tal como se leyó antes de editarlo; si se
+                entrega solo se envían los campos modificados y se verifica su versión
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otro usuario modificó el cliente después de leerlo
         """
-        daocliente = DaoCliente()
-        return daocliente.actualizarCliente(Cliente(
-            run=run, 
-            nombre=nombre, 
-            apellido=apellido, 
-            direccion=direccion, 
-            telefono=telefono
-        ))
+        try:
+            with DaoCliente() as daocliente:
+                if original is not None:
+                    cambios = cambios_entre({
+                        'nombre': original.getNombre(),
+                        'apellido': original.getApellido(),
+                        'direccion': original.getDireccion(),
+                        'telefono': original.getTelefono(),
+                    }, {
+                        'nombre': nombre,
+                        'apellido': apellido,
+                        'direccion': direccion,
+                        'telefono': telefono,
+                    })
+                    return daocliente.actualizarClienteParcial(original.getIdCliente(), cambios,
+                                                               original.getUpdateTime())
+                return daocliente.actualizarCliente(Cliente(
+                    run=run, 
+                    nombre=nombre, 
+                    apellido=apellido, 
+                    direccion=direccion, 
+                    telefono=telefono
+                ))
+        finally:
+            # Después de escribir: si se invalidara antes, otro hilo podría volver a cargar la fila vieja
+            self.invalidarCache(run)
 
     def eliminarCliente(self, run: str) -> bool:
         """
@@ -81,8 +149,11 @@ class ClienteDTO:
         Returns:
             bool: True si la eliminación fue exitosa, False en caso contrario
         """
-        daocliente = DaoCliente()
-        return daocliente.eliminarCliente(run)
+        try:
+            with DaoCliente() as daocliente:
+                return daocliente.eliminarCliente(run)
+        finally:
+            self.invalidarCache(run)
 
     def listarClientes(self) -> List[Cliente]:
         """
@@ -91,8 +162,37 @@ class ClienteDTO:
         Returns:
             List[Cliente]: Lista de todos los clientes registrados
         """
-        daocliente = DaoCliente()
-        return daocliente.listarClientes()
+        with DaoCliente() as daocliente:
+            return daocliente.listarClientes()
+
+    def iterClientes(self, tamano_lote: Optional[int] = None) -> Iterator[Cliente]:
+        """
+        Recorre los clientes del sistema de a uno, sin cargarlos todos en memoria.
+        
+        La conexión se mantiene ocupada hasta agotar o cerrar el generador.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote traídas desde el servidor
+            
+        Yields:
+            Cliente: Los mismos elementos que `listarClientes`
+        """
+        with DaoCliente() as daocliente:
+            yield from daocliente.iterClientes(tamano_lote)
+
+    def paginarClientes(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[Cliente]:
+        """
+        Obtiene una página de clientes (paginación por clave, sin OFFSET).
+        
+        Args:
+            limite (int): Cantidad máxima de clientes por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[Cliente]: Página de clientes y token de la siguiente
+        """
+        with DaoCliente() as daocliente:
+            return daocliente.paginarClientes(limite, cursor)
 
     def buscarClientePorId(self, id_cliente: int) -> Optional[Cliente]:
         """
@@ -104,5 +204,36 @@ class ClienteDTO:
         Returns:
             Optional[Cliente]: Instancia de Cliente si se encuentra, None en caso contrario
         """
-        daocliente = DaoCliente()
-        return daocliente.buscarClientePorId(id_cliente)
+        def cargar() -> Optional[Cliente]:
+            with DaoCliente() as daocliente:
+                return daocliente.buscarClientePorId(id_cliente)
+        return self._cache.obtener_o_cargar(('id', id_cliente), cargar)
+
+    def buscarClientesPorIds(self, ids: Iterable[int]) -> Dict[int, Cliente]:
+        """
+        Busca varios clientes por ID en una sola ida y vuelta por lote.
+        
+        Los que ya están en caché no se consultan; el resto se trae con
+        consultas `IN` por lotes y se guarda en la caché.
+        
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[int, Cliente]: Clientes encontrados indexados por ID
+        """
+        encontrados: Dict[int, Cliente] = {}
+        faltantes = []
+        for id_cliente in dict.fromkeys(i for i in ids if i is not None):
+            cliente = self._cache.obtener(('id', id_cliente))
+            if cliente is None:
+                faltantes.append(id_cliente)
+            else:
+                encontrados[id_cliente] = cliente
+        if faltantes:
+            with DaoCliente() as daocliente:
+                cargados = daocliente.buscarClientesPorIds(faltantes)
+            for id_cliente, cliente in cargados.items():
+                self._cache.guardar(('id', id_cliente), cliente)
+            encontrados.update(cargados)
+        return encontrados
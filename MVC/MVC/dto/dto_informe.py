@@ -0,0 +1,80 @@
+from conex.conn import obtener_pool
+from conex.metricas import obtener_registro
+from dao.dao_informe import DaoInforme, SECCIONES_RESUMEN
+from dao.dao_vehiculo import DaoVehiculo
+from modelo.resumen import ResumenSistema
+from typing import Iterable
+from servicio.analitica import DatasetArriendos, Fecha, cargar_dataset_arriendos
+from servicio.ocupacion import MatrizOcupacion
+
+class InformeDTO:
+    """
+    Data Transfer Object para los informes del sistema.
+
+    Entrega a la capa de presentación los totales calculados en la
+    base de datos por `DaoInforme`.
+    """
+
+    def obtenerResumen(self, secciones: Iterable[str] = SECCIONES_RESUMEN) -> ResumenSistema:
+        """
+        Obtiene el resumen agregado del sistema.
+
+        Args:
+            secciones (Iterable[str]): Secciones a consultar ('clientes', 'empleados',
+                'vehiculos', 'arriendos'); las demás quedan en cero. Default: todas
+
+        Returns:
+            ResumenSistema: Totales del sistema; vacío (todo en cero) si ocurre un error
+        """
+        with DaoInforme() as daoinforme:
+            return daoinforme.obtenerResumen(secciones) or ResumenSistema()
+
+    def obtenerDatasetArriendos(self) -> DatasetArriendos:
+        """
+        Obtiene todos los arriendos en formato columnar para los informes analíticos.
+
+        Returns:
+            DatasetArriendos: Arriendos listos para agrupar por mes, vehículo o empleado
+
+        Raises:
+            RuntimeError: Si numpy no está instalado
+        """
+        return cargar_dataset_arriendos()
+
+    def obtenerOcupacionFlota(self, desde: Fecha, hasta: Fecha) -> MatrizOcupacion:
+        """
+        Obtiene la matriz de ocupación (vehículo × día) de la flota en una ventana.
+
+        Args:
+            desde (Fecha): Primer día (incluido)
+            hasta (Fecha): Último día (excluido)
+
+        Returns:
+            MatrizOcupacion: Ocupación de todos los vehículos registrados
+
+        Raises:
+            RuntimeError: Si numpy no está instalado
+            ValueError: Si `hasta` no es posterior a `desde`
+        """
+        with DaoVehiculo() as daovehiculo:
+            flota = [(v.getIdVehiculo(), v.getPatente(), v.getMarca()) for v in daovehiculo.iterVehiculos()]
+        return MatrizOcupacion.desdeDataset(cargar_dataset_arriendos(), flota, desde, hasta)
+
+    def obtenerMetricasBD(self) -> str:
+        """
+        Obtiene el informe de latencias de la base de datos.
+
+        Returns:
+            str: p50/p95/p99, filas y bytes por método de DAO, consultas lentas
+            recientes y contadores del pool de conexiones
+        """
+        registro = obtener_registro()
+        informe = registro.volcar() if registro is not None else "Medición desactivada (DB_METRICAS=0)"
+        pool = obtener_pool().estadisticas()
+        return informe + "\nPool de conexiones: " + ", ".join(f"{clave}={valor:g}" for clave, valor in pool.items())
+
+    def reiniciarMetricasBD(self) -> None:
+        """Descarta las métricas de base de datos acumuladas."""
+        registro = obtener_registro()
+        if registro is not None:
+            registro.reiniciar()
@@ -1,8 +1,10 @@
 from modelo.user import User
 from dao.dao_user import daoUser
-from utils.encoder import Encoder
+from dao.concurrencia import cambios_entre
+from utils.encoder import Encoder, obtener_ejecutor_bcrypt
+from utils.limitador import LoginBloqueadoError, obtener_limitador, origen_actual
 import logging
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -15,32 +17,52 @@ class UserDTO:
     necesarias.
     """
     
-    def validarLogin(self, username: str, clave: str) -> Optional[User]:
+    def validarLogin(self, username: str, clave: str, origen: Optional[str] = None) -> Optional[User]:
         """
         Valida las credenciales de un usuario en el sistema.
         
+        Antes de consultar la base de datos o calcular bcrypt, el intento
+        pasa por el limitador de login (por RUN y por origen). Si el hash
+        usa un factor de trabajo antiguo, se recalcula en el pool de bcrypt
+        sin hacer esperar al login; el usuario devuelto conserva el hash
+        leído, que sigue siendo válido.
+        
         Args:
             username (str): RUN del usuario a validar
             clave (str): Contraseña en texto plano para verificar
+            origen (Optional[str]): Origen del intento (por defecto, la sesión actual)
             
         Returns:
             Optional[User]: Instancia de User si las credenciales son válidas,
                           None en caso contrario
                           
         Raises:
+            LoginBloqueadoError: Si el RUN o el origen superaron el límite de intentos
             Exception: Si ocurre un error inesperado durante la validación
         """
         logger.debug("Intentando validar login para usuario: %s", username)
-        daouser = daoUser()
-        resultado = daouser.validarLogin(User(run=username))
+        limitador = obtener_limitador()
+        origen = origen or origen_actual()
+        permitido, espera = limitador.permitir(username, origen)
+        if not permitido:
+            logger.warning("Intento de login rechazado por el limitador: %s desde %s", username, origen)
+            raise LoginBloqueadoError(f"Demasiados intentos; reintente en {espera:.0f} segundos", espera)
+        
+        with daoUser() as daouser:
+            resultado = daouser.validarLogin(User(run=username))
        
         if resultado is not None:
             run_db, password_hash_db, nombre, apellido, cargo, id_empleado = resultado
             logger.debug("Hash de contraseña recuperado para usuario: %s", username)
             
-            # Verificar la contraseña
-            if Encoder().verify(clave, password_hash_db):
+            # bcrypt libera el GIL: verificar en este hilo no bloquea a los demás
+            encoder = Encoder()
+            if encoder.verify(clave, password_hash_db):
                 logger.info("Login exitoso para usuario: %s %s (%s)", nombre, apellido, cargo)
+                limitador.registrar_exito(username, origen)
+                if encoder.necesita_rehash(password_hash_db):
+                    obtener_ejecutor_bcrypt().submit(self._actualizarCosto, encoder, run_db, clave,
+                                                     password_hash_db)
                 return User(
                     run=run_db, 
                     nombre=nombre, 
@@ -51,11 +73,37 @@ class UserDTO:
                 )
             else:
                 logger.warning("Contraseña incorrecta para usuario: %s", username)
+                limitador.registrar_fallo(username, origen)
                 return None
         else:
             logger.warning("Usuario no encontrado: %s", username)
+            limitador.registrar_fallo(username, origen)
             return None
 
+    def _actualizarCosto(self, encoder: Encoder, run: str, clave: str, password_hash: str) -> bool:
+        """
+        Vuelve a hashear la contraseña con el factor de trabajo configurado.
+        
+        Corre en el pool de bcrypt después del login, así que registra sus
+        errores en vez de propagarlos.
+        
+        Returns:
+            bool: True si el hash nuevo quedó guardado
+        """
+        try:
+            nuevo_hash = encoder.encode(clave)
+            if not nuevo_hash:
+                return False
+            with daoUser() as daouser:
+                guardado = daouser.actualizarPassword(run, nuevo_hash, anterior=password_hash)
+        except Exception as e:
+            logger.error("Error al actualizar el costo del hash para usuario %s: %s", run, e)
+            return False
+        if guardado:
+            logger.info("Hash de contraseña actualizado de costo %s a %s para usuario: %s",
+                        encoder.costo(password_hash), encoder.rounds, run)
+        return bool(guardado)
+
     def agregarUsuario(self, run: str, nombre: str, apellido: str, 
                       password: str, cargo: str) -> bool:
         """
@@ -76,19 +124,42 @@ class UserDTO:
         """
         logger.info("Agregando nuevo usuario: %s %s (%s)", nombre, apellido, cargo)
         hashed_password = Encoder().encode(password)
-        daouser = daoUser()
-        return daouser.agregarUsuario(
-            User(
-                run=run, 
-                nombre=nombre, 
-                apellido=apellido, 
-                password=hashed_password, 
-                cargo=cargo
+        with daoUser() as daouser:
+            return daouser.agregarUsuario(
+                User(
+                    run=run, 
+                    nombre=nombre, 
+                    apellido=apellido, 
+                    password=hashed_password, 
+                    cargo=cargo
+                )
             )
-        )
+
+    def agregarUsuariosLote(self, usuarios: List[User]) -> List[User]:
+        """
+        Inserta un lote de usuarios con una sola confirmación.
+        
+        A diferencia de `agregarUsuario`, las contraseñas deben venir ya
+        encriptadas (el importador las calcula en paralelo).
+        
+        Si la base de datos rechaza el lote (ej: un duplicado), se reintenta
+        de a uno para insertar los válidos y aislar los rechazados.
+        
+        Args:
+            usuarios (List[User]): Usuarios a insertar
+            
+        Returns:
+            List[User]: Los rechazados por la base de datos (vacía si se insertaron todos)
+        """
+        if not usuarios:
+            return []
+        with daoUser() as daouser:
+            if daouser.agregarUsuariosLote(usuarios):
+                return []
+            return [x for x in usuarios if not daouser.agregarUsuario(x)]
 
     def actualizarUsuario(self, run: str, nombre: str, apellido: str, 
-                         password: str, cargo: str) -> bool:
+                         password: str, cargo: str, original: Optional[User] = None) -> bool:
         """
         Actualiza la información de un usuario existente.
         
@@ -98,10 +169,15 @@ class UserDTO:
             apellido (str): Nuevo apellido del usuario
             password (str): Nueva contraseña (si está en texto plano, será encriptada)
             cargo (str): Nuevo cargo del usuario
+            original (Optional[User]): Usuario tal como se leyó antes de editarlo; si se
+                entrega solo se envían los campos modificados y se verifica su versión
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
             
+        Raises:
+            ConflictoVersionError: Si otro usuario modificó el registro después de leerlo
+            
         Note:
             Si la password ya está encriptada (comienza con '$2b$'), no se vuelve a encriptar
         """
@@ -112,16 +188,30 @@ class UserDTO:
         else:
             hashed_password = password
             
-        daouser = daoUser()
-        return daouser.actualizarUsuario(
-            User(
-                run=run, 
-                nombre=nombre, 
-                apellido=apellido, 
-                password=hashed_password, 
-                cargo=cargo
+        with daoUser() as daouser:
+            if original is not None:
+                cambios = cambios_entre({
+                    'nombre': original.getNombre(),
+                    'apellido': original.getApellido(),
+                    'password': original.getPassword(),
+                    'cargo': original.getCargo(),
+                }, {
+                    'nombre': nombre,
+                    'apellido': apellido,
+                    'password': hashed_password,
+                    'cargo': cargo,
+                })
+                return daouser.actualizarUsuarioParcial(original.getIdEmpleado(), cambios,
+                                                        original.getUpdateTime())
+            return daouser.actualizarUsuario(
+                User(
+                    run=run, 
+                    nombre=nombre, 
+                    apellido=apellido, 
+                    password=hashed_password, 
+                    cargo=cargo
+                )
             )
-        )
 
     def buscarUsuario(self, run: str) -> Optional[User]:
         """
@@ -133,18 +223,19 @@ class UserDTO:
         Returns:
             Optional[User]: Instancia de User si se encuentra, None en caso contrario
         """
-        daouser = daoUser()
-        resultado = daouser.buscarUsuario(User(run=run))
-        if resultado:
-            return User(
-                run=resultado[0], 
-                nombre=resultado[1], 
-                apellido=resultado[2], 
-                password=resultado[3], 
-                cargo=resultado[4], 
-                id_empleado=resultado[5]
-            )
-        return None
+        with daoUser() as daouser:
+            resultado = daouser.buscarUsuario(User(run=run))
+            if resultado:
+                return User(
+                    run=resultado[0], 
+                    nombre=resultado[1], 
+                    apellido=resultado[2], 
+                    password=resultado[3], 
+                    cargo=resultado[4], 
+                    id_empleado=resultado[5],
+                    update_time=resultado[6]
+                )
+            return None
 
     def eliminarUsuario(self, run: str) -> bool:
         """
@@ -159,8 +250,8 @@ class UserDTO:
         Warning:
             Esta operación es irreversible
         """
-        daouser = daoUser()
-        return daouser.eliminarUsuario(User(run=run))
+        with daoUser() as daouser:
+            return daouser.eliminarUsuario(User(run=run))
 
     def listarUsuarios(self) -> List[User]:
         """
@@ -172,5 +263,20 @@ class UserDTO:
         Note:
             Retorna una lista vacía si no hay usuarios registrados
         """
-        daouser = daoUser()
-        return daouser.listarUsuarios()
+        with daoUser() as daouser:
+            return daouser.listarUsuarios()
+
+    def iterUsuarios(self, tamano_lote: Optional[int] = None) -> Iterator[User]:
+        """
+        Recorre los usuarios del sistema de a uno, sin cargarlos todos en memoria.
+        
+        La conexión se mantiene ocupada hasta agotar o cerrar el generador.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote traídas desde el servidor
+            
+        Yields:
+            User: Los mismos elementos que `listarUsuarios`
+        """
+        with daoUser() as daouser:
+            yield from daouser.iterUsuarios(tamano_lote)
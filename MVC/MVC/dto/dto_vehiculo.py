@@ -1,6 +1,11 @@
 from dao.dao_vehiculo import DaoVehiculo
+from dao.concurrencia import cambios_entre
+from dao.paginacion import Pagina
+from dto.cache_entidades import CacheLRU, crear_cache_entidades
+from servicio.disponibilidad import (ESTADOS_ARRENDABLES, actualizar_motor_disponibilidad,
+                                     invalidar_motor_disponibilidad, obtener_motor_disponibilidad)
 from modelo.vehiculo import Vehiculo
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict, Any, Iterable
 
 class VehiculoDTO:
     """
@@ -8,8 +13,38 @@ class VehiculoDTO:
     
     Se encarga de la transferencia de datos entre la capa de negocio
     y la capa de persistencia para los vehículos.
+    
+    Las búsquedas por patente e ID se sirven desde una caché LRU compartida,
+    que se invalida al actualizar o eliminar un vehículo.
     """
 
+    _cache: CacheLRU = crear_cache_entidades()
+
+    @classmethod
+    def invalidarCache(cls, patente: Optional[str] = None, id_vehiculo: Optional[int] = None) -> None:
+        """
+        Elimina de la caché el vehículo indicado (bajo todas sus claves).
+        
+        Args:
+            patente (Optional[str]): Patente del vehículo modificado
+            id_vehiculo (Optional[int]): ID del vehículo modificado
+        """
+        cls._cache.invalidar_donde(
+            lambda v: v.getPatente() == patente or (id_vehiculo is not None and v.getIdVehiculo() == id_vehiculo))
+
+    @classmethod
+    def estadisticasCache(cls) -> Dict[str, Any]:
+        """Obtiene las métricas (aciertos, desalojos, ...) de la caché de vehículos."""
+        return cls._cache.estadisticas()
+
+    @staticmethod
+    def _actualizarIndice(id_vehiculo: Optional[int], estado: str) -> None:
+        """Refleja el estado de un vehículo en el índice de disponibilidad (lo descarta si falta el ID)."""
+        if id_vehiculo is None:
+            invalidar_motor_disponibilidad()
+        else:
+            actualizar_motor_disponibilidad(lambda motor: motor.actualizarVehiculo(id_vehiculo, estado))
+
     def agregarVehiculo(self, patente: str, marca: str, modelo: str, 
                        año: int, precio_diario: float, estado: str = "disponible") -> bool:
         """
@@ -26,15 +61,53 @@ class VehiculoDTO:
         Returns:
             bool: True si el vehículo fue agregado exitosamente, False en caso contrario
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.agregarVehiculo(Vehiculo(
+        vehiculo = Vehiculo(
             patente=patente, 
             marca=marca, 
             modelo=modelo, 
             año=año, 
             precio_diario=precio_diario, 
             estado=estado
-        ))
+        )
+        with DaoVehiculo() as daovehiculo:
+            ok = daovehiculo.agregarVehiculo(vehiculo)
+        if ok:
+            self._actualizarIndice(vehiculo.getIdVehiculo(), estado)
+        return ok
+
+    def agregarVehiculosLote(self, vehiculos: List[Vehiculo]) -> List[Vehiculo]:
+        """
+        Inserta un lote de vehículos con una sola confirmación.
+        
+        Si la base de datos rechaza el lote (ej: un duplicado), se reintenta
+        de a uno para insertar los válidos y aislar los rechazados.
+        
+        Args:
+            vehiculos (List[Vehiculo]): Vehículos a insertar
+            
+        Returns:
+            List[Vehiculo]: Los rechazados por la base de datos (vacía si se insertaron todos)
+        """
+        if not vehiculos:
+            return []
+        with DaoVehiculo() as daovehiculo:
+            if daovehiculo.agregarVehiculosLote(vehiculos):
+                rechazados = []
+            else:
+                rechazados = [x for x in vehiculos if not daovehiculo.agregarVehiculo(x)]
+            omitidos = {id(x) for x in rechazados}
+            # Solo los arrendables entran a la flota del índice
+            estados = {x.getPatente(): x.getEstado() for x in vehiculos
+                       if id(x) not in omitidos and x.getEstado() in ESTADOS_ARRENDABLES}
+            ids = daovehiculo.buscarIdsPorPatentes(estados) if estados else {}
+        if len(ids) < len(estados):
+            invalidar_motor_disponibilidad()
+        elif ids:
+            def agregar(motor) -> None:
+                for patente, id_vehiculo in ids.items():
+                    motor.actualizarVehiculo(id_vehiculo, estados[patente])
+            actualizar_motor_disponibilidad(agregar)
+        return rechazados
 
     def buscarVehiculo(self, patente: str) -> Optional[Vehiculo]:
         """
@@ -46,8 +119,10 @@ class VehiculoDTO:
         Returns:
             Optional[Vehiculo]: Instancia de Vehiculo si se encuentra, None en caso contrario
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.buscarVehiculo(patente)
+        def cargar() -> Optional[Vehiculo]:
+            with DaoVehiculo() as daovehiculo:
+                return daovehiculo.buscarVehiculo(patente)
+        return self._cache.obtener_o_cargar(('patente', patente), cargar)
 
     def buscarVehiculoPorId(self, id_vehiculo: int) -> Optional[Vehiculo]:
         """
@@ -59,11 +134,43 @@ class VehiculoDTO:
         Returns:
             Optional[Vehiculo]: Instancia de Vehiculo si se encuentra, None en caso contrario
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.buscarVehiculoPorId(id_vehiculo)
+        def cargar() -> Optional[Vehiculo]:
+            with DaoVehiculo() as daovehiculo:
+                return daovehiculo.buscarVehiculoPorId(id_vehiculo)
+        return self._cache.obtener_o_cargar(('id', id_vehiculo), cargar)
+
+    def buscarVehiculosPorIds(self, ids: Iterable[int]) -> Dict[int, Vehiculo]:
+        """
+        Busca varios vehículos por ID en una sola ida y vuelta por lote.
+        
+        Los que ya están en caché no se consultan; el resto se trae con
+        consultas `IN` por lotes y se guarda en la caché.
+        
+        Args:
+            ids (Iterable[int]): IDs a buscar (pueden repetirse)
+            
+        Returns:
+            Dict[int, Vehiculo]: Vehiculos encontrados indexados por ID
+        """
+        encontrados: Dict[int, Vehiculo] = {}
+        faltantes = []
+        for id_vehiculo in dict.fromkeys(i for i in ids if i is not None):
+            vehiculo = self._cache.obtener(('id', id_vehiculo))
+            if vehiculo is None:
+                faltantes.append(id_vehiculo)
+            else:
+                encontrados[id_vehiculo] = vehiculo
+        if faltantes:
+            with DaoVehiculo() as daovehiculo:
+                cargados = daovehiculo.buscarVehiculosPorIds(faltantes)
+            for id_vehiculo, vehiculo in cargados.items():
+                self._cache.guardar(('id', id_vehiculo), vehiculo)
+            encontrados.update(cargados)
+        return encontrados
 
     def actualizarVehiculo(self, patente: str, marca: str, modelo: str, 
-                          año: int, precio_diario: float, estado: str) -> bool:
+                          año: int, precio_diario: float, estado: str,
+                          original: Optional[Vehiculo] = None) -> bool:
         """
         Actualiza la información de un vehículo existente.
         
@@ -74,19 +181,51 @@ class VehiculoDTO:
             año (int): Nuevo año de fabricación del vehículo
             precio_diario (float): Nuevo precio de arriendo por día
             estado (str): Nuevo estado del vehículo
+            original (Optional[Vehiculo]): Vehículo tal como se leyó antes de editarlo; si se
+                entrega solo se envían los campos modificados y se verifica su versión
             
         Returns:
             bool: True si la actualización fue exitosa, False en caso contrario
+            
+        Raises:
+            ConflictoVersionError: Si otro usuario modificó el vehículo después de leerlo
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.actualizarVehiculo(Vehiculo(
-            patente=patente, 
-            marca=marca, 
-            modelo=modelo, 
-            año=año, 
-            precio_diario=precio_diario, 
-            estado=estado
-        ))
+        try:
+            with DaoVehiculo() as daovehiculo:
+                if original is not None:
+                    id_vehiculo = original.getIdVehiculo()
+                    cambios = cambios_entre({
+                        'marca': original.getMarca(),
+                        'modelo': original.getModelo(),
+                        'año': original.getAño(),
+                        'precio_diario': original.getPrecioDiario(),
+                        'estado': original.getEstado(),
+                    }, {
+                        'marca': marca,
+                        'modelo': modelo,
+                        'año': año,
+                        'precio_diario': precio_diario,
+                        'estado': estado,
+                    })
+                    ok = daovehiculo.actualizarVehiculoParcial(id_vehiculo, cambios, original.getUpdateTime())
+                else:
+                    ok = daovehiculo.actualizarVehiculo(Vehiculo(
+                        patente=patente, 
+                        marca=marca, 
+                        modelo=modelo, 
+                        año=año, 
+                        precio_diario=precio_diario, 
+                        estado=estado
+                    ))
+        finally:
+            # Después de escribir: si se invalidara antes, otro hilo podría volver a cargar la fila vieja
+            self.invalidarCache(patente=patente)
+        if ok:
+            if original is None:
+                vehiculo = self.buscarVehiculo(patente)
+                id_vehiculo = vehiculo.getIdVehiculo() if vehiculo is not None else None
+            self._actualizarIndice(id_vehiculo, estado)
+        return ok
 
     def eliminarVehiculo(self, patente: str) -> bool:
         """
@@ -98,8 +237,19 @@ class VehiculoDTO:
         Returns:
             bool: True si la eliminación fue exitosa, False en caso contrario
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.eliminarVehiculo(patente)
+        vehiculo = self.buscarVehiculo(patente)
+        try:
+            with DaoVehiculo() as daovehiculo:
+                ok = daovehiculo.eliminarVehiculo(patente)
+        finally:
+            self.invalidarCache(patente=patente)
+        if ok:
+            if vehiculo is None or vehiculo.getIdVehiculo() is None:
+                invalidar_motor_disponibilidad()
+            else:
+                id_vehiculo = vehiculo.getIdVehiculo()
+                actualizar_motor_disponibilidad(lambda motor: motor.quitarVehiculo(id_vehiculo))
+        return ok
 
     def listarVehiculos(self) -> List[Vehiculo]:
         """
@@ -108,8 +258,37 @@ class VehiculoDTO:
         Returns:
             List[Vehiculo]: Lista de todos los vehículos registrados
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.listarVehiculos()
+        with DaoVehiculo() as daovehiculo:
+            return daovehiculo.listarVehiculos()
+
+    def iterVehiculos(self, tamano_lote: Optional[int] = None) -> Iterator[Vehiculo]:
+        """
+        Recorre los vehículos del sistema de a uno, sin cargarlos todos en memoria.
+        
+        La conexión se mantiene ocupada hasta agotar o cerrar el generador.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lote traídas desde el servidor
+            
+        Yields:
+            Vehiculo: Los mismos elementos que `listarVehiculos`
+        """
+        with DaoVehiculo() as daovehiculo:
+            yield from daovehiculo.iterVehiculos(tamano_lote)
+
+    def paginarVehiculos(self, limite: int = 20, cursor: Optional[str] = None) -> Pagina[Vehiculo]:
+        """
+        Obtiene una página de vehículos (paginación por clave, sin OFFSET).
+        
+        Args:
+            limite (int): Cantidad máxima de vehículos por página
+            cursor (Optional[str]): Token `siguiente` de la página anterior, o None para la primera
+            
+        Returns:
+            Pagina[Vehiculo]: Página de vehículos y token de la siguiente
+        """
+        with DaoVehiculo() as daovehiculo:
+            return daovehiculo.paginarVehiculos(limite, cursor)
 
     def listarVehiculosDisponibles(self) -> List[Vehiculo]:
         """
@@ -118,5 +297,28 @@ class VehiculoDTO:
         Returns:
             List[Vehiculo]: Lista de vehículos con estado 'disponible'
         """
-        daovehiculo = DaoVehiculo()
-        return daovehiculo.listarVehiculosDisponibles()
+        with DaoVehiculo() as daovehiculo:
+            return daovehiculo.listarVehiculosDisponibles()
+
+    def listarVehiculosDisponiblesEntre(self, fecha_inicio: str, fecha_fin: str) -> List[Vehiculo]:
+        """
+        Obtiene los vehículos libres en todo un rango de fechas.
+        
+        A diferencia de `listarVehiculosDisponibles`, no mira el estado actual
+        sino los arriendos activos: un vehículo arrendado hoy aparece si está
+        libre en el rango pedido. El día de devolución cuenta como libre.
+        
+        Args:
+            fecha_inicio (str): Fecha de inicio del rango (YYYY-MM-DD)
+            fecha_fin (str): Fecha de fin del rango (YYYY-MM-DD)
+            
+        Returns:
+            List[Vehiculo]: Vehículos libres ordenados por marca y modelo
+            
+        Raises:
+            ValueError: Si fecha_fin no es posterior a fecha_inicio
+        """
+        ids = obtener_motor_disponibilidad().disponibles(fecha_inicio, fecha_fin)
+        vehiculos = list(self.buscarVehiculosPorIds(ids).values())
+        vehiculos.sort(key=lambda v: (v.getMarca(), v.getModelo(), v.getIdVehiculo()))
+        return vehiculos
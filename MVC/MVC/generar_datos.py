@@ -0,0 +1,59 @@
+import argparse
+import logging
+import sys
+import time
+from datetime import date
+from typing import List, Optional
+
+from utils.logger import SistemaLogging
+from benchmark.generador import CLAVE_EMPLEADOS, FECHA_REFERENCIA, GeneradorDatos, dimensiones, escribir_csv
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Genera datos sintéticos de arriendos en CSV (uno por tabla).
+
+    Uso:
+        python generar_datos.py datos/ --arriendos 5000000 [--semilla 7] [--referencia 2026-01-01]
+
+    Flota, clientes y empleados se derivan de la cantidad de arriendos. Los
+    CSV tienen como encabezado los nombres de columna de `create_updated.sql`;
+    `empleado.csv` trae la contraseña ya encriptada (`CLAVE_EMPLEADOS`), así
+    que se carga directo a la tabla y no con `importar_csv.py`. Para sembrar
+    un esquema de mediciones use `benchmark_dao.py preparar`.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de línea de comandos (default: sys.argv)
+
+    Returns:
+        int: 0 si se escribieron los archivos, 2 si los argumentos o la carpeta no son válidos
+    """
+    parser = argparse.ArgumentParser(description="Generador de datos sintéticos de arriendos")
+    parser.add_argument("carpeta", help="Carpeta donde escribir los CSV")
+    parser.add_argument("--arriendos", type=int, default=1_000_000, help="Arriendos a generar")
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--referencia", type=date.fromisoformat, default=FECHA_REFERENCIA,
+                        help="Fecha 'de hoy' de los datos (AAAA-MM-DD)")
+    args = parser.parse_args(argv)
+
+    SistemaLogging.configurar(nivel=logging.INFO)
+    inicio = time.perf_counter()
+    try:
+        generador = GeneradorDatos(dimensiones(args.arriendos), args.semilla, args.referencia)
+        escritas = escribir_csv(generador, args.carpeta)
+    except (OSError, ValueError) as e:
+        logger.error("No se pudieron generar los datos en %s: %s", args.carpeta, e)
+        print(f"❌ {e}")
+        return 2
+    segundos = time.perf_counter() - inicio
+    for tabla, filas in escritas.items():
+        print(f"📄 {args.carpeta}/{tabla}.csv: {filas:,} filas")
+    print(f"✅ {sum(escritas.values()):,} filas en {segundos:.1f} s "
+          f"(semilla {args.semilla}, contraseña de empleados {CLAVE_EMPLEADOS!r})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
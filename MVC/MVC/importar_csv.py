@@ -0,0 +1,62 @@
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from utils.logger import SistemaLogging
+from conex.conn import cerrar_pool
+from servicio.importador import ImportadorCSV
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Importa vehículos, clientes o empleados desde un archivo CSV.
+
+    Uso:
+        python importar_csv.py vehiculos flota.csv [--lote 1000] [--rechazos rechazos.csv]
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de línea de comandos (default: sys.argv)
+
+    Returns:
+        int: 0 si todas las filas se importaron, 1 si hubo rechazos, 2 si el archivo no es válido
+    """
+    parser = argparse.ArgumentParser(description="Importación masiva desde CSV")
+    parser.add_argument("entidad", choices=["vehiculos", "clientes", "empleados"])
+    parser.add_argument("archivo", help="CSV con encabezado (UTF-8)")
+    parser.add_argument("--lote", type=int, default=None, help="Filas por lote de inserción")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos para encriptar contraseñas")
+    parser.add_argument("--rechazos", default=None, help="CSV donde guardar las filas rechazadas")
+    args = parser.parse_args(argv)
+
+    SistemaLogging.configurar(nivel=logging.INFO)
+    importador = ImportadorCSV(tamano_lote=args.lote, procesos=args.procesos)
+    importar = {
+        "vehiculos": importador.importarVehiculos,
+        "clientes": importador.importarClientes,
+        "empleados": importador.importarEmpleados,
+    }[args.entidad]
+    try:
+        resultado = importar(args.archivo)
+    except (OSError, ValueError) as e:
+        logger.error("No se pudo importar %s: %s", args.archivo, e)
+        print(f"❌ {e}")
+        return 2
+    finally:
+        cerrar_pool()
+
+    print(f"✅ {resultado.resumen()}")
+    for rechazada in resultado.getRechazadas()[:20]:
+        print(f"   Línea {rechazada.linea}: {rechazada.motivo}")
+    if len(resultado.getRechazadas()) > 20:
+        print(f"   ... y {len(resultado.getRechazadas()) - 20} más")
+    if args.rechazos and resultado.getRechazadas():
+        resultado.escribirRechazos(args.rechazos)
+        print(f"📄 Filas rechazadas guardadas en {args.rechazos}")
+    return 1 if resultado.getRechazadas() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
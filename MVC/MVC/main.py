@@ -2,6 +2,10 @@ from controlador.validations import inicial, validarLogin
 import getpass
 import logging
 from utils.logger import SistemaLogging
+from conex.conn import cerrar_pool
+from servicio.http_cliente import cerrar_cliente_http
+from utils.encoder import cerrar_ejecutor_bcrypt
+from utils.limitador import LoginBloqueadoError
 from typing import Optional
 
 # Configurar sistema de logging
@@ -65,6 +69,11 @@ def main() -> None:
                                       username, intentos)
                         print("❌ Usuario o contraseña incorrecta")
                         intentos += 1
+                except LoginBloqueadoError as e:
+                    logger.warning("Login bloqueado temporalmente para: %s", username)
+                    print(f"🚫 {e}")
+                    input("Presione Enter para continuar...")
+                    break
                 except Exception as e:
                     logger.error("Error durante login: %s", str(e))
                     print("❌ Error, intentar nuevamente")
@@ -84,6 +93,10 @@ def main() -> None:
         elif opcion == '3':
             logger.info("Sistema cerrado por el usuario")
             print("¡Hasta pronto!")
+            cerrar_pool()
+            cerrar_cliente_http()
+            cerrar_ejecutor_bcrypt()
+            SistemaLogging.detener()
             break
         else:
             logger.warning("Opción inválida seleccionada: %s", opcion)
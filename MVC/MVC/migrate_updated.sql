@@ -0,0 +1,83 @@
+-- =============================================
+-- Sistema de Gestión de Arriendos - Viaja Seguro
+-- Migración de una base existente al esquema de create_updated.sql
+-- =============================================
+-- Se puede ejecutar más de una vez: cada cambio se aplica solo si falta.
+-- Las bases nuevas creadas con create_updated.sql no lo necesitan.
+
+USE viaja_seguro;
+
+DROP PROCEDURE IF EXISTS _migrar_si;
+
+-- Ejecuta la sentencia solo si `falta` es verdadero
+DELIMITER //
+CREATE PROCEDURE _migrar_si(IN falta BOOLEAN, IN sentencia TEXT)
+BEGIN
+    IF falta THEN
+        SET @sentencia_migracion = sentencia;
+        PREPARE migracion FROM @sentencia_migracion;
+        EXECUTE migracion;
+        DEALLOCATE PREPARE migracion;
+    END IF;
+END //
+DELIMITER ;
+
+-- =============================================
+-- Consultas de arriendos por fecha
+-- =============================================
+-- Duración de cada arriendo: acota los cruces por fecha al arriendo más largo
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND COLUMN_NAME = 'duracion_dias') = 0,
+    'ALTER TABLE arriendo ADD COLUMN duracion_dias INT AS (DATEDIFF(fecha_fin, fecha_inicio)) STORED');
+
+-- Arriendos que terminan en un rango
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND INDEX_NAME = 'idx_arriendo_fin') = 0,
+    'ALTER TABLE arriendo ADD INDEX idx_arriendo_fin (fecha_fin)');
+
+-- MAX(duracion_dias) por estado; reemplaza una versión anterior sin la columna estado
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND INDEX_NAME = 'idx_arriendo_duracion') > 0
+    AND (SELECT COUNT(*) FROM information_schema.STATISTICS
+         WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND INDEX_NAME = 'idx_arriendo_duracion'
+           AND COLUMN_NAME = 'estado') = 0,
+    'ALTER TABLE arriendo DROP INDEX idx_arriendo_duracion');
+
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND INDEX_NAME = 'idx_arriendo_duracion') = 0,
+    'ALTER TABLE arriendo ADD INDEX idx_arriendo_duracion (estado, duracion_dias)');
+
+-- =============================================
+-- Versión para edición concurrente
+-- =============================================
+-- update_time con microsegundos: con precisión de segundos dos ediciones en
+-- el mismo segundo dejarían la misma versión y el conflicto no se detectaría
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'empleado' AND COLUMN_NAME = 'update_time'
+       AND DATETIME_PRECISION = 6) = 0,
+    'ALTER TABLE empleado MODIFY update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)');
+
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'cliente' AND COLUMN_NAME = 'update_time'
+       AND DATETIME_PRECISION = 6) = 0,
+    'ALTER TABLE cliente MODIFY update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)');
+
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'vehiculo' AND COLUMN_NAME = 'update_time'
+       AND DATETIME_PRECISION = 6) = 0,
+    'ALTER TABLE vehiculo MODIFY update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)');
+
+CALL _migrar_si(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'arriendo' AND COLUMN_NAME = 'update_time'
+       AND DATETIME_PRECISION = 6) = 0,
+    'ALTER TABLE arriendo MODIFY update_time TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)');
+
+DROP PROCEDURE IF EXISTS _migrar_si;
@@ -12,13 +12,17 @@ class Arriendo:
         _lista_arriendos (ClassVar[List['Arriendo']]): Lista estática de todos los arriendos
     """
     _lista_arriendos: ClassVar[List['Arriendo']] = []
+    # Sin __dict__ por instancia: los listados pueden hidratar muchas filas
+    __slots__ = ('_id_arriendo', '_id_vehiculo', '_id_cliente', '_id_empleado', '_fecha_inicio',
+                 '_fecha_fin', '_costo_total', '_estado', '_create_time', '_valor_uf_fecha',
+                 '_fecha_uf_consulta', '_update_time')
     
     def __init__(self, id_vehiculo: Optional[int] = None, id_cliente: Optional[int] = None, 
                  id_empleado: Optional[int] = None, fecha_inicio: Optional[str] = None, 
                  fecha_fin: Optional[str] = None, costo_total: float = 0.0, 
                  estado: str = "activo", id_arriendo: Optional[int] = None, 
                  create_time: Optional[datetime] = None, valor_uf_fecha: float = 0.0, 
-                 fecha_uf_consulta: Optional[str] = None) -> None:
+                 fecha_uf_consulta: Optional[str] = None, update_time: Optional[datetime] = None) -> None:
         """
         Inicializa una nueva instancia de Arriendo.
         
@@ -34,6 +38,8 @@ class Arriendo:
             create_time (Optional[datetime]): Fecha y hora de creación del registro
             valor_uf_fecha (float): Valor de la UF al momento del arriendo
             fecha_uf_consulta (Optional[str]): Fecha del indicador UF consultado
+            update_time (Optional[datetime]): Última modificación del registro (versión para
+                detectar ediciones concurrentes)
         """
         self._id_arriendo = id_arriendo
         self._id_vehiculo = id_vehiculo
@@ -46,6 +52,7 @@ class Arriendo:
         self._create_time = create_time or datetime.now()
         self._valor_uf_fecha = valor_uf_fecha
         self._fecha_uf_consulta = fecha_uf_consulta
+        self._update_time = update_time
     
     # Getters y Setters con type hints
     def getIdArriendo(self) -> Optional[int]:
@@ -132,6 +139,14 @@ class Arriendo:
         """Establece la fecha del indicador UF."""
         self._fecha_uf_consulta = fecha_uf_consulta
     
+    def getUpdateTime(self) -> Optional[datetime]:
+        """Obtiene la última modificación leída de la base de datos (versión del registro)."""
+        return self._update_time
+    
+    def setUpdateTime(self, update_time: Optional[datetime]) -> None:
+        """Establece la versión del registro."""
+        self._update_time = update_time
+    
     @classmethod
     def getListaArriendos(cls) -> List['Arriendo']:
         """Obtiene la lista estática de todos los arriendos."""
@@ -12,10 +12,11 @@ class Cliente(Persona):
         _lista_clientes (ClassVar[List['Cliente']]): Lista estática de todos los clientes
     """
     _lista_clientes: ClassVar[List['Cliente']] = []
+    __slots__ = ('_direccion', '_telefono', '_id_cliente', '_create_time', '_update_time')
     
     def __init__(self, run: str = "", nombre: str = "", apellido: str = "", 
                  direccion: str = "", telefono: str = "", id_cliente: Optional[int] = None, 
-                 create_time: Optional[datetime] = None) -> None:
+                 create_time: Optional[datetime] = None, update_time: Optional[datetime] = None) -> None:
         """
         Inicializa una nueva instancia de Cliente.
         
@@ -27,12 +28,15 @@ class Cliente(Persona):
             telefono (str): Teléfono de contacto del cliente (9 dígitos)
             id_cliente (Optional[int]): Identificador único en base de datos
             create_time (Optional[datetime]): Fecha y hora de creación del registro
+            update_time (Optional[datetime]): Última modificación del registro (versión para
+                detectar ediciones concurrentes)
         """
         super().__init__(run, nombre, apellido)
         self._direccion = direccion
         self._telefono = telefono
         self._id_cliente = id_cliente
         self._create_time = create_time or datetime.now()
+        self._update_time = update_time
     
     def mostrar_info(self) -> str:
         """
@@ -73,6 +77,14 @@ class Cliente(Persona):
         """Establece el ID único del cliente."""
         self._id_cliente = id_cliente
     
+    def getUpdateTime(self) -> Optional[datetime]:
+        """Obtiene la última modificación leída de la base de datos (versión del registro)."""
+        return self._update_time
+    
+    def setUpdateTime(self, update_time: Optional[datetime]) -> None:
+        """Establece la versión del registro."""
+        self._update_time = update_time
+    
     @classmethod
     def getListaClientes(cls) -> List['Cliente']:
         """Obtiene la lista estática de todos los clientes."""
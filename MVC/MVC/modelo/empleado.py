@@ -16,6 +16,7 @@ class Empleado(Persona):
         _lista_empleados (ClassVar[List['Empleado']]): Lista estática de todos los empleados
     """
     _lista_empleados: ClassVar[List['Empleado']] = []
+    __slots__ = ('_password', '_cargo', '_id_empleado', '_create_time')
     
     def __init__(self, run: str = "", nombre: str = "", apellido: str = "", 
                  password: str = "", cargo: str = "", id_empleado: Optional[int] = None, 
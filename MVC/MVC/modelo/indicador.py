@@ -1,6 +1,7 @@
 # modelo/indicador.py
 import logging
-from typing import Optional
+from bisect import bisect_right
+from typing import Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -75,4 +76,69 @@ class IndicadorEconomico:
             )
         except (KeyError, IndexError, TypeError, ValueError) as e:
             logger.error("Error en la estructura JSON del Indicador: %s", e)
-            raise ValueError(f"Error en la estructura JSON del Indicador: {e}")
\ No newline at end of file
+            raise ValueError(f"Error en la estructura JSON del Indicador: {e}")
+
+
+class SerieIndicador:
+    """
+    Serie de valores de un indicador (ej: la UF de un año completo) ordenada
+    por fecha, para buscar el valor vigente de una fecha sin consultar la API.
+    """
+
+    def __init__(self, codigo: str, puntos: List[Tuple[str, str, float]]) -> None:
+        """
+        Inicializa la serie.
+
+        Args:
+            codigo (str): Código del indicador (ej: "uf")
+            puntos (List[Tuple[str, str, float]]): Tuplas (fecha YYYY-MM-DD, fecha original, valor)
+        """
+        self._codigo = codigo
+        self._puntos = sorted(puntos)
+        self._fechas = [p[0] for p in self._puntos]
+
+    def getCodigo(self) -> str:
+        return self._codigo
+
+    def __len__(self) -> int:
+        return len(self._puntos)
+
+    def buscarAnterior(self, fecha: str) -> Optional[IndicadorEconomico]:
+        """
+        Busca el valor de la fecha indicada o, si no existe, el de la fecha
+        anterior más próxima de la serie (búsqueda binaria).
+
+        Args:
+            fecha (str): Fecha en formato YYYY-MM-DD
+
+        Returns:
+            Optional[IndicadorEconomico]: Indicador encontrado, None si la fecha es anterior a toda la serie
+        """
+        pos = bisect_right(self._fechas, fecha)
+        if pos == 0:
+            return None
+        _, fecha_original, valor = self._puntos[pos - 1]
+        return IndicadorEconomico(codigo=self._codigo, fecha=fecha_original, valor=valor)
+
+    @classmethod
+    def from_json(cls, data_json: dict) -> 'SerieIndicador':
+        """
+        Crea la serie desde la respuesta de mindicador.cl para un año
+        (``/api/uf/{año}``): {"codigo": "uf", "serie": [ {"fecha": "...", "valor": X.X}, ... ]}
+
+        Args:
+            data_json (dict): Diccionario deserializado
+
+        Returns:
+            SerieIndicador: Serie (posiblemente vacía)
+
+        Raises:
+            ValueError: Si la estructura del JSON no es la esperada
+        """
+        try:
+            puntos = [(item['fecha'][:10], item['fecha'], float(item['valor']))
+                      for item in data_json.get('serie') or []]
+            return cls(data_json.get('codigo', 'uf'), puntos)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            logger.error("Error en la estructura JSON de la serie: %s", e)
+            raise ValueError(f"Error en la estructura JSON de la serie: {e}")
\ No newline at end of file
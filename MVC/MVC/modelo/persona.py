@@ -13,6 +13,8 @@ class Persona(ABC):
         _nombre (str): Nombre de la persona
         _apellido (str): Apellido de la persona
     """
+    # Sin __dict__ por instancia: los listados pueden hidratar muchas filas
+    __slots__ = ('_run', '_nombre', '_apellido')
     
     def __init__(self, run: str = "", nombre: str = "", apellido: str = "") -> None:
         """
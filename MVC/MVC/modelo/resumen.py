@@ -0,0 +1,67 @@
+from typing import Dict, Optional
+
+class ResumenSistema:
+    """
+    Resumen agregado del sistema calculado por la base de datos.
+
+    Contiene solo conteos y sumas (no filas), por lo que su tamaño no
+    depende de la cantidad de clientes, vehículos o arriendos registrados.
+    """
+
+    def __init__(self, total_clientes: int = 0,
+                 empleados_por_cargo: Optional[Dict[str, int]] = None,
+                 vehiculos_por_estado: Optional[Dict[str, int]] = None,
+                 arriendos_por_estado: Optional[Dict[str, int]] = None,
+                 costo_por_estado: Optional[Dict[str, float]] = None) -> None:
+        """
+        Inicializa una nueva instancia de ResumenSistema.
+
+        Args:
+            total_clientes (int): Cantidad de clientes registrados
+            empleados_por_cargo (Optional[Dict[str, int]]): Empleados por cargo
+            vehiculos_por_estado (Optional[Dict[str, int]]): Vehículos por estado
+            arriendos_por_estado (Optional[Dict[str, int]]): Arriendos por estado
+            costo_por_estado (Optional[Dict[str, float]]): Suma de costo_total por estado de arriendo
+        """
+        self._total_clientes = total_clientes
+        self._empleados_por_cargo = empleados_por_cargo or {}
+        self._vehiculos_por_estado = vehiculos_por_estado or {}
+        self._arriendos_por_estado = arriendos_por_estado or {}
+        self._costo_por_estado = costo_por_estado or {}
+
+    def getTotalClientes(self) -> int:
+        """Obtiene la cantidad de clientes registrados."""
+        return self._total_clientes
+
+    def getTotalEmpleados(self) -> int:
+        """Obtiene la cantidad total de empleados."""
+        return sum(self._empleados_por_cargo.values())
+
+    def getEmpleadosPorCargo(self, cargo: str) -> int:
+        """Obtiene la cantidad de empleados con el cargo indicado."""
+        return self._empleados_por_cargo.get(cargo, 0)
+
+    def getTotalVehiculos(self) -> int:
+        """Obtiene la cantidad total de vehículos de la flota."""
+        return sum(self._vehiculos_por_estado.values())
+
+    def getVehiculosPorEstado(self, estado: str) -> int:
+        """Obtiene la cantidad de vehículos en el estado indicado."""
+        return self._vehiculos_por_estado.get(estado, 0)
+
+    def getTotalArriendos(self) -> int:
+        """Obtiene la cantidad total de arriendos."""
+        return sum(self._arriendos_por_estado.values())
+
+    def getArriendosPorEstado(self, estado: str) -> int:
+        """Obtiene la cantidad de arriendos en el estado indicado."""
+        return self._arriendos_por_estado.get(estado, 0)
+
+    def getIngresosTotales(self) -> float:
+        """Obtiene la suma de costo_total de los arriendos no cancelados."""
+        return sum(total for estado, total in self._costo_por_estado.items() if estado != "cancelado")
+
+    def __str__(self) -> str:
+        """Representación en string del resumen."""
+        return (f"Resumen: {self._total_clientes} clientes, {self.getTotalVehiculos()} vehículos, "
+                f"{self.getTotalEmpleados()} empleados, {self.getTotalArriendos()} arriendos")
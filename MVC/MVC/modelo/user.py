@@ -13,10 +13,11 @@ class User(Persona):
         _lista_users (ClassVar[List['User']]): Lista estática de todos los usuarios
     """
     _lista_users: ClassVar[List['User']] = []
+    __slots__ = ('_password', '_cargo', '_id_empleado', '_create_time', '_update_time')
     
     def __init__(self, run: str = "", nombre: str = "", apellido: str = "", 
                  password: str = "", cargo: str = "", id_empleado: Optional[int] = None, 
-                 create_time: Optional[datetime] = None) -> None:
+                 create_time: Optional[datetime] = None, update_time: Optional[datetime] = None) -> None:
         """
         Inicializa una nueva instancia de User.
         
@@ -28,12 +29,15 @@ class User(Persona):
             cargo (str): Cargo del usuario ('gerente' o 'empleado')
             id_empleado (Optional[int]): Identificador único en base de datos
             create_time (Optional[datetime]): Fecha y hora de creación del registro
+            update_time (Optional[datetime]): Última modificación del registro (versión para
+                detectar ediciones concurrentes)
         """
         super().__init__(run, nombre, apellido)
         self._password = password
         self._cargo = cargo
         self._id_empleado = id_empleado
         self._create_time = create_time or datetime.now()
+        self._update_time = update_time
     
     def mostrar_info(self) -> str:
         """
@@ -74,6 +78,14 @@ class User(Persona):
         """Establece el ID único del empleado."""
         self._id_empleado = id_empleado
     
+    def getUpdateTime(self) -> Optional[datetime]:
+        """Obtiene la última modificación leída de la base de datos (versión del registro)."""
+        return self._update_time
+    
+    def setUpdateTime(self, update_time: Optional[datetime]) -> None:
+        """Establece la versión del registro."""
+        self._update_time = update_time
+    
     @classmethod
     def getListaUser(cls) -> List['User']:
         """Obtiene la lista estática de todos los usuarios."""
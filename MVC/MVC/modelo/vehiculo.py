@@ -12,10 +12,14 @@ class Vehiculo:
         _lista_vehiculos (ClassVar[List['Vehiculo']]): Lista estática de todos los vehículos
     """
     _lista_vehiculos: ClassVar[List['Vehiculo']] = []
+    # Sin __dict__ por instancia: los listados pueden hidratar muchas filas
+    __slots__ = ('_patente', '_marca', '_modelo', '_año', '_precio_diario', '_estado',
+                 '_id_vehiculo', '_create_time', '_update_time')
     
     def __init__(self, patente: str = "", marca: str = "", modelo: str = "", 
                  año: int = 0, precio_diario: float = 0.0, estado: str = "disponible", 
-                 id_vehiculo: Optional[int] = None, create_time: Optional[datetime] = None) -> None:
+                 id_vehiculo: Optional[int] = None, create_time: Optional[datetime] = None,
+                 update_time: Optional[datetime] = None) -> None:
         """
         Inicializa una nueva instancia de Vehiculo.
         
@@ -28,6 +32,8 @@ class Vehiculo:
             estado (str): Estado actual del vehículo (disponible, arrendado, mantencion)
             id_vehiculo (Optional[int]): Identificador único en base de datos
             create_time (Optional[datetime]): Fecha y hora de creación del registro
+            update_time (Optional[datetime]): Última modificación del registro (versión para
+                detectar ediciones concurrentes)
         """
         self._patente = patente
         self._marca = marca
@@ -37,6 +43,7 @@ class Vehiculo:
         self._estado = estado
         self._id_vehiculo = id_vehiculo
         self._create_time = create_time or datetime.now()
+        self._update_time = update_time
     
     # Getters y Setters con type hints
     def getPatente(self) -> str:
@@ -95,6 +102,14 @@ class Vehiculo:
         """Establece el ID único del vehículo."""
         self._id_vehiculo = id_vehiculo
     
+    def getUpdateTime(self) -> Optional[datetime]:
+        """Obtiene la última modificación leída de la base de datos (versión del registro)."""
+        return self._update_time
+    
+    def setUpdateTime(self, update_time: Optional[datetime]) -> None:
+        """Establece la versión del registro."""
+        self._update_time = update_time
+    
     @classmethod
     def getListaVehiculos(cls) -> List['Vehiculo']:
         """Obtiene la lista estática de todos los vehículos."""
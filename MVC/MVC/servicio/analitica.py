@@ -0,0 +1,198 @@
+# servicio/analitica.py
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: solo lo usan los informes analíticos
+    np = None
+
+from dao.dao_arriendo import DaoArriendo
+
+logger = logging.getLogger(__name__)
+
+Fecha = Union[str, date, datetime]
+
+# Orden de los códigos de estado (0 = estado desconocido o NULL)
+ESTADOS_ARRIENDO: Tuple[str, ...] = ('activo', 'finalizado', 'cancelado')
+
+_EPOCA = date(1970, 1, 1).toordinal()
+
+
+def numpy_disponible() -> bool:
+    """Indica si numpy está instalado (requerido por `DatasetArriendos`)."""
+    return np is not None
+
+
+def _requerir_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Los informes analíticos requieren numpy (pip install numpy)")
+
+
+def _ordinal(fecha: Fecha) -> int:
+    if isinstance(fecha, datetime):
+        return fecha.date().toordinal()
+    if isinstance(fecha, date):
+        return fecha.toordinal()
+    return datetime.strptime(str(fecha).strip(), '%Y-%m-%d').date().toordinal()
+
+
+class ResumenGrupo(NamedTuple):
+    """Totales de un grupo de arriendos."""
+    arriendos: int
+    ingresos: float
+    dias: int
+
+
+class DatasetArriendos:
+    """
+    Arriendos en formato columnar (un arreglo NumPy por columna).
+
+    Las fechas se guardan como número de día (`date.toordinal()`), el costo
+    en centavos (entero, sin errores de redondeo al sumar) y el estado como
+    código de `ESTADOS_ARRIENDO`. Las agregaciones cuentan y suman por clave
+    con `np.bincount` (u ordenando una vez si las claves son muy dispersas),
+    sin recorrer filas en Python.
+
+    Attributes:
+        id_arriendo, id_vehiculo, id_cliente, id_empleado (np.ndarray): IDs (int32)
+        inicio, fin (np.ndarray): Fechas como ordinal (int32)
+        costo (np.ndarray): costo_total en centavos (int64)
+        estado (np.ndarray): Código de estado (int8)
+    """
+
+    def __init__(self, id_arriendo, id_vehiculo, id_cliente, id_empleado,
+                 inicio, fin, costo, estado) -> None:
+        _requerir_numpy()
+        self.id_arriendo = np.asarray(id_arriendo, dtype=np.int32)
+        self.id_vehiculo = np.asarray(id_vehiculo, dtype=np.int32)
+        self.id_cliente = np.asarray(id_cliente, dtype=np.int32)
+        self.id_empleado = np.asarray(id_empleado, dtype=np.int32)
+        self.inicio = np.asarray(inicio, dtype=np.int32)
+        self.fin = np.asarray(fin, dtype=np.int32)
+        self.costo = np.asarray(costo, dtype=np.int64)
+        self.estado = np.asarray(estado, dtype=np.int8)
+
+    @classmethod
+    def desdeFilas(cls, filas: Iterable[Tuple[int, ...]]) -> 'DatasetArriendos':
+        """
+        Construye el dataset desde filas de `DaoArriendo.iterFilasNumericas`.
+
+        Las filas se copian directo a un arreglo a medida que llegan, sin
+        armar listas intermedias.
+
+        Args:
+            filas (Iterable[Tuple[int, ...]]): (id_arriendo, id_vehiculo, id_cliente,
+                id_empleado, inicio, fin, costo_centavos, codigo_estado)
+
+        Returns:
+            DatasetArriendos: Dataset con una fila por arriendo
+        """
+        _requerir_numpy()
+        datos = np.fromiter(filas, dtype=np.dtype((np.int64, 8)))
+        return cls(*datos.T)
+
+    def __len__(self) -> int:
+        return len(self.id_arriendo)
+
+    def dias(self) -> 'np.ndarray':
+        """Obtiene los días de cada arriendo (fin - inicio)."""
+        return self.fin - self.inicio
+
+    def ingresosTotales(self) -> float:
+        """Obtiene la suma de costo_total en pesos."""
+        return int(self.costo.sum()) / 100
+
+    def filtrar(self, estados: Optional[Sequence[str]] = None, desde: Optional[Fecha] = None,
+                hasta: Optional[Fecha] = None) -> 'DatasetArriendos':
+        """
+        Obtiene los arriendos que cumplen todos los filtros indicados.
+
+        Args:
+            estados (Optional[Sequence[str]]): Estados a incluir
+            desde (Optional[Fecha]): Fecha de inicio mínima (incluida)
+            hasta (Optional[Fecha]): Fecha de inicio máxima (excluida)
+
+        Returns:
+            DatasetArriendos: Nuevo dataset con las filas seleccionadas
+        """
+        mascara = np.ones(len(self), dtype=bool)
+        if estados is not None:
+            codigos = [ESTADOS_ARRIENDO.index(e) + 1 for e in estados]
+            mascara &= np.isin(self.estado, codigos)
+        if desde is not None:
+            mascara &= self.inicio >= _ordinal(desde)
+        if hasta is not None:
+            mascara &= self.inicio < _ordinal(hasta)
+        return DatasetArriendos(self.id_arriendo[mascara], self.id_vehiculo[mascara],
+                                self.id_cliente[mascara], self.id_empleado[mascara],
+                                self.inicio[mascara], self.fin[mascara],
+                                self.costo[mascara], self.estado[mascara])
+
+    def agruparPorEstado(self) -> Dict[str, ResumenGrupo]:
+        """Obtiene arriendos, ingresos y días por estado."""
+        nombres = ('desconocido',) + ESTADOS_ARRIENDO
+        return {nombres[codigo]: resumen for codigo, resumen in self._agrupar(self.estado).items()}
+
+    def agruparPorMes(self) -> Dict[str, ResumenGrupo]:
+        """Obtiene arriendos, ingresos y días por mes de inicio ('YYYY-MM')."""
+        meses = (self.inicio.astype(np.int64) - _EPOCA).astype('datetime64[D]').astype('datetime64[M]')
+        return {f"{1970 + mes // 12}-{mes % 12 + 1:02d}": resumen
+                for mes, resumen in self._agrupar(meses.astype(np.int64)).items()}
+
+    def agruparPorVehiculo(self) -> Dict[int, ResumenGrupo]:
+        """Obtiene arriendos, ingresos y días por ID de vehículo."""
+        return self._agrupar(self.id_vehiculo)
+
+    def agruparPorEmpleado(self) -> Dict[int, ResumenGrupo]:
+        """Obtiene arriendos, ingresos y días por ID de empleado."""
+        return self._agrupar(self.id_empleado)
+
+    def _agrupar(self, claves: 'np.ndarray') -> Dict[int, ResumenGrupo]:
+        if not len(claves):
+            return {}
+        minimo = int(claves.min())
+        rango = int(claves.max()) - minimo + 1
+        if rango <= max(len(claves), 1 << 16):
+            # Claves densas (IDs, meses, códigos): conteo directo sin ordenar. Las sumas
+            # en float64 son exactas mientras cada total quede bajo 2**53 centavos
+            posiciones = (claves - minimo).astype(np.intp)
+            conteos = np.bincount(posiciones, minlength=rango)
+            presentes = np.flatnonzero(conteos)
+            unicas = presentes + minimo
+            centavos = np.bincount(posiciones, weights=self.costo, minlength=rango)[presentes]
+            dias = np.bincount(posiciones, weights=self.dias(), minlength=rango)[presentes]
+            conteos = conteos[presentes]
+        else:
+            orden = np.argsort(claves, kind='stable')
+            ordenadas = claves[orden]
+            inicios = np.flatnonzero(np.concatenate(([True], ordenadas[1:] != ordenadas[:-1])))
+            unicas = ordenadas[inicios]
+            conteos = np.diff(np.append(inicios, len(ordenadas)))
+            centavos = np.add.reduceat(self.costo[orden], inicios)
+            dias = np.add.reduceat(self.dias()[orden].astype(np.int64), inicios)
+        return {int(clave): ResumenGrupo(int(n), int(c) / 100, int(d))
+                for clave, n, c, d in zip(unicas.tolist(), conteos.tolist(),
+                                          centavos.tolist(), dias.tolist())}
+
+
+def cargar_dataset_arriendos(tamano_lote: Optional[int] = None) -> DatasetArriendos:
+    """
+    Carga todos los arriendos en un `DatasetArriendos` leyendo en streaming.
+
+    Args:
+        tamano_lote (Optional[int]): Filas por lote del cursor (default: DB_FETCH_LOTE)
+
+    Returns:
+        DatasetArriendos: Dataset con todos los arriendos
+
+    Raises:
+        RuntimeError: Si numpy no está instalado
+    """
+    _requerir_numpy()
+    with DaoArriendo() as daoarriendo:
+        dataset = DatasetArriendos.desdeFilas(
+            daoarriendo.iterFilasNumericas(ESTADOS_ARRIENDO, tamano_lote=tamano_lote))
+    logger.info("Dataset de arriendos cargado: %d filas", len(dataset))
+    return dataset
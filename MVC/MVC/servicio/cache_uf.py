@@ -0,0 +1,189 @@
+# servicio/cache_uf.py
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+import logging
+from typing import Optional, Dict
+
+from modelo.indicador import IndicadorEconomico
+
+logger = logging.getLogger(__name__)
+
+#: Ruta por defecto de la caché, relativa al proyecto y no al directorio de trabajo
+RUTA_CACHE_UF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "cache", "cache_uf.sqlite3")
+
+
+class CacheUF:
+    """
+    Caché persistente (SQLite) de valores de la UF indexada por fecha.
+
+    La clave es la fecha consultada (YYYY-MM-DD) y el valor es el indicador
+    que se obtuvo para ella (que puede ser de un día anterior si la fecha
+    no tenía UF). Una entrada no expira solo si es la UF de esa misma fecha
+    y se guardó cuando la fecha ya había pasado: ese valor no cambia. Las
+    demás (hoy, fechas futuras, o el valor de un día anterior guardado como
+    reemplazo mientras la fecha no tenía UF) expiran tras ``ttl_hoy`` segundos.
+
+    Attributes:
+        ruta (str): Archivo SQLite (``:memory:`` para una caché temporal)
+        ttl_hoy (float): Segundos de validez de las entradas que aún pueden cambiar
+    """
+
+    def __init__(self, ruta: str = ":memory:", ttl_hoy: float = 3600.0) -> None:
+        """
+        Abre (o crea) la caché.
+
+        Args:
+            ruta (str): Ruta del archivo SQLite
+            ttl_hoy (float): Segundos de validez de las entradas que aún pueden cambiar
+        """
+        self.ruta = ruta
+        self.ttl_hoy = ttl_hoy
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirados = 0
+        self._guardados = 0
+        if ruta != ":memory:":
+            directorio = os.path.dirname(ruta)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+        self._db = sqlite3.connect(ruta, check_same_thread=False)
+        self._db.execute("""CREATE TABLE IF NOT EXISTS uf (
+                                fecha TEXT PRIMARY KEY,
+                                codigo TEXT NOT NULL,
+                                fecha_valor TEXT NOT NULL,
+                                valor REAL NOT NULL,
+                                guardado REAL NOT NULL)""")
+        self._db.commit()
+
+    def obtener(self, fecha: str, hoy: Optional[date] = None) -> Optional[IndicadorEconomico]:
+        """
+        Busca el indicador guardado para una fecha.
+
+        Args:
+            fecha (str): Fecha consultada (YYYY-MM-DD)
+            hoy (Optional[date]): Fecha actual (por defecto ``date.today()``)
+
+        Returns:
+            Optional[IndicadorEconomico]: Indicador en caché, None si no está o expiró
+        """
+        with self._lock:
+            fila = self._db.execute(
+                "SELECT codigo, fecha_valor, valor, guardado FROM uf WHERE fecha = ?", (fecha,)
+            ).fetchone()
+            if fila is None:
+                self._misses += 1
+                return None
+            if not self._es_definitiva(fecha, fila[1], fila[3], hoy) and time.time() - fila[3] > self.ttl_hoy:
+                self._expirados += 1
+                self._misses += 1
+                return None
+            self._hits += 1
+        return IndicadorEconomico(codigo=fila[0], fecha=fila[1], valor=fila[2])
+
+    def guardar(self, fecha: str, indicador: IndicadorEconomico) -> None:
+        """
+        Guarda (o reemplaza) el indicador obtenido para una fecha.
+
+        Args:
+            fecha (str): Fecha consultada (YYYY-MM-DD)
+            indicador (IndicadorEconomico): Indicador obtenido para esa fecha
+        """
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO uf (fecha, codigo, fecha_valor, valor, guardado) VALUES (?, ?, ?, ?, ?)",
+                    (fecha, indicador.getCodigo(), indicador.getFecha(), indicador.getValor(), time.time())
+                )
+                self._db.commit()
+                self._guardados += 1
+        except sqlite3.Error as e:
+            # La caché es una optimización: un fallo no debe impedir cotizar
+            logger.warning("No se pudo guardar la UF de %s en caché: %s", fecha, e)
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de uso de la caché.
+
+        Returns:
+            Dict[str, int]: hits, misses, expirados, guardados y entradas
+        """
+        with self._lock:
+            entradas = self._db.execute("SELECT COUNT(*) FROM uf").fetchone()[0]
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'expirados': self._expirados,
+                'guardados': self._guardados,
+                'entradas': entradas,
+            }
+
+    def cerrar(self) -> None:
+        """Cierra el archivo de la caché."""
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _es_definitiva(fecha: str, fecha_valor: str, guardado: float, hoy: Optional[date]) -> bool:
+        """
+        Indica si la entrada ya no puede cambiar.
+
+        Lo es si la fecha es anterior a hoy, el valor es de esa misma fecha
+        y se guardó después de que la fecha pasara.
+        """
+        return (fecha < (hoy or date.today()).isoformat()
+                and fecha_valor.split('T')[0] == fecha
+                and date.fromtimestamp(guardado).isoformat() > fecha)
+
+
+_cache: Optional[CacheUF] = None
+_cache_lock = threading.Lock()
+
+
+def obtener_cache_uf() -> CacheUF:
+    """
+    Obtiene la caché de UF compartida, abriéndola la primera vez.
+
+    La ruta se configura con UF_CACHE_PATH (default: cache/cache_uf.sqlite3
+    dentro del proyecto, sin importar el directorio de trabajo)
+    y el TTL de los valores de hoy con UF_CACHE_TTL_HOY (segundos).
+
+    Returns:
+        CacheUF: Caché compartida
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                ruta = os.environ.get("UF_CACHE_PATH", RUTA_CACHE_UF)
+                try:
+                    ttl = float(os.environ.get("UF_CACHE_TTL_HOY", "3600"))
+                except ValueError:
+                    ttl = 3600.0
+                try:
+                    _cache = CacheUF(ruta, ttl)
+                except sqlite3.Error as e:
+                    logger.warning("No se pudo abrir la caché de UF en %s (%s); se usa memoria", ruta, e)
+                    _cache = CacheUF(":memory:", ttl)
+    return _cache
+
+
+def configurar_cache_uf(cache: Optional[CacheUF]) -> Optional[CacheUF]:
+    """
+    Reemplaza la caché compartida (por ejemplo, para pruebas).
+
+    Args:
+        cache (Optional[CacheUF]): Nueva caché, o None para volver a la por defecto
+
+    Returns:
+        Optional[CacheUF]: La caché anterior
+    """
+    global _cache
+    with _cache_lock:
+        anterior = _cache
+        _cache = cache
+    return anterior
@@ -0,0 +1,411 @@
+# servicio/disponibilidad.py
+import os
+import threading
+import time
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from dao.dao_arriendo import DaoArriendo
+from dao.dao_vehiculo import DaoVehiculo
+
+logger = logging.getLogger(__name__)
+
+Fecha = Union[str, date, datetime]
+
+#: Estados con los que un vehículo forma parte de la flota arrendable
+ESTADOS_ARRENDABLES = ('disponible', 'arrendado')
+
+
+class VehiculoNoDisponibleError(Exception):
+    """
+    Se lanza cuando el vehículo ya está reservado (o no se puede arrendar) en el rango pedido.
+
+    Attributes:
+        id_vehiculo (int): Vehículo solicitado
+        conflictos (List[int]): Arriendos activos que se cruzan con el rango
+    """
+
+    def __init__(self, id_vehiculo: int, conflictos: Optional[List[int]] = None) -> None:
+        self.id_vehiculo = id_vehiculo
+        self.conflictos = list(conflictos or [])
+        if self.conflictos:
+            mensaje = f"El vehículo {id_vehiculo} ya está reservado en esas fechas (arriendos {self.conflictos})"
+        else:
+            mensaje = f"El vehículo {id_vehiculo} no está disponible para arriendo"
+        super().__init__(mensaje)
+
+
+def _ordinal(fecha: Fecha) -> int:
+    """Convierte una fecha (date, datetime o 'YYYY-MM-DD') a su número de día."""
+    if isinstance(fecha, datetime):
+        return fecha.date().toordinal()
+    if isinstance(fecha, date):
+        return fecha.toordinal()
+    return datetime.strptime(str(fecha).strip(), '%Y-%m-%d').date().toordinal()
+
+
+def _rango(inicio: Fecha, fin: Fecha) -> Tuple[int, int]:
+    a, b = _ordinal(inicio), _ordinal(fin)
+    if b <= a:
+        raise ValueError("La fecha de fin debe ser posterior a la fecha de inicio")
+    return a, b
+
+
+class _ReservasVehiculo:
+    """
+    Reservas de un vehículo ordenadas por fecha de inicio.
+
+    ``max_fin[i]`` es el mayor fin entre las reservas ``0..i``, así que
+    saber si algún intervalo se cruza con un rango cuesta una búsqueda
+    binaria aunque haya reservas superpuestas heredadas de la base de datos.
+    """
+
+    __slots__ = ('inicios', 'fines', 'ids', 'max_fin')
+
+    def __init__(self) -> None:
+        self.inicios: List[int] = []
+        self.fines: List[int] = []
+        self.ids: List[int] = []
+        self.max_fin: List[int] = []
+
+    def agregar(self, id_arriendo: int, inicio: int, fin: int) -> None:
+        i = bisect_right(self.inicios, inicio)
+        self.inicios.insert(i, inicio)
+        self.fines.insert(i, fin)
+        self.ids.insert(i, id_arriendo)
+        self.max_fin.insert(i, fin)
+        self._recalcular(i)
+
+    def quitar(self, id_arriendo: int) -> None:
+        i = self.ids.index(id_arriendo)
+        del self.inicios[i], self.fines[i], self.ids[i], self.max_fin[i]
+        self._recalcular(i)
+
+    def _recalcular(self, desde: int) -> None:
+        previo = self.max_fin[desde - 1] if desde else 0
+        for j in range(desde, len(self.fines)):
+            previo = max(previo, self.fines[j])
+            self.max_fin[j] = previo
+
+    def ocupado(self, inicio: int, fin: int) -> bool:
+        # Solo pueden cruzarse las reservas que empiezan antes del fin del rango
+        i = bisect_left(self.inicios, fin)
+        return i > 0 and self.max_fin[i - 1] > inicio
+
+    def conflictos(self, inicio: int, fin: int) -> List[int]:
+        i = bisect_left(self.inicios, fin)
+        return [self.ids[j] for j in range(i) if self.fines[j] > inicio]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class MotorDisponibilidad:
+    """
+    Índice en memoria de los intervalos reservados por vehículo.
+
+    Responde qué vehículos de la flota están libres en un rango de fechas y
+    si una nueva reserva se cruza con otra. Los rangos son semiabiertos
+    ``[inicio, fin)``: el día de devolución queda libre para otro arriendo,
+    igual que el cálculo de días del arriendo (fin - inicio).
+
+    Solo los arriendos activos ocupan el vehículo, y la flota la forman los
+    vehículos que pueden arrendarse (no en mantención ni reparación).
+    """
+
+    def __init__(self) -> None:
+        self._flota: Set[int] = set()
+        self._reservas: Dict[int, _ReservasVehiculo] = {}
+        self._arriendos: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def cargar(self, flota: Iterable[int], reservas: Iterable[Tuple[int, int, Fecha, Fecha]]) -> None:
+        """
+        Reemplaza el contenido del índice.
+
+        Args:
+            flota (Iterable[int]): IDs de los vehículos arrendables
+            reservas (Iterable[Tuple[int, int, Fecha, Fecha]]): (id_arriendo, id_vehiculo, inicio, fin)
+                de los arriendos activos
+        """
+        with self._lock:
+            self._flota = set(flota)
+            self._reservas = {}
+            self._arriendos = {}
+            for id_arriendo, id_vehiculo, inicio, fin in reservas:
+                try:
+                    self._agregar(id_arriendo, id_vehiculo, *_rango(inicio, fin))
+                except ValueError:
+                    logger.warning("Arriendo %s con fechas inválidas (%s - %s); se ignora", id_arriendo, inicio, fin)
+
+    def reservar(self, id_arriendo: int, id_vehiculo: int, inicio: Fecha, fin: Fecha) -> None:
+        """
+        Registra un arriendo activo en el índice (reemplaza uno con el mismo ID).
+
+        Raises:
+            ValueError: Si fin no es posterior a inicio
+        """
+        a, b = _rango(inicio, fin)
+        with self._lock:
+            self._quitar(id_arriendo)
+            self._agregar(id_arriendo, id_vehiculo, a, b)
+
+    def liberar(self, id_arriendo: int) -> bool:
+        """
+        Quita un arriendo del índice (al cancelarlo o finalizarlo).
+
+        Returns:
+            bool: True si el arriendo estaba en el índice
+        """
+        with self._lock:
+            return self._quitar(id_arriendo)
+
+    def actualizarVehiculo(self, id_vehiculo: int, estado: str) -> None:
+        """
+        Agrega el vehículo a la flota o lo saca según su estado (al crearlo o editarlo).
+
+        Sus reservas se conservan: un vehículo en mantención puede tener
+        arriendos activos que vuelven a contar si regresa a la flota.
+
+        Args:
+            id_vehiculo (int): ID del vehículo
+            estado (str): Estado actual del vehículo
+        """
+        with self._lock:
+            if estado in ESTADOS_ARRENDABLES:
+                self._flota.add(id_vehiculo)
+            else:
+                self._flota.discard(id_vehiculo)
+
+    def quitarVehiculo(self, id_vehiculo: int) -> None:
+        """Saca un vehículo eliminado de la flota junto con sus reservas."""
+        with self._lock:
+            self._flota.discard(id_vehiculo)
+            reservas = self._reservas.pop(id_vehiculo, None)
+            for id_arriendo in (reservas.ids if reservas else ()):
+                self._arriendos.pop(id_arriendo, None)
+
+    def estaDisponible(self, id_vehiculo: int, inicio: Fecha, fin: Fecha) -> bool:
+        """
+        Indica si un vehículo de la flota está libre en todo el rango.
+
+        Raises:
+            ValueError: Si fin no es posterior a inicio
+        """
+        a, b = _rango(inicio, fin)
+        with self._lock:
+            if id_vehiculo not in self._flota:
+                return False
+            reservas = self._reservas.get(id_vehiculo)
+            return reservas is None or not reservas.ocupado(a, b)
+
+    def conflictos(self, id_vehiculo: int, inicio: Fecha, fin: Fecha) -> List[int]:
+        """
+        Obtiene los arriendos del vehículo que se cruzan con el rango.
+
+        Returns:
+            List[int]: IDs de los arriendos en conflicto
+        """
+        a, b = _rango(inicio, fin)
+        with self._lock:
+            reservas = self._reservas.get(id_vehiculo)
+            return reservas.conflictos(a, b) if reservas else []
+
+    def disponibles(self, inicio: Fecha, fin: Fecha) -> List[int]:
+        """
+        Obtiene los vehículos de la flota libres en todo el rango.
+
+        Returns:
+            List[int]: IDs de vehículos ordenados
+
+        Raises:
+            ValueError: Si fin no es posterior a inicio
+        """
+        a, b = _rango(inicio, fin)
+        with self._lock:
+            reservas = self._reservas
+            libres = [v for v in self._flota
+                      if v not in reservas or not reservas[v].ocupado(a, b)]
+        libres.sort()
+        return libres
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene el tamaño del índice.
+
+        Returns:
+            Dict[str, int]: vehiculos (flota), con_reservas y reservas
+        """
+        with self._lock:
+            return {
+                'vehiculos': len(self._flota),
+                'con_reservas': len(self._reservas),
+                'reservas': len(self._arriendos),
+            }
+
+    def _agregar(self, id_arriendo: int, id_vehiculo: int, inicio: int, fin: int) -> None:
+        self._reservas.setdefault(id_vehiculo, _ReservasVehiculo()).agregar(id_arriendo, inicio, fin)
+        self._arriendos[id_arriendo] = id_vehiculo
+
+    def _quitar(self, id_arriendo: int) -> bool:
+        id_vehiculo = self._arriendos.pop(id_arriendo, None)
+        if id_vehiculo is None:
+            return False
+        reservas = self._reservas[id_vehiculo]
+        reservas.quitar(id_arriendo)
+        if not reservas:
+            del self._reservas[id_vehiculo]
+        return True
+
+
+_motor: Optional[MotorDisponibilidad] = None
+_motor_cargado = 0.0
+_motor_lock = threading.Lock()
+# Solo un hilo recarga a la vez; la carga corre sin tomar _motor_lock
+_carga_lock = threading.Lock()
+# Cambios aplicados mientras se carga un índice nuevo, para repetirlos sobre él
+_pendientes: Optional[List[Callable[[MotorDisponibilidad], None]]] = None
+# Aumenta al invalidar: una carga que empezó antes no se considera vigente
+_generacion = 0
+
+
+def _ttl_motor() -> float:
+    try:
+        return float(os.environ.get("DISPONIBILIDAD_TTL", "30"))
+    except ValueError:
+        return 30.0
+
+
+def _vigente() -> bool:
+    return _motor is not None and time.monotonic() - _motor_cargado <= _ttl_motor()
+
+
+def _cargar_desde_bd() -> MotorDisponibilidad:
+    """Arma el índice con la flota arrendable y los arriendos activos."""
+    motor = MotorDisponibilidad()
+    with DaoVehiculo() as daovehiculo:
+        flota = daovehiculo.listarIdsArrendables()
+    with DaoArriendo() as daoarriendo:
+        reservas = daoarriendo.listarReservasActivas()
+    motor.cargar(flota, reservas)
+    logger.info("Índice de disponibilidad cargado: %s", motor.estadisticas())
+    return motor
+
+
+def obtener_motor_disponibilidad() -> MotorDisponibilidad:
+    """
+    Obtiene el índice de disponibilidad compartido, cargándolo si hace falta.
+
+    Las escrituras de este proceso lo actualizan al instante (ver
+    `actualizar_motor_disponibilidad`), pero las de otros procesos o
+    sesiones (cancelaciones, vehículos nuevos, cambios de estado) no le
+    llegan: por eso se vuelve a cargar desde la base cuando tiene más de
+    DISPONIBILIDAD_TTL segundos (default 30), que es el desfase máximo de
+    lo que muestra. Las reservas no dependen de él: `registrarArriendo`
+    siempre verifica en la base.
+
+    La recarga se arma fuera del candado y luego reemplaza al índice
+    anterior; mientras tanto los demás hilos siguen usando el anterior.
+    Solo espera quien no tiene ningún índice cargado.
+
+    Returns:
+        MotorDisponibilidad: Índice compartido por el proceso
+    """
+    global _motor, _motor_cargado, _pendientes
+    motor = _motor
+    if _vigente():
+        return motor
+    if motor is not None and not _carga_lock.acquire(blocking=False):
+        # Otro hilo ya lo está recargando
+        return motor
+    if motor is None:
+        _carga_lock.acquire()
+    try:
+        if _vigente():
+            return _motor
+        with _motor_lock:
+            _pendientes = []
+            generacion = _generacion
+        try:
+            nuevo = _cargar_desde_bd()
+        except BaseException:
+            with _motor_lock:
+                _pendientes = None
+            raise
+        with _motor_lock:
+            completo = all([_aplicar(nuevo, cambio) for cambio in _pendientes])
+            _pendientes = None
+            _motor = nuevo
+            # Si se invalidó durante la carga, puede no reflejar esa escritura: vence de inmediato
+            vigente = completo and generacion == _generacion
+            _motor_cargado = time.monotonic() if vigente else float('-inf')
+        return nuevo
+    finally:
+        _carga_lock.release()
+
+
+def motor_disponibilidad_cargado() -> Optional[MotorDisponibilidad]:
+    """Obtiene el índice compartido solo si ya fue cargado (no consulta la base de datos)."""
+    return _motor
+
+
+def actualizar_motor_disponibilidad(cambio: Callable[[MotorDisponibilidad], None]) -> None:
+    """
+    Aplica una escritura confirmada al índice compartido, sin recargarlo.
+
+    Si el índice no está cargado no hace nada (la próxima carga ya la lee de
+    la base). Si se está recargando, el cambio también se aplica al índice
+    nuevo. Si el cambio falla, el índice se descarta para recargarlo.
+
+    Args:
+        cambio (Callable[[MotorDisponibilidad], None]): Por ejemplo
+            ``lambda m: m.liberar(id_arriendo)``; debe poder repetirse
+    """
+    global _motor
+    with _motor_lock:
+        if _pendientes is not None:
+            _pendientes.append(cambio)
+        if _motor is not None and not _aplicar(_motor, cambio):
+            _motor = None
+
+
+def _aplicar(motor: MotorDisponibilidad, cambio: Callable[[MotorDisponibilidad], None]) -> bool:
+    try:
+        cambio(motor)
+        return True
+    except Exception as e:
+        logger.warning("No se pudo actualizar el índice de disponibilidad (%s); se recargará", e)
+        return False
+
+
+def invalidar_motor_disponibilidad() -> None:
+    """
+    Descarta el índice compartido para que se recargue en la próxima consulta.
+
+    Solo para cuando se detecta que el índice no coincide con la base; las
+    escrituras propias se aplican con `actualizar_motor_disponibilidad`.
+    """
+    global _motor, _generacion
+    with _motor_lock:
+        _motor = None
+        _generacion += 1
+
+
+def configurar_motor_disponibilidad(motor: Optional[MotorDisponibilidad]) -> Optional[MotorDisponibilidad]:
+    """
+    Reemplaza el índice compartido (por ejemplo, para pruebas).
+
+    Args:
+        motor (Optional[MotorDisponibilidad]): Nuevo índice, o None para recargar desde la base de datos
+
+    Returns:
+        Optional[MotorDisponibilidad]: El índice anterior
+    """
+    global _motor, _motor_cargado
+    with _motor_lock:
+        anterior = _motor
+        _motor = motor
+        _motor_cargado = time.monotonic()
+    return anterior
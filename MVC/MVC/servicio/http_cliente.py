@@ -0,0 +1,139 @@
+# servicio/http_cliente.py
+import atexit
+import threading
+import logging
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class ClienteHTTP:
+    """
+    Cliente HTTP con sesión persistente (keep-alive) para las APIs externas.
+
+    Todas las consultas comparten una ``requests.Session`` con un
+    ``HTTPAdapter`` montado, de modo que las conexiones TCP/TLS se
+    reutilizan entre llamadas e hilos. Los errores 5xx se reintentan con
+    espera exponencial antes de entregar la respuesta al llamador.
+
+    Attributes:
+        pool_conexiones (int): Cantidad de hosts distintos con pool propio
+        pool_maximo (int): Conexiones reutilizables por host
+    """
+
+    def __init__(self, pool_conexiones: int = 4, pool_maximo: int = 10,
+                 reintentos: int = 3, backoff: float = 0.5) -> None:
+        """
+        Crea la sesión y monta el adaptador con la política de reintentos.
+
+        Args:
+            pool_conexiones (int): Pools de conexiones (uno por host)
+            pool_maximo (int): Conexiones guardadas por pool
+            reintentos (int): Reintentos ante respuestas 500, 502, 503 y 504
+            backoff (float): Factor de espera exponencial entre reintentos (segundos)
+        """
+        self.pool_conexiones = pool_conexiones
+        self.pool_maximo = pool_maximo
+        politica = Retry(
+            total=reintentos,
+            connect=1,
+            read=1,
+            status=reintentos,
+            backoff_factor=backoff,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        self._adaptador = HTTPAdapter(pool_connections=pool_conexiones,
+                                      pool_maxsize=pool_maximo,
+                                      max_retries=politica)
+        self._sesion = requests.Session()
+        self._sesion.mount("https://", self._adaptador)
+        self._sesion.mount("http://", self._adaptador)
+        self._lock = threading.Lock()
+        self._solicitudes = 0
+        self._cerrado = False
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Realiza una petición GET usando la sesión compartida.
+
+        Args:
+            url (str): URL a consultar
+            **kwargs: Parámetros adicionales de ``requests`` (timeout, params, ...)
+
+        Returns:
+            requests.Response: Respuesta (tras los reintentos que correspondan)
+        """
+        with self._lock:
+            self._solicitudes += 1
+        return self._sesion.get(url, **kwargs)
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de uso de conexiones.
+
+        ``nuevas`` son las conexiones TCP abiertas y ``reutilizadas`` las
+        peticiones (incluidos reintentos) que viajaron por una conexión ya abierta.
+
+        Returns:
+            Dict[str, int]: solicitudes, peticiones, nuevas y reutilizadas
+        """
+        nuevas = 0
+        peticiones = 0
+        pools = self._adaptador.poolmanager.pools
+        for clave in list(pools.keys()):
+            pool = pools.get(clave)
+            if pool is not None:
+                nuevas += pool.num_connections
+                peticiones += pool.num_requests
+        return {
+            'solicitudes': self._solicitudes,
+            'peticiones': peticiones,
+            'nuevas': nuevas,
+            'reutilizadas': max(peticiones - nuevas, 0),
+        }
+
+    def cerrar(self) -> None:
+        """Cierra la sesión y todas sus conexiones abiertas."""
+        if self._cerrado:
+            return
+        self._cerrado = True
+        logger.debug("Cerrando cliente HTTP: %s", self.estadisticas())
+        self._sesion.close()
+
+
+_cliente: Optional[ClienteHTTP] = None
+_cliente_lock = threading.Lock()
+
+
+def obtener_cliente_http() -> ClienteHTTP:
+    """
+    Obtiene el cliente HTTP compartido, creándolo la primera vez.
+
+    Returns:
+        ClienteHTTP: Cliente compartido por todo el proceso
+    """
+    global _cliente
+    if _cliente is None:
+        with _cliente_lock:
+            if _cliente is None:
+                _cliente = ClienteHTTP()
+    return _cliente
+
+
+def cerrar_cliente_http() -> None:
+    """Cierra el cliente HTTP compartido si fue creado (llamar al terminar el proceso)."""
+    global _cliente
+    with _cliente_lock:
+        anterior, _cliente = _cliente, None
+    if anterior is not None:
+        anterior.cerrar()
+
+
+# Respaldo por si el proceso termina sin pasar por el menú de salida
+atexit.register(cerrar_cliente_http)
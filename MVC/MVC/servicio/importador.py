@@ -0,0 +1,326 @@
+# servicio/importador.py
+import csv
+import os
+import time
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from dto.dto_cliente import ClienteDTO
+from dto.dto_user import UserDTO
+from dto.dto_vehiculo import VehiculoDTO
+from modelo.cliente import Cliente
+from modelo.user import User
+from modelo.vehiculo import Vehiculo
+from utils.encoder import Encoder, _rounds_configurados
+from utils.validador_formatos import (validar_run, validar_patente, validar_nombre, validar_direccion,
+                                      validar_telefono, validar_precio, validar_año, validar_cargo,
+                                      validar_estado_vehiculo, validar_password_segura,
+                                      validar_entrada_sql)
+
+logger = logging.getLogger(__name__)
+
+
+def _entero_env(nombre: str, defecto: int) -> int:
+    try:
+        return int(os.environ.get(nombre, defecto))
+    except ValueError:
+        logger.warning("Valor inválido para %s; se usa %s", nombre, defecto)
+        return defecto
+
+
+#: Filas insertadas por `executemany` y confirmación; configurable con IMPORT_LOTE
+TAMANO_LOTE_IMPORTACION = _entero_env("IMPORT_LOTE", 1000)
+
+#: Columnas que nunca se guardan en el reporte de rechazos
+COLUMNAS_SENSIBLES = frozenset({'password'})
+
+COLUMNAS_VEHICULO = ('patente', 'marca', 'modelo', 'año', 'precio_diario')
+COLUMNAS_CLIENTE = ('run', 'nombre', 'apellido', 'direccion', 'telefono')
+COLUMNAS_EMPLEADO = ('run', 'nombre', 'apellido', 'password', 'cargo')
+
+
+def _hashear_password(clave: str, rounds: int) -> str:
+    """Encripta una contraseña (se ejecuta en un proceso del pool)."""
+    return Encoder(rounds).encode(clave)
+
+
+class FilaRechazada:
+    """
+    Fila del CSV que no se importó.
+
+    Attributes:
+        linea (int): Línea del archivo donde termina la fila
+        datos (Dict[str, str]): Valores de la fila (sin columnas sensibles)
+        motivo (str): Razón del rechazo
+    """
+
+    __slots__ = ('linea', 'datos', 'motivo')
+
+    def __init__(self, linea: int, datos: Dict[str, str], motivo: str) -> None:
+        self.linea = linea
+        self.datos = {k: v for k, v in datos.items() if k not in COLUMNAS_SENSIBLES}
+        self.motivo = motivo
+
+
+class ResultadoImportacion:
+    """
+    Resumen de una importación CSV.
+
+    Attributes:
+        entidad (str): Tipo de registro importado (vehiculos, clientes, empleados)
+        leidas (int): Filas de datos leídas del archivo
+        insertadas (int): Filas insertadas en la base de datos
+        rechazadas (List[FilaRechazada]): Filas no importadas con su motivo
+        lotes (int): Lotes enviados a la base de datos
+        segundos (float): Duración total de la importación
+    """
+
+    def __init__(self, entidad: str) -> None:
+        self.entidad = entidad
+        self.leidas = 0
+        self.insertadas = 0
+        self.rechazadas: List[FilaRechazada] = []
+        self.lotes = 0
+        self.segundos = 0.0
+
+    def rechazar(self, linea: int, datos: Dict[str, str], motivo: str) -> None:
+        """Registra una fila rechazada."""
+        self.rechazadas.append(FilaRechazada(linea, datos, motivo))
+
+    def getLeidas(self) -> int:
+        return self.leidas
+
+    def getInsertadas(self) -> int:
+        return self.insertadas
+
+    def getRechazadas(self) -> List[FilaRechazada]:
+        return self.rechazadas
+
+    def getSegundos(self) -> float:
+        return self.segundos
+
+    def resumen(self) -> str:
+        """Texto de una línea con los totales de la importación."""
+        return (f"{self.entidad}: {self.leidas} leídas, {self.insertadas} insertadas, "
+                f"{len(self.rechazadas)} rechazadas en {self.segundos:.2f} s ({self.lotes} lotes)")
+
+    def escribirRechazos(self, ruta: str) -> None:
+        """
+        Guarda las filas rechazadas en un CSV (línea, motivo y columnas originales).
+
+        Args:
+            ruta (str): Archivo de salida
+        """
+        columnas: List[str] = []
+        for rechazada in self.rechazadas:
+            columnas.extend(c for c in rechazada.datos if c not in columnas)
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=['linea', 'motivo'] + columnas,
+                                      restval='', extrasaction='ignore')
+            escritor.writeheader()
+            for rechazada in self.rechazadas:
+                escritor.writerow({'linea': rechazada.linea, 'motivo': rechazada.motivo, **rechazada.datos})
+
+
+def _validar(funcion: Callable[[str], Tuple[bool, str]], valor: str, columna: str) -> str:
+    """Aplica un validador de `validador_formatos` y lanza ValueError si falla."""
+    ok, mensaje = funcion(valor)
+    if not ok:
+        raise ValueError(f"{columna}: {mensaje}")
+    return mensaje
+
+
+def _texto_seguro(valor: str, columna: str, max_longitud: int = 100) -> str:
+    """Valida un texto libre con `validar_entrada_sql`."""
+    if not validar_entrada_sql(valor, max_longitud):
+        raise ValueError(f"{columna}: valor vacío, muy largo o sospechoso")
+    return valor
+
+
+class ImportadorCSV:
+    """
+    Importación masiva de vehículos, clientes y empleados desde CSV.
+
+    Las filas se leen de a una, se validan con las mismas funciones que usan
+    los menús y se insertan en lotes con `executemany` y una confirmación por
+    lote. Las filas inválidas, duplicadas en el archivo o rechazadas por la
+    base de datos se informan aparte sin detener la importación. Las
+    contraseñas de los empleados se encriptan en un pool de procesos.
+    """
+
+    def __init__(self, tamano_lote: Optional[int] = None, procesos: Optional[int] = None,
+                 vehiculodto: Optional[VehiculoDTO] = None, clientedto: Optional[ClienteDTO] = None,
+                 userdto: Optional[UserDTO] = None) -> None:
+        """
+        Inicializa el importador.
+
+        Args:
+            tamano_lote (Optional[int]): Filas por lote (default: TAMANO_LOTE_IMPORTACION)
+            procesos (Optional[int]): Procesos para bcrypt (default: núcleos disponibles)
+            vehiculodto (Optional[VehiculoDTO]): DTO de vehículos a usar
+            clientedto (Optional[ClienteDTO]): DTO de clientes a usar
+            userdto (Optional[UserDTO]): DTO de usuarios a usar
+        """
+        self.tamano_lote = max(1, tamano_lote or TAMANO_LOTE_IMPORTACION)
+        self.procesos = procesos or os.cpu_count() or 1
+        self.vehiculodto = vehiculodto or VehiculoDTO()
+        self.clientedto = clientedto or ClienteDTO()
+        self.userdto = userdto or UserDTO()
+
+    def importarVehiculos(self, ruta: str) -> ResultadoImportacion:
+        """
+        Importa vehículos desde un CSV.
+
+        Columnas: patente, marca, modelo, año, precio_diario y, opcional, estado.
+
+        Args:
+            ruta (str): Archivo CSV (UTF-8, con encabezado)
+
+        Returns:
+            ResultadoImportacion: Totales y filas rechazadas
+        """
+        return self._importar(ruta, 'vehiculos', COLUMNAS_VEHICULO, self._crearVehiculo,
+                              Vehiculo.getPatente, self.vehiculodto.agregarVehiculosLote)
+
+    def importarClientes(self, ruta: str) -> ResultadoImportacion:
+        """
+        Importa clientes desde un CSV.
+
+        Columnas: run, nombre, apellido, direccion, telefono.
+
+        Args:
+            ruta (str): Archivo CSV (UTF-8, con encabezado)
+
+        Returns:
+            ResultadoImportacion: Totales y filas rechazadas
+        """
+        return self._importar(ruta, 'clientes', COLUMNAS_CLIENTE, self._crearCliente,
+                              Cliente.getRun, self.clientedto.agregarClientesLote)
+
+    def importarEmpleados(self, ruta: str) -> ResultadoImportacion:
+        """
+        Importa empleados desde un CSV, encriptando las contraseñas en paralelo.
+
+        Columnas: run, nombre, apellido, password, cargo.
+
+        Args:
+            ruta (str): Archivo CSV (UTF-8, con encabezado)
+
+        Returns:
+            ResultadoImportacion: Totales y filas rechazadas
+        """
+        rounds = _rounds_configurados()
+        with ProcessPoolExecutor(max_workers=self.procesos) as pool:
+            def encriptar(usuarios: List[User]) -> None:
+                self._encriptarLote(pool, usuarios, rounds)
+            return self._importar(ruta, 'empleados', COLUMNAS_EMPLEADO, self._crearUsuario,
+                                  User.getRun, self.userdto.agregarUsuariosLote, encriptar)
+
+    def _importar(self, ruta: str, entidad: str, requeridas: Sequence[str],
+                  convertir: Callable[[Dict[str, str]], Any], clave: Callable[[Any], str],
+                  insertar: Callable[[List[Any]], List[Any]],
+                  preparar: Optional[Callable[[List[Any]], None]] = None) -> ResultadoImportacion:
+        """
+        Lee, valida e inserta por lotes las filas de un CSV.
+
+        Raises:
+            ValueError: Si al archivo le faltan columnas obligatorias
+        """
+        resultado = ResultadoImportacion(entidad)
+        inicio = time.perf_counter()
+        vistas: Dict[str, int] = {}
+        lote: List[Tuple[int, Dict[str, str], Any]] = []
+        with open(ruta, newline='', encoding='utf-8-sig') as archivo:
+            lector = csv.DictReader(archivo)
+            faltantes = [c for c in requeridas if c not in (lector.fieldnames or [])]
+            if faltantes:
+                raise ValueError(f"Faltan columnas en {ruta}: {', '.join(faltantes)}")
+            for fila in lector:
+                resultado.leidas += 1
+                linea = lector.line_num
+                try:
+                    modelo = convertir(fila)
+                except ValueError as e:
+                    resultado.rechazar(linea, fila, str(e))
+                    continue
+                k = clave(modelo)
+                if k in vistas:
+                    resultado.rechazar(linea, fila, f"Duplicado en el archivo (línea {vistas[k]})")
+                    continue
+                vistas[k] = linea
+                lote.append((linea, fila, modelo))
+                if len(lote) >= self.tamano_lote:
+                    self._escribirLote(lote, insertar, preparar, resultado)
+                    lote = []
+        if lote:
+            self._escribirLote(lote, insertar, preparar, resultado)
+        resultado.segundos = time.perf_counter() - inicio
+        logger.info("Importación de %s desde %s: %s", entidad, ruta, resultado.resumen())
+        return resultado
+
+    @staticmethod
+    def _escribirLote(lote: List[Tuple[int, Dict[str, str], Any]],
+                      insertar: Callable[[List[Any]], List[Any]],
+                      preparar: Optional[Callable[[List[Any]], None]],
+                      resultado: ResultadoImportacion) -> None:
+        """Inserta un lote y registra como rechazadas las filas que la base de datos no aceptó."""
+        modelos = [modelo for _, _, modelo in lote]
+        if preparar:
+            preparar(modelos)
+        rechazados = {id(modelo) for modelo in insertar(modelos)}
+        for linea, fila, modelo in lote:
+            if id(modelo) in rechazados:
+                resultado.rechazar(linea, fila, "Rechazado por la base de datos (¿ya existe?)")
+        resultado.insertadas += len(lote) - len(rechazados)
+        resultado.lotes += 1
+
+    def _encriptarLote(self, pool: Executor, usuarios: List[User], rounds: int) -> None:
+        """Reemplaza las contraseñas del lote por su hash bcrypt calculado en el pool."""
+        claves = [u.getPassword() for u in usuarios]
+        bloque = max(1, len(claves) // (self.procesos * 4))
+        hashes = pool.map(_hashear_password, claves, [rounds] * len(claves), chunksize=bloque)
+        for usuario, hash_password in zip(usuarios, hashes):
+            usuario.setPassword(hash_password)
+
+    @staticmethod
+    def _crearVehiculo(fila: Dict[str, str]) -> Vehiculo:
+        patente = (fila.get('patente') or '').upper().replace(" ", "").replace("-", "").strip()
+        _validar(validar_patente, patente, 'patente')
+        marca = _texto_seguro((fila.get('marca') or '').strip(), 'marca', 50)
+        modelo = _texto_seguro((fila.get('modelo') or '').strip(), 'modelo', 50)
+        año = (fila.get('año') or '').strip()
+        _validar(validar_año, año, 'año')
+        precio = (fila.get('precio_diario') or '').strip()
+        _validar(validar_precio, precio, 'precio_diario')
+        estado = (fila.get('estado') or '').strip().lower() or "disponible"
+        _validar(validar_estado_vehiculo, estado, 'estado')
+        return Vehiculo(patente=patente, marca=marca, modelo=modelo, año=int(año),
+                        precio_diario=float(precio), estado=estado)
+
+    @staticmethod
+    def _crearCliente(fila: Dict[str, str]) -> Cliente:
+        run = _validar(validar_run, fila.get('run') or '', 'run')
+        nombre = (fila.get('nombre') or '').strip()
+        apellido = (fila.get('apellido') or '').strip()
+        direccion = (fila.get('direccion') or '').strip()
+        telefono = (fila.get('telefono') or '').strip()
+        _validar(validar_nombre, nombre, 'nombre')
+        _validar(validar_nombre, apellido, 'apellido')
+        _validar(validar_direccion, direccion, 'direccion')
+        _validar(validar_telefono, telefono, 'telefono')
+        _texto_seguro(direccion, 'direccion')
+        return Cliente(run=run, nombre=nombre, apellido=apellido, direccion=direccion, telefono=telefono)
+
+    @staticmethod
+    def _crearUsuario(fila: Dict[str, str]) -> User:
+        run = _validar(validar_run, fila.get('run') or '', 'run')
+        nombre = (fila.get('nombre') or '').strip()
+        apellido = (fila.get('apellido') or '').strip()
+        password = fila.get('password') or ''
+        cargo = (fila.get('cargo') or '').strip().lower()
+        _validar(validar_nombre, nombre, 'nombre')
+        _validar(validar_nombre, apellido, 'apellido')
+        _validar(validar_password_segura, password, 'password')
+        _validar(validar_cargo, cargo, 'cargo')
+        return User(run=run, nombre=nombre, apellido=apellido, password=password, cargo=cargo)
@@ -1,9 +1,13 @@
 # servicio/indicador_service.py
 import requests
-from modelo.indicador import IndicadorEconomico
+import threading
+import time
+from modelo.indicador import IndicadorEconomico, SerieIndicador
+from servicio.cache_uf import obtener_cache_uf
+from servicio.http_cliente import obtener_cliente_http
 from datetime import datetime, timedelta
 import logging
-from typing import Optional
+from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +15,16 @@ class IndicadorService:
     """
     Servicio para obtener indicadores económicos (UF) de mindicador.cl.
     Implementa manejo de excepciones y búsqueda de fecha próxima.
+    Los valores obtenidos se guardan en una caché local persistente y las
+    consultas HTTP reutilizan conexiones mediante una sesión compartida.
     """
     
     BASE_URL: str = "https://mindicador.cl/api"
+    # Segundos antes de volver a descargar la serie del año en curso (los años pasados no cambian)
+    TTL_SERIE_ACTUAL: float = 3600.0
+    
+    _series: Dict[int, Tuple[SerieIndicador, float]] = {}
+    _series_lock = threading.Lock()
     
     @staticmethod
     def obtener_uf_por_fecha(fecha_str: str) -> Optional[IndicadorEconomico]:
@@ -21,6 +32,9 @@ class IndicadorService:
         Consulta el valor de la UF para una fecha específica.
         Si la fecha no tiene valor (ej: fin de semana), busca
         la fecha anterior más próxima disponible (Requisito ES3).
+        Las fechas ya consultadas se responden desde la caché sin red;
+        el resto se busca en la serie anual (una descarga por año) y solo
+        si la serie no está disponible se consulta día por día.
         
         Args:
             fecha_str (str): Fecha en formato YYYY-MM-DD.
@@ -38,9 +52,28 @@ class IndicadorService:
             print(f"❌ Error: Formato de fecha inválido {fecha_str}. Use YYYY-MM-DD.")
             return None
 
+        cache = obtener_cache_uf()
+        indicador = cache.obtener(fecha_str)
+        if indicador:
+            logger.debug("UF de %s obtenida desde caché: %s", fecha_str, indicador.getValor())
+            return indicador
+
         # Intentar buscar la UF hasta 7 días hacia atrás
         max_intentos = 7 
         
+        # Primero en la serie anual: búsqueda binaria local, sin más llamadas HTTP
+        indicador, series_disponibles = IndicadorService._buscar_en_series(fecha_dt, max_intentos)
+        if indicador:
+            logger.info("UF para la fecha %s obtenida de la serie anual: %s (%s)",
+                        fecha_str, indicador.getValor(), indicador.getFechaCorta())
+            cache.guardar(fecha_str, indicador)
+            return indicador
+        if series_disponibles:
+            logger.warning("No se encontró valor de UF en los últimos %d días.", max_intentos)
+            print(f"❌ Advertencia: No se encontró un valor de UF para la fecha {fecha_str} ni en los días cercanos.")
+            return None
+        
+        # Respaldo: consultar día por día si no se pudo descargar la serie
         for i in range(max_intentos):
             fecha_consulta_dt = fecha_dt - timedelta(days=i)
             fecha_formato_api = fecha_consulta_dt.strftime('%d-%m-%Y')
@@ -50,7 +83,7 @@ class IndicadorService:
             
             try:
                 # 1. Consumo de API (Requisito 3.1.2)
-                response = requests.get(url, timeout=10)
+                response = obtener_cliente_http().get(url, timeout=10)
                 response.raise_for_status()  # Lanza HTTPError para 4xx/5xx
 
                 # 2. Deserialización
@@ -62,6 +95,9 @@ class IndicadorService:
                 if indicador:
                     logger.info("UF encontrada para la fecha %s: %s", 
                                 fecha_consulta_dt.strftime('%Y-%m-%d'), indicador.getValor())
+                    cache.guardar(fecha_str, indicador)
+                    if i > 0:
+                        cache.guardar(fecha_consulta_dt.strftime('%Y-%m-%d'), indicador)
                     return indicador
                 else:
                     # La API respondió pero la data estaba vacía
@@ -99,4 +135,82 @@ class IndicadorService:
 
         logger.warning("No se encontró valor de UF en los últimos %d días.", max_intentos)
         print(f"❌ Advertencia: No se encontró un valor de UF para la fecha {fecha_str} ni en los días cercanos.")
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def cargar_serie_anual(año: int) -> Optional[SerieIndicador]:
+        """
+        Descarga (una vez) la serie completa de la UF de un año desde
+        ``/api/uf/{año}`` y la mantiene ordenada en memoria.
+        
+        Los años pasados se descargan una sola vez por proceso; el año en
+        curso se vuelve a descargar tras ``TTL_SERIE_ACTUAL`` segundos.
+        
+        Args:
+            año (int): Año de la serie
+        
+        Returns:
+            Optional[SerieIndicador]: Serie del año, o None si no se pudo obtener
+        """
+        with IndicadorService._series_lock:
+            memo = IndicadorService._series.get(año)
+        if memo and (año < datetime.now().year or
+                     time.time() - memo[1] < IndicadorService.TTL_SERIE_ACTUAL):
+            return memo[0]
+        
+        url = f"{IndicadorService.BASE_URL}/uf/{año}"
+        logger.info("Descargando serie anual de UF: %s", url)
+        try:
+            response = obtener_cliente_http().get(url, timeout=10)
+            response.raise_for_status()
+            serie = SerieIndicador.from_json(response.json())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("No se pudo obtener la serie UF de %s: %s", año, str(e))
+            return None
+        
+        with IndicadorService._series_lock:
+            IndicadorService._series[año] = (serie, time.time())
+        logger.info("Serie UF %s cargada: %d valores", año, len(serie))
+        return serie
+
+    @staticmethod
+    def _buscar_en_series(fecha_dt: datetime, max_dias: int) -> Tuple[Optional[IndicadorEconomico], bool]:
+        """
+        Busca la UF de la fecha (o la anterior más próxima dentro de ``max_dias``)
+        en las series anuales, incluyendo el año anterior si la ventana lo cruza.
+        
+        Returns:
+            Tuple[Optional[IndicadorEconomico], bool]: El indicador encontrado y si
+            todas las series necesarias estaban disponibles
+        """
+        fecha = fecha_dt.strftime('%Y-%m-%d')
+        desde_dt = fecha_dt - timedelta(days=max_dias - 1)
+        desde = desde_dt.strftime('%Y-%m-%d')
+        for año in range(fecha_dt.year, desde_dt.year - 1, -1):
+            serie = IndicadorService.cargar_serie_anual(año)
+            if serie is None:
+                return None, False
+            indicador = serie.buscarAnterior(fecha)
+            if indicador:
+                return (indicador if indicador.getFechaCorta() >= desde else None), True
+        return None, True
+
+    @staticmethod
+    def estadisticas_cache() -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché de UF (hits, misses, expirados, ...).
+
+        Returns:
+            Dict[str, int]: Estadísticas de la caché compartida
+        """
+        return obtener_cache_uf().estadisticas()
+
+    @staticmethod
+    def estadisticas_http() -> Dict[str, int]:
+        """
+        Obtiene los contadores de conexiones HTTP (nuevas vs reutilizadas).
+
+        Returns:
+            Dict[str, int]: Estadísticas del cliente HTTP compartido
+        """
+        return obtener_cliente_http().estadisticas()
\ No newline at end of file
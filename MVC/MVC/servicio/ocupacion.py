@@ -0,0 +1,221 @@
+# servicio/ocupacion.py
+import csv
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from servicio.analitica import DatasetArriendos, Fecha, _EPOCA, _ordinal, _requerir_numpy, np
+
+logger = logging.getLogger(__name__)
+
+# Estados que ocupan el vehículo (los cancelados no cuentan)
+ESTADOS_OCUPAN: Tuple[str, ...] = ('activo', 'finalizado')
+
+
+class Utilizacion(NamedTuple):
+    """Días arrendados sobre días disponibles en una ventana."""
+    dias_ocupados: int
+    dias_totales: int
+
+    @property
+    def porcentaje(self) -> float:
+        return 100.0 * self.dias_ocupados / self.dias_totales if self.dias_totales else 0.0
+
+
+class MatrizOcupacion:
+    """
+    Ocupación de la flota como matriz vehículo × día.
+
+    ``ocupado[i, d]`` es True si el vehículo ``ids_vehiculo[i]`` estaba
+    arrendado el día ``desde + d``. Los arriendos son rangos semiabiertos
+    ``[inicio, fin)``, igual que en `servicio.disponibilidad`: el día de
+    devolución queda libre. La matriz se llena sin recorrer arriendos en
+    Python: se marca +1 en el día de inicio y -1 en el de fin de cada
+    intervalo y una suma acumulada por fila deja los días cubiertos.
+
+    Attributes:
+        ids_vehiculo (np.ndarray): IDs de vehículo ordenados (una fila cada uno)
+        patentes (List[str]): Patente de cada fila
+        marcas (np.ndarray): Marca de cada fila
+        desde (int): Ordinal del primer día (columna 0)
+        ocupado (np.ndarray): Matriz booleana (vehículos × días)
+    """
+
+    def __init__(self, ids_vehiculo, patentes, marcas, desde: int, ocupado) -> None:
+        _requerir_numpy()
+        self.ids_vehiculo = np.asarray(ids_vehiculo, dtype=np.int32)
+        self.patentes = list(patentes)
+        self.marcas = np.asarray(marcas, dtype=object)
+        self.desde = desde
+        self.ocupado = np.asarray(ocupado, dtype=bool)
+
+    @classmethod
+    def desdeDataset(cls, dataset: DatasetArriendos, vehiculos: Iterable[Tuple[int, str, str]],
+                     desde: Fecha, hasta: Fecha) -> 'MatrizOcupacion':
+        """
+        Construye la matriz de `[desde, hasta)` a partir de los arriendos.
+
+        Los arriendos cancelados, los que quedan fuera de la ventana y los de
+        vehículos que no están en `vehiculos` se ignoran; los que cruzan un
+        borde se recortan.
+
+        Args:
+            dataset (DatasetArriendos): Arriendos (ver `cargar_dataset_arriendos`)
+            vehiculos (Iterable[Tuple[int, str, str]]): (id_vehiculo, patente, marca) de cada vehículo
+            desde (Fecha): Primer día de la ventana (incluido)
+            hasta (Fecha): Último día de la ventana (excluido)
+
+        Returns:
+            MatrizOcupacion: Matriz de la flota en la ventana
+
+        Raises:
+            ValueError: Si `hasta` no es posterior a `desde`
+        """
+        _requerir_numpy()
+        a, b = _ordinal(desde), _ordinal(hasta)
+        if b <= a:
+            raise ValueError("La fecha de fin debe ser posterior a la fecha de inicio")
+        flota = sorted({vehiculo[0]: vehiculo for vehiculo in vehiculos}.values())
+        ids = np.array([id_vehiculo for id_vehiculo, _, _ in flota], dtype=np.int32)
+        dias = b - a
+
+        arriendos = dataset.filtrar(estados=ESTADOS_OCUPAN)
+        inicios = np.clip(arriendos.inicio.astype(np.int64) - a, 0, dias)
+        fines = np.clip(arriendos.fin.astype(np.int64) - a, 0, dias)
+        validos = (fines > inicios) & np.isin(arriendos.id_vehiculo, ids)
+        filas = np.searchsorted(ids, arriendos.id_vehiculo[validos]).astype(np.int64)
+        inicios, fines = inicios[validos], fines[validos]
+
+        # Una columna extra recibe los -1 de los arriendos que terminan en `hasta`
+        ancho = dias + 1
+        marcas_dia = (np.bincount(filas * ancho + inicios, minlength=len(ids) * ancho)
+                      - np.bincount(filas * ancho + fines, minlength=len(ids) * ancho))
+        ocupado = marcas_dia.reshape(len(ids), ancho)[:, :dias].cumsum(axis=1) > 0
+        logger.debug("Matriz de ocupación: %d vehículos × %d días, %d arriendos", len(ids), dias, len(filas))
+        return cls(ids, [patente for _, patente, _ in flota], [marca for _, _, marca in flota], a, ocupado)
+
+    @property
+    def dias(self) -> int:
+        return self.ocupado.shape[1]
+
+    def _columnas(self, desde: Optional[Fecha], hasta: Optional[Fecha]) -> slice:
+        a = 0 if desde is None else min(max(_ordinal(desde) - self.desde, 0), self.dias)
+        b = self.dias if hasta is None else min(max(_ordinal(hasta) - self.desde, a), self.dias)
+        return slice(a, b)
+
+    def utilizacionPorVehiculo(self, desde: Optional[Fecha] = None,
+                               hasta: Optional[Fecha] = None) -> Dict[int, Utilizacion]:
+        """
+        Obtiene la utilización de cada vehículo en una ventana.
+
+        Args:
+            desde (Optional[Fecha]): Primer día (default: inicio de la matriz)
+            hasta (Optional[Fecha]): Día final excluido (default: fin de la matriz)
+
+        Returns:
+            Dict[int, Utilizacion]: Utilización por ID de vehículo
+        """
+        columnas = self._columnas(desde, hasta)
+        ocupados = np.count_nonzero(self.ocupado[:, columnas], axis=1)
+        total = columnas.stop - columnas.start
+        return {id_vehiculo: Utilizacion(n, total)
+                for id_vehiculo, n in zip(self.ids_vehiculo.tolist(), ocupados.tolist())}
+
+    def utilizacionPorMarca(self, desde: Optional[Fecha] = None,
+                            hasta: Optional[Fecha] = None) -> Dict[str, Utilizacion]:
+        """
+        Obtiene la utilización agregada de cada marca (días-vehículo).
+
+        Args:
+            desde (Optional[Fecha]): Primer día (default: inicio de la matriz)
+            hasta (Optional[Fecha]): Día final excluido (default: fin de la matriz)
+
+        Returns:
+            Dict[str, Utilizacion]: Utilización por marca
+        """
+        columnas = self._columnas(desde, hasta)
+        ocupados = np.count_nonzero(self.ocupado[:, columnas], axis=1)
+        nombres, codigos, vehiculos = np.unique(self.marcas.astype(str), return_inverse=True, return_counts=True)
+        por_marca = np.bincount(codigos, weights=ocupados, minlength=len(nombres))
+        total = columnas.stop - columnas.start
+        return {marca: Utilizacion(int(n), int(v) * total)
+                for marca, n, v in zip(nombres.tolist(), por_marca.tolist(), vehiculos.tolist())}
+
+    def utilizacionFlota(self, desde: Optional[Fecha] = None, hasta: Optional[Fecha] = None) -> Utilizacion:
+        """
+        Obtiene la utilización de toda la flota (días-vehículo arrendados / totales).
+
+        Args:
+            desde (Optional[Fecha]): Primer día (default: inicio de la matriz)
+            hasta (Optional[Fecha]): Día final excluido (default: fin de la matriz)
+
+        Returns:
+            Utilizacion: Utilización de la flota
+        """
+        columnas = self._columnas(desde, hasta)
+        return Utilizacion(int(np.count_nonzero(self.ocupado[:, columnas])),
+                           len(self.ids_vehiculo) * (columnas.stop - columnas.start))
+
+    def meses(self) -> List[Tuple[str, int, int]]:
+        """
+        Obtiene los meses que cubre la matriz.
+
+        Returns:
+            List[Tuple[str, int, int]]: ('YYYY-MM', primera columna, columna final excluida)
+        """
+        dias = np.arange(self.desde, self.desde + self.dias, dtype=np.int64) - _EPOCA
+        meses = dias.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        inicios = np.flatnonzero(np.concatenate(([True], meses[1:] != meses[:-1])))
+        fines = np.append(inicios[1:], self.dias)
+        return [(f"{1970 + mes // 12}-{mes % 12 + 1:02d}", int(i), int(f))
+                for mes, i, f in zip(meses[inicios].tolist(), inicios.tolist(), fines.tolist())]
+
+    def utilizacionMensual(self) -> Tuple[List[str], 'np.ndarray']:
+        """
+        Obtiene la fracción de días arrendados de cada vehículo en cada mes.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Meses ('YYYY-MM') y matriz vehículos × meses
+            con valores entre 0 y 1 (los meses de los bordes cuentan solo los días
+            dentro de la ventana)
+        """
+        nombres, ocupados, largos = self._ocupadosPorMes()
+        return nombres, ocupados / largos
+
+    def _ocupadosPorMes(self) -> Tuple[List[str], 'np.ndarray', 'np.ndarray']:
+        meses = self.meses()
+        inicios = np.array([i for _, i, _ in meses])
+        largos = np.array([f - i for _, i, f in meses])
+        if len(self.ids_vehiculo):
+            ocupados = np.add.reduceat(self.ocupado, inicios, axis=1, dtype=np.int32)
+        else:
+            ocupados = np.zeros((0, len(meses)), dtype=np.int32)
+        return [m for m, _, _ in meses], ocupados, largos
+
+    def exportarCsv(self, ruta: str) -> int:
+        """
+        Guarda la utilización mensual por vehículo en un CSV.
+
+        Una fila por vehículo (id, patente, marca, total de la ventana y un
+        porcentaje por mes) más una fila final con la flota completa.
+
+        Args:
+            ruta (str): Archivo de salida
+
+        Returns:
+            int: Filas de vehículos escritas
+        """
+        meses, ocupados, largos = self._ocupadosPorMes()
+        totales = self.utilizacionPorVehiculo()
+        flota_mensual = [Utilizacion(int(n), len(self.ids_vehiculo) * int(largo))
+                         for n, largo in zip(ocupados.sum(axis=0).tolist(), largos.tolist())]
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(['id_vehiculo', 'patente', 'marca', 'utilizacion'] + meses)
+            for i, id_vehiculo in enumerate(self.ids_vehiculo.tolist()):
+                escritor.writerow([id_vehiculo, self.patentes[i], self.marcas[i],
+                                   f"{totales[id_vehiculo].porcentaje:.1f}"]
+                                  + [f"{100 * n / largo:.1f}" for n, largo in zip(ocupados[i].tolist(), largos.tolist())])
+            escritor.writerow(['', '', 'FLOTA', f"{self.utilizacionFlota().porcentaje:.1f}"]
+                              + [f"{mes.porcentaje:.1f}" for mes in flota_mensual])
+        logger.info("Utilización de la flota exportada a %s (%d vehículos)", ruta, len(self.ids_vehiculo))
+        return len(self.ids_vehiculo)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Fake pymysql connection and pool swap shared by the DB-free test suites
+
+`ConexionFalsa` records every statement and answers it from a script of
+sql-fragment -> rows (or from a custom `responder`); `ConPoolFalso`
+installs it as the only connection of the shared pool for one test.
+"""
+
+import time
+
+from conex.conn import PoolConexiones, configurar_pool
+
+_ESCRITURAS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+class CursorFalso:
+    """Cursor that records statements on its connection and returns the rows it answers"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.lastrowid = conn.lastrowid
+        self.pendientes = []
+        self.lotes = []
+        self.cerrado = False
+
+    def execute(self, sql, params=None):
+        self.conn.sentencias.append((" ".join(sql.split()), params))
+        if self.conn.error is not None:
+            raise self.conn.error
+        if self.conn.demora:
+            time.sleep(self.conn.demora)
+        self.pendientes = list(self.conn.responder(sql, params) or [])
+        if sql.lstrip().upper().startswith(_ESCRITURAS):
+            return self.conn.afectadas
+        return len(self.pendientes)
+
+    def executemany(self, sql, filas):
+        for params in filas:
+            self.execute(sql, params)
+        return len(filas)
+
+    def fetchone(self):
+        return self.pendientes.pop(0) if self.pendientes else None
+
+    def fetchmany(self, size=1):
+        self.lotes.append(size)
+        lote, self.pendientes = self.pendientes[:size], self.pendientes[size:]
+        return lote
+
+    def fetchall(self):
+        lote, self.pendientes = self.pendientes, []
+        return lote
+
+    def close(self):
+        self.cerrado = True
+
+
+class ConexionFalsa:
+    """
+    pymysql connection stand-in.
+
+    Args:
+        guion (dict): sql fragment -> rows; the last fragment contained in the statement wins
+        responder (callable): (sql, params) -> rows, replaces the script lookup
+        afectadas (int): Value returned by execute() for INSERT/UPDATE/DELETE
+        lastrowid (int): Id reported by cursors after an INSERT
+        demora (float): Seconds each execute() sleeps
+    """
+
+    def __init__(self, guion=None, responder=None, afectadas=1, lastrowid=42, demora=0.0):
+        self.guion = dict(guion or {})
+        if responder is not None:
+            self.responder = responder
+        self.afectadas = afectadas
+        self.lastrowid = lastrowid
+        self.demora = demora
+        self.error = None
+        self.sentencias = []
+        self.cursores = []
+        self.open = True
+        self.ping_falla = False
+        self.pings = 0
+        self.begins = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    @property
+    def textos(self):
+        """SQL of every statement executed, whitespace-normalised"""
+        return [sql for sql, _ in self.sentencias]
+
+    def responder(self, sql, params):
+        filas = []
+        for fragmento, respuesta in self.guion.items():
+            if fragmento in sql:
+                filas = respuesta
+        return filas
+
+    def cursor(self, clase=None):
+        cursor = CursorFalso(self)
+        self.cursores.append(cursor)
+        return cursor
+
+    def ping(self, reconnect=True):
+        self.pings += 1
+        if self.ping_falla:
+            raise ConnectionError("server has gone away")
+
+    def begin(self):
+        self.begins += 1
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+
+
+class ConPoolFalso:
+    """TestCase mixin: serves the shared pool from a single fake connection during the test"""
+
+    def instalar_conexion(self, conn=None):
+        """
+        Makes `conn` (a new ConexionFalsa by default) the pool's only connection.
+
+        The previous pool is restored when the test ends.
+
+        Returns:
+            ConexionFalsa: The installed connection, also kept in `self.conn`
+        """
+        self.conn = conn if conn is not None else ConexionFalsa()
+        anterior = configurar_pool(PoolConexiones(lambda: self.conn, min_size=0, max_size=1))
+        self.addCleanup(configurar_pool, anterior)
+        return self.conn
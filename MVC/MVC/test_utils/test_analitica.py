@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the columnar arriendo dataset in servicio/analitica.py
+"""
+
+import random
+import sys
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from servicio.analitica import DatasetArriendos, ESTADOS_ARRIENDO, np
+
+BASE = date(2024, 1, 1).toordinal()
+
+
+def filas_aleatorias(n, semilla=7):
+    azar = random.Random(semilla)
+    filas = []
+    for id_arriendo in range(1, n + 1):
+        inicio = BASE + azar.randrange(400)
+        filas.append((id_arriendo, azar.randrange(1, 40), azar.randrange(1, 200), azar.randrange(1, 6),
+                      inicio, inicio + azar.randint(1, 15), azar.randrange(10000, 5000000),
+                      azar.randint(1, len(ESTADOS_ARRIENDO))))
+    return filas
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestDatasetArriendos(unittest.TestCase):
+    """Vectorized group-bys match a plain Python loop"""
+
+    def setUp(self):
+        self.filas = filas_aleatorias(2000)
+        self.dataset = DatasetArriendos.desdeFilas(iter(self.filas))
+
+    def _esperado(self, clave):
+        totales = defaultdict(lambda: [0, 0, 0])
+        for fila in self.filas:
+            grupo = totales[clave(fila)]
+            grupo[0] += 1
+            grupo[1] += fila[6]
+            grupo[2] += fila[5] - fila[4]
+        return {k: (n, centavos / 100, dias) for k, (n, centavos, dias) in totales.items()}
+
+    def test_group_by_vehicle_and_employee(self):
+        self.assertEqual(len(self.dataset), 2000)
+        self.assertEqual({k: tuple(v) for k, v in self.dataset.agruparPorVehiculo().items()},
+                         self._esperado(lambda fila: fila[1]))
+        self.assertEqual({k: tuple(v) for k, v in self.dataset.agruparPorEmpleado().items()},
+                         self._esperado(lambda fila: fila[3]))
+
+    def test_group_by_month_and_state(self):
+        por_mes = self._esperado(lambda fila: date.fromordinal(fila[4]).strftime('%Y-%m'))
+        self.assertEqual({k: tuple(v) for k, v in self.dataset.agruparPorMes().items()}, por_mes)
+        self.assertEqual(set(self.dataset.agruparPorEstado()), set(ESTADOS_ARRIENDO))
+
+    def test_sparse_keys_use_sorted_path(self):
+        filas = [(1, 10, 1, 1, BASE, BASE + 2, 150, 1), (2, 10 ** 9, 1, 1, BASE, BASE + 1, 250, 2),
+                 (3, 10, 1, 2, BASE, BASE + 3, 199, 1)]
+        grupos = DatasetArriendos.desdeFilas(iter(filas)).agruparPorVehiculo()
+        self.assertEqual(grupos, {10: (2, 3.49, 5), 10 ** 9: (1, 2.5, 1)})
+
+    def test_fixed_point_totals_are_exact(self):
+        filas = [(i, 1, 1, 1, BASE, BASE + 1, 10, 1) for i in range(1, 11)]
+        self.assertEqual(DatasetArriendos.desdeFilas(iter(filas)).ingresosTotales(), 1.0)
+
+    def test_filter_by_state_and_dates(self):
+        filtrado = self.dataset.filtrar(estados=('activo', 'finalizado'), desde=date(2024, 3, 1),
+                                        hasta="2024-06-01")
+        esperados = [fila[0] for fila in self.filas
+                     if fila[7] in (1, 2) and date(2024, 3, 1).toordinal() <= fila[4] < date(2024, 6, 1).toordinal()]
+        self.assertEqual(filtrado.id_arriendo.tolist(), esperados)
+
+    def test_empty_dataset(self):
+        vacio = DatasetArriendos.desdeFilas(iter([]))
+        self.assertEqual((len(vacio), vacio.agruparPorMes(), vacio.ingresosTotales()), (0, {}, 0.0))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Columnar Analytics Test Suite\n")
+    unittest.main(verbosity=2)
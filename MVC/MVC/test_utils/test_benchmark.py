@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the DAO/DTO benchmark harness in benchmark/
+"""
+
+import csv
+import logging
+import sys
+import tempfile
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from benchmark.carga import (ConfiguracionCarga, ContadorBloqueos, Empleado, Reserva, ResultadoCarga,
+                            cache_uf_sintetica, dobles_reservas, generar_informe)
+from benchmark.esquema import dividir_script, sentencias_esquema, validar_nombre
+from benchmark.generador import (COLUMNAS, FECHA_REFERENCIA as FECHA, Dimensiones, GeneradorDatos, SerieUF,
+                                 digito_verificador, dimensiones, escribir_csv, run_valido)
+from benchmark.suite import Caso, Contexto, casos, comparar_informes, medir, metodos_sin_caso, resumir
+from servicio.disponibilidad import VehiculoNoDisponibleError
+from utils.validador_formatos import validar_patente, validar_run, validar_telefono
+
+SCRIPT = """-- comentario
+DROP DATABASE IF EXISTS viaja_seguro;
+USE viaja_seguro;
+CREATE TABLE t (id INT);
+DELIMITER //
+CREATE TRIGGER tr AFTER INSERT ON t
+FOR EACH ROW
+BEGIN
+    INSERT INTO viaja_seguro.log VALUES (NEW.id);
+END//
+DELIMITER ;
+INSERT INTO t VALUES (1);
+SELECT 'listo' AS mensaje;
+"""
+
+
+class Reloj:
+    """DTO falso: `medir` solo necesita un método que llamar"""
+
+    llamadas = 0
+
+    def tic(self, fallar=False):
+        Reloj.llamadas += 1
+        if fallar:
+            raise RuntimeError("sin conexión")
+
+
+class TestEsquema(unittest.TestCase):
+    """DDL splitting honours DELIMITER and never targets the application database"""
+
+    def test_split_respects_delimiter(self):
+        sentencias = dividir_script(SCRIPT)
+        self.assertEqual(len(sentencias), 6)
+        self.assertTrue(sentencias[3].startswith("CREATE TRIGGER tr"))
+        self.assertTrue(sentencias[3].endswith("END"))
+
+    def test_schema_is_renamed_and_sample_data_dropped(self):
+        sentencias = sentencias_esquema("vs_bench", SCRIPT)
+        self.assertEqual(sentencias[:2], ["DROP DATABASE IF EXISTS vs_bench", "USE vs_bench"])
+        self.assertIn("INSERT INTO vs_bench.log", sentencias[-1])
+        self.assertEqual(len(sentencias), 4)
+
+    def test_application_database_is_protected(self):
+        for nombre in ("viaja_seguro", "VIAJA_SEGURO", "bench; DROP", ""):
+            with self.assertRaises(ValueError):
+                validar_nombre(nombre)
+        with self.assertRaises(ValueError):
+            validar_nombre("produccion", {"produccion"})
+        self.assertEqual(validar_nombre("viaja_seguro_bench"), "viaja_seguro_bench")
+
+
+class TestGenerador(unittest.TestCase):
+    """Generated rows are valid, consistent with the schema rules and deterministic"""
+
+    DIMS = Dimensiones(6000, 30, 400, 20)
+
+    def setUp(self):
+        self.generador = GeneradorDatos(self.DIMS, semilla=5, hash_clave="hash")
+
+    def test_runs_have_valid_check_digits_and_are_unique(self):
+        self.assertEqual(run_valido(12345678), "12345678-5")
+        self.assertEqual(run_valido(11111111), "11111111-1")
+        runs = [fila[1] for fila in self.generador.clientes()] + [fila[1] for fila in self.generador.empleados()]
+        self.assertEqual(len(set(runs)), self.DIMS.clientes + self.DIMS.empleados)
+        for run in runs:
+            cuerpo, dv = run.split("-")
+            self.assertTrue(validar_run(run)[0])
+            self.assertEqual(dv, digito_verificador(int(cuerpo)))
+        self.assertTrue(all(validar_telefono(fila[5])[0] for fila in self.generador.clientes()))
+
+    def test_plates_use_both_formats_and_are_unique(self):
+        generador = GeneradorDatos(Dimensiones(1000, 5000, 100, 20), semilla=5)
+        patentes = [fila[1] for fila in generador.vehiculos()]
+        self.assertEqual(len(set(patentes)), 5000)
+        self.assertTrue(all(validar_patente(p)[0] for p in patentes))
+        formatos = Counter(p[3].isdigit() for p in patentes)
+        self.assertGreater(formatos[True], 1000)   # ABC123
+        self.assertGreater(formatos[False], 3000)  # BCDF12
+
+    def test_rentals_never_overlap_and_follow_start_date(self):
+        filas = list(self.generador.arriendos())
+        self.assertEqual(len(filas), self.DIMS.arriendos)
+        self.assertEqual([f[0] for f in filas], list(range(1, self.DIMS.arriendos + 1)))
+        self.assertEqual([f[4] for f in filas], sorted(f[4] for f in filas))
+        precios = {v[0]: v[5] for v in self.generador.vehiculos()}
+        uf = self.generador.serieUF()
+        ultimo_fin = {}
+        for _, id_vehiculo, id_cliente, id_empleado, inicio, fin, costo, estado, valor_uf, fecha_uf in filas:
+            self.assertGreaterEqual(inicio, ultimo_fin.get(id_vehiculo, date.min))
+            self.assertTrue(fin > inicio and 1 <= id_cliente <= self.DIMS.clientes)
+            self.assertTrue(1 <= id_empleado <= self.DIMS.empleados)
+            self.assertEqual((valor_uf, fecha_uf), (uf.valor(inicio), inicio))
+            self.assertEqual(costo, round((fin - inicio).days * precios[id_vehiculo] * valor_uf))
+            if estado != "cancelado":
+                self.assertEqual(estado, "finalizado" if fin <= FECHA else "activo")
+            ultimo_fin[id_vehiculo] = fin
+
+    def test_vehicle_state_matches_rentals_on_reference_date(self):
+        en_curso = {f[1] for f in self.generador.arriendos() if f[7] == "activo" and f[4] <= FECHA < f[5]}
+        estados = {v[0]: v[6] for v in self.generador.vehiculos()}
+        self.assertTrue(en_curso)
+        self.assertEqual({i for i, estado in estados.items() if estado == "arrendado"}, en_curso)
+
+    def test_output_is_deterministic(self):
+        otro = GeneradorDatos(self.DIMS, semilla=5, hash_clave="hash")
+        for tabla in COLUMNAS:
+            self.assertEqual(list(self.generador.filas(tabla)), list(otro.filas(tabla)))
+        distinto = GeneradorDatos(self.DIMS, semilla=6, hash_clave="hash")
+        self.assertNotEqual(list(self.generador.arriendos()), list(distinto.arriendos()))
+
+    def test_demand_is_seasonal(self):
+        generador = GeneradorDatos(Dimensiones(60_000, 200, 1000, 20), semilla=1, hash_clave="hash")
+        meses = Counter(f[4].month for f in generador.arriendos())
+        self.assertGreater(meses[1], meses[5] * 1.3)
+        self.assertGreater(meses[9], meses[4] * 1.2)
+
+    def test_uf_series_readjusts_from_the_tenth_and_ignores_window(self):
+        corta = SerieUF(date(2025, 6, 1), date(2025, 9, 1), semilla=2)
+        larga = SerieUF(date(2020, 1, 1), date(2027, 1, 1), semilla=2)
+        self.assertEqual(SerieUF(date(2026, 1, 10), date(2026, 1, 11)).valor(date(2026, 1, 10)), 39_700.0)
+        dia = date(2025, 6, 1)
+        while dia < date(2025, 9, 1):
+            self.assertEqual(corta.valor(dia), larga.valor(dia))
+            dia += timedelta(days=1)
+        self.assertLess(larga.valor(date(2021, 1, 1)), larga.valor(date(2026, 1, 1)))
+
+    def test_csv_round_trip(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            escritas = escribir_csv(self.generador, carpeta)
+            self.assertEqual(escritas, {"empleado": 20, "cliente": 400, "vehiculo": 30, "arriendo": 6000})
+            with open(Path(carpeta) / "arriendo.csv", newline="", encoding="utf-8") as archivo:
+                filas = list(csv.reader(archivo))
+        self.assertEqual(tuple(filas[0]), COLUMNAS["arriendo"])
+        primera = next(self.generador.arriendos())
+        self.assertEqual(filas[1], [str(valor) for valor in primera])
+
+    def test_scale_dimensions(self):
+        self.assertEqual(dimensiones(1_000_000), Dimensiones(1_000_000, 6666, 100_000, 200))
+        self.assertEqual(dimensiones(1_000), Dimensiones(1_000, 50, 100, 20))
+
+
+class TestSuite(unittest.TestCase):
+    """Coverage of public methods, statistics and report comparison"""
+
+    def test_every_public_dao_and_dto_method_has_a_case(self):
+        self.assertEqual(metodos_sin_caso(), [])
+        operaciones = [caso.operacion for caso in casos()]
+        self.assertEqual(len(operaciones), len(set(operaciones)))
+        self.assertEqual(metodos_sin_caso([c for c in casos() if c.metodo != "buscarArriendo"]),
+                         ["DaoArriendo.buscarArriendo", "ArriendoDTO.buscarArriendo"])
+
+    def test_statistics_use_nearest_rank(self):
+        resumen = resumir([i / 1000 for i in range(1, 101)])  # 1..100 ms
+        self.assertEqual((resumen["min_ms"], resumen["p50_ms"], resumen["p95_ms"], resumen["p99_ms"]),
+                         (1.0, 50.0, 95.0, 99.0))
+        self.assertEqual(resumen["media_ms"], 50.5)
+        self.assertEqual(resumir([]), {})
+
+    def test_measure_counts_errors_and_skips_warmup(self):
+        contexto = Contexto([(1, "AAAA11", "disponible")], [(1, "11111111-1")], [(1, "5000001-6")],
+                            [(1, 1, date(2026, 1, 1), date(2026, 1, 4))])
+        Reloj.llamadas = 0
+        resultado = medir(Caso(Reloj, "tic"), contexto, repeticiones=5)
+        self.assertEqual((resultado["repeticiones"], resultado["errores"], Reloj.llamadas), (5, 0, 6))
+        self.assertEqual((resultado["operacion"], resultado["capa"]), ("Reloj.tic", "dto"))
+
+        fallido = medir(Caso(Reloj, "tic", lambda c: (True,)), contexto, repeticiones=3)
+        self.assertEqual(fallido["errores"], 4)
+        self.assertEqual(fallido["ultimo_error"], "RuntimeError: sin conexión")
+
+    def test_compare_reports(self):
+        base = {"escala": "1k", "dimensiones": {"arriendos": 1000}, "semilla": 1}
+        antes = dict(base, resultados=[{"operacion": "A.x", "p50_ms": 2.0}, {"operacion": "A.y", "p50_ms": 1.0}])
+        despues = dict(base, resultados=[{"operacion": "A.x", "p50_ms": 1.5}, {"operacion": "A.z", "p50_ms": 3.0}])
+        filas = {f.operacion: f for f in comparar_informes(antes, despues)}
+        self.assertEqual(filas["A.x"].cambio, -0.25)
+        self.assertIsNone(filas["A.y"].despues_ms)
+        self.assertIsNone(filas["A.z"].antes_ms)
+        with self.assertRaises(ValueError):
+            comparar_informes(antes, dict(despues, escala="100k"))
+
+
+class TestCarga(unittest.TestCase):
+    """Load harness: step classification, deadlock counting and double-booking detection"""
+
+    def setUp(self):
+        self.contador = ContadorBloqueos()
+        logging.getLogger().addHandler(self.contador)
+        self.addCleanup(logging.getLogger().removeHandler, self.contador)
+        self.empleado = Empleado(1, "5000001-6", [1], ConfiguracionCarga(), self.contador)
+
+    def test_steps_are_classified(self):
+        def conflicto():
+            raise VehiculoNoDisponibleError(7, [3])
+
+        def espera():
+            raise RuntimeError(1205, "Lock wait timeout exceeded; try restarting transaction")
+
+        def deadlock_tragado():
+            logging.getLogger("dao.dao_arriendo").error(
+                "Error al agregar arriendo: %s", "(1213, 'Deadlock found when trying to get lock')")
+            return False
+
+        self.assertEqual(self.empleado.paso("disponibles", lambda: []), [])
+        self.assertIsNone(self.empleado.paso("arrendar", conflicto))
+        self.assertIsNone(self.empleado.paso("arrendar", espera))
+        self.assertIsNone(self.empleado.paso("arrendar", deadlock_tragado))
+        self.assertIsNone(self.empleado.paso("arrendar", lambda: False))
+        self.assertEqual(self.empleado.resultado.resultados["arrendar"],
+                         {"conflicto": 1, "espera_bloqueo": 1, "deadlock": 1, "fallo": 1})
+        self.assertEqual(self.contador.delHilo()["deadlock"], 1)
+        self.assertEqual(self.empleado.resultado.latencias["arrendar"].total, 4)
+        self.assertEqual(len(self.empleado.resultado.mensajes), 1)
+
+    def test_double_bookings_need_overlapping_dates_and_lifetimes(self):
+        d = date(2026, 2, 1)
+        reservas = [
+            Reserva(1, d, d + timedelta(days=3), 10.0, 20.0),
+            Reserva(1, d + timedelta(days=2), d + timedelta(days=4), 15.0),     # activa antes de cancelar la 1.ª
+            Reserva(1, d + timedelta(days=1), d + timedelta(days=3), 25.0),     # la 1.ª ya estaba cancelada
+            Reserva(2, d, d + timedelta(days=3), 10.0),
+            Reserva(2, d + timedelta(days=3), d + timedelta(days=5), 11.0),     # se toca, no se solapa
+        ]
+        pares = dobles_reservas(reservas)
+        self.assertEqual(len(pares), 2)
+        self.assertIn((reservas[0], reservas[1]), pares)
+        self.assertIn((reservas[2], reservas[1]), pares)
+
+    def test_results_combine_and_report(self):
+        otro = Empleado(2, "5000002-4", [1], ConfiguracionCarga(), self.contador)
+        for empleado, inicio in ((self.empleado, 100.0), (otro, 101.0)):
+            empleado.paso("login", lambda: True)
+            empleado.resultado.sesiones = 4
+            empleado.resultado.inicio, empleado.resultado.fin = inicio, inicio + 1
+        otro.paso("arrendar", lambda: False)
+        otro.resultado.resultados["arrendar"]["conflicto"] += 1
+        total = ResultadoCarga()
+        total.combinar(self.empleado.resultado)
+        total.combinar(otro.resultado)
+        informe = generar_informe(total, ConfiguracionCarga())
+        self.assertEqual((informe["duracion_s"], informe["sesiones"], informe["sesiones_por_s"]), (2.0, 8, 4.0))
+        self.assertEqual(informe["pasos"]["login"]["llamadas"], 2)
+        self.assertEqual(informe["pasos"]["arrendar"]["tasa_error"], 0.5)
+        self.assertEqual((informe["conflictos"], informe["dobles_reservas"]), (1, 0))
+
+    def test_synthetic_uf_cache_matches_generator_series(self):
+        cache = cache_uf_sintetica(date(2026, 1, 1), date(2026, 2, 1), semilla=3)
+        indicador = cache.obtener("2026-01-20")
+        self.assertEqual(indicador.getFechaCorta(), "2026-01-20")
+        self.assertEqual(indicador.getValor(), SerieUF(date(2026, 1, 1), date(2026, 2, 1), 3).valor(date(2026, 1, 20)))
+        self.assertIsNone(cache.obtener("2026-02-01"))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Benchmark Harness Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the LRU entity cache in dto/cache_entidades.py
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dto.cache_entidades import CacheLRU
+from dto.dto_cliente import ClienteDTO
+from dto.dto_vehiculo import VehiculoDTO
+from modelo.vehiculo import Vehiculo
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+VERSION = datetime(2026, 3, 1, 12, 0, 0)
+
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def vehiculo(patente, id_vehiculo=1, estado="disponible"):
+    return Vehiculo(id_vehiculo=id_vehiculo, patente=patente, marca="Kia", modelo="Rio",
+                    año=2020, precio_diario=20000, estado=estado)
+
+
+class TestCacheLRU(unittest.TestCase):
+    """Read-through, eviction, expiry and invalidation"""
+
+    def setUp(self):
+        self.reloj = RelojFalso()
+        self.cache = CacheLRU(max_entradas=2, ttl=10, reloj=self.reloj)
+
+    def test_read_through_loads_once(self):
+        cargas = []
+
+        def cargar():
+            cargas.append(1)
+            return vehiculo("ABCD12")
+
+        self.cache.obtener_o_cargar(('patente', "ABCD12"), cargar)
+        v = self.cache.obtener_o_cargar(('patente', "ABCD12"), cargar)
+        self.assertEqual(v.getPatente(), "ABCD12")
+        self.assertEqual(len(cargas), 1)
+        stats = self.cache.estadisticas()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertAlmostEqual(stats['tasa_aciertos'], 0.5)
+
+    def test_none_is_not_cached(self):
+        self.assertIsNone(self.cache.obtener_o_cargar('x', lambda: None))
+        self.assertEqual(self.cache.estadisticas()['entradas'], 0)
+
+    def test_returned_object_is_a_copy(self):
+        self.cache.guardar('a', vehiculo("ABCD12"))
+        self.cache.obtener('a').setEstado("arrendado")
+        self.assertEqual(self.cache.obtener('a').getEstado(), "disponible")
+
+    def test_evicts_least_recently_used(self):
+        self.cache.guardar('a', 1)
+        self.cache.guardar('b', 2)
+        self.cache.obtener('a')
+        self.cache.guardar('c', 3)
+        self.assertIsNone(self.cache.obtener('b'))
+        self.assertEqual(self.cache.obtener('a'), 1)
+        self.assertEqual(self.cache.estadisticas()['desalojos'], 1)
+
+    def test_entries_expire(self):
+        self.cache.guardar('a', 1)
+        self.reloj.ahora = 10
+        self.assertIsNone(self.cache.obtener('a'))
+        self.assertEqual(self.cache.estadisticas()['expirados'], 1)
+
+    def test_invalidate_all_keys_of_an_entity(self):
+        self.cache.guardar(('id', 7), vehiculo("ABCD12", 7))
+        self.cache.guardar(('patente', "ABCD12"), vehiculo("ABCD12", 7))
+        eliminadas = self.cache.invalidar_donde(lambda v: v.getIdVehiculo() == 7)
+        self.assertEqual(eliminadas, 2)
+        self.assertIsNone(self.cache.obtener(('patente', "ABCD12")))
+        self.assertEqual(self.cache.estadisticas()['invalidaciones'], 2)
+
+
+class TestCacheLoteVersionado(ConPoolFalso, unittest.TestCase):
+    """Batch lookups cache versioned entities, so a later by-id hit keeps optimistic locking"""
+
+    def setUp(self):
+        self.durante_escritura = lambda: None
+        self.instalar_conexion(ConexionFalsa(responder=self._responder))
+        for dto in (VehiculoDTO, ClienteDTO):
+            anterior_cache = dto._cache
+            dto._cache = CacheLRU(max_entradas=10, ttl=60)
+            self.addCleanup(setattr, dto, "_cache", anterior_cache)
+
+    def _responder(self, sql, params):
+        """Answers the batch `IN` queries with one versioned row per ID"""
+        if sql.startswith("UPDATE"):
+            self.durante_escritura()
+            return []
+        creado = datetime(2026, 1, 1)
+        if "FROM vehiculo" in sql:
+            return [(i, f"ABCD{i:02d}", "Kia", "Rio", 2020, 1.2, "disponible", creado, VERSION) for i in params]
+        return [(i, "11111111-1", "Ana", "Soto", "Calle 1", "+56912345678", creado, VERSION) for i in params]
+
+    def test_vehicle_by_id_after_batch_keeps_version(self):
+        self.assertEqual(VehiculoDTO().buscarVehiculosPorIds([7, 8])[7].getUpdateTime(), VERSION)
+        self.assertEqual(VehiculoDTO().buscarVehiculoPorId(7).getUpdateTime(), VERSION)
+        self.assertEqual(len(self.conn.sentencias), 1)
+
+    def test_client_by_id_after_batch_keeps_version(self):
+        self.assertEqual(ClienteDTO().buscarClientesPorIds([3])[3].getUpdateTime(), VERSION)
+        self.assertEqual(ClienteDTO().buscarClientePorId(3).getUpdateTime(), VERSION)
+        self.assertEqual(len(self.conn.sentencias), 1)
+
+    def test_update_invalidates_after_the_write(self):
+        original = VehiculoDTO().buscarVehiculosPorIds([7])[7]
+        # Otro hilo vuelve a cargar la fila vieja mientras la escritura está en curso
+        self.durante_escritura = lambda: VehiculoDTO._cache.guardar(('id', 7), original)
+        self.assertTrue(VehiculoDTO().actualizarVehiculo(original.getPatente(), "Kia", "Soluto", 2020, 1.2,
+                                                         "disponible", original=original))
+        self.assertIsNone(VehiculoDTO._cache.obtener(('id', 7)))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Entity Cache Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the persistent UF cache in servicio/cache_uf.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from modelo.indicador import IndicadorEconomico
+from servicio.cache_uf import CacheUF
+
+HOY = date(2025, 3, 10)
+
+
+def indicador(valor):
+    return IndicadorEconomico("uf", "2025-03-07T03:00:00.000Z", valor)
+
+
+class TestCacheUF(unittest.TestCase):
+    """Hit/miss accounting and expiry rules"""
+
+    def test_miss_then_hit(self):
+        cache = CacheUF()
+        self.assertIsNone(cache.obtener("2025-03-08", HOY))
+        cache.guardar("2025-03-08", indicador(38500.5))
+        encontrado = cache.obtener("2025-03-08", HOY)
+        self.assertEqual(encontrado.getValor(), 38500.5)
+        self.assertEqual(encontrado.getFechaCorta(), "2025-03-07")
+        stats = cache.estadisticas()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entradas']), (1, 1, 1))
+
+    def test_past_dates_never_expire(self):
+        cache = CacheUF(ttl_hoy=-1)
+        cache.guardar("2025-03-07", indicador(1.0))
+        self.assertIsNotNone(cache.obtener("2025-03-07", HOY))
+
+    def test_earlier_day_fallback_expires(self):
+        # Guardado para el 9 con la UF del 7: cuando el 9 tenga UF debe volver a consultarse
+        cache = CacheUF(ttl_hoy=-1)
+        cache.guardar("2025-03-09", indicador(1.0))
+        self.assertIsNone(cache.obtener("2025-03-09", HOY))
+
+    def test_saved_before_its_date_expires_after_it_passes(self):
+        # Guardado hoy para una fecha futura: que esa fecha pase no lo vuelve definitivo
+        cache = CacheUF(ttl_hoy=-1)
+        futura = (date.today() + timedelta(days=30)).isoformat()
+        cache.guardar(futura, IndicadorEconomico("uf", futura + "T03:00:00.000Z", 1.0))
+        self.assertIsNone(cache.obtener(futura, date.today() + timedelta(days=60)))
+
+    def test_today_expires_after_ttl(self):
+        cache = CacheUF(ttl_hoy=-1)
+        cache.guardar("2025-03-10", indicador(1.0))
+        self.assertIsNone(cache.obtener("2025-03-10", HOY))
+        self.assertEqual(cache.estadisticas()['expirados'], 1)
+
+    def test_values_survive_reopening(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, "uf.sqlite3")
+            cache = CacheUF(ruta)
+            cache.guardar("2025-01-02", indicador(2.0))
+            cache.cerrar()
+            reabierta = CacheUF(ruta)
+            self.assertEqual(reabierta.obtener("2025-01-02", HOY).getValor(), 2.0)
+            reabierta.cerrar()
+
+
+if __name__ == "__main__":
+    print("[TEST] Running UF Cache Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for version-checked partial updates in dao/concurrencia.py
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from benchmark.esquema import dividir_script
+from dao.concurrencia import ConflictoVersionError, cambios_entre, sentencia_actualizar
+from dao.dao_vehiculo import DaoVehiculo
+from dto.dto_vehiculo import VehiculoDTO
+from modelo.vehiculo import Vehiculo
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+LEIDA = datetime(2026, 10, 1, 12, 0, 0, 123456)
+VIGENTE = datetime(2026, 10, 1, 12, 5, 0, 654321)
+
+
+class TestSentenciaActualizar(unittest.TestCase):
+    """SQL generation and change detection"""
+
+    def test_only_changed_columns_with_version(self):
+        sql, params = sentencia_actualizar('vehiculo', 'id_vehiculo', 7, {'estado': 'mantencion'},
+                                           DaoVehiculo.COLUMNAS_ACTUALIZABLES, LEIDA)
+        self.assertEqual(sql, "UPDATE vehiculo SET estado = %s, "
+                              "update_time = GREATEST(CURRENT_TIMESTAMP(6), update_time + INTERVAL 1 MICROSECOND) "
+                              "WHERE id_vehiculo = %s AND update_time = %s")
+        self.assertEqual(params, ['mantencion', 7, LEIDA])
+
+    def test_unknown_column_rejected(self):
+        with self.assertRaises(ValueError):
+            sentencia_actualizar('vehiculo', 'id_vehiculo', 7, {'id_vehiculo': 8},
+                                 DaoVehiculo.COLUMNAS_ACTUALIZABLES)
+
+    def test_migration_adds_microsecond_versions(self):
+        script = (Path(__file__).parent.parent / "migrate_updated.sql").read_text(encoding="utf-8")
+        sentencias = " ".join(dividir_script(script))
+        for tabla in ('empleado', 'cliente', 'vehiculo', 'arriendo'):
+            self.assertIn(f"ALTER TABLE {tabla} MODIFY update_time TIMESTAMP(6)", sentencias)
+
+    def test_cambios_entre(self):
+        self.assertEqual(cambios_entre({'marca': 'Kia', 'año': 2020}, {'marca': 'Kia', 'año': 2021}),
+                         {'año': 2021})
+
+
+class TestActualizacionVersionada(ConPoolFalso, unittest.TestCase):
+    """Conflict detection through the DAO and DTO"""
+
+    def _preparar(self, afectadas, vigente=None):
+        # El UPDATE afecta `afectadas` filas; la relectura de la versión devuelve `vigente`
+        guion = {"SELECT": [vigente]} if vigente else {}
+        self.instalar_conexion(ConexionFalsa(guion, afectadas=afectadas))
+
+    def test_matching_version_updates(self):
+        self._preparar(afectadas=1)
+        with DaoVehiculo() as dao:
+            self.assertTrue(dao.actualizarVehiculoParcial(7, {'precio_diario': 2.0}, LEIDA))
+        self.assertEqual(len(self.conn.sentencias), 1)
+        self.assertEqual(self.conn.commits, 1)
+
+    def test_stale_version_raises_conflict(self):
+        self._preparar(afectadas=0, vigente=(VIGENTE,))
+        with DaoVehiculo() as dao:
+            with self.assertRaises(ConflictoVersionError) as ctx:
+                dao.actualizarVehiculoParcial(7, {'precio_diario': 2.0}, LEIDA)
+        self.assertEqual(ctx.exception.actual, VIGENTE)
+        self.assertEqual(self.conn.commits, 0)
+
+    def test_deleted_row_returns_false(self):
+        self._preparar(afectadas=0, vigente=None)
+        with DaoVehiculo() as dao:
+            self.assertFalse(dao.actualizarVehiculoParcial(7, {'precio_diario': 2.0}, LEIDA))
+
+    def test_dto_sends_only_edited_fields(self):
+        self._preparar(afectadas=1)
+        original = Vehiculo(patente="ABCD12", marca="Kia", modelo="Rio", año=2020,
+                            precio_diario=1.5, estado="disponible", id_vehiculo=7, update_time=LEIDA)
+        self.assertTrue(VehiculoDTO().actualizarVehiculo("ABCD12", "Kia", "Rio", 2020, 1.5, "mantencion",
+                                                         original=original))
+        sql, params = self.conn.sentencias[0]
+        self.assertTrue(sql.startswith("UPDATE vehiculo SET estado = %s, update_time"))
+        self.assertEqual(list(params), ['mantencion', 7, LEIDA])
+
+    def test_unchanged_edit_sends_nothing(self):
+        self._preparar(afectadas=1)
+        original = Vehiculo(patente="ABCD12", marca="Kia", modelo="Rio", año=2020,
+                            precio_diario=1.5, id_vehiculo=7, update_time=LEIDA)
+        self.assertTrue(VehiculoDTO().actualizarVehiculo("ABCD12", "Kia", "Rio", 2020, 1.5, "disponible",
+                                                         original=original))
+        self.assertEqual(self.conn.sentencias, [])
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Optimistic Concurrency Test Suite\n")
+    unittest.main(verbosity=2)
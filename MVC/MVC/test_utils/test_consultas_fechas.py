@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the date-range arriendo queries in dao/dao_arriendo.py
+
+The EXPLAIN checks need a MySQL server with the create_updated.sql schema
+(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME) and are skipped otherwise.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+import pymysql
+from benchmark.esquema import dividir_script
+from conex.conn import _fabrica_mysql
+from dao.dao_arriendo import DaoArriendo
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+# Consulta -> índice que debe poder resolverla
+INDICES_ESPERADOS = {
+    'activos': 'idx_arriendo_fechas',
+    'solapados': 'idx_arriendo_fechas',
+    'inician': 'idx_arriendo_fechas',
+    'terminan': 'idx_arriendo_fin',
+}
+
+
+class TestConsultasPorFechas(ConPoolFalso, unittest.TestCase):
+    """Predicates are plain ranges on indexed columns"""
+
+    def setUp(self):
+        # El arriendo más largo dura 30 días
+        self.instalar_conexion(ConexionFalsa({"MAX(duracion_dias)": [(30,)]}))
+
+    def test_predicates_are_sargable(self):
+        for tipo in INDICES_ESPERADOS:
+            where = DaoArriendo._sqlPorFechas(tipo).split("WHERE")[1].split("ORDER BY")[0]
+            self.assertNotIn(" OR ", where.upper(), tipo)
+            # Las columnas nunca quedan dentro de una función
+            self.assertFalse(re.search(r"\(\s*a\.fecha", where), tipo)
+
+    def test_overlap_is_bounded_by_longest_rental(self):
+        with DaoArriendo() as dao:
+            dao.listarArriendosSolapados("2026-03-01", "2026-04-01", estado="activo")
+        (maximo, _), (sql, params) = self.conn.sentencias
+        self.assertIn("MAX(duracion_dias)", maximo)
+        # Solo los arriendos del estado consultado acotan la búsqueda
+        self.assertIn("WHERE estado = %(estado)s", maximo)
+        self.assertEqual(params, {'desde': "2026-03-01", 'hasta': "2026-04-01", 'estado': "activo", 'dias': 30})
+        self.assertIn("a.fecha_fin > %(desde)s", sql)
+        self.assertIn("a.estado = %(estado)s", sql)
+
+    def test_start_and_end_windows_need_no_bound(self):
+        with DaoArriendo() as dao:
+            dao.listarArriendosQueInicianEntre("2026-03-01", "2026-04-01")
+            dao.listarArriendosQueTerminanEntre("2026-03-01", "2026-04-01")
+        self.assertEqual(len(self.conn.sentencias), 2)
+        self.assertIn("a.fecha_fin >= %(desde)s AND a.fecha_fin < %(hasta)s", self.conn.textos[1])
+
+    def test_by_date_listing_includes_spanning_rentals(self):
+        with DaoArriendo() as dao:
+            dao.listarArriendosPorFecha("2026-03-15")
+        maximo, sql = self.conn.textos[0], self.conn.textos[-1]
+        self.assertIn("GROUP BY estado", maximo)
+        self.assertIn("a.fecha_inicio <= %(desde)s AND a.fecha_fin >= %(desde)s", sql)
+
+    def test_outdated_schema_is_not_an_empty_result(self):
+        self.conn.error = pymysql.err.OperationalError(1054, "Unknown column 'duracion_dias' in 'field list'")
+        with DaoArriendo() as dao:
+            with self.assertRaises(pymysql.err.OperationalError):
+                dao.listarArriendosActivosEn("2026-03-15")
+
+    def test_other_errors_still_return_empty(self):
+        self.conn.error = pymysql.err.OperationalError(2013, "Lost connection to MySQL server during query")
+        with DaoArriendo() as dao:
+            self.assertEqual(dao.listarArriendosActivosEn("2026-03-15"), [])
+
+
+class TestMigracion(unittest.TestCase):
+    """migrate_updated.sql brings existing databases up to the date-query schema"""
+
+    def test_migration_adds_date_query_column_and_indexes(self):
+        script = (Path(__file__).parent.parent / "migrate_updated.sql").read_text(encoding="utf-8")
+        sentencias = " ".join(dividir_script(script))
+        for requerido in ("ADD COLUMN duracion_dias", "ADD INDEX idx_arriendo_fin",
+                          "ADD INDEX idx_arriendo_duracion (estado, duracion_dias)"):
+            self.assertIn(requerido, sentencias)
+
+
+class TestExplainConsultasPorFechas(unittest.TestCase):
+    """EXPLAIN lists the expected index for every date query (needs MySQL)"""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.conn = _fabrica_mysql()
+        except Exception as e:
+            raise unittest.SkipTest(f"MySQL no disponible: {e}")
+        with cls.conn.cursor() as cursor:
+            cursor.execute("SELECT DISTINCT index_name FROM information_schema.statistics "
+                           "WHERE table_schema = DATABASE() AND table_name = 'arriendo'")
+            indices = {fila[0] for fila in cursor.fetchall()}
+        if not set(INDICES_ESPERADOS.values()) <= indices:
+            cls.conn.close()
+            raise unittest.SkipTest("El esquema no tiene los índices de create_updated.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
+
+    def _explicar(self, tipo):
+        parametros = {'desde': "2024-01-01", 'hasta': "2024-02-01", 'estado': None, 'dias': 30}
+        with self.conn.cursor() as cursor:
+            cursor.execute("EXPLAIN " + DaoArriendo._sqlPorFechas(tipo), parametros)
+            columnas = [d[0].lower() for d in cursor.description]
+            return dict(zip(columnas, cursor.fetchone()))
+
+    def test_each_query_can_use_its_index(self):
+        for tipo, indice in INDICES_ESPERADOS.items():
+            with self.subTest(tipo=tipo):
+                plan = self._explicar(tipo)
+                self.assertIn(indice, (plan['possible_keys'] or '').split(','))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Date Range Query Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the vehicle availability index in servicio/disponibilidad.py
+"""
+
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from unittest import mock
+from servicio import disponibilidad
+import threading
+from servicio.disponibilidad import (MotorDisponibilidad, actualizar_motor_disponibilidad,
+                                     configurar_motor_disponibilidad, invalidar_motor_disponibilidad,
+                                     motor_disponibilidad_cargado, obtener_motor_disponibilidad)
+
+
+class TestMotorDisponibilidad(unittest.TestCase):
+    """Range availability, overlap detection and incremental updates"""
+
+    def setUp(self):
+        self.motor = MotorDisponibilidad()
+        self.motor.cargar([1, 2, 3], [
+            (10, 1, date(2026, 12, 20), date(2026, 12, 27)),
+            (11, 2, "2026-12-01", "2026-12-05"),
+        ])
+
+    def test_fleet_range_query(self):
+        self.assertEqual(self.motor.disponibles("2026-12-20", "2026-12-27"), [2, 3])
+        self.assertEqual(self.motor.disponibles("2026-12-03", "2026-12-21"), [3])
+        self.assertEqual(self.motor.disponibles("2027-01-01", "2027-01-02"), [1, 2, 3])
+
+    def test_return_day_is_free(self):
+        self.assertTrue(self.motor.estaDisponible(1, "2026-12-27", "2026-12-30"))
+        self.assertTrue(self.motor.estaDisponible(1, "2026-12-15", "2026-12-20"))
+        self.assertFalse(self.motor.estaDisponible(1, "2026-12-26", "2026-12-28"))
+        self.assertEqual(self.motor.conflictos(1, "2026-12-26", "2026-12-28"), [10])
+
+    def test_vehicle_outside_fleet_is_not_available(self):
+        self.assertFalse(self.motor.estaDisponible(99, "2026-12-01", "2026-12-02"))
+
+    def test_reserve_and_release(self):
+        self.motor.reservar(12, 3, "2026-12-22", "2026-12-24")
+        self.assertEqual(self.motor.disponibles("2026-12-20", "2026-12-27"), [2])
+        self.assertTrue(self.motor.liberar(10))
+        self.assertFalse(self.motor.liberar(10))
+        self.assertEqual(self.motor.disponibles("2026-12-20", "2026-12-27"), [1, 2])
+        self.assertEqual(self.motor.estadisticas()['reservas'], 2)
+
+    def test_invalid_range_raises(self):
+        with self.assertRaises(ValueError):
+            self.motor.disponibles("2026-12-05", "2026-12-05")
+
+    def test_matches_brute_force_with_overlapping_rows(self):
+        rnd = random.Random(7)
+        base = date(2026, 1, 1)
+        reservas = []
+        for id_arriendo in range(400):
+            inicio = base + timedelta(days=rnd.randrange(300))
+            reservas.append((id_arriendo, rnd.randrange(20), inicio, inicio + timedelta(days=rnd.randint(1, 20))))
+        motor = MotorDisponibilidad()
+        motor.cargar(range(20), reservas)
+        for id_arriendo in range(0, 400, 3):
+            motor.liberar(id_arriendo)
+        vigentes = [r for r in reservas if r[0] % 3]
+        for _ in range(200):
+            a = base + timedelta(days=rnd.randrange(320))
+            b = a + timedelta(days=rnd.randint(1, 15))
+            esperado = sorted(set(range(20)) - {v for _, v, i, f in vigentes if i < b and f > a})
+            self.assertEqual(motor.disponibles(a, b), esperado)
+
+    def test_vehicle_writes_update_the_fleet(self):
+        self.motor.actualizarVehiculo(4, "disponible")
+        self.motor.actualizarVehiculo(3, "mantencion")
+        self.assertEqual(self.motor.disponibles("2026-12-20", "2026-12-27"), [2, 4])
+        # Vuelve de mantención con sus reservas intactas
+        self.motor.actualizarVehiculo(1, "mantencion")
+        self.motor.actualizarVehiculo(1, "arrendado")
+        self.assertEqual(self.motor.conflictos(1, "2026-12-21", "2026-12-22"), [10])
+
+    def test_removed_vehicle_drops_its_reservations(self):
+        self.motor.quitarVehiculo(1)
+        self.assertEqual(self.motor.estadisticas(), {'vehiculos': 2, 'con_reservas': 1, 'reservas': 1})
+        self.assertFalse(self.motor.liberar(10))
+
+
+class TestVentanaDeRecarga(unittest.TestCase):
+    """The shared index is reloaded once it is older than DISPONIBILIDAD_TTL"""
+
+    def setUp(self):
+        self.anterior = configurar_motor_disponibilidad(None)
+        self.cargas = 0
+
+        def cargar():
+            self.cargas += 1
+            motor = MotorDisponibilidad()
+            motor.cargar([1], [])
+            return motor
+        self.reloj = [1000.0]
+        self.parches = [
+            mock.patch.object(disponibilidad, "_cargar_desde_bd", cargar),
+            mock.patch.object(disponibilidad.time, "monotonic", lambda: self.reloj[0]),
+            mock.patch.dict("os.environ", {"DISPONIBILIDAD_TTL": "30"}),
+        ]
+        for parche in self.parches:
+            parche.start()
+
+    def tearDown(self):
+        for parche in self.parches:
+            parche.stop()
+        configurar_motor_disponibilidad(self.anterior)
+
+    def test_reused_within_the_window(self):
+        primero = obtener_motor_disponibilidad()
+        self.reloj[0] += 29
+        self.assertIs(obtener_motor_disponibilidad(), primero)
+        self.assertEqual(self.cargas, 1)
+
+    def test_reloaded_after_the_window(self):
+        primero = obtener_motor_disponibilidad()
+        self.reloj[0] += 31
+        segundo = obtener_motor_disponibilidad()
+        self.assertIsNot(segundo, primero)
+        self.assertEqual(self.cargas, 2)
+        self.assertIs(obtener_motor_disponibilidad(), segundo)
+
+
+class TestRecargaSinBloquear(unittest.TestCase):
+    """Reloads are built outside the lock and keep the writes made meanwhile"""
+
+    def setUp(self):
+        self.viejo = MotorDisponibilidad()
+        self.viejo.cargar([1], [])
+        self.anterior = configurar_motor_disponibilidad(self.viejo)
+        self.empezo, self.seguir = threading.Event(), threading.Event()
+
+        def cargar():
+            self.empezo.set()
+            self.seguir.wait(5)
+            motor = MotorDisponibilidad()
+            motor.cargar([1, 2], [])
+            return motor
+        self.parches = [
+            mock.patch.object(disponibilidad, "_cargar_desde_bd", cargar),
+            mock.patch.dict("os.environ", {"DISPONIBILIDAD_TTL": "-1"}),
+        ]
+        for parche in self.parches:
+            parche.start()
+        self.recargado = []
+        self.hilo = threading.Thread(target=lambda: self.recargado.append(obtener_motor_disponibilidad()))
+        self.hilo.start()
+        self.assertTrue(self.empezo.wait(5))
+
+    def tearDown(self):
+        self.seguir.set()
+        self.hilo.join(5)
+        for parche in self.parches:
+            parche.stop()
+        configurar_motor_disponibilidad(self.anterior)
+
+    def test_readers_keep_the_old_index_while_reloading(self):
+        self.assertIs(obtener_motor_disponibilidad(), self.viejo)
+
+    def test_writes_during_reload_reach_the_new_index(self):
+        actualizar_motor_disponibilidad(lambda m: m.reservar(5, 2, "2026-12-20", "2026-12-27"))
+        self.seguir.set()
+        self.hilo.join(5)
+        nuevo = self.recargado[0]
+        self.assertIs(motor_disponibilidad_cargado(), nuevo)
+        self.assertEqual(nuevo.conflictos(2, "2026-12-21", "2026-12-22"), [5])
+
+    def test_invalidation_during_reload_expires_the_new_index(self):
+        invalidar_motor_disponibilidad()
+        self.seguir.set()
+        self.hilo.join(5)
+        self.assertIs(motor_disponibilidad_cargado(), self.recargado[0])
+        with mock.patch.dict("os.environ", {"DISPONIBILIDAD_TTL": "30"}):
+            self.assertFalse(disponibilidad._vigente())
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Availability Index Test Suite\n")
+    unittest.main(verbosity=2)
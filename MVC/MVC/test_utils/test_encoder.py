@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for bcrypt work factor handling in utils/encoder.py
+
+Uses the minimum cost (4) so hashing stays fast.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dto.dto_user import UserDTO
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+from utils.encoder import Encoder
+from utils.limitador import LimitadorLogin, configurar_limitador
+
+
+class TestEncoderCosto(unittest.TestCase):
+    """Configurable cost, rehash detection and off-thread verification"""
+
+    def test_encode_uses_configured_rounds(self):
+        encoder = Encoder(rounds=4)
+        hashed = encoder.encode("clave_segura")
+        self.assertEqual(encoder.costo(hashed), 4)
+        self.assertFalse(encoder.necesita_rehash(hashed))
+
+    def test_outdated_cost_needs_rehash(self):
+        viejo = Encoder(rounds=4).encode("clave_segura")
+        self.assertTrue(Encoder(rounds=5).necesita_rehash(viejo))
+        self.assertFalse(Encoder(rounds=5).necesita_rehash("texto_plano"))
+
+    def test_is_hashed_accepts_every_bcrypt_prefix(self):
+        encoder = Encoder(rounds=4)
+        hashed = encoder.encode("clave_segura")
+        for prefijo in ("$2a$", "$2b$", "$2y$"):
+            self.assertTrue(encoder.is_hashed(prefijo + hashed[4:]))
+        self.assertFalse(encoder.is_hashed("$2b$clave"))
+        self.assertFalse(encoder.is_hashed("texto_plano"))
+
+    def test_verify_async(self):
+        encoder = Encoder(rounds=4)
+        hashed = encoder.encode("clave_segura")
+        self.assertTrue(encoder.verify_async("clave_segura", hashed).result(timeout=5))
+        self.assertFalse(encoder.verify_async("otra", hashed).result(timeout=5))
+
+
+class EjecutorDiferido:
+    """Keeps submitted tasks so the test decides when they run"""
+
+    def __init__(self):
+        self.tareas = []
+
+    def submit(self, funcion, *args):
+        self.tareas.append((funcion, args))
+
+
+class TestRehashEnLogin(ConPoolFalso, unittest.TestCase):
+    """An outdated cost is upgraded off the login path, without overwriting newer passwords"""
+
+    def setUp(self):
+        self.viejo = Encoder(rounds=4).encode("clave_segura")
+        self.instalar_conexion(ConexionFalsa(
+            {"FROM empleado WHERE run": [("11111111-1", self.viejo, "Ana", "Soto", "gerente", 3)]}))
+        self.addCleanup(configurar_limitador, configurar_limitador(LimitadorLogin()))
+        self.ejecutor = EjecutorDiferido()
+        for parche in (mock.patch.dict(os.environ, {"BCRYPT_ROUNDS": "5"}),
+                       mock.patch("dto.dto_user.obtener_ejecutor_bcrypt", return_value=self.ejecutor)):
+            parche.start()
+            self.addCleanup(parche.stop)
+
+    def test_login_does_not_wait_for_rehash(self):
+        usuario = UserDTO().validarLogin("11111111-1", "clave_segura", "local")
+        self.assertEqual(usuario.getPassword(), self.viejo)
+        self.assertFalse(any(sql.startswith("UPDATE") for sql in self.conn.textos))
+        (funcion, args), = self.ejecutor.tareas
+        self.assertTrue(funcion(*args))
+        sql, params = self.conn.sentencias[-1]
+        self.assertEqual(sql, "UPDATE empleado SET password = %s WHERE run = %s AND password = %s")
+        self.assertEqual(Encoder().costo(params[0]), 5)
+        self.assertEqual(params[1:], ("11111111-1", self.viejo))
+
+    def test_rehash_skips_a_changed_password(self):
+        UserDTO().validarLogin("11111111-1", "clave_segura", "local")
+        (funcion, args), = self.ejecutor.tareas
+        self.conn.afectadas = 0
+        self.assertFalse(funcion(*args))
+
+    def test_wrong_password_schedules_nothing(self):
+        self.assertIsNone(UserDTO().validarLogin("11111111-1", "otra", "local"))
+        self.assertEqual(self.ejecutor.tareas, [])
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Encoder Test Suite\n")
+    unittest.main(verbosity=2)
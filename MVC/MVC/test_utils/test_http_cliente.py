@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the shared keep-alive HTTP client in servicio/http_cliente.py
+
+Runs against a throwaway HTTP/1.1 server on localhost.
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from servicio.http_cliente import ClienteHTTP
+
+
+class ManejadorPrueba(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fallos_pendientes = 0
+
+    def do_GET(self):
+        if ManejadorPrueba.fallos_pendientes > 0:
+            ManejadorPrueba.fallos_pendientes -= 1
+            codigo, cuerpo = 503, b"{}"
+        else:
+            codigo, cuerpo = 200, b'{"ok": true}'
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestClienteHTTP(unittest.TestCase):
+    """Connection reuse and retry on 5xx"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.servidor = ThreadingHTTPServer(("127.0.0.1", 0), ManejadorPrueba)
+        cls.url = f"http://127.0.0.1:{cls.servidor.server_address[1]}/"
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+
+    def setUp(self):
+        ManejadorPrueba.fallos_pendientes = 0
+        self.cliente = ClienteHTTP(backoff=0)
+
+    def tearDown(self):
+        self.cliente.cerrar()
+
+    def test_connection_is_reused(self):
+        for _ in range(3):
+            self.assertEqual(self.cliente.get(self.url, timeout=5).status_code, 200)
+        stats = self.cliente.estadisticas()
+        self.assertEqual(stats['solicitudes'], 3)
+        self.assertEqual(stats['nuevas'], 1)
+        self.assertEqual(stats['reutilizadas'], 2)
+
+    def test_retries_server_errors(self):
+        ManejadorPrueba.fallos_pendientes = 2
+        respuesta = self.cliente.get(self.url, timeout=5)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(self.cliente.estadisticas()['peticiones'], 3)
+
+    def test_gives_up_after_retries(self):
+        ManejadorPrueba.fallos_pendientes = 10
+        self.assertEqual(self.cliente.get(self.url, timeout=5).status_code, 503)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running HTTP Client Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the bulk CSV importer in servicio/importador.py
+"""
+
+import csv
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+import bcrypt
+from servicio.importador import ImportadorCSV
+
+
+class DTOFalso:
+    """Records batches and rejects the keys listed in `existentes`"""
+
+    def __init__(self, existentes=()):
+        self.lotes = []
+        self.existentes = set(existentes)
+
+    def _agregar(self, modelos, clave):
+        self.lotes.append(list(modelos))
+        return [m for m in modelos if clave(m) in self.existentes]
+
+    def agregarVehiculosLote(self, vehiculos):
+        return self._agregar(vehiculos, lambda v: v.getPatente())
+
+    def agregarClientesLote(self, clientes):
+        return self._agregar(clientes, lambda c: c.getRun())
+
+    def agregarUsuariosLote(self, usuarios):
+        return self._agregar(usuarios, lambda u: u.getRun())
+
+
+class TestImportadorCSV(unittest.TestCase):
+    """Validation, batching and rejection reporting"""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.dto = DTOFalso(existentes={"ZZZZ99"})
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _csv(self, nombre, columnas, filas):
+        ruta = os.path.join(self.dir.name, nombre)
+        with open(ruta, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.writer(f)
+            escritor.writerow(columnas)
+            escritor.writerows(filas)
+        return ruta
+
+    def test_vehicles_batched_and_rejected(self):
+        ruta = self._csv("flota.csv", ["patente", "marca", "modelo", "año", "precio_diario"], [
+            ["abcd12", "Kia", "Rio", "2020", "1.5"],
+            ["ABC123", "Kia", "Rio", "2021", "1.5"],
+            ["BAD", "Kia", "Rio", "2020", "1.5"],
+            ["ABCD12", "Kia", "Rio", "2020", "1.5"],
+            ["ZZZZ99", "Kia", "Rio", "2020", "1.5"],
+            ["BCDF34", "Kia", "Rio", "2020", "-1"],
+        ])
+        importador = ImportadorCSV(tamano_lote=2, vehiculodto=self.dto)
+        resultado = importador.importarVehiculos(ruta)
+        self.assertEqual(resultado.getLeidas(), 6)
+        self.assertEqual(resultado.getInsertadas(), 2)
+        self.assertEqual([len(l) for l in self.dto.lotes], [2, 1])
+        self.assertEqual(self.dto.lotes[0][0].getPatente(), "ABCD12")
+        motivos = {r.linea: r.motivo for r in resultado.getRechazadas()}
+        self.assertEqual(sorted(motivos), [4, 5, 6, 7])
+        self.assertIn("patente", motivos[4])
+        self.assertIn("línea 2", motivos[5])
+        self.assertIn("base de datos", motivos[6])
+        self.assertIn("precio_diario", motivos[7])
+
+    def test_missing_columns_raise(self):
+        ruta = self._csv("malo.csv", ["patente", "marca"], [["ABCD12", "Kia"]])
+        with self.assertRaises(ValueError):
+            ImportadorCSV(vehiculodto=self.dto).importarVehiculos(ruta)
+
+    def test_employee_passwords_hashed_and_not_reported(self):
+        ruta = self._csv("empleados.csv", ["run", "nombre", "apellido", "password", "cargo"], [
+            ["12345678-9", "Ana", "Soto", "Clave#Segura1", "Empleado"],
+            ["11111111-1", "Luis", "Rojas", "debil", "gerente"],
+        ])
+        os.environ["BCRYPT_ROUNDS"] = "4"
+        try:
+            resultado = ImportadorCSV(procesos=2, userdto=self.dto).importarEmpleados(ruta)
+        finally:
+            del os.environ["BCRYPT_ROUNDS"]
+        usuario = self.dto.lotes[0][0]
+        self.assertEqual(usuario.getCargo(), "empleado")
+        self.assertTrue(bcrypt.checkpw(b"Clave#Segura1", usuario.getPassword().encode()))
+        rechazada = resultado.getRechazadas()[0]
+        self.assertNotIn("password", rechazada.datos)
+        salida = os.path.join(self.dir.name, "rechazos.csv")
+        resultado.escribirRechazos(salida)
+        with open(salida, encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("11111111-1", contenido)
+        self.assertNotIn("debil", contenido)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running CSV Importer Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the login rate limiter in utils/limitador.py
+
+Uses a fake clock, so no test sleeps.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from utils.limitador import LimitadorLogin, PoliticaLimite
+
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def __call__(self):
+        return self.ahora
+
+
+class TestLimitadorLogin(unittest.TestCase):
+    """Token bucket, lockout and failure window"""
+
+    def setUp(self):
+        self.reloj = RelojFalso()
+        self.limitador = LimitadorLogin(
+            politica_run=PoliticaLimite(capacidad=3, recarga=0.5, max_fallos=3,
+                                        ventana=60, ancho_bucket=10, bloqueo=120),
+            politica_origen=PoliticaLimite(capacidad=100, recarga=10, max_fallos=100),
+            reloj=self.reloj)
+
+    def test_bucket_empties_and_refills(self):
+        for _ in range(3):
+            self.assertTrue(self.limitador.permitir("11111111-1", "local")[0])
+        permitido, espera = self.limitador.permitir("11111111-1", "local")
+        self.assertFalse(permitido)
+        self.assertAlmostEqual(espera, 2.0)
+        self.reloj.ahora += 2.0
+        self.assertTrue(self.limitador.permitir("11111111-1", "local")[0])
+
+    def test_keys_are_independent(self):
+        for _ in range(3):
+            self.limitador.permitir("11111111-1", "local")
+        self.assertTrue(self.limitador.permitir("22222222-2", "local")[0])
+
+    def test_failures_trigger_lockout(self):
+        for _ in range(3):
+            self.limitador.registrar_fallo("11111111-1", "local")
+        permitido, espera = self.limitador.permitir("11111111-1", "local")
+        self.assertFalse(permitido)
+        self.assertAlmostEqual(espera, 120.0)
+        self.reloj.ahora += 121
+        self.assertTrue(self.limitador.permitir("11111111-1", "local")[0])
+        self.assertEqual(self.limitador.estadisticas()['bloqueos'], 1)
+
+    def test_old_failures_leave_the_window(self):
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.reloj.ahora += 70
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.assertTrue(self.limitador.permitir("11111111-1", "local")[0])
+
+    def test_success_clears_failures(self):
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.limitador.registrar_exito("11111111-1", "local")
+        self.limitador.registrar_fallo("11111111-1", "local")
+        self.assertTrue(self.limitador.permitir("11111111-1", "local")[0])
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Login Rate Limiter Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the queue-based logging pipeline in utils/logger.py
+"""
+
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from utils.logger import ColaLoggingHandler, SistemaLogging
+
+
+def registro(nivel, mensaje="mensaje"):
+    return logging.makeLogRecord({'name': 'prueba', 'levelno': nivel,
+                                  'levelname': logging.getLevelName(nivel), 'msg': mensaje})
+
+
+class TestColaLoggingHandler(unittest.TestCase):
+    """Bounded queue: low levels are dropped, warnings and errors wait"""
+
+    def test_full_queue_drops_info_and_reports_it(self):
+        cola = queue.Queue(maxsize=2)
+        handler = ColaLoggingHandler(cola, espera_maxima=0.01)
+        for _ in range(5):
+            handler.handle(registro(logging.INFO))
+        self.assertEqual((cola.qsize(), handler.descartados), (2, 3))
+
+        cola.get_nowait()
+        cola.get_nowait()
+        handler.handle(registro(logging.INFO, "otra vez"))
+        aviso = [cola.get_nowait(), cola.get_nowait()][1]
+        self.assertEqual(aviso.levelno, logging.WARNING)
+        self.assertIn("se descartaron 3 mensajes", aviso.getMessage())
+
+    def test_errors_wait_for_space(self):
+        cola = queue.Queue(maxsize=1)
+        handler = ColaLoggingHandler(cola, espera_maxima=5)
+        handler.handle(registro(logging.INFO))
+        threading.Timer(0.05, cola.get_nowait).start()
+        handler.handle(registro(logging.ERROR, "no se pierde"))
+        self.assertEqual(cola.get_nowait().getMessage(), "no se pierde")
+        self.assertEqual(handler.descartados, 0)
+
+
+class TestSistemaLogging(unittest.TestCase):
+    """configurar() writes through a background thread and detener() flushes"""
+
+    def setUp(self):
+        self.raiz = logging.getLogger()
+        self.estado_raiz = (self.raiz.level, list(self.raiz.handlers))
+        for handler in self.estado_raiz[1]:
+            self.raiz.removeHandler(handler)
+        self.directorio_original = os.getcwd()
+        self.carpeta = tempfile.TemporaryDirectory()
+        os.chdir(self.carpeta.name)
+
+    def tearDown(self):
+        SistemaLogging.detener()
+        os.chdir(self.directorio_original)
+        self.carpeta.cleanup()
+        self.raiz.setLevel(self.estado_raiz[0])
+        for handler in self.estado_raiz[1]:
+            self.raiz.addHandler(handler)
+
+    def test_records_are_written_by_listener_and_flushed_on_stop(self):
+        SistemaLogging.configurar(nivel=logging.INFO, archivo_log='prueba.log')
+        self.assertEqual([type(h) for h in self.raiz.handlers], [ColaLoggingHandler])
+        archivos = [h for h in SistemaLogging._handlers if isinstance(h, RotatingFileHandler)]
+        self.assertEqual([h.maxBytes for h in archivos], [10485760, 10485760])
+
+        hilo_escritor = []
+        consola = SistemaLogging._handlers[-1]
+        consola.emit = lambda record: hilo_escritor.append(threading.current_thread().name)
+        logger = logging.getLogger("test_logger")
+        for i in range(200):
+            logger.info("fila %d", i)
+        logger.error("falló algo")
+        SistemaLogging.detener()
+
+        principal = Path('logs', 'prueba.log').read_text(encoding='utf-8')
+        errores = Path('logs', 'errores.log').read_text(encoding='utf-8')
+        self.assertIn("fila 199", principal)
+        self.assertIn("falló algo", errores)
+        self.assertNotIn("fila 0", errores)
+        self.assertNotIn(threading.current_thread().name, hilo_escritor)
+        self.assertEqual(self.raiz.handlers, [])
+
+    def test_synchronous_mode_attaches_handlers_directly(self):
+        SistemaLogging.configurar(archivo_log='prueba.log', asincrono=False)
+        self.assertEqual(len(self.raiz.handlers), 3)
+        self.assertIsNone(SistemaLogging._listener)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Queue Logging Test Suite\n")
+    unittest.main(verbosity=2)
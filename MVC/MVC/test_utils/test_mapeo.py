@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the precompiled row mappers in dao/mapeo.py
+"""
+
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dao.dao_arriendo import DaoArriendo
+from dao.dao_cliente import DaoCliente
+from dao.dao_user import daoUser
+from dao.dao_vehiculo import DaoVehiculo
+from dao.mapeo import columna, crear_mapeador
+from modelo.arriendo import Arriendo
+from modelo.vehiculo import Vehiculo
+
+CREADO = datetime(2024, 1, 15, 9, 30)
+
+
+class TestCrearMapeador(unittest.TestCase):
+    """Mappers build the same objects as the constructors, without __dict__"""
+
+    def test_arriendo_row_matches_constructor(self):
+        fila = (7, 1, 2, 3, date(2024, 1, 15), date(2024, 1, 20), Decimal("281250.00"),
+                "finalizado", CREADO, None, date(2024, 1, 15), "patente extra")
+        arriendo = DaoArriendo._crearArriendo(fila)
+        esperado = Arriendo(id_vehiculo=1, id_cliente=2, id_empleado=3, fecha_inicio=date(2024, 1, 15),
+                            fecha_fin=date(2024, 1, 20), costo_total=281250.0, estado="finalizado",
+                            id_arriendo=7, create_time=CREADO, valor_uf_fecha=0.0,
+                            fecha_uf_consulta=date(2024, 1, 15))
+        for nombre in Arriendo.__slots__:
+            self.assertEqual(getattr(arriendo, nombre), getattr(esperado, nombre), nombre)
+        self.assertIsInstance(arriendo.getCostoTotal(), float)
+        self.assertFalse(hasattr(arriendo, '__dict__'))
+
+    def test_missing_attributes_take_constructor_defaults(self):
+        vehiculo = DaoVehiculo._crearVehiculo((4, "ABCD12", "Kia", "Rio", 2020, Decimal("1.50"), "disponible", CREADO))
+        self.assertEqual((vehiculo.getIdVehiculo(), vehiculo.getAño(), vehiculo.getPrecioDiario()), (4, 2020, 1.5))
+        self.assertIsNone(vehiculo.getUpdateTime())
+        cliente = DaoCliente._crearCliente((9, "12345678-9", "Ana", "Soto", "Calle 1", "+56911111111", CREADO))
+        self.assertEqual((cliente.getIdCliente(), cliente.getRun(), cliente.getTelefono()),
+                         (9, "12345678-9", "+56911111111"))
+
+    def test_user_row_keeps_its_create_time(self):
+        usuario = daoUser._crearUsuario(("12345678-9", "Ana", "Soto", "$2b$hash", "gerente", 3, CREADO))
+        self.assertEqual(usuario.getIdEmpleado(), 3)
+        self.assertEqual(usuario._create_time, CREADO)
+        self.assertIsNone(usuario._update_time)
+
+    def test_constants_override_defaults(self):
+        mapear = crear_mapeador(Vehiculo, (columna('id_vehiculo', int),), estado="mantencion")
+        self.assertEqual(mapear((5,)).getEstado(), "mantencion")
+
+    def test_null_default_and_conversion(self):
+        mapear = crear_mapeador(Vehiculo, (columna('id_vehiculo', int), columna('precio_diario', float, 0.0)))
+        self.assertEqual(mapear(("5", None)).getPrecioDiario(), 0.0)
+        self.assertEqual(mapear(("5", "2.5")).getIdVehiculo(), 5)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Row Mapper Test Suite\n")
+    unittest.main(verbosity=2)
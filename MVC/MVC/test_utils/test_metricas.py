@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the DAO latency instrumentation in conex/metricas.py
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from conex.metricas import Histograma, RegistroMetricas, configurar_registro, conexion_medida, forma_sql
+from dao.dao_vehiculo import DaoVehiculo
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+FILA = (7, "ABCD12", "Kia", "Rio", 2020, 25000.0, "disponible", datetime(2026, 1, 1), datetime(2026, 1, 2))
+
+
+class TestHistograma(unittest.TestCase):
+    """Percentiles stay within one bucket (~9 %) of the exact value"""
+
+    def test_percentiles(self):
+        histograma = Histograma()
+        valores = [i / 10000 for i in range(1, 1001)]  # 0.1 ms .. 100 ms
+        for valor in valores:
+            histograma.registrar(valor)
+        for p, exacto in ((50, 0.05), (95, 0.095), (99, 0.099)):
+            self.assertGreaterEqual(histograma.percentil(p), exacto)
+            self.assertLess(histograma.percentil(p), exacto * 1.1)
+        self.assertEqual(histograma.percentil(100), 0.1)
+
+    def test_sql_shape_hides_id_list_length(self):
+        self.assertEqual(forma_sql("SELECT *\n  FROM v WHERE id IN (%s, %s,%s) AND a = %s"),
+                         "SELECT * FROM v WHERE id IN (%s, ...) AND a = %s")
+
+
+class TestInstrumentacionDao(ConPoolFalso, unittest.TestCase):
+    """DAO methods are timed and their statements attributed to Clase.metodo"""
+
+    def _preparar(self, filas, demora=0.0, umbral_lenta=0.2):
+        self.instalar_conexion(ConexionFalsa(responder=lambda sql, params: filas, demora=demora))
+        self.registro = RegistroMetricas(umbral_lenta=umbral_lenta)
+        self.addCleanup(configurar_registro, configurar_registro(self.registro))
+
+    def _operacion(self, nombre):
+        return next(fila for fila in self.registro.resumen() if fila.operacion == nombre)
+
+    def test_rows_bytes_and_latency_per_method(self):
+        self._preparar([FILA])
+        with DaoVehiculo() as dao:
+            for _ in range(3):
+                self.assertEqual(dao.buscarVehiculo("ABCD12").getPatente(), "ABCD12")
+        fila = self._operacion("DaoVehiculo.buscarVehiculo")
+        self.assertEqual((fila.llamadas, fila.sentencias, fila.filas, fila.errores), (3, 3, 3, 0))
+        self.assertGreater(fila.bytes, 3 * len("ABCD12KiaRio"))
+        self.assertGreater(fila.p99, 0)
+
+    def test_errors_are_counted(self):
+        self._preparar([])
+        self.conn.error = RuntimeError("restricción de clave foránea")
+        with DaoVehiculo() as dao:
+            self.assertFalse(dao.eliminarVehiculo("ABCD12"))
+        self.assertEqual(self._operacion("DaoVehiculo.eliminarVehiculo").errores, 1)
+
+    def test_generators_exclude_consumer_time(self):
+        self._preparar([FILA] * 5)
+        with DaoVehiculo() as dao:
+            for _ in dao.iterVehiculos(tamano_lote=2):
+                time.sleep(0.02)
+        fila = self._operacion("DaoVehiculo.iterVehiculos")
+        self.assertEqual((fila.llamadas, fila.filas), (1, 5))
+        self.assertLess(fila.maximo, 0.05)
+
+    def test_slow_queries_are_logged_with_shape(self):
+        self._preparar([FILA], demora=0.03, umbral_lenta=0.02)
+        with self.assertLogs("conex.consultas_lentas", level="WARNING") as registro_log:
+            with DaoVehiculo() as dao:
+                dao.buscarVehiculoPorId(7)
+        lenta, = self.registro.consultasLentas()
+        self.assertEqual((lenta.operacion, lenta.parametros, lenta.filas),
+                         ("DaoVehiculo.buscarVehiculoPorId", 1, 1))
+        self.assertIn("WHERE id_vehiculo = %s", lenta.forma)
+        self.assertIn("DaoVehiculo.buscarVehiculoPorId", registro_log.output[0])
+        self.assertIn("Consultas lentas (>= 20 ms): 1", self.registro.volcar())
+
+    def test_disabled_registry_returns_raw_connection(self):
+        self.addCleanup(configurar_registro, configurar_registro(None))
+        conn = ConexionFalsa()
+        self.assertIs(conexion_medida(conn), conn)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running DAO Metrics Test Suite\n")
+    unittest.main(verbosity=2)
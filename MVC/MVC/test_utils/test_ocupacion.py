@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the fleet occupancy matrix in servicio/ocupacion.py
+"""
+
+import csv
+import random
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from servicio.analitica import DatasetArriendos, np
+from servicio.ocupacion import MatrizOcupacion
+
+ENERO = date(2026, 1, 1).toordinal()
+FLOTA = [(1, "AAAA11", "Kia"), (2, "BBBB22", "Kia"), (3, "CCCC33", "Mazda")]
+
+
+def dataset(*arriendos):
+    """arriendos: (id_vehiculo, inicio, fin, codigo_estado) con días relativos a enero"""
+    return DatasetArriendos.desdeFilas(iter([
+        (i, vehiculo, 1, 1, ENERO + inicio, ENERO + fin, 1000, estado)
+        for i, (vehiculo, inicio, fin, estado) in enumerate(arriendos, start=1)]))
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestMatrizOcupacion(unittest.TestCase):
+    """Interval filling, clipping and utilization by vehicle, brand and month"""
+
+    def test_half_open_intervals_are_clipped_to_window(self):
+        datos = dataset((1, 0, 10, 1),      # 1-10 ene: devolución el 11 queda libre
+                        (1, 9, 12, 2),      # se superpone con el anterior
+                        (2, -5, 3, 2),      # empieza antes de la ventana
+                        (3, 29, 40, 1),     # termina después de la ventana
+                        (3, 5, 8, 3),       # cancelado: no ocupa
+                        (9, 0, 31, 1))      # vehículo fuera de la flota
+        matriz = MatrizOcupacion.desdeDataset(datos, FLOTA, "2026-01-01", "2026-02-01")
+        self.assertEqual(matriz.ocupado.shape, (3, 31))
+        self.assertEqual(np.flatnonzero(matriz.ocupado[0]).tolist(), list(range(12)))
+        self.assertEqual(np.flatnonzero(matriz.ocupado[1]).tolist(), [0, 1, 2])
+        self.assertEqual(np.flatnonzero(matriz.ocupado[2]).tolist(), [29, 30])
+
+        self.assertEqual(matriz.utilizacionPorVehiculo()[1], (12, 31))
+        self.assertEqual(matriz.utilizacionPorMarca(), {'Kia': (15, 62), 'Mazda': (2, 31)})
+        self.assertEqual(matriz.utilizacionFlota(desde="2026-01-10", hasta="2026-01-13"), (3, 9))
+
+    def test_matches_day_by_day_loop(self):
+        azar = random.Random(3)
+        arriendos = []
+        for _ in range(500):
+            inicio = azar.randrange(-20, 400)
+            arriendos.append((azar.randint(1, 3), inicio, inicio + azar.randint(1, 25), azar.randint(1, 3)))
+        matriz = MatrizOcupacion.desdeDataset(dataset(*arriendos), FLOTA, date(2026, 1, 1), date(2027, 1, 1))
+        esperado = np.zeros((3, 365), dtype=bool)
+        for vehiculo, inicio, fin, estado in arriendos:
+            if estado != 3:
+                for dia in range(max(inicio, 0), min(fin, 365)):
+                    esperado[vehiculo - 1, dia] = True
+        self.assertTrue((matriz.ocupado == esperado).all())
+
+    def test_monthly_utilization_and_csv(self):
+        matriz = MatrizOcupacion.desdeDataset(dataset((1, 0, 31, 1), (2, 31, 38, 2)), FLOTA,
+                                              "2026-01-16", "2026-03-01")
+        meses, mensual = matriz.utilizacionMensual()
+        self.assertEqual(meses, ["2026-01", "2026-02"])
+        self.assertEqual(mensual[0].tolist(), [1.0, 0.0])
+        self.assertEqual(mensual[1].tolist(), [0.0, 0.25])
+
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = str(Path(carpeta) / "utilizacion.csv")
+            self.assertEqual(matriz.exportarCsv(ruta), 3)
+            with open(ruta, newline='', encoding='utf-8') as archivo:
+                filas = list(csv.reader(archivo))
+        self.assertEqual(filas[0], ['id_vehiculo', 'patente', 'marca', 'utilizacion', '2026-01', '2026-02'])
+        self.assertEqual(filas[2], ['2', 'BBBB22', 'Kia', '15.9', '0.0', '25.0'])
+        self.assertEqual(filas[-1][2:], ['FLOTA', '17.4', '33.3', '8.3'])
+
+    def test_invalid_window_and_empty_fleet(self):
+        with self.assertRaises(ValueError):
+            MatrizOcupacion.desdeDataset(dataset(), FLOTA, "2026-02-01", "2026-01-01")
+        vacia = MatrizOcupacion.desdeDataset(dataset((1, 0, 5, 1)), [], "2026-01-01", "2026-02-01")
+        self.assertEqual(vacia.utilizacionFlota(), (0, 0))
+        self.assertEqual(vacia.utilizacionMensual()[1].shape, (0, 1))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Fleet Occupancy Test Suite\n")
+    unittest.main(verbosity=2)
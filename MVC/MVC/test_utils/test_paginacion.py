@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for keyset pagination helpers in dao/paginacion.py
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dao.dao_cliente import DaoCliente
+from dao.dao_vehiculo import DaoVehiculo
+from dao.paginacion import (Pagina, CursorInvalidoError, armar_pagina,
+                            codificar_cursor, decodificar_cursor)
+from test_utils.bd_falsa import ConPoolFalso
+
+
+class TestCursorPagina(unittest.TestCase):
+    """Opaque cursor token encoding"""
+
+    def test_round_trip_with_dates(self):
+        token = codificar_cursor('arriendo', (date(2025, 3, 1), 42))
+        self.assertEqual(decodificar_cursor('arriendo', token, 2), ['2025-03-01', 42])
+
+    def test_token_from_other_listing_is_rejected(self):
+        token = codificar_cursor('cliente', ('Ana', 'Soto', 7))
+        with self.assertRaises(CursorInvalidoError):
+            decodificar_cursor('vehiculo', token, 3)
+
+    def test_garbage_token_is_rejected(self):
+        with self.assertRaises(CursorInvalidoError):
+            decodificar_cursor('cliente', 'no-es-un-token', 3)
+
+
+class TestArmarPagina(unittest.TestCase):
+    """Trimming the extra row and computing the next token"""
+
+    def test_last_page_has_no_next_token(self):
+        pagina = armar_pagina([1, 2], 2, 'numeros', lambda n: (n,))
+        self.assertEqual(pagina.getElementos(), [1, 2])
+        self.assertFalse(pagina.hayMas())
+
+    def test_extra_row_produces_next_token(self):
+        pagina = armar_pagina([1, 2, 3], 2, 'numeros', lambda n: (n,))
+        self.assertEqual(list(pagina), [1, 2])
+        self.assertTrue(pagina.hayMas())
+        self.assertEqual(decodificar_cursor('numeros', pagina.getSiguiente(), 1), [2])
+
+    def test_empty_page(self):
+        pagina = Pagina([])
+        self.assertEqual(len(pagina), 0)
+        self.assertIsNone(pagina.getSiguiente())
+
+
+class TestConsultaPaginada(ConPoolFalso, unittest.TestCase):
+    """The next page continues after the token's key with an index-friendly predicate"""
+
+    def setUp(self):
+        self.instalar_conexion()
+
+    def test_first_page_has_no_predicate(self):
+        with DaoVehiculo() as dao:
+            dao.paginarVehiculos(limite=20)
+        (sql, params), = self.conn.sentencias
+        self.assertNotIn("WHERE", sql)
+        self.assertEqual(tuple(params), (21,))
+
+    def test_vehicle_seek_is_expanded(self):
+        token = codificar_cursor('vehiculo', ('Kia', 'Rio', 7))
+        with DaoVehiculo() as dao:
+            dao.paginarVehiculos(limite=20, cursor=token)
+        (sql, params), = self.conn.sentencias
+        self.assertIn("WHERE marca > %s OR (marca = %s AND "
+                      "(modelo > %s OR (modelo = %s AND id_vehiculo > %s))) "
+                      "ORDER BY marca, modelo, id_vehiculo LIMIT %s", sql)
+        self.assertEqual(tuple(params), ('Kia', 'Kia', 'Rio', 'Rio', 7, 21))
+
+    def test_client_seek_is_expanded(self):
+        token = codificar_cursor('cliente', ('Ana', 'Soto', 3))
+        with DaoCliente() as dao:
+            dao.paginarClientes(limite=10, cursor=token)
+        (sql, params), = self.conn.sentencias
+        self.assertIn("WHERE nombre > %s OR (nombre = %s AND "
+                      "(apellido > %s OR (apellido = %s AND id_cliente > %s))) "
+                      "ORDER BY nombre, apellido, id_cliente LIMIT %s", sql)
+        self.assertEqual(tuple(params), ('Ana', 'Ana', 'Soto', 'Soto', 3, 11))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Pagination Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the shared connection pool in conex/conn.py
+
+Uses an in-memory fake connection, so no MySQL server is required.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from conex.conn import (PoolConexiones, PoolAgotadoError, Conex, UnidadDeTrabajo,
+                        configurar_pool, iterar_consulta, consultar_por_ids)
+from test_utils.bd_falsa import ConexionFalsa
+
+
+def crear_pool(**kwargs):
+    creadas = []
+
+    def fabrica():
+        conn = ConexionFalsa()
+        creadas.append(conn)
+        return conn
+
+    return PoolConexiones(fabrica, **kwargs), creadas
+
+
+class TestPoolConexiones(unittest.TestCase):
+    """Checkout/checkin behaviour and statistics"""
+
+    def test_reuses_returned_connection(self):
+        pool, creadas = crear_pool(min_size=0, max_size=2)
+        conn = pool.obtener()
+        pool.devolver(conn)
+        self.assertIs(pool.obtener(), conn)
+        stats = pool.estadisticas()
+        self.assertEqual(stats['creadas'], 1)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(conn.rollbacks, 1)
+
+    def test_timeout_when_exhausted(self):
+        pool, _ = crear_pool(min_size=0, max_size=1, timeout_checkout=0.05)
+        pool.obtener()
+        with self.assertRaises(PoolAgotadoError):
+            pool.obtener()
+        stats = pool.estadisticas()
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['esperas'], 1)
+
+    def test_waiter_receives_released_connection(self):
+        pool, creadas = crear_pool(min_size=0, max_size=1, timeout_checkout=2.0)
+        conn = pool.obtener()
+        resultado = []
+        hilo = threading.Thread(target=lambda: resultado.append(pool.obtener()))
+        hilo.start()
+        time.sleep(0.05)
+        pool.devolver(conn)
+        hilo.join(1.0)
+        self.assertEqual(resultado, [conn])
+        self.assertEqual(len(creadas), 1)
+        self.assertEqual(pool.estadisticas()['esperas'], 1)
+
+    def test_health_check_discards_dead_connection(self):
+        pool, creadas = crear_pool(min_size=0, max_size=2, verificar_tras=0)
+        conn = pool.obtener()
+        pool.devolver(conn)
+        conn.ping_falla = True
+        nueva = pool.obtener()
+        self.assertIsNot(nueva, conn)
+        self.assertFalse(conn.open)
+        stats = pool.estadisticas()
+        self.assertEqual(stats['fallidas_salud'], 1)
+        self.assertEqual(stats['abiertas'], 1)
+
+    def test_idle_connections_are_reaped_above_min_size(self):
+        pool, creadas = crear_pool(min_size=1, max_size=3, max_idle=0.01)
+        conexiones = [pool.obtener() for _ in range(3)]
+        for conn in conexiones:
+            pool.devolver(conn)
+        time.sleep(0.02)
+        pool.devolver(pool.obtener())
+        stats = pool.estadisticas()
+        self.assertEqual(stats['abiertas'], 1)
+        self.assertEqual(stats['reaped'], 2)
+
+    def test_conex_borrows_and_returns(self):
+        pool, creadas = crear_pool(min_size=0, max_size=1)
+        anterior = configurar_pool(pool)
+        try:
+            with Conex() as conex:
+                self.assertIs(conex.getConex(), creadas[0])
+                self.assertEqual(pool.estadisticas()['en_uso'], 1)
+            self.assertIsNone(conex.getConex())
+            self.assertEqual(pool.estadisticas()['en_uso'], 0)
+        finally:
+            configurar_pool(anterior)
+
+
+class TestUnidadDeTrabajo(unittest.TestCase):
+    """Transactions spanning several Conex instances"""
+
+    def setUp(self):
+        self.pool, self.creadas = crear_pool(min_size=0, max_size=2)
+        self.anterior = configurar_pool(self.pool)
+
+    def tearDown(self):
+        configurar_pool(self.anterior)
+
+    def test_shares_connection_and_commits_once(self):
+        with UnidadDeTrabajo() as uow:
+            with Conex() as c1, Conex() as c2:
+                c1.getConex().commit()
+                c2.getConex().commit()
+                c1.closeConex()
+        conn = self.creadas[0]
+        self.assertEqual(len(self.creadas), 1)
+        self.assertEqual(conn.begins, 1)
+        self.assertEqual(conn.commits, 1)
+        self.assertTrue(uow.confirmada)
+        self.assertEqual(self.pool.estadisticas()['en_uso'], 0)
+
+    def test_revertir_rolls_back(self):
+        with UnidadDeTrabajo() as uow:
+            with UnidadDeTrabajo() as interna:
+                interna.revertir()
+        conn = self.creadas[0]
+        self.assertEqual(conn.commits, 0)
+        self.assertFalse(uow.confirmada)
+        self.assertFalse(interna.confirmada)
+
+    def test_exception_rolls_back_and_propagates(self):
+        with self.assertRaises(ValueError):
+            with UnidadDeTrabajo():
+                raise ValueError("fallo")
+        self.assertEqual(self.creadas[0].commits, 0)
+        self.assertIsNone(UnidadDeTrabajo.actual())
+
+
+class TestIterarConsulta(unittest.TestCase):
+    """Streaming rows in batches through a server-side cursor"""
+
+    def _conexion(self, filas):
+        return ConexionFalsa(guion={"SELECT 1": filas})
+
+    def test_yields_all_rows_in_batches(self):
+        conn = self._conexion([(i,) for i in range(5)])
+        filas = list(iterar_consulta(conn, "SELECT 1", tamano_lote=2))
+        self.assertEqual(filas, [(i,) for i in range(5)])
+        cursor, = conn.cursores
+        self.assertEqual(cursor.lotes, [2, 2, 2, 2])
+        self.assertTrue(cursor.cerrado)
+
+    def test_closing_early_closes_cursor(self):
+        conn = self._conexion([(i,) for i in range(5)])
+        gen = iterar_consulta(conn, "SELECT 1", tamano_lote=2)
+        self.assertEqual(next(gen), (0,))
+        gen.close()
+        self.assertTrue(conn.cursores[0].cerrado)
+
+
+class TestConsultarPorIds(unittest.TestCase):
+    """Chunked IN lookups"""
+
+    def _conexion(self, filas):
+        return ConexionFalsa(responder=lambda sql, params: [filas[i] for i in params if i in filas])
+
+    def test_deduplicates_and_chunks(self):
+        conn = self._conexion({i: (i, f"v{i}") for i in range(1, 6)})
+        sql = "SELECT id, v FROM t WHERE id IN ({marcadores})"
+        filas = list(consultar_por_ids(conn, sql, [1, 2, 2, None, 3, 4, 5, 9], tamano_lote=3))
+        self.assertEqual([f[0] for f in filas], [1, 2, 3, 4, 5])
+        self.assertEqual([list(p) for _, p in conn.sentencias], [[1, 2, 3], [4, 5, 9]])
+        self.assertEqual(conn.textos[0], "SELECT id, v FROM t WHERE id IN (%s, %s, %s)")
+        self.assertTrue(all(cursor.cerrado for cursor in conn.cursores))
+
+    def test_no_ids_no_query(self):
+        conn = self._conexion({})
+        self.assertEqual(list(consultar_por_ids(conn, "{marcadores}", [])), [])
+        self.assertEqual(conn.sentencias, [])
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Connection Pool Test Suite\n")
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the atomic reservation in ArriendoDTO.registrarArriendo
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dto.dto_arriendo import ArriendoDTO
+from dto.dto_vehiculo import VehiculoDTO
+from servicio.disponibilidad import (MotorDisponibilidad, VehiculoNoDisponibleError,
+                                     configurar_motor_disponibilidad, motor_disponibilidad_cargado)
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+
+class TestRegistrarArriendo(ConPoolFalso, unittest.TestCase):
+    """Row lock, database overlap check and clean rejection"""
+
+    def _preparar(self, guion):
+        self.instalar_conexion(ConexionFalsa(guion))
+        self.motor = MotorDisponibilidad()
+        self.motor.cargar([7], [])
+        self.anterior_motor = configurar_motor_disponibilidad(self.motor)
+
+    def tearDown(self):
+        configurar_motor_disponibilidad(self.anterior_motor)
+
+    def _registrar(self):
+        return ArriendoDTO().registrarArriendo(7, 1, 1, "2026-12-20", "2026-12-27", 100000.0)
+
+    def test_locks_vehicle_then_inserts_in_one_transaction(self):
+        self._preparar({"FOR UPDATE": [("disponible",)]})
+        self.assertTrue(self._registrar())
+        sentencias = self.conn.textos
+        self.assertIn("FOR UPDATE", sentencias[0])
+        self.assertIn("fecha_inicio <", sentencias[1])
+        self.assertTrue(sentencias[2].startswith("INSERT INTO arriendo"))
+        self.assertTrue(sentencias[3].startswith("UPDATE vehiculo"))
+        self.assertEqual(self.conn.commits, 1)
+        self.assertEqual(self.motor.conflictos(7, "2026-12-21", "2026-12-22"), [42])
+
+    def test_losing_contender_gets_clean_rejection(self):
+        # El índice local no vio la reserva de otra sesión; la base de datos sí
+        self._preparar({"FOR UPDATE": [("arrendado",)], "fecha_inicio <": [(5,)]})
+        with self.assertRaises(VehiculoNoDisponibleError) as ctx:
+            self._registrar()
+        self.assertEqual(ctx.exception.conflictos, [5])
+        self.assertFalse(any(s.startswith("INSERT") for s in self.conn.textos))
+        self.assertEqual(self.conn.commits, 0)
+        self.assertGreaterEqual(self.conn.rollbacks, 1)
+        self.assertIsNone(motor_disponibilidad_cargado())
+
+    def test_stale_index_does_not_reject_a_free_vehicle(self):
+        # Otro proceso canceló el arriendo 9: este índice todavía lo cree activo
+        self._preparar({"FOR UPDATE": [("arrendado",)]})
+        self.motor.reservar(9, 7, "2026-12-18", "2026-12-25")
+        self.assertTrue(self._registrar())
+        self.assertTrue(any(s.startswith("INSERT INTO arriendo") for s in self.conn.textos))
+        self.assertEqual(self.conn.commits, 1)
+        self.assertIsNone(motor_disponibilidad_cargado())
+
+    def test_vehicle_in_maintenance_is_rejected(self):
+        self._preparar({"FOR UPDATE": [("mantencion",)]})
+        with self.assertRaises(VehiculoNoDisponibleError):
+            self._registrar()
+        self.assertEqual(self.conn.commits, 0)
+
+
+class TestCancelarArriendo(ConPoolFalso, unittest.TestCase):
+    """The vehicle is released only when no other active rental remains"""
+
+    def _preparar(self, guion):
+        self.instalar_conexion(ConexionFalsa(guion))
+        self.motor = MotorDisponibilidad()
+        self.motor.cargar([7], [(42, 7, "2026-12-20", "2026-12-27"), (43, 7, "2027-01-10", "2027-01-15")])
+        self.anterior_motor = configurar_motor_disponibilidad(self.motor)
+
+    def tearDown(self):
+        configurar_motor_disponibilidad(self.anterior_motor)
+
+    def _actualizaciones_vehiculo(self):
+        return [s for s in self.conn.textos if s.startswith("UPDATE vehiculo")]
+
+    def test_last_active_rental_releases_the_vehicle(self):
+        self._preparar({"FOR UPDATE": [("arrendado",)], "COUNT(*)": [(0,)]})
+        self.assertTrue(ArriendoDTO().cancelarArriendo(42, 7))
+        self.assertIn("FOR UPDATE", self.conn.textos[0])
+        self.assertEqual(len(self._actualizaciones_vehiculo()), 1)
+        self.assertEqual(self.conn.commits, 1)
+        self.assertEqual(self.motor.conflictos(7, "2026-12-21", "2026-12-22"), [])
+
+    def test_other_active_rental_keeps_the_vehicle_rented(self):
+        self._preparar({"FOR UPDATE": [("arrendado",)], "COUNT(*)": [(1,)]})
+        self.assertTrue(ArriendoDTO().cancelarArriendo(42, 7))
+        self.assertEqual(self._actualizaciones_vehiculo(), [])
+        self.assertEqual(self.conn.commits, 1)
+        self.assertEqual(self.motor.conflictos(7, "2027-01-11", "2027-01-12"), [43])
+
+    def test_vehicle_in_maintenance_keeps_its_state(self):
+        self._preparar({"FOR UPDATE": [("mantencion",)], "COUNT(*)": [(0,)]})
+        self.assertTrue(ArriendoDTO().cancelarArriendo(42, 7))
+        self.assertEqual(self._actualizaciones_vehiculo(), [])
+
+
+class TestIndiceEnEscrituras(ConPoolFalso, unittest.TestCase):
+    """Own writes update the shared index in place instead of dropping it"""
+
+    def setUp(self):
+        self.instalar_conexion()
+        self.motor = MotorDisponibilidad()
+        self.motor.cargar([7], [])
+        self.anterior_motor = configurar_motor_disponibilidad(self.motor)
+
+    def tearDown(self):
+        configurar_motor_disponibilidad(self.anterior_motor)
+
+    def test_new_active_rental_is_reserved(self):
+        self.assertTrue(ArriendoDTO().agregarArriendo(7, 1, 1, "2026-12-20", "2026-12-27", 100000.0))
+        self.assertIs(motor_disponibilidad_cargado(), self.motor)
+        self.assertEqual(self.motor.conflictos(7, "2026-12-21", "2026-12-22"), [42])
+
+    def test_finished_rental_is_released(self):
+        self.motor.reservar(42, 7, "2026-12-20", "2026-12-27")
+        self.assertTrue(ArriendoDTO().actualizarArriendo(42, 7, 1, 1, "2026-12-20", "2026-12-27",
+                                                         100000.0, "finalizado"))
+        self.assertIs(motor_disponibilidad_cargado(), self.motor)
+        self.assertEqual(self.motor.conflictos(7, "2026-12-21", "2026-12-22"), [])
+
+    def test_new_vehicle_joins_the_fleet(self):
+        self.assertTrue(VehiculoDTO().agregarVehiculo("ZZZZ99", "Kia", "Rio", 2024, 30000.0))
+        self.assertIs(motor_disponibilidad_cargado(), self.motor)
+        self.assertEqual(self.motor.disponibles("2026-12-20", "2026-12-27"), [7, 42])
+
+
+if __name__ == "__main__":
+    print("[TEST] Running Reservation Test Suite\n")
+    unittest.main(verbosity=2)
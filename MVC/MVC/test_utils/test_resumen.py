@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the aggregated system summary (modelo/resumen.py, DaoInforme.obtenerResumen)
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from dto.dto_informe import InformeDTO
+from modelo.resumen import ResumenSistema
+from test_utils.bd_falsa import ConexionFalsa, ConPoolFalso
+
+
+#: Grouped counts answered per table
+RESPUESTAS = {
+    "FROM cliente": [(12,)],
+    "FROM empleado": [('gerente', 1), ('empleado', 4)],
+    "FROM vehiculo": [('disponible', 5), ('arrendado', 3)],
+    "FROM arriendo": [('activo', 3, 300000.0), ('cancelado', 2, 150000.0)],
+}
+
+
+class TestResumenSistema(unittest.TestCase):
+    """Totals derived from grouped SQL counts"""
+
+    def setUp(self):
+        self.resumen = ResumenSistema(
+            total_clientes=12,
+            empleados_por_cargo={'gerente': 1, 'empleado': 4},
+            vehiculos_por_estado={'disponible': 5, 'arrendado': 3, 'mantencion': 1},
+            arriendos_por_estado={'activo': 3, 'finalizado': 6, 'cancelado': 2},
+            costo_por_estado={'activo': 300000.0, 'finalizado': 900000.0, 'cancelado': 150000.0}
+        )
+
+    def test_totals_sum_groups(self):
+        self.assertEqual(self.resumen.getTotalClientes(), 12)
+        self.assertEqual(self.resumen.getTotalEmpleados(), 5)
+        self.assertEqual(self.resumen.getTotalVehiculos(), 9)
+        self.assertEqual(self.resumen.getTotalArriendos(), 11)
+
+    def test_missing_group_counts_as_zero(self):
+        self.assertEqual(self.resumen.getVehiculosPorEstado('reparacion'), 0)
+        self.assertEqual(ResumenSistema().getTotalArriendos(), 0)
+
+    def test_income_excludes_cancelled(self):
+        self.assertEqual(self.resumen.getIngresosTotales(), 1200000.0)
+
+
+class TestSeccionesResumen(ConPoolFalso, unittest.TestCase):
+    """Single-section reports run only the query they print"""
+
+    def setUp(self):
+        self.instalar_conexion(ConexionFalsa(guion=RESPUESTAS))
+
+    def test_full_summary_runs_every_query(self):
+        resumen = InformeDTO().obtenerResumen()
+        self.assertEqual(len(self.conn.sentencias), 4)
+        self.assertEqual((resumen.getTotalClientes(), resumen.getTotalVehiculos()), (12, 8))
+
+    def test_one_section_runs_one_query(self):
+        resumen = InformeDTO().obtenerResumen(('vehiculos',))
+        self.assertEqual(len(self.conn.sentencias), 1)
+        self.assertIn("FROM vehiculo", self.conn.textos[0])
+        self.assertEqual(resumen.getVehiculosPorEstado('arrendado'), 3)
+        self.assertEqual(resumen.getTotalClientes(), 0)
+
+    def test_unknown_section_is_rejected(self):
+        with self.assertRaises(ValueError):
+            InformeDTO().obtenerResumen(('flota',))
+
+
+if __name__ == "__main__":
+    print("[TEST] Running System Summary Test Suite\n")
+    unittest.main(verbosity=2)
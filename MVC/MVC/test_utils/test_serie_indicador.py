@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the yearly UF series lookup (modelo/indicador.py and
+IndicadorService._buscar_en_series). No network access is needed:
+series are seeded directly into the service's in-memory index.
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory (MVC) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from modelo.indicador import SerieIndicador
+from servicio.indicador_service import IndicadorService
+
+
+def serie_json(*pares):
+    # mindicador.cl returns the series newest first
+    return {"codigo": "uf", "serie": [{"fecha": f"{f}T03:00:00.000Z", "valor": v}
+                                      for f, v in sorted(pares, reverse=True)]}
+
+
+class TestSerieIndicador(unittest.TestCase):
+    """Binary search for the nearest previous value"""
+
+    def setUp(self):
+        self.serie = SerieIndicador.from_json(serie_json(
+            ("2025-03-06", 38000.0), ("2025-03-07", 38010.0), ("2025-03-10", 38040.0)))
+
+    def test_exact_date(self):
+        self.assertEqual(self.serie.buscarAnterior("2025-03-07").getValor(), 38010.0)
+
+    def test_gap_uses_previous_date(self):
+        indicador = self.serie.buscarAnterior("2025-03-09")
+        self.assertEqual(indicador.getFechaCorta(), "2025-03-07")
+
+    def test_before_series_start(self):
+        self.assertIsNone(self.serie.buscarAnterior("2025-01-01"))
+
+
+class TestBuscarEnSeries(unittest.TestCase):
+    """Window handling across year boundaries without HTTP calls"""
+
+    def setUp(self):
+        self.anteriores = dict(IndicadorService._series)
+        ahora = time.time()
+        IndicadorService._series[2024] = (SerieIndicador.from_json(serie_json(("2024-12-30", 37000.0))), ahora)
+        IndicadorService._series[2025] = (SerieIndicador.from_json(serie_json(("2025-01-10", 37100.0))), ahora)
+
+    def tearDown(self):
+        IndicadorService._series.clear()
+        IndicadorService._series.update(self.anteriores)
+
+    def test_window_crosses_previous_year(self):
+        indicador, disponibles = IndicadorService._buscar_en_series(datetime(2025, 1, 2), 7)
+        self.assertTrue(disponibles)
+        self.assertEqual(indicador.getFechaCorta(), "2024-12-30")
+
+    def test_value_older_than_window_is_not_used(self):
+        indicador, disponibles = IndicadorService._buscar_en_series(datetime(2025, 1, 20), 7)
+        self.assertTrue(disponibles)
+        self.assertIsNone(indicador)
+
+
+if __name__ == "__main__":
+    print("[TEST] Running UF Series Test Suite\n")
+    unittest.main(verbosity=2)
@@ -1,16 +1,79 @@
 import bcrypt
 import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+#: Factor de trabajo por defecto (2^12 iteraciones); configurable con BCRYPT_ROUNDS
+ROUNDS_POR_DEFECTO = 12
+
+#: Prefijo de un hash bcrypt ($2a$, $2b$ o $2y$) con su factor de trabajo
+_PATRON_BCRYPT = re.compile(r'^\$2[aby]\$(\d{2})\$')
+
+_ejecutor: Optional[ThreadPoolExecutor] = None
+_ejecutor_lock = threading.Lock()
+
+
+def _rounds_configurados() -> int:
+    """Lee BCRYPT_ROUNDS (4-31) o usa el valor por defecto."""
+    try:
+        rounds = int(os.environ.get("BCRYPT_ROUNDS", ROUNDS_POR_DEFECTO))
+    except ValueError:
+        logger.warning("BCRYPT_ROUNDS inválido; se usa %d", ROUNDS_POR_DEFECTO)
+        return ROUNDS_POR_DEFECTO
+    return min(max(rounds, 4), 31)
+
+
+def obtener_ejecutor_bcrypt() -> ThreadPoolExecutor:
+    """
+    Obtiene el pool de hilos compartido para las operaciones bcrypt.
+
+    bcrypt libera el GIL mientras calcula, así que un hilo por núcleo
+    permite verificar varios logins en paralelo sin sobrecargar la CPU.
+
+    Returns:
+        ThreadPoolExecutor: Ejecutor con tantos hilos como núcleos
+    """
+    global _ejecutor
+    if _ejecutor is None:
+        with _ejecutor_lock:
+            if _ejecutor is None:
+                _ejecutor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                               thread_name_prefix="bcrypt")
+    return _ejecutor
+
+
+def cerrar_ejecutor_bcrypt() -> None:
+    """Detiene el pool de hilos de bcrypt si fue creado."""
+    global _ejecutor
+    with _ejecutor_lock:
+        anterior, _ejecutor = _ejecutor, None
+    if anterior is not None:
+        anterior.shutdown(wait=True)
+
 class Encoder:
     """
     Utilidad para el manejo seguro de contraseñas usando bcrypt.
     
     Proporciona métodos para encriptar y verificar contraseñas
     utilizando el algoritmo bcrypt con salt automático.
+    
+    Attributes:
+        rounds (int): Factor de trabajo de los hashes nuevos (BCRYPT_ROUNDS)
     """
+
+    def __init__(self, rounds: Optional[int] = None) -> None:
+        """
+        Inicializa el encoder.
+        
+        Args:
+            rounds (Optional[int]): Factor de trabajo; por defecto BCRYPT_ROUNDS o 12
+        """
+        self.rounds = rounds if rounds is not None else _rounds_configurados()
    
     def encode(self, password: str) -> Optional[str]:
         """
@@ -30,7 +93,7 @@ class Encoder:
         """
         try:
             # Generar salt y hashear la contraseña
-            salt = bcrypt.gensalt()
+            salt = bcrypt.gensalt(rounds=self.rounds)
             hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
             logger.debug("Contraseña encriptada exitosamente")
             return hashed.decode('utf-8')
@@ -64,6 +127,45 @@ class Encoder:
             logger.error("Error al verificar contraseña: %s", str(e))
             return False
 
+    def verify_async(self, password: str, hashed_password: str) -> 'Future[bool]':
+        """
+        Verifica una contraseña en el pool de hilos de bcrypt.
+        
+        Args:
+            password (str): Contraseña en texto plano a verificar
+            hashed_password (str): Hash bcrypt almacenado
+            
+        Returns:
+            Future[bool]: Resultado de `verify` cuando termine
+        """
+        return obtener_ejecutor_bcrypt().submit(self.verify, password, hashed_password)
+
+    def costo(self, hashed_password: str) -> Optional[int]:
+        """
+        Obtiene el factor de trabajo con que se generó un hash bcrypt.
+        
+        Args:
+            hashed_password (str): Hash bcrypt
+            
+        Returns:
+            Optional[int]: Factor de trabajo, o None si no es un hash bcrypt
+        """
+        coincidencia = _PATRON_BCRYPT.match(hashed_password or '')
+        return int(coincidencia.group(1)) if coincidencia else None
+
+    def necesita_rehash(self, hashed_password: str) -> bool:
+        """
+        Indica si un hash se generó con un factor de trabajo distinto al configurado.
+        
+        Args:
+            hashed_password (str): Hash bcrypt almacenado
+            
+        Returns:
+            bool: True si conviene volver a hashear la contraseña
+        """
+        costo = self.costo(hashed_password)
+        return costo is not None and costo != self.rounds
+
     def is_hashed(self, password: str) -> bool:
         """
         Determina si una cadena ya está en formato hash bcrypt.
@@ -83,4 +185,4 @@ class Encoder:
         """
         if not password:
             return False
-        return password.startswith('$2b$')
+        return _PATRON_BCRYPT.match(password) is not None
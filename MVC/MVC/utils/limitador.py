@@ -0,0 +1,257 @@
+import os
+import threading
+import time
+import getpass
+import logging
+from array import array
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LoginBloqueadoError(Exception):
+    """
+    Se lanza cuando un intento de login es rechazado por el limitador.
+
+    Attributes:
+        espera (float): Segundos que faltan para poder reintentar
+    """
+
+    def __init__(self, mensaje: str, espera: float) -> None:
+        super().__init__(mensaje)
+        self.espera = espera
+
+
+class PoliticaLimite:
+    """
+    Parámetros de limitación para un tipo de clave (RUN u origen).
+
+    Attributes:
+        capacidad (int): Intentos seguidos permitidos (tamaño del token bucket)
+        recarga (float): Tokens recuperados por segundo
+        max_fallos (int): Fallos dentro de la ventana que provocan bloqueo
+        ventana (float): Segundos considerados para contar fallos
+        ancho_bucket (float): Resolución de los contadores de fallos (segundos)
+        bloqueo (float): Duración del bloqueo (segundos)
+    """
+
+    __slots__ = ('capacidad', 'recarga', 'max_fallos', 'ventana', 'ancho_bucket', 'bloqueo')
+
+    def __init__(self, capacidad: int = 5, recarga: float = 0.2, max_fallos: int = 5,
+                 ventana: float = 900.0, ancho_bucket: float = 60.0, bloqueo: float = 900.0) -> None:
+        self.capacidad = capacidad
+        self.recarga = recarga
+        self.max_fallos = max_fallos
+        self.ventana = ventana
+        self.ancho_bucket = ancho_bucket
+        self.bloqueo = bloqueo
+
+
+class _EstadoClave:
+    """Token bucket y contadores de fallos por bucket de tiempo de una clave."""
+
+    __slots__ = ('tokens', 'actualizado', 'bloqueado_hasta', 'ids', 'conteos')
+
+    def __init__(self, politica: PoliticaLimite, ahora: float) -> None:
+        n = max(1, int(politica.ventana // politica.ancho_bucket))
+        self.tokens = float(politica.capacidad)
+        self.actualizado = ahora
+        self.bloqueado_hasta = 0.0
+        # Anillo de n buckets: ids[i] es el número de bucket y conteos[i] sus fallos
+        self.ids = array('q', [-1] * n)
+        self.conteos = array('H', [0] * n)
+
+    def recargar(self, politica: PoliticaLimite, ahora: float) -> None:
+        self.tokens = min(politica.capacidad,
+                          self.tokens + (ahora - self.actualizado) * politica.recarga)
+        self.actualizado = ahora
+
+    def sumar_fallo(self, politica: PoliticaLimite, ahora: float) -> int:
+        """Registra un fallo y retorna los fallos dentro de la ventana."""
+        bucket = int(ahora // politica.ancho_bucket)
+        pos = bucket % len(self.ids)
+        if self.ids[pos] != bucket:
+            self.ids[pos] = bucket
+            self.conteos[pos] = 0
+        if self.conteos[pos] < 0xFFFF:
+            self.conteos[pos] += 1
+        return self.fallos(bucket)
+
+    def fallos(self, bucket: int) -> int:
+        minimo = bucket - len(self.ids)
+        return sum(c for b, c in zip(self.ids, self.conteos) if b > minimo)
+
+    def limpiar_fallos(self) -> None:
+        for i in range(len(self.ids)):
+            self.ids[i] = -1
+            self.conteos[i] = 0
+
+
+class LimitadorLogin:
+    """
+    Limitador de intentos de login en memoria.
+
+    Cada intento consume un token del bucket de su RUN y del de su origen;
+    sin tokens, o con la clave bloqueada, el intento se rechaza antes de
+    consultar la base de datos o calcular bcrypt. Al acumular demasiados
+    fallos en la ventana, la clave queda bloqueada por un tiempo.
+    """
+
+    def __init__(self, politica_run: Optional[PoliticaLimite] = None,
+                 politica_origen: Optional[PoliticaLimite] = None,
+                 reloj: Callable[[], float] = time.monotonic,
+                 max_claves: int = 10000) -> None:
+        """
+        Inicializa el limitador.
+
+        Args:
+            politica_run (Optional[PoliticaLimite]): Límites por RUN
+            politica_origen (Optional[PoliticaLimite]): Límites por origen (más holgados por defecto)
+            reloj (Callable[[], float]): Fuente de tiempo en segundos
+            max_claves (int): Claves guardadas antes de purgar las inactivas
+        """
+        self._politicas = {
+            'run': politica_run or PoliticaLimite(),
+            'origen': politica_origen or PoliticaLimite(capacidad=20, recarga=1.0, max_fallos=20),
+        }
+        self._reloj = reloj
+        self._max_claves = max_claves
+        self._estados: Dict[Tuple[str, str], _EstadoClave] = {}
+        self._lock = threading.Lock()
+        self._permitidos = 0
+        self._rechazados = 0
+        self._bloqueos = 0
+
+    def permitir(self, run: str, origen: str) -> Tuple[bool, float]:
+        """
+        Consulta (y consume) el permiso para un intento de login.
+
+        Args:
+            run (str): RUN ingresado
+            origen (str): Identificador del origen del intento
+
+        Returns:
+            Tuple[bool, float]: Si se permite el intento y, si no, los segundos de espera
+        """
+        ahora = self._reloj()
+        claves = (('run', run), ('origen', origen))
+        with self._lock:
+            estados = [self._estado(clave, ahora) for clave in claves]
+            espera = 0.0
+            for (tipo, _), estado in zip(claves, estados):
+                politica = self._politicas[tipo]
+                estado.recargar(politica, ahora)
+                if estado.bloqueado_hasta > ahora:
+                    espera = max(espera, estado.bloqueado_hasta - ahora)
+                elif estado.tokens < 1.0:
+                    espera = max(espera, (1.0 - estado.tokens) / politica.recarga)
+            if espera > 0:
+                self._rechazados += 1
+                return False, espera
+            for estado in estados:
+                estado.tokens -= 1.0
+            self._permitidos += 1
+            return True, 0.0
+
+    def registrar_fallo(self, run: str, origen: str) -> None:
+        """Registra un login fallido y bloquea las claves que superen el máximo de fallos."""
+        ahora = self._reloj()
+        with self._lock:
+            for clave in (('run', run), ('origen', origen)):
+                politica = self._politicas[clave[0]]
+                estado = self._estado(clave, ahora)
+                if estado.sumar_fallo(politica, ahora) >= politica.max_fallos:
+                    estado.bloqueado_hasta = ahora + politica.bloqueo
+                    estado.limpiar_fallos()
+                    self._bloqueos += 1
+                    logger.warning("Login bloqueado por %.0f s para %s %s", politica.bloqueo, *clave)
+
+    def registrar_exito(self, run: str, origen: str) -> None:
+        """Olvida los fallos del RUN tras un login exitoso."""
+        with self._lock:
+            estado = self._estados.get(('run', run))
+            if estado is not None:
+                estado.limpiar_fallos()
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores del limitador.
+
+        Returns:
+            Dict[str, int]: permitidos, rechazados, bloqueos y claves en memoria
+        """
+        with self._lock:
+            return {
+                'permitidos': self._permitidos,
+                'rechazados': self._rechazados,
+                'bloqueos': self._bloqueos,
+                'claves': len(self._estados),
+            }
+
+    def _estado(self, clave: Tuple[str, str], ahora: float) -> _EstadoClave:
+        estado = self._estados.get(clave)
+        if estado is None:
+            if len(self._estados) >= self._max_claves:
+                self._purgar(ahora)
+            estado = _EstadoClave(self._politicas[clave[0]], ahora)
+            self._estados[clave] = estado
+        return estado
+
+    def _purgar(self, ahora: float) -> None:
+        """Descarta claves sin bloqueo, con el bucket lleno y sin fallos recientes."""
+        inactivas = []
+        for clave, estado in self._estados.items():
+            politica = self._politicas[clave[0]]
+            estado.recargar(politica, ahora)
+            bucket = int(ahora // politica.ancho_bucket)
+            if (estado.bloqueado_hasta <= ahora and estado.tokens >= politica.capacidad
+                    and estado.fallos(bucket) == 0):
+                inactivas.append(clave)
+        for clave in inactivas:
+            del self._estados[clave]
+
+
+_limitador: Optional[LimitadorLogin] = None
+_limitador_lock = threading.Lock()
+
+
+def obtener_limitador() -> LimitadorLogin:
+    """Obtiene el limitador de login compartido por el proceso."""
+    global _limitador
+    if _limitador is None:
+        with _limitador_lock:
+            if _limitador is None:
+                _limitador = LimitadorLogin()
+    return _limitador
+
+
+def configurar_limitador(limitador: Optional[LimitadorLogin]) -> Optional[LimitadorLogin]:
+    """
+    Reemplaza el limitador compartido (por ejemplo, para pruebas de carga).
+
+    Args:
+        limitador (Optional[LimitadorLogin]): Nuevo limitador, o None para volver al por defecto
+
+    Returns:
+        Optional[LimitadorLogin]: El limitador anterior
+    """
+    global _limitador
+    with _limitador_lock:
+        anterior, _limitador = _limitador, limitador
+    return anterior
+
+
+def origen_actual() -> str:
+    """
+    Identifica el origen de la sesión de consola actual.
+
+    Returns:
+        str: IP remota si la sesión llega por SSH, o "local:<usuario del SO>"
+    """
+    ssh = os.environ.get("SSH_CLIENT", "").split()
+    if ssh:
+        return ssh[0]
+    try:
+        return f"local:{getpass.getuser()}"
+    except Exception:
+        return "local"
@@ -1,45 +1,194 @@
 # utils/logger.py
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+from config.logging_config import COLA_LOGGING, LOGGING_CONFIG
+
+
+class ColaLoggingHandler(QueueHandler):
+    """
+    Encola los registros para que los escriba el hilo de `QueueListener`.
+
+    La cola es acotada. Si está llena, los registros bajo `nivel_bloqueo`
+    se descartan (y se cuentan) y los demás esperan hasta `espera_maxima`
+    segundos a que se libere espacio: una ráfaga de mensajes informativos
+    no hace perder errores, y un disco lento no detiene indefinidamente al
+    hilo que registra. Al volver a haber espacio se encola un aviso con la
+    cantidad de mensajes perdidos.
+    """
+
+    def __init__(self, cola: queue.Queue, nivel_bloqueo: int = logging.WARNING,
+                 espera_maxima: float = 1.0) -> None:
+        super().__init__(cola)
+        self.nivel_bloqueo = nivel_bloqueo
+        self.espera_maxima = espera_maxima
+        self.descartados = 0
+        self._sin_avisar = 0
+        self._lock_descartes = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # La cola ya es segura entre hilos; sin el lock del handler, un
+        # registro que espera espacio no frena a los demás hilos
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= self.nivel_bloqueo:
+                self.queue.put(record, timeout=self.espera_maxima)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_descartes:
+                self.descartados += 1
+                self._sin_avisar += 1
+            return
+        if self._sin_avisar:
+            self._avisarDescartes()
+
+    def _avisarDescartes(self) -> None:
+        with self._lock_descartes:
+            perdidos, self._sin_avisar = self._sin_avisar, 0
+        aviso = logging.makeLogRecord({
+            'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+            'msg': "Cola de logging llena: se descartaron %d mensajes", 'args': (perdidos,)})
+        try:
+            self.queue.put_nowait(self.prepare(aviso))
+        except queue.Full:
+            with self._lock_descartes:
+                self._sin_avisar += perdidos
+
+
+class _ListenerLogging(QueueListener):
+    """QueueListener que espera espacio para el centinela de `stop()` si la cola está llena."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
 
 class SistemaLogging:
     _configurado = False
-    
+    _lock = threading.Lock()
+    _listener: Optional[QueueListener] = None
+    _cola_handler: Optional[ColaLoggingHandler] = None
+    _handlers: List[logging.Handler] = []
+
     @classmethod
-    def configurar(cls, nivel=logging.INFO, archivo_log='sistema_arriendos.log'):
-        if cls._configurado:
-            return
-            
-        # Crear directorio de logs si no existe
-        os.makedirs('logs', exist_ok=True)
-        ruta_log = os.path.join('logs', archivo_log)
-        
-        # Configurar formato
-        formato = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Configurar handler de archivo
-        file_handler = logging.FileHandler(ruta_log, encoding='utf-8')
-        file_handler.setFormatter(formato)
-        
-        # Configurar handler de consola (solo para desarrollo)
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formato)
-        
-        # Configurar logger raíz
-        logger_raíz = logging.getLogger()
-        logger_raíz.setLevel(nivel)
-        logger_raíz.addHandler(file_handler)
-        
-        # En producción, comentar la siguiente línea para evitar logs en consola
-        logger_raíz.addHandler(console_handler)
-        
-        cls._configurado = True
+    def configurar(cls, nivel=logging.INFO, archivo_log='sistema_arriendos.log', asincrono=True):
+        """
+        Configura el logger raíz con archivo rotativo, archivo de errores y consola.
+
+        Con `asincrono` (por defecto) los hilos de la aplicación solo encolan
+        el registro; el formato y la escritura a disco y consola ocurren en
+        un hilo aparte. La rotación y los formatos salen de
+        `config.logging_config.LOGGING_CONFIG` y la cola de `COLA_LOGGING`.
+
+        Args:
+            nivel (int): Nivel del logger raíz
+            archivo_log (str): Nombre del archivo principal dentro de `logs/`
+            asincrono (bool): Escribir desde un hilo de fondo (False: en el hilo que registra)
+        """
+        with cls._lock:
+            if cls._configurado:
+                return
+
+            # Crear directorio de logs si no existe
+            os.makedirs('logs', exist_ok=True)
+
+            # Archivo principal (todo lo que pase el nivel raíz) y archivo de errores, ambos rotativos
+            cls._handlers = [
+                cls._crearHandlerArchivo('file', os.path.join('logs', archivo_log), con_nivel=False),
+                cls._crearHandlerArchivo('error_file'),
+            ]
+
+            # Configurar handler de consola (solo para desarrollo)
+            # En producción, comentar la siguiente línea para evitar logs en consola
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(cls._crearFormato('standard'))
+            cls._handlers.append(console_handler)
+
+            # Configurar logger raíz
+            logger_raíz = logging.getLogger()
+            logger_raíz.setLevel(nivel)
+            if asincrono:
+                cola = queue.Queue(maxsize=COLA_LOGGING['tamano'])
+                cls._cola_handler = ColaLoggingHandler(
+                    cola, logging.getLevelName(COLA_LOGGING['nivel_bloqueo']), COLA_LOGGING['espera_maxima'])
+                cls._listener = _ListenerLogging(cola, *cls._handlers, respect_handler_level=True)
+                cls._listener.start()
+                logger_raíz.addHandler(cls._cola_handler)
+                atexit.register(cls.detener)
+            else:
+                for handler in cls._handlers:
+                    logger_raíz.addHandler(handler)
+
+            cls._configurado = True
         logging.info("Sistema de logging configurado correctamente")
-    
+
+    @classmethod
+    def detener(cls) -> None:
+        """
+        Escribe los registros pendientes y cierra los handlers.
+
+        Se registra con `atexit`, así que los mensajes encolados no se pierden
+        al salir; puede llamarse antes (p. ej. en pruebas) y es idempotente.
+        """
+        with cls._lock:
+            if not cls._configurado:
+                return
+            logger_raíz = logging.getLogger()
+            if cls._cola_handler is not None:
+                logger_raíz.removeHandler(cls._cola_handler)
+                cls._listener.stop()  # procesa todo lo que quedó en la cola
+                if cls._cola_handler.descartados:
+                    cls._escribirDirecto(logging.WARNING, "Mensajes de log descartados por cola llena: %d",
+                                         cls._cola_handler.descartados)
+            for handler in cls._handlers:
+                logger_raíz.removeHandler(handler)
+                handler.close()
+            cls._listener = None
+            cls._cola_handler = None
+            cls._handlers = []
+            cls._configurado = False
+        atexit.unregister(cls.detener)
+
+    @classmethod
+    def descartados(cls) -> int:
+        """Obtiene cuántos mensajes se descartaron por cola llena desde `configurar`."""
+        return cls._cola_handler.descartados if cls._cola_handler is not None else 0
+
     @classmethod
     def obtener_logger(cls, nombre):
         return logging.getLogger(nombre)
+
+    @staticmethod
+    def _crearFormato(nombre: str) -> logging.Formatter:
+        formato = LOGGING_CONFIG['formatters'][nombre]
+        return logging.Formatter(formato['format'], datefmt=formato.get('datefmt'))
+
+    @classmethod
+    def _crearHandlerArchivo(cls, nombre: str, ruta: Optional[str] = None,
+                             con_nivel: bool = True) -> RotatingFileHandler:
+        config = LOGGING_CONFIG['handlers'][nombre]
+        handler = RotatingFileHandler(ruta or config['filename'], maxBytes=config['maxBytes'],
+                                      backupCount=config['backupCount'], encoding=config.get('encoding'))
+        if con_nivel:
+            handler.setLevel(config['level'])
+        handler.setFormatter(cls._crearFormato(config['formatter']))
+        return handler
+
+    @classmethod
+    def _escribirDirecto(cls, nivel: int, mensaje: str, *args) -> None:
+        registro = logging.makeLogRecord({'name': __name__, 'levelno': nivel,
+                                          'levelname': logging.getLevelName(nivel),
+                                          'msg': mensaje, 'args': args})
+        for handler in cls._handlers:
+            if registro.levelno >= handler.level:
+                handler.handle(registro)